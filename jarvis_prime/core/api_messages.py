@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
-import os, json, asyncio
+import os, json, asyncio, threading, time
 from pathlib import Path
 from aiohttp import web
 import importlib.util
@@ -30,8 +30,7 @@ if orchestrator_spec and orchestrator_spec.loader and _ORCHESTRATOR_FILE.exists(
         title = data.get("title", "Orchestrator")
         message = data.get("message", "")
         priority = 8 if data.get("priority") == "high" else 5
-        storage.save_message(title, message, "orchestrator", priority, {})  # type: ignore
-        _broadcast("created")
+        _notify_inbox(title, message, "orchestrator", priority)
     
     orchestrator_module.init_orchestrator(
         config={
@@ -59,8 +58,7 @@ if analytics_spec and analytics_spec.loader and _ANALYTICS_FILE.exists():
         title = f"Analytics: {source}"
         body = f"{level.upper()}: {message}"
         priority = 8 if level.lower() in ["down", "critical", "error"] else 5
-        storage.save_message(title, body, "analytics", priority, {})  # type: ignore
-        _broadcast("created")
+        _notify_inbox(title, body, "analytics", priority)
 
     print("[analytics] Module loaded")
 else:
@@ -78,8 +76,7 @@ if sentinel_spec and sentinel_spec.loader and _SENTINEL_FILE.exists():
         
         def notify_via_sentinel(title, body, source="sentinel", priority=5):
             """Send sentinel health/recovery events through inbox"""
-            storage.save_message(title, body, source, priority, {})  # type: ignore
-            _broadcast("created")
+            _notify_inbox(title, body, source, priority)
         
         sentinel_instance = sentinel_module.Sentinel(
             config={
@@ -194,6 +191,42 @@ def _broadcast(event: str, **kw):
     for q in dead:
         _listeners.discard(q)
 
+_LOOP = None  # set on startup; storage flushes complete on its writer thread
+
+def _broadcast_when_saved(fut):
+    """Emit `created` only once the row is committed (group commit may defer it)."""
+    def _done(f):
+        if f.exception() is not None:
+            print(f"[inbox] save failed: {f.exception()}")
+            return
+        mid = int(f.result())
+        if _LOOP is not None and _LOOP.is_running():
+            _LOOP.call_soon_threadsafe(lambda: _broadcast("created", id=mid))
+        else:
+            _broadcast("created", id=mid)
+    fut.add_done_callback(_done)
+
+def _notify_inbox(title, body, source, priority):
+    """Module notification -> inbox. submit_message blocks while the group-commit
+    ring is full, so on the event loop it is handed to the default executor."""
+    def _submit():
+        try:
+            _broadcast_when_saved(storage.submit_message(title, body, source, priority, {}))  # type: ignore
+        except Exception as e:
+            print(f"[inbox] save failed: {e}")
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _submit()  # called from a module's own thread
+        return
+    loop.run_in_executor(None, _submit)
+
+async def _save(title, body, source, priority, extras) -> int:
+    """Insert without blocking the loop while a group-commit batch is pending."""
+    loop = asyncio.get_running_loop()
+    fut = await loop.run_in_executor(None, storage.submit_message, title, body, source, priority, extras)  # type: ignore
+    return int(await asyncio.wrap_future(fut))
+
 def _json(data, status=200):
     return web.Response(text=json.dumps(data, ensure_ascii=False), status=status, content_type="application/json")
 
@@ -208,7 +241,7 @@ async def api_create_message(request: web.Request):
     source = str(data.get("source") or "api")
     priority = int(data.get("priority", 5))
     extras = data.get("extras") or {}
-    mid = storage.save_message(title, body, source, priority, extras)  # type: ignore
+    mid = await _save(title, body, source, priority, extras)
     _broadcast("created", id=int(mid))
     return _json({"id": int(mid)})
 
@@ -229,8 +262,21 @@ async def api_list_messages(request: web.Request):
             saved_bool = bool(int(saved))
         except Exception:
             saved_bool = saved.lower() in ('1','true','yes')
-    items = storage.list_messages(limit=limit, q=q, offset=offset, saved=saved_bool)  # type: ignore
-    return _json({"items": items})
+    rank = request.rel_url.query.get("rank", "").lower() in ('1','true','yes')
+    cursors = {}
+    for key in ("before_id", "after_id"):
+        val = request.rel_url.query.get(key)
+        if val is not None:
+            try:
+                cursors[key] = int(val)
+            except Exception:
+                return _json({"error": f"bad {key}"}, status=400)
+    items = storage.list_messages(limit=limit, q=q, offset=offset, saved=saved_bool, rank=rank, **cursors)  # type: ignore
+    out = {"items": items}
+    # keyset cursor for the next (older) page; ranked results are not id-ordered
+    if items and len(items) >= limit and not rank:
+        out["next_before_id"] = int(items[-1]["id"])
+    return _json(out)
 
 async def api_get_message(request: web.Request):
     mid = int(request.match_info["id"])
@@ -301,7 +347,7 @@ async def api_wake(request: web.Request):
     title = str(data.get("title","") or "Wake")
     msg = str(data.get("message","") or "")
     priority = int(data.get("priority", 5))
-    mid = storage.save_message(title, msg, "wake", priority, {})  # type: ignore
+    mid = await _save(title, msg, "wake", priority, {})
     _broadcast("created", id=int(mid))
     return _json({"id": int(mid)})
 
@@ -315,7 +361,7 @@ async def api_emit(request: web.Request):
     source = str(data.get("source") or "internal")
     priority = int(data.get("priority", 5))
     extras = data.get("extras") or {}
-    mid = storage.save_message(title, body, source, priority, extras)  # type: ignore
+    mid = await _save(title, body, source, priority, extras)
     _broadcast("created", id=int(mid))
     return _json({"id": int(mid)})
 
@@ -435,6 +481,91 @@ async def api_llm_chat(request: web.Request):
     
     return _json({"task_id": task_id, "status": "processing"})
 
+_CHAT_STREAM_KEEPALIVE = 15  # seconds between comment pings while waiting for the LLM
+
+async def api_llm_chat_stream(request: web.Request):
+    """
+    POST /api/llm/chat/stream - chat reply as server-sent events:
+    {"event": "token", "text": ...} per generated piece, then
+    {"event": "done", "text": <cleaned reply>} (or {"event": "error"}).
+    Disconnecting stops generation and frees the LLM slot.
+    """
+    try:
+        data = await request.json()
+    except Exception:
+        return _json({"error": "bad json"}, status=400)
+    
+    messages = data.get("messages", [])
+    if not messages:
+        return _json({"error": "messages required"}, status=400)
+    
+    loop = asyncio.get_running_loop()
+    q: asyncio.Queue = asyncio.Queue()
+    cancel = threading.Event()
+    fut = llm_client.submit_stream(
+        lambda piece: loop.call_soon_threadsafe(q.put_nowait, ("token", piece)),
+        cancel,
+        messages=messages,
+        system_prompt=str(data.get("system_prompt", "")),
+        max_new_tokens=int(data.get("max_tokens", 384)),
+        timeout=int(data.get("timeout", 20))
+    )
+    fut.add_done_callback(lambda f: loop.call_soon_threadsafe(q.put_nowait, ("end", f)))
+
+    resp = web.StreamResponse(
+        status=200,
+        reason='OK',
+        headers={
+            'Content-Type': 'text/event-stream',
+            'Cache-Control': 'no-cache',
+            'Connection': 'keep-alive',
+        }
+    )
+    started = time.time()
+    pieces = 0
+    try:
+        await resp.prepare(request)
+        await resp.write(b": hello\n\n")
+        idle = 0.0
+        while True:
+            try:
+                kind, val = await asyncio.wait_for(q.get(), timeout=1.0)
+            except asyncio.TimeoutError:
+                # Nothing yet (queued behind another LLM task, or a slow token):
+                # notice a vanished client without waiting for the next write
+                if request.transport is None or request.transport.is_closing():
+                    break
+                idle += 1.0
+                if idle >= _CHAT_STREAM_KEEPALIVE:
+                    idle = 0.0
+                    await resp.write(b": keepalive\n\n")
+                continue
+            idle = 0.0
+            if kind == "token":
+                pieces += 1
+                event = {"event": "token", "text": val}
+            else:
+                try:
+                    event = {"event": "done", "text": val.result(), "pieces": pieces,
+                             "seconds": round(time.time() - started, 2)}
+                except Exception as e:
+                    event = {"event": "error", "error": str(e) or e.__class__.__name__}
+            await resp.write(b"data: " + json.dumps(event, ensure_ascii=False).encode('utf-8') + b"\n\n")
+            if kind == "end":
+                break
+    except (asyncio.CancelledError, ConnectionResetError, RuntimeError, BrokenPipeError):
+        pass
+    finally:
+        if not fut.done():
+            cancel.set()
+            fut.cancel()
+            print(f"[llm] chat stream client went away after {pieces} pieces → generation cancelled")
+        try:
+            await resp.write_eof()
+        except Exception:
+            pass
+    return resp
+
 async def api_llm_task_status(request: web.Request):
     """GET /api/llm/task/{task_id} - get task status"""
     task_id = request.match_info["task_id"]
@@ -447,17 +578,29 @@ def _make_app() -> web.Application:
     
     # Startup hook to start orchestrator scheduler, analytics monitors, and sentinel monitors after event loop is running
     async def start_background_tasks(app):
+        global _LOOP
+        _LOOP = asyncio.get_running_loop()
         if orchestrator_module:
             orchestrator_module.start_orchestrator_scheduler()
         if analytics_module:
             await analytics_module.init_analytics(app, notification_callback=notify_via_analytics)
             print("[analytics] Initialized and monitoring started")
+            if atlas_module:
+                atlas_module.set_status_provider(analytics_module.service_states_snapshot)
         if sentinel_instance:
             sentinel_instance.start_all_monitoring()
             asyncio.create_task(sentinel_instance.auto_purge())
             print("[sentinel] Monitoring started")
 
     app.on_startup.append(start_background_tasks)
+
+    async def drain_inbox_buffer(app):
+        # joins the flusher thread (up to 10 s); keep the other cleanup handlers running
+        await asyncio.get_running_loop().run_in_executor(None, storage.flush_pending)  # type: ignore
+        if analytics_module:
+            await analytics_module.shutdown_analytics()
+
+    app.on_cleanup.append(drain_inbox_buffer)
     
     # ✅ Ensure Atlas routes are registered before startup (fixes 404)
     if atlas_module:
@@ -488,6 +631,7 @@ def _make_app() -> web.Application:
     app.router.add_post("/api/llm/rewrite", api_llm_rewrite)
     app.router.add_post("/api/llm/riff", api_llm_riff)
     app.router.add_post("/api/llm/chat", api_llm_chat)
+    app.router.add_post("/api/llm/chat/stream", api_llm_chat_stream)
     app.router.add_get("/api/llm/task/{task_id}", api_llm_task_status)
 
     # Register orchestrator routes if available
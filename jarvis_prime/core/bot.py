@@ -12,6 +12,8 @@ import atexit
 import time
 import socket
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Tuple
 
 import re as _re_local, time as _time_local
@@ -419,6 +421,70 @@ def stop_sidecars():
         except Exception:
             pass
 atexit.register(stop_sidecars)
+# ============================
+# Outbound dispatcher (pooled, parallel fan-out)
+# ============================
+def _opt_int(key: str, default: int) -> int:
+    try:
+        return int(merged.get(key, default))
+    except Exception:
+        return default
+
+def _build_dispatcher():
+    try:
+        import dispatcher as _d  # /app/dispatcher.py
+    except Exception as e:
+        print(f"[bot] dispatcher unavailable: {e}")
+        return None, None
+    retries = _opt_int("dispatch_retries", 2)
+    qsize = _opt_int("dispatch_queue_size", 1000)
+    channels = []
+    if storage:
+        channels.append(_d.InboxChannel(storage, queue_size=qsize))
+    if GOTIFY_URL and APP_TOKEN:
+        channels.append(_d.GotifyChannel(GOTIFY_URL, APP_TOKEN, retries=retries, queue_size=qsize,
+                                         timeout=_opt_int("dispatch_gotify_timeout_seconds", 8)))
+    if bool(merged.get("push_ntfy_enabled", True)):
+        try:
+            channels.append(_d.NtfyChannel(retries=retries, queue_size=qsize,
+                                           timeout=_opt_int("dispatch_ntfy_timeout_seconds", 8)))
+        except Exception as e:
+            print(f"[bot] ntfy channel unavailable: {e}")
+    else:
+        print("[bot] NTFY fan-out disabled by config (push_ntfy_enabled=false via options.json)")
+    if bool(merged.get("push_smtp_enabled", True)):
+        smtp_host = str(merged.get("push_smtp_host") or os.getenv("SMTP_OUT_HOST", "")).strip()
+        smtp_user = str(merged.get("push_smtp_user") or os.getenv("SMTP_OUT_USER", "")).strip()
+        smtp_to   = str(merged.get("push_smtp_to") or os.getenv("SMTP_RECIPIENTS", smtp_user)).strip()
+        if smtp_host and smtp_to:
+            channels.append(_d.SmtpChannel(
+                smtp_host,
+                int(merged.get("push_smtp_port") or os.getenv("SMTP_OUT_PORT", "587")),
+                user=smtp_user,
+                password=str(merged.get("push_smtp_pass") or os.getenv("SMTP_OUT_PASS", "")).strip(),
+                to=[smtp_to],
+                sender=smtp_user or "jarvis@localhost",
+                retries=retries,
+                queue_size=qsize,
+                timeout=_opt_int("dispatch_smtp_timeout_seconds", 15),
+                digest_window=_opt_int("push_smtp_digest_window_seconds", 0),
+                digest_max_batch=_opt_int("push_smtp_digest_max_batch", 50),
+                digest_bypass_priority=_opt_int("push_smtp_digest_bypass_priority", 8),
+                digest_subject_prefix=f"{BOT_ICON} {BOT_NAME}",
+            ))
+        else:
+            print("[bot] SMTP fan-out skipped: missing host or recipients")
+    else:
+        print("[bot] SMTP fan-out disabled by config (push_smtp_enabled=false via options.json)")
+    return _d, _d.Dispatcher(channels)
+
+_dispatch_mod, _dispatcher = _build_dispatcher()
+
+def _stop_dispatcher():
+    if _dispatcher is not None:
+        _dispatcher.stop(timeout=10)
+atexit.register(_stop_dispatcher)
+
 # ============================
 # Gotify helpers (output)
 # ============================
@@ -491,6 +557,22 @@ def send_message(title, message, priority=5, extras=None, decorate=True):
         except Exception:
             pass
 
+    if _dispatcher is not None:
+        try:
+            _dispatcher.submit(_dispatch_mod.Notification(
+                title=f"{BOT_ICON} {BOT_NAME}: {title}",
+                message=message or "",
+                priority=int(priority),
+                extras=extras,
+                inbox_title=orig_title or "Notification",
+            ))
+            return True
+        except Exception as e:
+            print(f"[bot] dispatcher submit failed, falling back to direct fan-out: {e}")
+    return _send_direct(title, orig_title, message, priority, extras)
+
+def _send_direct(title, orig_title, message, priority, extras):
+    """Legacy serial fan-out, used only when the dispatcher is unavailable."""
     if GOTIFY_URL and APP_TOKEN:
         url = f"{GOTIFY_URL}/message?token={APP_TOKEN}"
         payload = {"title": f"{BOT_ICON} {BOT_NAME}: {title}", "message": message or "", "priority": priority}
@@ -624,7 +706,11 @@ def _footer(used_llm: bool, used_beautify: bool) -> str:
     if not tags: tags.append("Relay Path")
     return "— " + " · ".join(tags)
 
-def _llm_then_beautify(title: str, message: str):
+def _wants_fresh_render(extras) -> bool:
+    """Incoming extras {"bypass_cache": true}: render this message without the decoration cache"""
+    return isinstance(extras, dict) and extras.get("bypass_cache") is True
+
+def _llm_then_beautify(title: str, message: str, bypass_cache: bool = False, source: str = ""):
     # Reflect LLM state in footer tag
     used_llm = bool(merged.get("llm_enabled")) or bool(merged.get("llm_rewrite_enabled")) or LLM_REWRITE_ENABLED
     used_beautify = True if _beautify else False
@@ -648,7 +734,10 @@ def _llm_then_beautify(title: str, message: str):
                 final,
                 mood=ACTIVE_PERSONA,
                 persona=ACTIVE_PERSONA,
-                persona_quip=True
+                persona_quip=True,
+                source_hint=source,
+                # only the flag: other incoming extras would leak into the output and the fingerprint
+                extras_in={"bypass_cache": True} if bypass_cache else None
             )
     except Exception as e:
         print(f"[bot] Beautify failed: {e}")
@@ -930,6 +1019,7 @@ def _handle_command(ncmd: str) -> bool:
 # ============================
 _recent_hashes: dict = {}
 _RECENT_TTL = 90
+_recent_lock = threading.Lock()
 
 def _gc_recent():
     now = time.time()
@@ -938,11 +1028,13 @@ def _gc_recent():
             _recent_hashes.pop(k, None)
 
 def _seen_recent(title: str, body: str, source: str, orig_id: Optional[str]) -> bool:
-    _gc_recent()
     h = hashlib.sha256(f"{source}|{orig_id}|{title}|{body}".encode("utf-8")).hexdigest()
-    if h in _recent_hashes:
-        return True
-    _recent_hashes[h] = time.time() + _RECENT_TTL
+    # intake workers run in parallel; check-and-set must be atomic
+    with _recent_lock:
+        _gc_recent()
+        if h in _recent_hashes:
+            return True
+        _recent_hashes[h] = time.time() + _RECENT_TTL
     return False
 
 # --- ADDITIVE: Chat/Talk wakeword routing (case-insensitive, works in title or body) ---
@@ -1013,7 +1105,8 @@ def _route_chat_freeform(source: str, query: str) -> bool:
     return True
 # --- end additive ---
 
-def _process_incoming(title: str, body: str, source: str = "intake", original_id: Optional[str] = None, priority: int = 5):
+def _process_incoming(title: str, body: str, source: str = "intake", original_id: Optional[str] = None, priority: int = 5,
+                      bypass_cache: bool = False):
     if _seen_recent(title or "", body or "", source, original_id or ""):
         return
 
@@ -1081,8 +1174,12 @@ def _process_incoming(title: str, body: str, source: str = "intake", original_id
             pass
         return
 
-    final, extras, used_llm, used_beautify = _llm_then_beautify(title or "Notification", body or "")
+    t0 = time.perf_counter()
+    final, extras, used_llm, used_beautify = _llm_then_beautify(title or "Notification", body or "", bypass_cache=bypass_cache, source=source)
+    t1 = time.perf_counter()
+    _intake_stage("beautify", t1 - t0)
     send_message(title or "Notification", final, priority=priority, extras=extras)
+    _intake_stage("fanout", time.perf_counter() - t1)
 
     try:
         if source == "gotify" and original_id:
@@ -1090,6 +1187,129 @@ def _process_incoming(title: str, body: str, source: str = "intake", original_id
     except Exception:
         pass
 # ============================
+# Intake pipeline (bounded queue + worker pool)
+# ============================
+# Every intake (Gotify stream, /internal/emit) only enqueues. A fixed pool of
+# consumers drains the queue and runs _process_incoming (LLM, beautify, fan-out)
+# on worker threads so the event loop never waits on a slow stage.
+INTAKE_QUEUE_SIZE = max(1, _opt_int("intake_queue_size", 500))
+# intake_workers: 1 (default) keeps delivery strictly FIFO, as before the queue
+# existed. More workers raise throughput when the LLM rewrite is slow, but a
+# message can then overtake an earlier one (e.g. an "UP" delivered before the
+# "DOWN" still being rewritten) — only raise it if ordering doesn't matter.
+INTAKE_WORKERS = max(1, _opt_int("intake_workers", 1))
+# block       → intake waits for a free slot (backpressure to the sender; default,
+#               nothing is ever dropped)
+# drop_oldest → evict the oldest queued item to admit the new one
+# drop_newest → reject the new item
+INTAKE_SHED_POLICY = str(merged.get("intake_shed_policy", "block")).strip().lower()
+if INTAKE_SHED_POLICY not in ("block", "drop_oldest", "drop_newest"):
+    INTAKE_SHED_POLICY = "block"
+
+_intake_queue: Optional[asyncio.Queue] = None
+_intake_executor = ThreadPoolExecutor(max_workers=INTAKE_WORKERS, thread_name_prefix="intake")
+_intake_lock = threading.Lock()
+_intake_counters = {"enqueued": 0, "processed": 0, "failed": 0, "shed": 0}
+_intake_stages: dict = {}
+
+def _intake_count(key: str, n: int = 1):
+    with _intake_lock:
+        _intake_counters[key] = _intake_counters.get(key, 0) + n
+
+def _intake_stage(stage: str, seconds: float):
+    ms = seconds * 1000.0
+    with _intake_lock:
+        st = _intake_stages.setdefault(stage, {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0})
+        st["count"] += 1
+        st["total_ms"] += ms
+        st["last_ms"] = ms
+        if ms > st["max_ms"]:
+            st["max_ms"] = ms
+
+# Per-stage beautify timings show up next to the intake stages in /internal/stats
+if _beautify and hasattr(_beautify, "set_stage_hook"):
+    _beautify.set_stage_hook(lambda name, seconds: _intake_stage(f"beautify.{name}", seconds))
+
+def intake_stats() -> dict:
+    with _intake_lock:
+        stages = {
+            k: {
+                "count": v["count"],
+                "avg_ms": round(v["total_ms"] / v["count"], 3) if v["count"] else 0.0,
+                "max_ms": round(v["max_ms"], 3),
+                "last_ms": round(v["last_ms"], 3),
+            }
+            for k, v in _intake_stages.items()
+        }
+        counters = dict(_intake_counters)
+    return {
+        "queue_depth": _intake_queue.qsize() if _intake_queue else 0,
+        "queue_size": INTAKE_QUEUE_SIZE,
+        "workers": INTAKE_WORKERS,
+        "shed_policy": INTAKE_SHED_POLICY,
+        **counters,
+        "stages": stages,
+    }
+
+async def enqueue_incoming(title: str, body: str, source: str = "intake", original_id: Optional[str] = None, priority: int = 5,
+                           bypass_cache: bool = False) -> bool:
+    """Hand a message to the intake pipeline. Returns False if it was shed."""
+    item = (time.perf_counter(), title, body, source, original_id, priority, bypass_cache)
+    q = _intake_queue
+    if q is None:
+        # pipeline not running (e.g. imported by another module) — process off-loop directly
+        await asyncio.get_running_loop().run_in_executor(_intake_executor, _process_incoming, *item[1:])
+        return True
+    if INTAKE_SHED_POLICY == "block":
+        await q.put(item)
+    else:
+        try:
+            q.put_nowait(item)
+        except asyncio.QueueFull:
+            if INTAKE_SHED_POLICY == "drop_newest":
+                _intake_count("shed")
+                print(f"[bot] intake queue full ({INTAKE_QUEUE_SIZE}); dropped new '{title}' from {source}")
+                return False
+            try:
+                old = q.get_nowait()
+                q.task_done()
+                _intake_count("shed")
+                print(f"[bot] intake queue full ({INTAKE_QUEUE_SIZE}); dropped oldest '{old[1]}' from {old[3]}")
+            except asyncio.QueueEmpty:
+                pass
+            q.put_nowait(item)
+    _intake_count("enqueued")
+    return True
+
+async def _intake_worker(n: int):
+    loop = asyncio.get_running_loop()
+    q = _intake_queue
+    while True:
+        item = await q.get()
+        t_enq, title, body, source, original_id, priority, bypass_cache = item
+        t0 = time.perf_counter()
+        _intake_stage("queue_wait", t0 - t_enq)
+        try:
+            await loop.run_in_executor(_intake_executor, _process_incoming, title, body, source, original_id, priority,
+                                       bypass_cache)
+            _intake_count("processed")
+        except Exception as e:
+            _intake_count("failed")
+            print(f"[bot] intake worker {n} error: {e}")
+        finally:
+            _intake_stage("process", time.perf_counter() - t0)
+            q.task_done()
+
+def _start_intake_pipeline():
+    global _intake_queue
+    if _intake_queue is not None:
+        return
+    _intake_queue = asyncio.Queue(maxsize=INTAKE_QUEUE_SIZE)
+    for n in range(INTAKE_WORKERS):
+        asyncio.create_task(_intake_worker(n))
+    print(f"[bot] intake pipeline started: workers={INTAKE_WORKERS} queue={INTAKE_QUEUE_SIZE} policy={INTAKE_SHED_POLICY}"
+          + (" (parallel: delivery order not guaranteed)" if INTAKE_WORKERS > 1 else ""))
+# ============================
 # Gotify WebSocket intake
 # ============================
 async def listen_gotify():
@@ -1109,12 +1329,13 @@ async def listen_gotify():
                         msg_id = data.get("id")
                         title = data.get("title") or ""
                         message = data.get("message") or ""
-                        _process_incoming(
+                        await enqueue_incoming(
                             title,
                             message,
                             source="gotify",
                             original_id=str(msg_id),
-                            priority=int(data.get("priority", 5))
+                            priority=int(data.get("priority", 5)),
+                            bypass_cache=_wants_fresh_render(data.get("extras"))
                         )
                     except Exception as ie:
                         print(f"[bot] gotify intake msg err: {ie}")
@@ -1293,12 +1514,28 @@ async def _internal_emit(request):
     source = str(data.get("source") or "internal")
     oid = str(data.get("id") or "")
     try:
-        _process_incoming(title, body, source=source, original_id=oid, priority=prio)
-        return web.json_response({"ok": True})
+        queued = await enqueue_incoming(title, body, source=source, original_id=oid, priority=prio,
+                                        bypass_cache=_wants_fresh_render(data.get("extras")))
+        if not queued:
+            return web.json_response({"ok": False, "error": "intake queue full"}, status=503)
+        return web.json_response({"ok": True, "queued": True})
     except Exception as e:
         print(f"[bot] internal emit error: {e}")
         return web.json_response({"ok": False, "error": str(e)}, status=500)
 
+async def _internal_stats(request):
+    data = {"intake": intake_stats()}
+    if _dispatcher is not None:
+        data["dispatch"] = _dispatcher.stats()
+    if _beautify and hasattr(_beautify, "decoration_cache_stats"):
+        data["decorate_cache"] = _beautify.decoration_cache_stats()
+    try:
+        import options_store
+        data["options"] = options_store.stats()
+    except Exception:
+        pass
+    return web.json_response(data)
+
 async def _start_internal_server():
     if web is None:
         print("[bot] aiohttp not available; internal server disabled")
@@ -1307,11 +1544,12 @@ async def _start_internal_server():
         app = web.Application()
         app.router.add_post("/internal/wake", _internal_wake)
         app.router.add_post("/internal/emit", _internal_emit)
+        app.router.add_get("/internal/stats", _internal_stats)
         runner = web.AppRunner(app)
         await runner.setup()
         site = web.TCPSite(runner, "127.0.0.1", 2599)
         await site.start()
-        print("[bot] internal server listening on 127.0.0.1:2599 (/internal/wake, /internal/emit)")
+        print("[bot] internal server listening on 127.0.0.1:2599 (/internal/wake, /internal/emit, /internal/stats)")
     except Exception as e:
         print(f"[bot] failed to start internal server: {e}")
 # ============================
@@ -1365,6 +1603,7 @@ def main():
     asyncio.run(_run_forever())
 
 async def _run_forever():
+    _start_intake_pipeline()
     try:
         asyncio.create_task(_start_internal_server())
     except Exception:
@@ -0,0 +1,699 @@
+#!/usr/bin/env python3
+# /app/dispatcher.py
+#
+# Jarvis Prime — outbound fan-out dispatcher
+#
+# send_message() decorates a notification and hands it to the dispatcher, which
+# owns one asyncio worker per channel (inbox, Gotify, ntfy, SMTP) on a dedicated
+# event-loop thread. Channels deliver in parallel over pooled connections:
+#   - Gotify + ntfy share one aiohttp ClientSession (keep-alive connector)
+#   - SMTP keeps one long-lived connection that reconnects lazily
+#   - inbox writes go through storage.save_message on a single writer thread
+# Each channel has its own timeout, retry budget (jittered exponential backoff)
+# and throughput/latency counters, so one slow relay never delays the others.
+#
+# Benchmark against local stand-ins:  python3 dispatcher.py --bench 200
+
+from __future__ import annotations
+import asyncio
+import html
+import random
+import smtplib
+import ssl
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import aiohttp
+except Exception:
+    aiohttp = None
+
+# ============================
+# Notification + metrics
+# ============================
+@dataclass
+class Notification:
+    title: str                       # display title, already prefixed with bot icon/name
+    message: str
+    priority: int = 5
+    extras: Optional[Dict[str, Any]] = None
+    inbox_title: str = ""            # un-prefixed title stored in the inbox
+    created_at: int = field(default_factory=lambda: int(time.time()))
+    queued_at: float = field(default_factory=time.perf_counter)
+    # Gotify result recorded on the inbox row, as the serial path did:
+    # HTTP status, 0 on error, -1 when Gotify isn't configured (None = in flight)
+    status: Optional[int] = None
+    inbox_id: Optional[int] = None
+
+class ChannelStats:
+    def __init__(self):
+        self.sent = 0
+        self.failed = 0
+        self.retries = 0
+        self.dropped = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.last_error = ""
+        self.started = time.time()
+
+    def record(self, ms: float):
+        self.sent += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def snapshot(self) -> Dict[str, Any]:
+        elapsed = max(1e-6, time.time() - self.started)
+        return {
+            "sent": self.sent,
+            "failed": self.failed,
+            "retries": self.retries,
+            "dropped": self.dropped,
+            "avg_ms": round(self.total_ms / self.sent, 3) if self.sent else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "per_min": round(self.sent * 60.0 / elapsed, 2),
+            "last_error": self.last_error,
+        }
+
+def _backoff(attempt: int, base: float = 0.5, cap: float = 10.0) -> float:
+    """Full-jitter exponential backoff."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+# ============================
+# Channels
+# ============================
+class Channel:
+    name = "channel"
+    # Sends that run on a worker thread can't be cancelled by wait_for: the thread
+    # would finish the send anyway and the retry would deliver it twice. Such
+    # channels rely on their own (socket/DB) timeouts instead.
+    executor_backed = False
+
+    def __init__(self, timeout: float = 8.0, retries: int = 2, queue_size: int = 1000):
+        self.timeout = float(timeout)
+        self.retries = max(0, int(retries))
+        self.queue_size = max(1, int(queue_size))
+        self.queue: Optional[asyncio.Queue] = None
+        self.stats = ChannelStats()
+        self.dispatcher: Optional["Dispatcher"] = None
+
+    async def open(self, dispatcher: "Dispatcher"):
+        self.dispatcher = dispatcher
+
+    async def close(self):
+        pass
+
+    def accepts(self, note: Notification) -> bool:
+        return True
+
+    async def deliver(self, note: Notification):
+        raise NotImplementedError
+
+    async def handle(self, note: Notification):
+        await self.deliver_with_retry(note)
+
+    def extra_stats(self) -> Dict[str, Any]:
+        return {}
+
+    def offer(self, note: Notification):
+        # runs on the dispatcher loop (via call_soon_threadsafe)
+        if not self.accepts(note):
+            return
+        try:
+            self.queue.put_nowait(note)
+        except asyncio.QueueFull:
+            self.stats.dropped += 1
+            print(f"[dispatch] {self.name} queue full ({self.queue_size}); dropped '{note.title}'")
+
+    async def deliver_with_retry(self, note, send: Optional[Callable] = None):
+        send = send or self.deliver
+        for attempt in range(self.retries + 1):
+            t0 = time.perf_counter()
+            try:
+                if self.executor_backed:
+                    await send(note)
+                else:
+                    await asyncio.wait_for(send(note), timeout=self.timeout)
+                self.stats.record((time.perf_counter() - t0) * 1000.0)
+                return True
+            except Exception as e:
+                err = str(e) or e.__class__.__name__
+                self.stats.last_error = err
+                if attempt < self.retries:
+                    self.stats.retries += 1
+                    await asyncio.sleep(_backoff(attempt))
+                    continue
+                self.stats.failed += 1
+                print(f"[dispatch] {self.name} delivery failed after {attempt + 1} attempt(s): {err}")
+        return False
+
+    async def run(self):
+        while True:
+            note = await self.queue.get()
+            try:
+                await self.handle(note)
+            except Exception as e:
+                print(f"[dispatch] {self.name} worker error: {e}")
+            finally:
+                self.queue.task_done()
+
+class InboxChannel(Channel):
+    """Persists outbound notifications into the SQLite inbox (storage.save_message)."""
+    name = "inbox"
+    executor_backed = True
+
+    def __init__(self, storage, **kw):
+        kw.setdefault("retries", 1)
+        super().__init__(**kw)
+        self.storage = storage
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # single writer thread keeps SQLite writes serialized and off the loop
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dispatch-inbox")
+
+    async def open(self, dispatcher: "Dispatcher"):
+        await super().open(dispatcher)
+        self._loop = asyncio.get_running_loop()
+
+    async def deliver(self, note: Notification):
+        loop = asyncio.get_running_loop()
+        if note.status is None and not any(isinstance(c, GotifyChannel) for c in self.dispatcher.channels):
+            note.status = -1
+        if getattr(self.storage, "is_group_commit", lambda: False)():
+            # write-behind buffer batches the insert; don't serialize on each flush.
+            # Still off the loop: submit_message blocks while the ring buffer is full.
+            fut = await loop.run_in_executor(self._executor, self._save, note, self.storage.submit_message)
+
+            def _committed(f):
+                if f.exception() is None:
+                    loop.call_soon_threadsafe(self._saved, note, int(f.result()))
+            fut.add_done_callback(_committed)
+            return
+        self._saved(note, await loop.run_in_executor(self._executor, self._save, note))
+
+    def _save(self, note: Notification, writer: Optional[Callable] = None):
+        # Rows are written without waiting for Gotify; a "pending" status is
+        # replaced by record_status() once the Gotify channel has finished
+        return (writer or self.storage.save_message)(
+            title=note.inbox_title or note.title or "Notification",
+            body=note.message or "",
+            source="jarvis_out",
+            priority=int(note.priority),
+            extras={"extras": note.extras or {}, "status": "pending" if note.status is None else note.status},
+            created_at=note.created_at,
+        )
+
+    def _saved(self, note: Notification, mid: int):
+        # loop thread only, like record_status(): whichever of the two runs last patches the row
+        note.inbox_id = mid
+        if note.status is not None:
+            self.record_status(note)
+
+    def record_status(self, note: Notification):
+        """Write note.status onto its inbox row once both are known (dispatcher loop only)."""
+        update = getattr(self.storage, "update_extras", None)
+        if note.inbox_id is None or note.status is None or update is None:
+            return
+        try:
+            fut = self._loop.run_in_executor(self._executor, lambda: update(note.inbox_id, status=note.status))
+        except RuntimeError:  # channel already closed
+            return
+
+        def _done(f):
+            if f.exception() is not None:
+                print(f"[dispatch] inbox status update failed: {f.exception()}")
+        fut.add_done_callback(_done)
+
+    async def close(self):
+        self._executor.shutdown(wait=True)
+
+class GotifyChannel(Channel):
+    name = "gotify"
+
+    def __init__(self, url: str, token: str, **kw):
+        super().__init__(**kw)
+        self.url = f"{url.rstrip('/')}/message?token={token}"
+
+    async def deliver(self, note: Notification):
+        payload = {"title": note.title, "message": note.message or "", "priority": int(note.priority)}
+        if note.extras:
+            payload["extras"] = note.extras
+        async with self.dispatcher.session.post(self.url, json=payload) as r:
+            r.raise_for_status()
+            await r.read()
+            note.status = r.status
+
+    async def handle(self, note: Notification):
+        if not await self.deliver_with_retry(note):
+            note.status = 0
+        for ch in self.dispatcher.channels:
+            if isinstance(ch, InboxChannel):
+                ch.record_status(note)
+
+class NtfyChannel(Channel):
+    name = "ntfy"
+
+    def __init__(self, tags: str = "jarvis", **kw):
+        super().__init__(**kw)
+        self.tags = tags
+        import ntfy_client  # /app/ntfy_client.py — header sanitising + config
+        self._ntfy = ntfy_client
+
+    def accepts(self, note: Notification) -> bool:
+        return self._ntfy.is_enabled()
+
+    async def deliver(self, note: Notification):
+        url, headers, data, auth = self._ntfy.build_request(
+            note.title, note.message or "", tags=self.tags, priority=note.priority
+        )
+        basic = aiohttp.BasicAuth(auth[0], auth[1]) if auth else None
+        async with self.dispatcher.session.post(url, headers=headers, data=data, auth=basic) as r:
+            r.raise_for_status()
+            await r.read()
+
+class SmtpChannel(Channel):
+    """
+    Outbound mail over one long-lived SMTP connection. The connection is opened on
+    first use, probed with NOOP after it has been idle, and re-established lazily
+    when the relay drops it.
+
+    With digest_window > 0 messages are coalesced per priority band ("low" <= 3,
+    "normal" below digest_bypass_priority) and sent as one multipart digest when
+    the band's window expires or it reaches digest_max_batch. Messages at or above
+    digest_bypass_priority are always mailed immediately.
+    """
+    name = "smtp"
+    executor_backed = True  # smtplib's socket timeout bounds each connect/STARTTLS/login/sendmail step
+    IDLE_PROBE_SECONDS = 60
+
+    def __init__(self, host: str, port: int = 587, user: str = "", password: str = "",
+                 to: Optional[List[str]] = None, sender: str = "",
+                 digest_window: float = 0.0, digest_max_batch: int = 50,
+                 digest_bypass_priority: int = 8, digest_subject_prefix: str = "", **kw):
+        kw.setdefault("timeout", 15.0)
+        super().__init__(**kw)
+        self.host = host
+        self.port = int(port)
+        self.user = user
+        self.password = password
+        self.to = [t for t in (to or []) if t]
+        self.sender = sender or user or "jarvis@localhost"
+        self._conn: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self.connects = 0
+        self.digest_window = max(0.0, float(digest_window))
+        self.digest_max_batch = max(1, int(digest_max_batch))
+        self.digest_bypass_priority = int(digest_bypass_priority)
+        self.digest_subject_prefix = digest_subject_prefix
+        self.digests = 0
+        self._buckets: Dict[str, List[Notification]] = {}
+        self._bucket_started: Dict[str, float] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+        # smtplib is blocking and not thread-safe: one thread owns the connection
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dispatch-smtp")
+
+    def _connect(self) -> smtplib.SMTP:
+        if self.port == 465:
+            s = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout, context=ssl.create_default_context())
+        else:
+            s = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            try:
+                s.starttls()
+            except Exception:
+                pass
+        if self.user:
+            try:
+                s.login(self.user, self.password)
+            except Exception as e:
+                print(f"[dispatch] smtp login failed: {e}")
+        self.connects += 1
+        return s
+
+    def _drop(self):
+        if self._conn is not None:
+            try:
+                self._conn.quit()
+            except Exception:
+                try:
+                    self._conn.close()
+                except Exception:
+                    pass
+        self._conn = None
+
+    def _ensure_conn(self) -> smtplib.SMTP:
+        if self._conn is not None and (time.time() - self._last_used) > self.IDLE_PROBE_SECONDS:
+            try:
+                if self._conn.noop()[0] != 250:
+                    self._drop()
+            except Exception:
+                self._drop()
+        if self._conn is None:
+            self._conn = self._connect()
+        return self._conn
+
+    def send_raw(self, subject: str, msg) -> None:
+        """Send a prepared email.message object on the pooled connection (connection thread only)."""
+        msg["Subject"] = subject
+        msg["From"] = self.sender
+        msg["To"] = ", ".join(self.to)
+        raw = msg.as_string()
+        for attempt in (0, 1):
+            conn = self._ensure_conn()
+            try:
+                conn.sendmail(self.sender, self.to, raw)
+                self._last_used = time.time()
+                return
+            except (smtplib.SMTPServerDisconnected, smtplib.SMTPHeloError, ConnectionError, OSError):
+                # stale pooled connection — reconnect once, then let retry/backoff handle it
+                self._drop()
+                if attempt:
+                    raise
+
+    def _send(self, note: Notification):
+        self.send_raw(note.title, MIMEText(note.message or "", _charset="utf-8"))
+
+    # ---- digest batching ----
+    def _band(self, priority: int) -> str:
+        return "low" if priority <= 3 else "normal"
+
+    def _send_digest(self, batch: List[Notification]):
+        band = self._band(batch[0].priority)
+        text_parts, html_parts = [], []
+        for n in batch:
+            stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(n.created_at))
+            text_parts.append(f"[{stamp}] {n.title} (priority {n.priority})\n{n.message or ''}".rstrip())
+            html_parts.append(
+                f"<h3 style=\"margin:16px 0 4px\">{html.escape(n.title)}</h3>"
+                f"<div style=\"color:#888;font-size:12px\">{stamp} · priority {n.priority}</div>"
+                f"<pre style=\"white-space:pre-wrap;font-family:inherit\">{html.escape(n.message or '')}</pre>"
+            )
+        msg = MIMEMultipart("alternative")
+        msg.attach(MIMEText(("\n\n" + "-" * 40 + "\n\n").join(text_parts), "plain", "utf-8"))
+        msg.attach(MIMEText("<hr>".join(html_parts), "html", "utf-8"))
+        prefix = f"{self.digest_subject_prefix}: " if self.digest_subject_prefix else ""
+        self.send_raw(f"{prefix}Digest — {len(batch)} notifications ({band})", msg)
+
+    async def _deliver_digest(self, batch: List[Notification]):
+        await self.run_blocking(self._send_digest, batch)
+        self.digests += 1
+
+    async def _flush(self, band: str):
+        batch = self._buckets.pop(band, None)
+        self._bucket_started.pop(band, None)
+        if not batch:
+            return
+        if len(batch) == 1:
+            await self.deliver_with_retry(batch[0])
+        else:
+            await self.deliver_with_retry(batch, self._deliver_digest)
+
+    async def _flush_loop(self):
+        tick = max(0.25, min(5.0, self.digest_window / 4))
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=tick)
+                return
+            except asyncio.TimeoutError:
+                pass
+            now = time.monotonic()
+            for band, started in list(self._bucket_started.items()):
+                if now - started >= self.digest_window:
+                    try:
+                        await self._flush(band)
+                    except Exception as e:
+                        print(f"[dispatch] smtp digest flush error: {e}")
+
+    async def handle(self, note: Notification):
+        if self.digest_window <= 0 or int(note.priority) >= self.digest_bypass_priority:
+            await self.deliver_with_retry(note)
+            return
+        band = self._band(int(note.priority))
+        bucket = self._buckets.setdefault(band, [])
+        if not bucket:
+            self._bucket_started[band] = time.monotonic()
+        bucket.append(note)
+        if len(bucket) >= self.digest_max_batch:
+            await self._flush(band)
+
+    async def open(self, dispatcher: "Dispatcher"):
+        await super().open(dispatcher)
+        if self.digest_window > 0:
+            self._stopping = asyncio.Event()
+            self._flusher = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    def extra_stats(self) -> Dict[str, Any]:
+        return {
+            "connects": self.connects,
+            "digests": self.digests,
+            "batched_pending": sum(len(b) for b in self._buckets.values()),
+        }
+
+    def accepts(self, note: Notification) -> bool:
+        return bool(self.host and self.to)
+
+    async def run_blocking(self, fn: Callable, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    async def deliver(self, note: Notification):
+        await self.run_blocking(self._send, note)
+
+    async def close(self):
+        if self._flusher is not None:
+            # Let a flush already in progress (mid-send or in retry backoff) finish:
+            # cancelling it would lose the batch it has popped, or mail it twice
+            self._stopping.set()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+        for band in list(self._buckets):
+            await self._flush(band)
+        try:
+            await self.run_blocking(self._drop)
+        finally:
+            self._executor.shutdown(wait=False)
+
+# ============================
+# Dispatcher
+# ============================
+class Dispatcher:
+    """
+    Owns a private event loop thread, the shared HTTP session and one worker task
+    per channel. submit() is thread-safe and never blocks the caller.
+    """
+
+    def __init__(self, channels: List[Channel], http_limit: int = 20, http_keepalive: float = 60.0):
+        self.channels = list(channels)
+        self.http_limit = int(http_limit)
+        self.http_keepalive = float(http_keepalive)
+        self.session = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+        self._running = False
+        self._lock = threading.Lock()
+        self._tasks: List[asyncio.Task] = []
+        self.submitted = 0
+
+    # ---- lifecycle ----
+    def start(self):
+        with self._lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run_loop, name="dispatcher", daemon=True)
+            self._thread.start()
+        self._ready.wait(timeout=10)
+
+    def _run_loop(self):
+        loop = asyncio.new_event_loop()
+        self._loop = loop
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._open())
+        except Exception as e:
+            print(f"[dispatch] failed to start, falling back to direct sends: {e}")
+            if self.session is not None:
+                try:
+                    loop.run_until_complete(self.session.close())
+                except Exception:
+                    pass
+            loop.close()
+            self._ready.set()
+            return
+        self._running = True
+        self._ready.set()
+        try:
+            loop.run_forever()
+        finally:
+            self._running = False
+            loop.close()
+
+    async def _open(self):
+        if aiohttp is not None:
+            connector = aiohttp.TCPConnector(limit=self.http_limit, keepalive_timeout=self.http_keepalive, ttl_dns_cache=300)
+            self.session = aiohttp.ClientSession(connector=connector)
+        for ch in list(self.channels):
+            if self.session is None and isinstance(ch, (GotifyChannel, NtfyChannel)):
+                print(f"[dispatch] aiohttp unavailable; {ch.name} channel disabled")
+                self.channels.remove(ch)
+                continue
+            ch.queue = asyncio.Queue(maxsize=ch.queue_size)
+            await ch.open(self)
+            self._tasks.append(asyncio.get_running_loop().create_task(ch.run()))
+        print(f"[dispatch] started channels: {', '.join(c.name for c in self.channels) or 'none'}")
+
+    async def _drain(self, timeout: float):
+        try:
+            await asyncio.wait_for(asyncio.gather(*(c.queue.join() for c in self.channels)), timeout=timeout)
+        except asyncio.TimeoutError:
+            print("[dispatch] drain timed out; pending notifications dropped")
+
+    async def _close(self):
+        for t in self._tasks:
+            t.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for ch in self.channels:
+            try:
+                await ch.close()
+            except Exception:
+                pass
+        if self.session is not None:
+            await self.session.close()
+
+    def wait_idle(self, timeout: float = 30.0):
+        """Block until every channel queue is empty (used by shutdown and the benchmark)."""
+        if not self._loop or not self._running:
+            return
+        fut = asyncio.run_coroutine_threadsafe(self._drain(timeout), self._loop)
+        fut.result(timeout + 1)
+
+    def stop(self, timeout: float = 10.0):
+        if not self._loop or not self._running:
+            return
+        try:
+            self.wait_idle(timeout)
+            asyncio.run_coroutine_threadsafe(self._close(), self._loop).result(timeout)
+        except Exception as e:
+            print(f"[dispatch] stop error: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+
+    # ---- intake ----
+    def submit(self, note: Notification):
+        """Queue note on every channel; raises RuntimeError when the loop isn't running so callers can send directly."""
+        if self._thread is None:
+            self.start()
+        if not self._running:
+            raise RuntimeError("dispatcher loop is not running")
+        self.submitted += 1
+        for ch in self.channels:
+            self._loop.call_soon_threadsafe(ch.offer, note)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "submitted": self.submitted,
+            "channels": {
+                c.name: {**c.stats.snapshot(), **c.extra_stats(), "queue_depth": c.queue.qsize() if c.queue else 0}
+                for c in self.channels
+            },
+        }
+
+# ============================
+# Benchmark (local stand-ins)
+# ============================
+def _bench(n: int = 200, delay_ms: int = 40):
+    """
+    Compare the legacy serial fan-out (requests + fresh SMTP login per message)
+    against the dispatcher, using local Gotify/ntfy HTTP stand-ins and an
+    aiosmtpd sink that each add `delay_ms` of latency.
+    """
+    import os
+    import socket
+    import requests
+    from aiohttp import web
+
+    def _free_port() -> int:
+        s = socket.socket()
+        s.bind(("127.0.0.1", 0))
+        p = s.getsockname()[1]
+        s.close()
+        return p
+
+    http_port, smtp_port = _free_port(), _free_port()
+
+    async def _slow_ok(request):
+        await request.read()
+        await asyncio.sleep(delay_ms / 1000.0)
+        return web.json_response({"id": 1})
+
+    def _serve_http():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        app = web.Application()
+        app.router.add_post("/message", _slow_ok)
+        app.router.add_post("/{topic}", _slow_ok)
+        runner = web.AppRunner(app)
+        loop.run_until_complete(runner.setup())
+        loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", http_port).start())
+        loop.run_forever()
+
+    threading.Thread(target=_serve_http, daemon=True).start()
+
+    from aiosmtpd.controller import Controller
+
+    class _Sink:
+        async def handle_DATA(self, server, session, envelope):
+            await asyncio.sleep(delay_ms / 1000.0)
+            return "250 OK"
+
+    smtpd = Controller(_Sink(), hostname="127.0.0.1", port=smtp_port)
+    smtpd.start()
+    time.sleep(0.3)
+
+    base = f"http://127.0.0.1:{http_port}"
+    os.environ["PUSH_NTFY_ENABLED"] = "true"
+    import ntfy_client
+    ntfy_client.NTFY_URL = base
+
+    # --- legacy serial path ---
+    t0 = time.perf_counter()
+    for i in range(n):
+        requests.post(f"{base}/message?token=x", json={"title": f"t{i}", "message": "m", "priority": 5}, timeout=8)
+        ntfy_client.publish(f"t{i}", "m", priority=5, tags="jarvis")
+        with smtplib.SMTP("127.0.0.1", smtp_port, timeout=8) as s:
+            s.sendmail("a@b", ["c@d"], MIMEText("m").as_string())
+    legacy = time.perf_counter() - t0
+
+    # --- dispatcher ---
+    d = Dispatcher([
+        GotifyChannel(base, "x"),
+        NtfyChannel(),
+        SmtpChannel("127.0.0.1", smtp_port, to=["c@d"], sender="a@b"),
+    ])
+    d.start()
+    t0 = time.perf_counter()
+    for i in range(n):
+        d.submit(Notification(title=f"t{i}", message="m"))
+    submit_ms = (time.perf_counter() - t0) * 1000.0
+    d.wait_idle(timeout=600)
+    pooled = time.perf_counter() - t0
+    smtp_connects = next((c.connects for c in d.channels if isinstance(c, SmtpChannel)), 0)
+    stats = d.stats()
+    d.stop()
+    smtpd.stop()
+
+    print(f"messages: {n}   stand-in latency: {delay_ms} ms per channel")
+    print(f"legacy serial : {legacy:8.2f} s  ({n / legacy:7.1f} msg/s)")
+    print(f"dispatcher    : {pooled:8.2f} s  ({n / pooled:7.1f} msg/s)   submit() total {submit_ms:.1f} ms")
+    print(f"smtp connections opened: {smtp_connects}")
+    for name, st in stats["channels"].items():
+        print(f"  {name:<7} sent={st['sent']} failed={st['failed']} avg={st['avg_ms']} ms max={st['max_ms']} ms")
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == "--bench":
+        _bench(int(sys.argv[2]) if len(sys.argv) > 2 else 200)
+    else:
+        print("usage: dispatcher.py --bench [N]")
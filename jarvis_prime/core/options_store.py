@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+# /app/options_store.py
+#
+# Jarvis Prime — shared add-on options
+#
+# One parsed copy of /data/options.json (or /data/config.json outside Home
+# Assistant) for every module. Reads return an immutable snapshot; the file is
+# re-checked at most once per OPTIONS_CHECK_SECONDS by stat (mtime/size/inode)
+# and only re-parsed when it changed. A half-written or unparsable file keeps
+# the last good snapshot instead of turning every option into its default.
+#
+# Modules that need to react to edits subscribe with a callback:
+#     options_store.subscribe(on_change, keys=("custom_aliases",))
+# and receive (changed_keys, snapshot) after each reload. A watcher thread
+# starts with the first subscription so events fire even when nobody reads.
+# Writers (EnviroGuard, persona switches) call invalidate() after saving so the
+# next read sees the new file immediately.
+#
+# The shared store reads the first file that exists. A module that layers
+# several files (rag: options.json, then config.json on top) builds its own
+# OptionsStore(paths, merge=True).
+#
+# Benchmark (1,000-message replay):  python3 options_store.py --bench 1000
+
+from __future__ import annotations
+import json
+import os
+import sys
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+try:
+    import yaml
+except Exception:
+    yaml = None
+
+OPTIONS_PATHS = [os.getenv("JARVIS_CONFIG_PATH")] if os.getenv("JARVIS_CONFIG_PATH") else \
+    ["/data/options.json", "/data/config.json"]
+OPTIONS_CHECK_SECONDS = float(os.getenv("OPTIONS_CHECK_SECONDS", "1.0") or 1.0)
+
+Listener = Callable[[frozenset, Mapping[str, Any]], None]
+
+
+def _parse(raw: str) -> Optional[Dict[str, Any]]:
+    try:
+        data = json.loads(raw)
+    except json.JSONDecodeError:
+        # Some HA setups hand over YAML
+        if yaml is None:
+            return None
+        try:
+            data = yaml.safe_load(raw)
+        except Exception:
+            return None
+    return data if isinstance(data, dict) else None
+
+
+class OptionsStore:
+    """
+    Snapshot of the first existing file in paths, or with merge=True of every
+    existing file layered in order (later files override earlier keys).
+    """
+
+    def __init__(self, paths: Iterable[str] = OPTIONS_PATHS, check_seconds: float = OPTIONS_CHECK_SECONDS,
+                 merge: bool = False):
+        self.paths = [p for p in paths if p]
+        self.check_seconds = check_seconds
+        self.merge = merge
+        self._lock = threading.Lock()
+        self._snapshot: Mapping[str, Any] = MappingProxyType({})
+        self._signature: Optional[Tuple] = None
+        self._checked = 0.0
+        self._listeners: List[Tuple[Listener, Optional[frozenset]]] = []
+        self._watcher: Optional[threading.Thread] = None
+        self.path: Optional[str] = None
+        self.version = 0
+        self.reloads = 0
+        self.parse_errors = 0
+
+    # ---------- reading ----------
+    def snapshot(self) -> Mapping[str, Any]:
+        """Current options as a read-only mapping (nested values must not be mutated)"""
+        if time.monotonic() - self._checked >= self.check_seconds:
+            self.refresh()
+        return self._snapshot
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.snapshot().get(key, default)
+
+    def load(self) -> Dict[str, Any]:
+        """A private, mutable deep copy for callers that edit and save options"""
+        return json.loads(json.dumps(dict(self.snapshot()), default=str))
+
+    def invalidate(self) -> None:
+        """Force the next read to re-check the file (call after writing it)"""
+        self._checked = 0.0
+
+    # ---------- reloading ----------
+    def _stat(self) -> Tuple[List[str], Optional[Tuple]]:
+        found: List[str] = []
+        sig: List[Tuple] = []
+        for path in self.paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            found.append(path)
+            sig.append((path, st.st_mtime_ns, st.st_size, st.st_ino))
+            if not self.merge:
+                break
+        return found, (tuple(sig) if sig else None)
+
+    def refresh(self) -> bool:
+        """Re-read the options file if it changed; returns True when a new snapshot was published"""
+        events: List[Tuple[Listener, frozenset]] = []
+        with self._lock:
+            self._checked = time.monotonic()
+            paths, signature = self._stat()
+            if signature == self._signature:
+                return False
+            data: Dict[str, Any] = {}
+            for path in paths:
+                try:
+                    with open(path, "r", encoding="utf-8") as f:
+                        part = _parse(f.read())
+                except Exception:
+                    part = None
+                if part is None:
+                    # Mid-write or broken: keep serving the last good snapshot, retry next check
+                    self.parse_errors += 1
+                    return False
+                data.update(part)
+            old = self._snapshot
+            new = MappingProxyType(data)
+            changed = frozenset(k for k in set(old) | set(new) if old.get(k) != new.get(k))
+            self._signature = signature
+            self.path = os.pathsep.join(paths) or None
+            self._snapshot = new
+            self.reloads += 1
+            if not changed:
+                return False
+            self.version += 1
+            events = [(fn, changed) for fn, keys in self._listeners if keys is None or keys & changed]
+        for fn, changed in events:
+            try:
+                fn(changed, new)
+            except Exception as e:
+                print(f"[options] listener {getattr(fn, '__name__', fn)} failed: {e}", flush=True)
+        return True
+
+    # ---------- change events ----------
+    def subscribe(self, fn: Listener, keys: Optional[Iterable[str]] = None) -> Callable[[], None]:
+        """Call fn(changed_keys, snapshot) when any of keys (or any key) changes; returns an unsubscribe"""
+        entry = (fn, frozenset(keys) if keys is not None else None)
+        with self._lock:
+            self._listeners.append(entry)
+        self.snapshot()
+        self._start_watcher()
+
+        def _unsubscribe():
+            with self._lock:
+                if entry in self._listeners:
+                    self._listeners.remove(entry)
+        return _unsubscribe
+
+    def _start_watcher(self) -> None:
+        if self._watcher is not None:
+            return
+        def _watch():
+            while True:
+                time.sleep(max(0.2, self.check_seconds))
+                if time.monotonic() - self._checked >= self.check_seconds:
+                    try:
+                        self.refresh()
+                    except Exception as e:
+                        print(f"[options] watcher error: {e}", flush=True)
+        self._watcher = threading.Thread(target=_watch, name="options-watch", daemon=True)
+        self._watcher.start()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "keys": len(self._snapshot),
+            "version": self.version,
+            "reloads": self.reloads,
+            "parse_errors": self.parse_errors,
+            "listeners": len(self._listeners),
+        }
+
+
+store = OptionsStore()
+
+# Module-level shortcuts
+snapshot = store.snapshot
+get = store.get
+load = store.load
+invalidate = store.invalidate
+subscribe = store.subscribe
+stats = store.stats
+
+
+# ============================
+# Benchmark
+# ============================
+def _bench(n: int = 1000, reads_per_message: int = 14):
+    """
+    Replay n messages against a copy of the add-on's default options: the
+    legacy path opens and parses the file on every option read (beautify's
+    toggles alone do ~10 per message), the store serves a snapshot. Then
+    measures how long an edit takes to reach a subscriber.
+    """
+    import tempfile
+    here = os.path.dirname(os.path.abspath(__file__))
+    options: Dict[str, Any] = {}
+    for candidate in (os.path.join(here, "config.json"), os.path.join(here, "..", "config.json")):
+        if os.path.exists(candidate):
+            with open(candidate, "r", encoding="utf-8") as f:
+                options = json.load(f).get("options", {})
+            break
+    tmp = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
+    json.dump(options, tmp, indent=2)
+    tmp.close()
+    print(f"[options] bench: {n} messages x {reads_per_message} option reads, "
+          f"{len(options)} keys / {os.path.getsize(tmp.name)} bytes")
+
+    t = time.perf_counter()
+    for _ in range(n):
+        for _ in range(reads_per_message):
+            with open(tmp.name, "r", encoding="utf-8") as f:
+                json.load(f).get("llm_enabled")
+    legacy = time.perf_counter() - t
+
+    bench_store = OptionsStore([tmp.name])
+    t = time.perf_counter()
+    for _ in range(n):
+        for _ in range(reads_per_message):
+            bench_store.snapshot().get("llm_enabled")
+    cached = time.perf_counter() - t
+    print(f"  open + parse per read  {legacy * 1000:9.1f} ms total  {legacy / n * 1e6:8.1f} us/msg")
+    print(f"  shared snapshot        {cached * 1000:9.1f} ms total  {cached / n * 1e6:8.1f} us/msg  "
+          f"({legacy / cached:.0f}x)")
+
+    got = threading.Event()
+    bench_store.subscribe(lambda changed, snap: got.set(), keys=("llm_enabled",))
+    options["llm_enabled"] = not options.get("llm_enabled", True)
+    with open(tmp.name, "w", encoding="utf-8") as f:
+        json.dump(options, f)
+    t = time.perf_counter()
+    got.wait(5)
+    print(f"  edit -> change event   {(time.perf_counter() - t) * 1000:9.1f} ms (watcher, {bench_store.check_seconds}s checks)")
+    os.unlink(tmp.name)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == "--bench":
+        _bench(int(sys.argv[2]) if len(sys.argv) > 2 else 1000)
+    else:
+        print(stats())
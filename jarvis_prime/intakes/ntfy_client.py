@@ -3,7 +3,12 @@
 
 from __future__ import annotations
 import os, json, requests, re, mimetypes
-from typing import Optional, Dict, Any, Union
+from typing import Optional, Dict, Any, Union, Tuple
+
+try:
+    import options_store  # shared, change-aware /data/options.json snapshot
+except Exception:
+    options_store = None
 
 # -----------------------------
 # Environment / Config
@@ -65,11 +70,13 @@ def _auth_headers() -> Dict[str, str]:
 # Read option flag directly
 # -----------------------------
 def _read_option_flag() -> bool:
-    """Read push_ntfy_enabled from /data/options.json when env var not exported."""
+    """Read push_ntfy_enabled from the options snapshot when env var not exported."""
     try:
         env_val = os.getenv("PUSH_NTFY_ENABLED")
         if env_val is not None:
             return env_val.lower() not in ("false", "0", "no")
+        if options_store is not None:
+            return bool(options_store.get("push_ntfy_enabled", True))
         with open("/data/options.json", "r") as f:
             cfg = json.load(f)
         val = cfg.get("push_ntfy_enabled", True)
@@ -119,7 +126,7 @@ def _auto_attach(path_or_url: Optional[str]) -> Optional[str]:
 # -----------------------------
 # Publish
 # -----------------------------
-def publish(
+def build_request(
     title: str,
     message: str,
     *,
@@ -128,18 +135,8 @@ def publish(
     tags: Optional[str] = None,
     priority: Optional[int] = None,
     attach: Optional[str] = None
-) -> Dict[str, Any]:
-    """Publish safely to ntfy (UTF-8 body, Latin-1 headers, image auto-attach)."""
-
-    # 🔒 Config-aware disable guard
-    if not _read_option_flag():
-        print("[ntfy] disabled by config (push_ntfy_enabled=false via options.json)")
-        return {"status": "disabled"}
-
-    if not NTFY_URL:
-        print("[ntfy] disabled (no ntfy_url set)")
-        return {"status": "disabled"}
-
+) -> Tuple[str, Dict[str, str], bytes, Optional[Tuple[str, str]]]:
+    """Build (url, headers, body, basic_auth) for a publish; shared by the sync and pooled async senders."""
     base = NTFY_URL or "https://ntfy.sh"
     t = topic or (NTFY_TOPIC or "jarvis")
     url = f"{base}/{t}"
@@ -168,14 +165,44 @@ def publish(
     for k, v in list(headers.items()):
         headers[k] = _safe_header(v)
 
-    data = _safe_body_bytes(message)
+    auth = (NTFY_USER, NTFY_PASS) if (NTFY_USER or NTFY_PASS) else None
+    return url, headers, _safe_body_bytes(message), auth
+
+def is_enabled() -> bool:
+    """True when ntfy fan-out is both enabled by config and has a target URL."""
+    return _read_option_flag() and bool(NTFY_URL)
+
+def publish(
+    title: str,
+    message: str,
+    *,
+    topic: Optional[str] = None,
+    click: Optional[str] = None,
+    tags: Optional[str] = None,
+    priority: Optional[int] = None,
+    attach: Optional[str] = None
+) -> Dict[str, Any]:
+    """Publish safely to ntfy (UTF-8 body, Latin-1 headers, image auto-attach)."""
+
+    # 🔒 Config-aware disable guard
+    if not _read_option_flag():
+        print("[ntfy] disabled by config (push_ntfy_enabled=false via options.json)")
+        return {"status": "disabled"}
+
+    if not NTFY_URL:
+        print("[ntfy] disabled (no ntfy_url set)")
+        return {"status": "disabled"}
+
+    url, headers, data, auth = build_request(
+        title, message, topic=topic, click=click, tags=tags, priority=priority, attach=attach
+    )
 
     try:
         r = _session.post(
             url,
             headers=headers,
             data=data,
-            auth=(NTFY_USER, NTFY_PASS) if (NTFY_USER or NTFY_PASS) else None,
+            auth=auth,
             timeout=8,
         )
         try:
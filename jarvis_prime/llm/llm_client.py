@@ -12,6 +12,8 @@
 #   persona_riff(...)
 #   submit_task(...)  → async task submission
 #   get_task_status(...)
+#   chat_stream(...)  → token-by-token chat (llama.cpp / Ollama / worker)
+#   submit_stream(...)
 
 from __future__ import annotations
 import os
@@ -27,9 +29,9 @@ import http.client
 import re
 import threading
 import uuid
-from typing import Optional, Dict, Any, Tuple, List
+from typing import Optional, Dict, Any, Tuple, List, Iterator, Callable
 from collections import deque
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, Future
 
 # ============================
 # Singleton Worker Manager
@@ -48,12 +50,24 @@ except Exception as e:
 # EnviroGuard safety sync
 # ---------------------------
 try:
-    with open("/data/options.json", "r", encoding="utf-8") as f:
-        _opts = json.load(f)
-    if not _opts.get("llm_enabled", True):
-        os.environ["LLM_ENABLED"] = "false"
+    import options_store  # shared, change-aware /data/options.json snapshot
+except Exception:
+    options_store = None
+
+def _sync_llm_enabled(changed=None, opts=None) -> None:
+    # No options snapshot (file missing/unreadable) or no key: keep whatever the env says
+    if not opts or "llm_enabled" not in opts:
+        return
+    os.environ["LLM_ENABLED"] = "true" if opts.get("llm_enabled") else "false"
+
+try:
+    if options_store is not None:
+        _sync_llm_enabled(opts=options_store.snapshot())
+        # EnviroGuard's OFF profile flips llm_enabled in options.json; follow it live
+        options_store.subscribe(_sync_llm_enabled, keys=("llm_enabled",))
     else:
-        os.environ["LLM_ENABLED"] = "true"
+        with open("/data/options.json", "r", encoding="utf-8") as f:
+            _sync_llm_enabled(opts=json.load(f))
 except Exception as e:
     print(f"[llm_client] EnviroGuard sync failed: {e}", flush=True)
 
@@ -240,6 +254,8 @@ def _sanitize_context_subject(ctx: str) -> str:
 # Options helpers
 # ============================
 def _read_options() -> Dict[str, Any]:
+    if options_store is not None:
+        return options_store.snapshot()
     try:
         with open(OPTIONS_PATH, "r", encoding="utf-8") as f:
             return json.load(f)
@@ -256,6 +272,9 @@ def _get_int_opt(opts: Dict[str, Any], key: str, default: int) -> int:
 # ============================
 # Profile resolution (EnviroGuard-first)
 # ============================
+# (options snapshot, LLM_POWER_PROFILE, resolved profile) — re-resolved only when either changes
+_PROFILE_CACHE: Tuple[Any, Optional[str], Optional[Tuple[str, int, int, int]]] = (None, None, None)
+
 def _current_profile() -> Tuple[str, int, int, int]:
     """
     Resolve active profile (EnviroGuard-first) and return:
@@ -266,7 +285,17 @@ def _current_profile() -> Tuple[str, int, int, int]:
       3) Global knobs (llm_max_cpu_percent / llm_ctx_tokens / llm_timeout_seconds)
       4) Hard defaults
     """
+    global _PROFILE_CACHE
     opts = _read_options()
+    env_profile = os.getenv("LLM_POWER_PROFILE")
+    cached_opts, cached_env, resolved = _PROFILE_CACHE
+    if resolved and options_store is not None and opts is cached_opts and env_profile == cached_env:
+        return resolved
+    resolved = _resolve_profile(opts)
+    _PROFILE_CACHE = (opts, env_profile, resolved)
+    return resolved
+
+def _resolve_profile(opts: Dict[str, Any]) -> Tuple[str, int, int, int]:
     prof_name = (opts.get("llm_power_profile")
                  or opts.get("power_profile")
                  or os.getenv("LLM_POWER_PROFILE")
@@ -683,24 +712,27 @@ def _ollama_ready(base_url: str, timeout: int = 2) -> bool:
     except Exception:
         return False
 
+def _ollama_payload(model_name: str, prompt: str, max_tokens: int, stops: Optional[List[str]], stream: bool) -> bytes:
+    payload = {
+        "model": model_name,
+        "prompt": prompt,
+        "stream": stream,
+        "options": {
+            "temperature": 0.35,
+            "top_p": 0.9,
+            "repeat_penalty": 1.1
+        }
+    }
+    if max_tokens and max_tokens > 0:
+        payload["options"]["num_predict"] = int(max_tokens)
+    if stops:
+        payload["stop"] = stops
+    return json.dumps(payload).encode("utf-8")
+
 def _ollama_generate(base_url: str, model_name: str, prompt: str, timeout: int = 20, max_tokens: int = 0, stops: Optional[List[str]] = None) -> str:
     try:
         url = base_url.rstrip("/") + "/api/generate"
-        payload = {
-            "model": model_name,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": 0.35,
-                "top_p": 0.9,
-                "repeat_penalty": 1.1
-            }
-        }
-        if max_tokens and max_tokens > 0:
-            payload["options"]["num_predict"] = int(max_tokens)
-        if stops:
-            payload["stop"] = stops
-        data = json.dumps(payload).encode("utf-8")
+        data = _ollama_payload(model_name, prompt, max_tokens, stops, stream=False)
         out = _http_post(url, data=data, headers={"Content-Type": "application/json"}, timeout=timeout)
         obj = json.loads(out.decode("utf-8"))
         return obj.get("response", "") or ""
@@ -711,6 +743,37 @@ def _ollama_generate(base_url: str, model_name: str, prompt: str, timeout: int =
         _log(f"ollama error: {e}")
         return ""
 
+def _ollama_stream(base_url: str, model_name: str, prompt: str, *, timeout: int, max_tokens: int = 0,
+                   stops: Optional[List[str]] = None, cancel: Optional[threading.Event] = None) -> Iterator[str]:
+    """
+    /api/generate with stream=true: one JSON object per line until "done".
+    timeout applies per read, so it bounds the gap between tokens. Closing the
+    connection on cancel makes Ollama abort the generation server-side.
+    """
+    url = base_url.rstrip("/") + "/api/generate"
+    data = _ollama_payload(model_name, prompt, max_tokens, stops, stream=True)
+    req = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"}, method="POST")
+    try:
+        with urllib.request.build_opener().open(req, timeout=timeout) as r:
+            for line in r:
+                if cancel is not None and cancel.is_set():
+                    break
+                if not line.strip():
+                    continue
+                obj = json.loads(line.decode("utf-8"))
+                if obj.get("error"):
+                    _log(f"ollama stream error: {obj['error']}")
+                    break
+                piece = obj.get("response") or ""
+                if piece:
+                    yield piece
+                if obj.get("done"):
+                    break
+    except urllib.error.HTTPError as e:
+        _log(f"ollama HTTP {e.code}: {getattr(e, 'reason', '')}")
+    except (socket.timeout, TimeoutError):
+        _log(f"ollama stream stalled for {timeout}s → stop")
+
 def _model_name_from_url(model_url: str) -> str:
     if not model_url:
         return "llama3"
@@ -1032,6 +1095,60 @@ def _do_generate(prompt: str, *, timeout: int, base_url: str, model_url: str, mo
 
     return ""
 
+def _llama_stream(prompt: str, *, timeout: int, max_tokens: int, cancel: Optional[threading.Event] = None) -> Iterator[str]:
+    """
+    In-process llama.cpp with stream=True. Tokens are decoded on this thread, so
+    cancel and the stall timeout are checked between tokens; closing the
+    completion iterator stops evaluation.
+    """
+    it = LLM(
+        prompt=prompt,
+        max_tokens=max(1, int(max_tokens)),
+        temperature=0.35,
+        top_p=0.9,
+        repeat_penalty=1.10,
+        stop=_stops_for_model(),
+        stream=True,
+    )
+    try:
+        last = time.time()
+        for chunk in it:
+            if cancel is not None and cancel.is_set():
+                break
+            now = time.time()
+            if now - last > timeout:
+                _log(f"llama stream stalled for {timeout}s → stop")
+                break
+            last = now
+            piece = (chunk.get("choices") or [{}])[0].get("text", "")
+            if piece:
+                yield piece
+    finally:
+        close = getattr(it, "close", None)
+        if close:
+            close()
+
+def _do_generate_stream(prompt: str, *, timeout: int, model_url: str, model_name_hint: str, max_tokens: int,
+                        cancel: Optional[threading.Event] = None) -> Iterator[str]:
+    if LLM_MODE == "ollama" and OLLAMA_URL:
+        cand = (model_name_hint or "").strip()
+        name = cand if (cand and "/" not in cand and not cand.endswith(".gguf")) else _model_name_from_url(model_url)
+        return _ollama_stream(OLLAMA_URL, name, prompt, timeout=timeout, max_tokens=max_tokens,
+                              stops=_stops_for_model(), cancel=cancel)
+
+    if LLM_MODE == "worker" and _WORKER_MANAGER is not None:
+        return _WORKER_MANAGER.stream("generate_stream", {
+            "prompt": prompt,
+            "max_tokens": max_tokens,
+            "temperature": 0.35,
+            "stops": _stops_for_model()
+        }, cancel=cancel, timeout=timeout)
+
+    if LLM_MODE == "llama" and LLM is not None:
+        return _llama_stream(prompt, timeout=timeout, max_tokens=max_tokens, cancel=cancel)
+
+    return iter(())
+
 # ============================
 # Ensure loaded
 # ============================
@@ -1541,6 +1658,103 @@ def persona_riff_ex(
 # ============================
 # Pure Chat (no riff/persona, now RAG-aware)
 # ============================
+def _chat_prompt(msgs: List[Dict[str, str]], sys_prompt: str) -> str:
+    sys_txt = (sys_prompt or _load_system_prompt() or "You are a helpful assistant.").strip()
+    if _is_phi3_family():
+        parts = []
+        if sys_txt:
+            parts.append(f"<|system|>\n{sys_txt}\n<|end|>")
+        for m in msgs:
+            role = (m.get("role") or "").lower()
+            content = (m.get("content") or "").strip()
+            if not content:
+                continue
+            if role == "user":
+                parts.append(f"<|user|>\n{content}\n<|end|>")
+            elif role == "assistant":
+                parts.append(f"<|assistant|>\n{content}\n<|end|>")
+        parts.append("<|assistant|>\n")
+        return "\n".join(parts)
+    else:
+        convo = []
+        if sys_txt:
+            convo.append(f"<<SYS>>{sys_txt}<</SYS>>")
+        for m in msgs:
+            role = (m.get("role") or "").lower()
+            content = (m.get("content") or "").strip()
+            if not content:
+                continue
+            if role == "user":
+                convo.append(f"[USER]\n{content}")
+            elif role == "assistant":
+                convo.append(f"[ASSISTANT]\n{content}")
+        return "<s>[INST] " + "\n".join(convo + ["[/INST]"]) + "\n[ASSISTANT]\n"
+
+def _chat_enabled(messages: List[Dict[str, str]], caller: str) -> bool:
+    opts = _read_options()
+    
+    # CRITICAL FIX: Check environment first (EnviroGuard sets this)
+    env_llm_enabled = os.getenv("LLM_ENABLED", "").strip().lower()
+    if env_llm_enabled in ("false", "0", "no", "off"):
+        _log(f"{caller}: LLM_ENABLED env=false → refusing chat")
+        return False
+    
+    if not bool(opts.get("llm_enabled", True)):
+        return False
+
+    if not messages or not isinstance(messages, list):
+        return False
+
+    last = messages[-1]
+    if (last.get("role") or "").lower() != "user" or not (last.get("content") or "").strip():
+        return False
+    return True
+
+def _chat_prepare(
+    messages: List[Dict[str, str]],
+    system_prompt: str,
+    max_new_tokens: int,
+    *,
+    ctx_tokens: int,
+    cpu_limit: int,
+    base_url: str,
+    model_url: str,
+    model_path: str,
+    model_sha256: str,
+    hf_token: Optional[str],
+    caller: str
+) -> str:
+    """
+    Load the model if needed and build the RAG-aware chat prompt.
+    Returns "" when generation must not run. Call with the generation lock held.
+    """
+    if LLM_MODE == "none":
+        ok = ensure_loaded(
+            model_url=model_url,
+            model_path=model_path,
+            model_sha256=model_sha256,
+            ctx_tokens=ctx_tokens,
+            cpu_limit=cpu_limit,
+            hf_token=hf_token,
+            base_url=base_url
+        )
+        if not ok:
+            return ""
+
+    # RAG injection
+    messages, system_prompt = _build_prompt_with_rag_messages(messages, system_preamble=system_prompt)
+
+    prompt = _chat_prompt(messages, system_prompt)
+
+    try:
+        n_in = len(LLM.tokenize(prompt.encode("utf-8"), add_bos=True))
+    except Exception:
+        n_in = _estimate_tokens(prompt)
+    if _would_overflow(n_in, max_new_tokens, ctx_tokens, reserve=256):
+        _log(f"{caller}: ctx overflow → refuse generation")
+        return ""
+    return prompt
+
 def chat_generate(
     *,
     messages: List[Dict[str, str]],
@@ -1559,85 +1773,19 @@ def chat_generate(
       - Adds a small RAG 'Context' block to the system prompt (top-5 facts)
       - No separate config keys; if llm_enabled is false, returns ""
     """
-    opts = _read_options()
-    
-    # CRITICAL FIX: Check environment first (EnviroGuard sets this)
-    env_llm_enabled = os.getenv("LLM_ENABLED", "").strip().lower()
-    if env_llm_enabled in ("false", "0", "no", "off"):
-        _log("chat_generate: LLM_ENABLED env=false → refusing chat")
-        return ""
-    
-    if not bool(opts.get("llm_enabled", True)):
-        return ""
-
-    if not messages or not isinstance(messages, list):
-        return ""
-
-    last = messages[-1]
-    if (last.get("role") or "").lower() != "user" or not (last.get("content") or "").strip():
+    if not _chat_enabled(messages, "chat_generate"):
         return ""
 
     prof_name, prof_cpu, prof_ctx, prof_timeout = _current_profile()
-    ctx_tokens = prof_ctx
     eff_timeout = timeout if timeout is not None else prof_timeout
 
-    def _build_prompt(msgs: List[Dict[str, str]], sys_prompt: str) -> str:
-        sys_txt = (sys_prompt or _load_system_prompt() or "You are a helpful assistant.").strip()
-        if _is_phi3_family():
-            parts = []
-            if sys_txt:
-                parts.append(f"<|system|>\n{sys_txt}\n<|end|>")
-            for m in msgs:
-                role = (m.get("role") or "").lower()
-                content = (m.get("content") or "").strip()
-                if not content:
-                    continue
-                if role == "user":
-                    parts.append(f"<|user|>\n{content}\n<|end|>")
-                elif role == "assistant":
-                    parts.append(f"<|assistant|>\n{content}\n<|end|>")
-            parts.append("<|assistant|>\n")
-            return "\n".join(parts)
-        else:
-            convo = []
-            if sys_txt:
-                convo.append(f"<<SYS>>{sys_txt}<</SYS>>")
-            for m in msgs:
-                role = (m.get("role") or "").lower()
-                content = (m.get("content") or "").strip()
-                if not content:
-                    continue
-                if role == "user":
-                    convo.append(f"[USER]\n{content}")
-                elif role == "assistant":
-                    convo.append(f"[ASSISTANT]\n{content}")
-            return "<s>[INST] " + "\n".join(convo + ["[/INST]"]) + "\n[ASSISTANT]\n"
-
     with _GenCritical(eff_timeout):
-        if LLM_MODE == "none":
-            ok = ensure_loaded(
-                model_url=model_url,
-                model_path=model_path,
-                model_sha256=model_sha256,
-                ctx_tokens=ctx_tokens,
-                cpu_limit=prof_cpu,
-                hf_token=hf_token,
-                base_url=base_url
-            )
-            if not ok:
-                return ""
-
-        # RAG injection
-        messages, system_prompt = _build_prompt_with_rag_messages(messages, system_preamble=system_prompt)
-
-        prompt = _build_prompt(messages, system_prompt)
-
-        try:
-            n_in = len(LLM.tokenize(prompt.encode("utf-8"), add_bos=True))
-        except Exception:
-            n_in = _estimate_tokens(prompt)
-        if _would_overflow(n_in, max_new_tokens, ctx_tokens, reserve=256):
-            _log("chat_generate: ctx overflow → refuse generation")
+        prompt = _chat_prepare(
+            messages, system_prompt, max_new_tokens,
+            ctx_tokens=prof_ctx, cpu_limit=prof_cpu, base_url=base_url, model_url=model_url,
+            model_path=model_path, model_sha256=model_sha256, hf_token=hf_token, caller="chat_generate"
+        )
+        if not prompt:
             return ""
 
         # CRITICAL FIX: Wrap generation in try-except to catch timeouts/exceptions
@@ -1657,10 +1805,105 @@ def chat_generate(
 
     return _strip_meta_markers(out or "").strip()
 
+# ============================
+# Streaming chat
+# ============================
+def chat_stream(
+    *,
+    messages: List[Dict[str, str]],
+    system_prompt: str = "",
+    max_new_tokens: int = 384,
+    timeout: Optional[int] = None,
+    cancel: Optional[threading.Event] = None,
+    base_url: str = "",
+    model_url: str = "",
+    model_path: str = "",
+    model_sha256: str = "",
+    hf_token: Optional[str] = None
+) -> Iterator[str]:
+    """
+    chat_generate() that yields text pieces as the backend produces them.
+      - timeout is a stall limit: generation stops if no token arrives for that long
+      - setting cancel stops generation at the next token and frees the LLM
+      - pieces are raw model output; run the joined text through
+        _strip_meta_markers() for the final reply (submit_stream does)
+    Holds the generation lock while iterated, so consume and close it on one thread.
+    """
+    if not _chat_enabled(messages, "chat_stream"):
+        return
+
+    prof_name, prof_cpu, prof_ctx, prof_timeout = _current_profile()
+    eff_timeout = max(4, int(timeout if timeout is not None else prof_timeout))
+
+    with _GenCritical(eff_timeout):
+        if cancel is not None and cancel.is_set():
+            return
+        prompt = _chat_prepare(
+            messages, system_prompt, max_new_tokens,
+            ctx_tokens=prof_ctx, cpu_limit=prof_cpu, base_url=base_url, model_url=model_url,
+            model_path=model_path, model_sha256=model_sha256, hf_token=hf_token, caller="chat_stream"
+        )
+        if not prompt:
+            return
+
+        t0 = time.time()
+        n = 0
+        try:
+            for piece in _do_generate_stream(
+                prompt,
+                timeout=eff_timeout,
+                model_url=model_url,
+                model_name_hint=model_path,
+                max_tokens=max_new_tokens,
+                cancel=cancel
+            ):
+                if n == 0:
+                    _log(f"chat_stream: TTFT ~ {time.time() - t0:.2f}s")
+                n += 1
+                yield piece
+        except Exception as e:
+            _log(f"chat_stream: LLM generation exception ({e}) → stop")
+        finally:
+            state = "cancelled" if (cancel is not None and cancel.is_set()) else "done"
+            _log(f"chat_stream: {state} after {n} pieces in {time.time() - t0:.2f}s")
+
+def submit_stream(on_piece: Callable[[str], None], cancel: threading.Event, **chat_kwargs) -> Future:
+    """
+    Run chat_stream() on the single LLM worker thread, handing each piece to
+    on_piece (called on that thread). The returned future resolves to the
+    cleaned full reply. Set cancel to stop generation (or skip it while queued).
+    """
+    def _run() -> str:
+        if cancel.is_set():
+            return ""
+        pieces: List[str] = []
+        gen = chat_stream(cancel=cancel, **chat_kwargs)
+        try:
+            for piece in gen:
+                pieces.append(piece)
+                on_piece(piece)
+                if cancel.is_set():
+                    break
+        finally:
+            gen.close()  # releases the generation lock on this thread
+        return _strip_meta_markers("".join(pieces)).strip()
+
+    return _LLM_EXECUTOR.submit(_run)
+
 # ============================
 # Quick self-test (optional)
 # ============================
 if __name__ == "__main__":
+    if len(sys.argv) >= 3 and sys.argv[1] == "--stream":
+        # Time-to-first-token vs full reply on the configured backend:
+        #   python3 llm_client.py --stream "why is the sky blue?"
+        t0 = time.time()
+        first = None
+        for piece in chat_stream(messages=[{"role": "user", "content": " ".join(sys.argv[2:])}]):
+            first = first or time.time() - t0
+            print(piece, end="", flush=True)
+        print(f"\n[llm] first token {first or 0:.2f}s, full reply {time.time() - t0:.2f}s")
+        sys.exit(0)
     print("llm_client self-check start")
     try:
         prof_name, prof_cpu, prof_ctx, prof_timeout = _current_profile()
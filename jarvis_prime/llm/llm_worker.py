@@ -8,7 +8,10 @@ import os
 import sys
 import json
 import time
+import queue
+import threading
 import traceback
+from collections import deque
 from typing import Optional, Dict, Any
 
 # Disable buffering for immediate IPC
@@ -19,6 +22,11 @@ LLM = None
 LLM_MODE = "none"
 LOADED_MODEL_PATH = None
 
+# stdin is read on its own thread so a streaming generation can notice a
+# {"method": "cancel"} line between tokens
+_INBOX: "queue.Queue[Optional[str]]" = queue.Queue()
+_DEFERRED: deque = deque()  # non-cancel requests that arrived mid-stream
+
 def log(msg: str):
     """Log to stderr so it doesn't interfere with JSON-RPC on stdout"""
     print(f"[llm_worker] {msg}", file=sys.stderr, flush=True)
@@ -96,6 +104,76 @@ def generate(prompt: str, max_tokens: int, temperature: float, stops: list) -> D
         log(f"Traceback: {traceback.format_exc()}")
         return {"success": False, "error": str(e)}
 
+def _stdin_reader():
+    for line in sys.stdin:
+        _INBOX.put(line)
+    _INBOX.put(None)  # EOF
+
+def _next_line() -> Optional[str]:
+    if _DEFERRED:
+        return _DEFERRED.popleft()
+    return _INBOX.get()
+
+def _cancel_requested() -> bool:
+    """Drain pending stdin lines; True on a cancel request or EOF"""
+    while True:
+        try:
+            line = _INBOX.get_nowait()
+        except queue.Empty:
+            return False
+        if line is None:
+            _INBOX.put(None)  # let the main loop see EOF too
+            return True
+        try:
+            if json.loads(line).get("method") == "cancel":
+                return True
+        except Exception:
+            pass
+        _DEFERRED.append(line)
+
+def generate_stream(prompt: str, max_tokens: int, temperature: float, stops: list) -> Dict[str, Any]:
+    """Generate with stream=True, writing one {"token": ...} line per piece before the final response"""
+    global LLM, LLM_MODE
+    
+    if LLM_MODE != "llama" or LLM is None:
+        return {"success": False, "error": "Model not loaded"}
+    
+    n = 0
+    cancelled = False
+    try:
+        log(f"Streaming ({max_tokens} tokens)")
+        
+        it = LLM(
+            prompt=prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=0.9,
+            repeat_penalty=1.10,
+            stop=stops or [],
+            stream=True
+        )
+        try:
+            for chunk in it:
+                if _cancel_requested():
+                    cancelled = True
+                    break
+                text = (chunk.get("choices") or [{}])[0].get("text", "")
+                if text:
+                    print(json.dumps({"token": text}), flush=True)
+                    n += 1
+        finally:
+            close = getattr(it, "close", None)
+            if close:
+                close()
+        
+        log(f"Streamed {n} pieces{' (cancelled)' if cancelled else ''}")
+        return {"success": True, "done": True, "cancelled": cancelled, "pieces": n}
+        
+    except Exception as e:
+        log(f"Streaming failed: {e}")
+        log(f"Traceback: {traceback.format_exc()}")
+        return {"success": False, "error": str(e)}
+
 def unload_model() -> Dict[str, Any]:
     """Unload model to free memory"""
     global LLM, LLM_MODE, LOADED_MODEL_PATH
@@ -107,7 +185,7 @@ def unload_model() -> Dict[str, Any]:
     log("Model unloaded")
     return {"success": True, "message": "Model unloaded"}
 
-def handle_request(req: Dict[str, Any]) -> Dict[str, Any]:
+def handle_request(req: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Handle a single JSON-RPC request"""
     method = req.get("method")
     params = req.get("params", {})
@@ -127,6 +205,18 @@ def handle_request(req: Dict[str, Any]) -> Dict[str, Any]:
             params.get("stops", [])
         )
     
+    elif method == "generate_stream":
+        return generate_stream(
+            params.get("prompt"),
+            params.get("max_tokens", 128),
+            params.get("temperature", 0.7),
+            params.get("stops", [])
+        )
+    
+    elif method == "cancel":
+        # Only meaningful mid-stream; a late cancel after "done" is dropped silently
+        return None
+    
     elif method == "unload":
         return unload_model()
     
@@ -144,10 +234,12 @@ def main():
     log("Process isolated - crashes won't affect main Jarvis")
     log("="*60)
     
+    threading.Thread(target=_stdin_reader, name="stdin", daemon=True).start()
+    
     while True:
         try:
             # Read request from stdin
-            line = sys.stdin.readline()
+            line = _next_line()
             if not line:
                 log("EOF on stdin - parent died, exiting")
                 break
@@ -158,7 +250,8 @@ def main():
             response = handle_request(req)
             
             # Write response to stdout
-            print(json.dumps(response), flush=True)
+            if response is not None:
+                print(json.dumps(response), flush=True)
             
         except json.JSONDecodeError as e:
             log(f"JSON decode error: {e}")
@@ -15,6 +15,14 @@ from typing import Any, Dict, List, Tuple, Set
 
 OPTIONS_PATHS = ["/data/options.json", "/data/config.json"]
 
+try:
+    import options_store  # change-aware options snapshots
+except Exception:
+    options_store = None
+
+# config.json overrides options.json key by key, so rag keeps its own merged store
+_OPTIONS = options_store.OptionsStore(OPTIONS_PATHS, merge=True) if options_store is not None else None
+
 # Primary (single target) + fallback
 PRIMARY_DIRS   = ["/share/jarvis_prime/memory"]
 FALLBACK_PATH  = "/data/rag_facts.json"
@@ -150,6 +158,8 @@ def _rel_time(ts: str) -> str:
         return ts
 
 def _load_options() -> Dict[str, Any]:
+    if _OPTIONS is not None:
+        return dict(_OPTIONS.snapshot())
     cfg: Dict[str, Any] = {}
     for p in OPTIONS_PATHS:
         try:
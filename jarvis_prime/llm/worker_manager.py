@@ -10,7 +10,7 @@ import time
 import subprocess
 import threading
 import select
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator
 
 class WorkerManager:
     """Singleton that manages the LLM worker process"""
@@ -142,6 +142,86 @@ class WorkerManager:
             print(f"[WorkerManager] Call failed: {e}", file=sys.stderr)
             return None
     
+    def stream(self, method: str, params: Dict[str, Any], cancel: Optional[threading.Event] = None,
+               timeout: float = 30.0) -> Iterator[str]:
+        """
+        Call a streaming worker method, yielding each {"token": ...} line until the
+        final response. When cancel is set, no token arrives for timeout seconds,
+        or the caller closes the iterator early, a cancel request is sent and the
+        reply is drained so the pipe stays in sync for the next call.
+        """
+        if not self.is_alive():
+            return
+        
+        try:
+            request = json.dumps({"method": method, "params": params})
+            self.process.stdin.write(request + "\n")
+            self.process.stdin.flush()
+        except Exception as e:
+            print(f"[WorkerManager] Stream call failed: {e}", file=sys.stderr)
+            return
+        
+        # Raw fd reads: several token lines can arrive in one chunk, and select()
+        # can't see lines already sitting in the text wrapper's buffer
+        fd = self.process.stdout.fileno()
+        pending = [b""]
+        finished = False
+        try:
+            last = time.time()
+            while self.is_alive():
+                if cancel is not None and cancel.is_set():
+                    break
+                if time.time() - last > timeout:
+                    print(f"[WorkerManager] Stream stalled for {timeout}s: {method}", file=sys.stderr)
+                    break
+                for msg in self._read_messages(fd, pending):
+                    if "token" in msg:
+                        last = time.time()
+                        yield msg["token"]
+                        continue
+                    finished = True
+                    if not msg.get("success"):
+                        print(f"[WorkerManager] Stream failed: {msg.get('error')}", file=sys.stderr)
+                    return
+            finished = not self.is_alive()
+        finally:
+            if not finished:
+                self._cancel_stream(fd, pending, timeout)
+    
+    def _read_messages(self, fd: int, pending: list, wait: float = 0.1) -> Iterator[Dict[str, Any]]:
+        """Complete JSON lines available on fd within wait seconds; partial lines stay in pending[0]"""
+        ready, _, _ = select.select([fd], [], [], wait)
+        if not ready:
+            return
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            return
+        pending[0] += chunk
+        while b"\n" in pending[0]:
+            line, pending[0] = pending[0].split(b"\n", 1)
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line.decode("utf-8"))
+            except Exception:
+                continue
+    
+    def _cancel_stream(self, fd: int, pending: list, timeout: float):
+        """Ask the worker to stop streaming and discard output up to its final response"""
+        try:
+            self.process.stdin.write(json.dumps({"method": "cancel"}) + "\n")
+            self.process.stdin.flush()
+        except Exception:
+            return
+        end = time.time() + max(5.0, timeout)
+        while time.time() < end and self.is_alive():
+            for msg in self._read_messages(fd, pending):
+                if "token" not in msg:
+                    return
+        if self.is_alive():
+            print("[WorkerManager] Worker ignored cancel - restarting it", file=sys.stderr)
+            self.stop()
+    
     def stop(self):
         """Stop worker process"""
         if self.process is None:
@@ -5,6 +5,11 @@
 import json
 import re
 
+try:
+    import options_store  # shared, change-aware /data/options.json snapshot
+except Exception:
+    options_store = None
+
 # ---- Canonical command names (must match bot.py routes) ----
 CANON = {
     "dns",
@@ -62,25 +67,30 @@ DEFAULT_ALIASES = {
     "summary": "digest",
 }
 
-def _load_custom_aliases() -> dict:
-    """
-    Read user custom aliases from /data/options.json (key: custom_aliases).
-    Accepts either a JSON object or a JSON string of an object.
-    """
+def _read_options() -> dict:
+    if options_store is not None:
+        return options_store.snapshot()
     try:
         with open("/data/options.json", "r") as f:
             raw_text = f.read()
         try:
-            opts = json.loads(raw_text)
+            return json.loads(raw_text)
         except json.JSONDecodeError:
             # Some HA configs write YAML; try a simple key scan
             m = re.search(r"custom_aliases:\s*(\{.*\})", raw_text, re.S)
             if m:
-                opts = {"custom_aliases": json.loads(m.group(1))}
-            else:
-                opts = {}
+                return {"custom_aliases": json.loads(m.group(1))}
+            return {}
     except Exception:
-        opts = {}
+        return {}
+
+def _load_custom_aliases(opts=None) -> dict:
+    """
+    Read user custom aliases from /data/options.json (key: custom_aliases).
+    Accepts either a JSON object or a JSON string of an object.
+    """
+    if opts is None:
+        opts = _read_options()
 
     val = opts.get("custom_aliases", {})
     if isinstance(val, str):
@@ -98,10 +108,19 @@ def _load_custom_aliases() -> dict:
         out[lk] = lv
     return out
 
-# Build the alias map once
+# Build the alias map once; rebuilt when custom_aliases is edited
 _ALIAS_MAP = DEFAULT_ALIASES.copy()
 _ALIAS_MAP.update(_load_custom_aliases())
 
+def _reload_aliases(changed=None, opts=None) -> None:
+    global _ALIAS_MAP
+    fresh = DEFAULT_ALIASES.copy()
+    fresh.update(_load_custom_aliases(opts))
+    _ALIAS_MAP = fresh
+
+if options_store is not None:
+    options_store.subscribe(_reload_aliases, keys=("custom_aliases",))
+
 # ---- Public API -------------------------------------------------------------
 def normalize_cmd(cmd: str) -> str:
     """
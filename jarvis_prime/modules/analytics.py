@@ -19,6 +19,7 @@ CRITICAL FIXES:
 Complete file with Internet Speed Testing integrated
 """
 
+import os
 import sqlite3
 import time
 import json
@@ -32,17 +33,36 @@ from aiohttp import web
 from collections import deque
 import logging
 import re
+import shutil
 import socket
+import stat
+import threading
+import uuid
+import heapq
+import zlib
 from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+try:
+    import netsweep  # native ICMP / neighbour-table sweeper (optional)
+except Exception:
+    netsweep = None
+
+try:
+    import oui  # MAC vendor index (IEEE MA-L/MA-M/MA-S, longest-prefix match)
+except Exception:
+    oui = None
+
 # Print version on import
 logger.info("ðŸ”¥ Analytics Module VERSION: 2025-01-19-FINAL-FIX + SPEED TEST ðŸ”¥")
 
 # Thread executor for running blocking operations (prevents UI freezing)
 _executor = ThreadPoolExecutor(max_workers=4)
 
+# Dedicated executor for AnalyticsDB work; each worker keeps its own connection
+_db_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="analytics-db")
+
 
 
 # Service fingerprint database - maps ports to common services
@@ -265,6 +285,7 @@ class HealthCheck:
     flap_threshold: int = 5
     suppression_duration: int = 3600  # seconds (1 hour)
     id: int = None  # Database ID
+    managed_by: Optional[str] = None  # 'docker' when registered by DockerDiscovery; user edits clear it
 
 
 @dataclass
@@ -275,6 +296,7 @@ class ServiceMetric:
     status: str  # 'up', 'down', 'degraded'
     response_time: float
     error_message: Optional[str] = None
+    timing: Optional[Dict[str, float]] = None  # HTTP phase breakdown (ms), not persisted
 
 
 @dataclass
@@ -286,6 +308,49 @@ class FlapTracker:
     consecutive_failures: int = 0
 
 
+# Number of recent check results kept per service in the in-memory state table
+STATE_WINDOW = 20
+
+
+@dataclass
+class ServiceState:
+    """Authoritative in-memory state for one monitored service"""
+    service_name: str
+    last_status: Optional[str] = None
+    last_check: Optional[int] = None
+    last_response_time: Optional[float] = None
+    last_error: Optional[str] = None
+    last_timing: Optional[Dict[str, float]] = None
+    window: deque = field(default_factory=lambda: deque(maxlen=STATE_WINDOW))
+    flap: FlapTracker = field(default_factory=FlapTracker)
+    config: Optional['HealthCheck'] = None
+    
+    def record(self, metric: 'ServiceMetric') -> Optional[str]:
+        """Apply a check result; returns the status it replaced"""
+        previous = self.last_status
+        self.last_status = metric.status
+        self.last_check = metric.timestamp
+        self.last_response_time = metric.response_time
+        self.last_error = metric.error_message
+        self.last_timing = metric.timing
+        self.window.append(metric.status)
+        return previous
+    
+    def to_dict(self) -> Dict:
+        ups = sum(1 for st in self.window if st == 'up')
+        return {
+            'status': self.last_status or 'unknown',
+            'timestamp': self.last_check,
+            'response_time': self.last_response_time,
+            'error_message': self.last_error,
+            'timing': self.last_timing,
+            'recent_checks': len(self.window),
+            'recent_uptime': round(ups / len(self.window) * 100, 1) if self.window else None,
+            'flaps': len(self.flap.flap_times),
+            'suppressed_until': self.flap.suppressed_until
+        }
+
+
 @dataclass
 class NetworkDevice:
     """Network device discovered during scan"""
@@ -313,16 +378,132 @@ class SpeedTestResult:
     status: str = 'normal'  # normal, degraded, offline
 
 
+# Newest speed-test results kept in memory for rolling averages
+SPEED_RECENT_KEEP = 50
+
+
+# Rollup buckets kept per service: name -> bucket width (seconds), retention (seconds, None = forever)
+ROLLUP_GRANULARITIES = {
+    'minute': (60, 2 * 86400),
+    'hour': (3600, 90 * 86400),
+    'day': (86400, None),
+}
+
+# Upper bounds (seconds) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+_HIST_COLS = [f"h{i}" for i in range(len(LATENCY_BUCKETS) + 1)]
+
+
+def _latency_bucket(response_time: float) -> int:
+    for i, bound in enumerate(LATENCY_BUCKETS):
+        if response_time <= bound:
+            return i
+    return len(LATENCY_BUCKETS)
+
+
+class _PooledConnection(sqlite3.Connection):
+    """
+    Connection handed out by AnalyticsDB's per-thread pool.
+    close() returns it to the pool instead of tearing it down: any
+    half-finished transaction is rolled back and the row factory reset,
+    so every method still sees a fresh-looking connection.
+    """
+
+    def close(self):
+        try:
+            if self.in_transaction:
+                self.rollback()
+        except sqlite3.Error:
+            pass
+        self.row_factory = None
+
+    def really_close(self):
+        super().close()
+
+
 class AnalyticsDB:
     """Database handler for analytics data"""
     
-    def __init__(self, db_path: str = "/data/jarvis.db"):
+    def __init__(self, db_path: str = "/data/jarvis.db",
+                 metric_flush_interval: float = 1.0, metric_batch_size: int = 200):
         self.db_path = db_path
+        self._local = threading.local()
+        self._conns: List[_PooledConnection] = []
+        self._conns_lock = threading.Lock()
+        
+        # Batched metric writer (see add_metric_async)
+        self.metric_flush_interval = metric_flush_interval
+        self.metric_batch_size = metric_batch_size
+        self._pending_metrics: List[tuple] = []
+        self._metric_flush_task: Optional[asyncio.Task] = None
+        self._metrics_written = 0
+        self._metric_batches = 0
+        
+        # Speed-test aggregates, loaded once and then kept current by record_speed_test
+        self._speed_agg: Optional[Dict] = None
+        self._speed_lock = threading.Lock()
+        
         self.init_db()
     
+    def _connect(self) -> _PooledConnection:
+        """
+        Return this thread's connection, opening it on first use.
+        Each connection is only ever used by the thread that opened it; the
+        WAL/pragmas are applied once when the connection is created. A
+        transaction left open by a call that raised before close() is rolled
+        back here, so it cannot keep holding the write lock.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            return conn
+        # check_same_thread is off only so close() can tear the pool down from the loop thread
+        conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False,
+                               factory=_PooledConnection)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA temp_store=MEMORY")
+        except sqlite3.Error as e:
+            logger.warning(f"Analytics DB pragmas not applied: {e}")
+        self._local.conn = conn
+        with self._conns_lock:
+            self._conns.append(conn)
+        return conn
+    
+    def close(self):
+        """Close every pooled connection (call once the executor is idle)"""
+        with self._conns_lock:
+            conns, self._conns = self._conns, []
+        for conn in conns:
+            try:
+                conn.really_close()
+            except Exception:
+                pass
+        self._local = threading.local()
+    
+    def _release_thread_conn(self):
+        """Roll back whatever this thread's connection left open"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+    
+    async def run(self, fn: Callable, *args, **kwargs):
+        """Run a blocking DB call on the analytics DB executor"""
+        def call():
+            try:
+                return fn(*args, **kwargs)
+            except BaseException:
+                # Don't let a failed write hold the lock until this worker's next call
+                self._release_thread_conn()
+                raise
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_db_executor, call)
+    
     def init_db(self):
         """Initialize analytics tables"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         
         # Services configuration table
@@ -340,6 +521,7 @@ class AnalyticsDB:
                 flap_window INTEGER DEFAULT 3600,
                 flap_threshold INTEGER DEFAULT 5,
                 suppression_duration INTEGER DEFAULT 3600,
+                managed_by TEXT,
                 created_at INTEGER DEFAULT (strftime('%s', 'now')),
                 updated_at INTEGER DEFAULT (strftime('%s', 'now'))
             )
@@ -469,6 +651,9 @@ class AnalyticsDB:
         # Migrate existing tables
         self._migrate_tables(cur)
         
+        # Per-service minute/hour/day rollups of analytics_metrics
+        self._ensure_rollups(cur)
+        
         conn.commit()
         conn.close()
         logger.info("Analytics database initialized with network and speed test monitoring")
@@ -494,18 +679,229 @@ class AnalyticsDB:
             if 'suppression_duration' not in columns:
                 logger.info("Migrating: adding suppression_duration column")
                 cur.execute("ALTER TABLE analytics_services ADD COLUMN suppression_duration INTEGER DEFAULT 3600")
+            
+            if 'managed_by' not in columns:
+                logger.info("Migrating: adding managed_by column")
+                cur.execute("ALTER TABLE analytics_services ADD COLUMN managed_by TEXT")
+        
+        except Exception as e:
+            logger.error(f"Migration error: {e}")
+        
+        try:
+            cur.execute("PRAGMA table_info(network_scans)")
+            columns = [col[1] for col in cur.fetchall()]
+            
+            if 'stage_timings' not in columns:
+                logger.info("Migrating: adding network_scans.stage_timings column")
+                cur.execute("ALTER TABLE network_scans ADD COLUMN stage_timings TEXT")
         
         except Exception as e:
             logger.error(f"Migration error: {e}")
     
+    # Rollup methods
+    
+    def _ensure_rollups(self, cur):
+        """Create the rollup table, backfilling it from raw metrics the first time"""
+        cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='analytics_rollups'")
+        existed = cur.fetchone() is not None
+        hist_cols = ",\n".join(f"{c} INTEGER NOT NULL DEFAULT 0" for c in _HIST_COLS)
+        cur.execute(f"""
+            CREATE TABLE IF NOT EXISTS analytics_rollups (
+                service_name TEXT NOT NULL,
+                granularity TEXT NOT NULL,
+                bucket INTEGER NOT NULL,
+                checks INTEGER NOT NULL DEFAULT 0,
+                up_checks INTEGER NOT NULL DEFAULT 0,
+                rt_count INTEGER NOT NULL DEFAULT 0,
+                rt_sum REAL NOT NULL DEFAULT 0,
+                rt_min REAL,
+                rt_max REAL,
+                {hist_cols},
+                PRIMARY KEY (service_name, granularity, bucket)
+            ) WITHOUT ROWID
+        """)
+        cur.execute("""
+            CREATE INDEX IF NOT EXISTS idx_rollups_gran_bucket
+            ON analytics_rollups(granularity, bucket)
+        """)
+        if not existed:
+            self._rebuild_rollups(cur)
+    
+    def _rebuild_rollups(self, cur, service_name: Optional[str] = None):
+        """Recompute rollups from analytics_metrics (all services or just one)"""
+        where, params = "", []
+        if service_name:
+            where = "WHERE service_name = ?"
+            params = [service_name]
+        cur.execute(f"DELETE FROM analytics_rollups {where}", params)
+        
+        hist_sql, lower = [], None
+        for bound in LATENCY_BUCKETS:
+            cond = f"response_time <= {bound}" if lower is None else f"response_time > {lower} AND response_time <= {bound}"
+            hist_sql.append(f"SUM(CASE WHEN {cond} THEN 1 ELSE 0 END)")
+            lower = bound
+        hist_sql.append(f"SUM(CASE WHEN response_time > {lower} THEN 1 ELSE 0 END)")
+        
+        for name, (width, _) in ROLLUP_GRANULARITIES.items():
+            cur.execute(f"""
+                INSERT INTO analytics_rollups
+                (service_name, granularity, bucket, checks, up_checks, rt_count, rt_sum, rt_min, rt_max, {', '.join(_HIST_COLS)})
+                SELECT service_name, ?, (timestamp / {width}) * {width},
+                       COUNT(*),
+                       SUM(CASE WHEN status = 'up' THEN 1 ELSE 0 END),
+                       COUNT(response_time),
+                       COALESCE(SUM(response_time), 0),
+                       MIN(response_time),
+                       MAX(response_time),
+                       {', '.join(hist_sql)}
+                FROM analytics_metrics
+                {where}
+                GROUP BY service_name, timestamp / {width}
+            """, [name] + params)
+    
+    def _apply_rollups(self, cur, rows: List[tuple]):
+        """Fold (service_name, timestamp, status, response_time, error) rows into the rollups"""
+        agg: Dict[tuple, list] = {}
+        n_hist = len(_HIST_COLS)
+        for service_name, ts, status, rt, _err in rows:
+            for name, (width, _) in ROLLUP_GRANULARITIES.items():
+                key = (service_name, name, (int(ts) // width) * width)
+                a = agg.get(key)
+                if a is None:
+                    # checks, up_checks, rt_count, rt_sum, rt_min, rt_max, hist...
+                    a = agg[key] = [0, 0, 0, 0.0, None, None] + [0] * n_hist
+                a[0] += 1
+                if status == 'up':
+                    a[1] += 1
+                if rt is not None:
+                    a[2] += 1
+                    a[3] += rt
+                    a[4] = rt if a[4] is None else min(a[4], rt)
+                    a[5] = rt if a[5] is None else max(a[5], rt)
+                    a[6 + _latency_bucket(rt)] += 1
+        if not agg:
+            return
+        hist_updates = ", ".join(f"{c} = {c} + excluded.{c}" for c in _HIST_COLS)
+        cur.executemany(f"""
+            INSERT INTO analytics_rollups
+            (service_name, granularity, bucket, checks, up_checks, rt_count, rt_sum, rt_min, rt_max, {', '.join(_HIST_COLS)})
+            VALUES ({', '.join('?' * (9 + n_hist))})
+            ON CONFLICT(service_name, granularity, bucket) DO UPDATE SET
+                checks = checks + excluded.checks,
+                up_checks = up_checks + excluded.up_checks,
+                rt_count = rt_count + excluded.rt_count,
+                rt_sum = rt_sum + excluded.rt_sum,
+                rt_min = CASE WHEN rt_min IS NULL OR excluded.rt_min < rt_min THEN excluded.rt_min ELSE rt_min END,
+                rt_max = CASE WHEN rt_max IS NULL OR excluded.rt_max > rt_max THEN excluded.rt_max ELSE rt_max END,
+                {hist_updates}
+        """, [key + tuple(a) for key, a in agg.items()])
+    
+    def get_rollup_stats(self, service_name: Optional[str] = None, hours: int = 24) -> Dict[str, Dict]:
+        """
+        Uptime and response-time stats per service over the last `hours`,
+        read from the coarsest rollups that keep the window edge accurate.
+        """
+        window = hours * 3600
+        since = int(time.time()) - window
+        if window <= ROLLUP_GRANULARITIES['minute'][1]:
+            # minute buckets for the ragged head of the window, hour buckets for the rest
+            since = (since // 60) * 60
+            boundary = -(-since // 3600) * 3600
+            ranges = [('minute', since, boundary), ('hour', boundary, None)]
+        elif window <= ROLLUP_GRANULARITIES['hour'][1]:
+            ranges = [('hour', (since // 3600) * 3600, None)]
+        else:
+            ranges = [('day', (since // 86400) * 86400, None)]
+        
+        conn = self._connect()
+        cur = conn.cursor()
+        sums = ", ".join(f"SUM({c})" for c in _HIST_COLS)
+        clauses, params = [], []
+        for granularity, start, end in ranges:
+            clause = "(granularity = ? AND bucket >= ?"
+            params += [granularity, start]
+            if end is not None:
+                clause += " AND bucket < ?"
+                params.append(end)
+            clauses.append(clause + ")")
+        sql = f"""
+            SELECT service_name, SUM(checks), SUM(up_checks), SUM(rt_count), SUM(rt_sum),
+                   MIN(rt_min), MAX(rt_max), {sums}
+            FROM analytics_rollups
+            WHERE ({' OR '.join(clauses)})
+        """
+        if service_name:
+            sql += " AND service_name = ?"
+            params.append(service_name)
+        cur.execute(sql + " GROUP BY service_name", params)
+        rows = cur.fetchall()
+        conn.close()
+        
+        stats = {}
+        for row in rows:
+            name, checks, up, rt_count, rt_sum, rt_min, rt_max = row[:7]
+            hist = [int(h or 0) for h in row[7:]]
+            stats[name] = {
+                'checks': checks or 0,
+                'up_checks': up or 0,
+                'uptime': round((up / checks) * 100, 1) if checks else None,
+                'avg_response': (rt_sum / rt_count) if rt_count else None,
+                'min_response': rt_min,
+                'max_response': rt_max,
+                'p95_response': self._histogram_quantile(hist, 0.95, rt_max),
+                'histogram': hist
+            }
+        return stats
+    
+    @staticmethod
+    def _histogram_quantile(hist: List[int], q: float, rt_max: Optional[float]) -> Optional[float]:
+        """Upper bound of the latency bucket holding quantile q (capped at the observed max)"""
+        total = sum(hist)
+        if not total:
+            return None
+        target, seen = q * total, 0
+        for i, n in enumerate(hist):
+            seen += n
+            if seen >= target:
+                bound = LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else rt_max
+                return min(bound, rt_max) if rt_max is not None and bound is not None else bound
+        return rt_max
+    
+    def downsample_metrics(self, raw_days: int = 0) -> Dict[str, int]:
+        """
+        Expire fine-grained rollup buckets past their retention and, when
+        raw_days > 0, drop raw metrics older than that (their history lives
+        on in the rollups). The newest raw row per service is always kept.
+        """
+        now = int(time.time())
+        conn = self._connect()
+        cur = conn.cursor()
+        deleted = {'raw': 0}
+        if raw_days > 0:
+            cur.execute("""
+                DELETE FROM analytics_metrics
+                WHERE timestamp < ?
+                  AND id NOT IN (SELECT MAX(id) FROM analytics_metrics GROUP BY service_name)
+            """, (now - raw_days * 86400,))
+            deleted['raw'] = cur.rowcount
+        for name, (_, retention) in ROLLUP_GRANULARITIES.items():
+            if retention is None:
+                continue
+            cur.execute("DELETE FROM analytics_rollups WHERE granularity = ? AND bucket < ?",
+                        (name, now - retention))
+            deleted[name] = cur.rowcount
+        conn.commit()
+        conn.close()
+        return deleted
+    
     def add_service(self, service: HealthCheck):
         """Add or update a service"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         cur.execute("""
             INSERT OR REPLACE INTO analytics_services 
-            (service_name, endpoint, check_type, expected_status, timeout, check_interval, enabled, retries, flap_window, flap_threshold, suppression_duration)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            (service_name, endpoint, check_type, expected_status, timeout, check_interval, enabled, retries, flap_window, flap_threshold, suppression_duration, managed_by)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """, (
             service.service_name,
             service.endpoint,
@@ -517,14 +913,15 @@ class AnalyticsDB:
             service.retries,
             service.flap_window,
             service.flap_threshold,
-            service.suppression_duration
+            service.suppression_duration,
+            service.managed_by
         ))
         conn.commit()
         conn.close()
     
     def get_services(self) -> List[HealthCheck]:
         """Get all services"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         cur.execute("SELECT * FROM analytics_services")
@@ -545,59 +942,103 @@ class AnalyticsDB:
                 retries=row_dict.get('retries', 3),
                 flap_window=row_dict.get('flap_window', 3600),
                 flap_threshold=row_dict.get('flap_threshold', 5),
-                suppression_duration=row_dict.get('suppression_duration', 3600)
+                suppression_duration=row_dict.get('suppression_duration', 3600),
+                managed_by=row_dict.get('managed_by')
             )
             service.id = row_dict['id']
             services.append(service)
         return services
     
-    def get_all_services(self) -> List[Dict]:
-        """Get all configured services with current status and stats"""
-        conn = sqlite3.connect(self.db_path)
+    def get_recent_statuses(self, per_service: int = STATE_WINDOW) -> Dict[str, List[Dict]]:
+        """Newest `per_service` check results for every service, newest first"""
+        conn = self._connect()
+        conn.row_factory = sqlite3.Row
+        cur = conn.cursor()
+        cur.execute("""
+            SELECT service_name, timestamp, status, response_time, error_message
+            FROM (
+                SELECT *, ROW_NUMBER() OVER (
+                    PARTITION BY service_name ORDER BY timestamp DESC, id DESC
+                ) AS rn
+                FROM analytics_metrics
+            )
+            WHERE rn <= ?
+            ORDER BY service_name, timestamp DESC
+        """, (per_service,))
+        out: Dict[str, List[Dict]] = {}
+        for row in cur.fetchall():
+            out.setdefault(row['service_name'], []).append(dict(row))
+        conn.close()
+        return out
+    
+    def get_all_services(self, latest: Optional[Dict[str, Dict]] = None) -> List[Dict]:
+        """
+        Get all configured services with current status and stats.
+        `latest` maps service_name -> ServiceState.to_dict(); when given, the
+        current status comes from it instead of the metrics table.
+        """
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         
+        if latest is not None:
+            cur.execute("""
+                SELECT id, service_name, endpoint, check_type, expected_status, timeout,
+                       check_interval, enabled, retries, flap_window, flap_threshold,
+                       suppression_duration
+                FROM analytics_services
+                ORDER BY service_name
+            """)
+            services = [dict(row) for row in cur.fetchall()]
+            conn.close()
+            for service in services:
+                state = latest.get(service['service_name']) or {}
+                service['current_status'] = state.get('status') if state.get('timestamp') else None
+                service['last_check'] = state.get('timestamp')
+                service['latest_response_time'] = state.get('response_time')
+            return self._with_rollup_stats(services)
+        
+        # Latest check per service comes from one index seek on the raw table;
+        # the 24h aggregates come from the rollups.
         cur.execute("""
             SELECT 
-                id,
-                service_name,
-                endpoint,
-                check_type,
-                expected_status,
-                timeout,
-                check_interval,
-                enabled,
-                retries,
-                flap_window,
-                flap_threshold,
-                suppression_duration,
-                (SELECT status FROM analytics_metrics 
-                 WHERE service_name = analytics_services.service_name 
-                 ORDER BY timestamp DESC LIMIT 1) as current_status,
-                (SELECT timestamp FROM analytics_metrics 
-                 WHERE service_name = analytics_services.service_name 
-                 ORDER BY timestamp DESC LIMIT 1) as last_check,
-                (SELECT AVG(response_time) FROM analytics_metrics 
-                 WHERE service_name = analytics_services.service_name 
-                 AND timestamp > (strftime('%s', 'now') - 86400)
-                 AND response_time IS NOT NULL) as avg_response_24h,
-                (SELECT response_time FROM analytics_metrics 
-                 WHERE service_name = analytics_services.service_name 
-                 ORDER BY timestamp DESC LIMIT 1) as latest_response_time,
-                (SELECT COUNT(*) FROM analytics_metrics 
-                 WHERE service_name = analytics_services.service_name 
-                 AND timestamp > (strftime('%s', 'now') - 86400)) as total_checks_24h,
-                (SELECT COUNT(*) FROM analytics_metrics 
-                 WHERE service_name = analytics_services.service_name 
-                 AND status = 'up'
-                 AND timestamp > (strftime('%s', 'now') - 86400)) as successful_checks_24h
-            FROM analytics_services
-            ORDER BY service_name
+                s.id,
+                s.service_name,
+                s.endpoint,
+                s.check_type,
+                s.expected_status,
+                s.timeout,
+                s.check_interval,
+                s.enabled,
+                s.retries,
+                s.flap_window,
+                s.flap_threshold,
+                s.suppression_duration,
+                m.status as current_status,
+                m.timestamp as last_check,
+                m.response_time as latest_response_time
+            FROM analytics_services s
+            LEFT JOIN analytics_metrics m ON m.id = (
+                SELECT id FROM analytics_metrics 
+                WHERE service_name = s.service_name 
+                ORDER BY timestamp DESC LIMIT 1
+            )
+            ORDER BY s.service_name
         """)
         
         services = [dict(row) for row in cur.fetchall()]
+        conn.close()
+        return self._with_rollup_stats(services)
+    
+    def _with_rollup_stats(self, services: List[Dict]) -> List[Dict]:
+        rollups = self.get_rollup_stats(hours=24)
         
         for service in services:
+            stats = rollups.get(service['service_name'], {})
+            service['total_checks_24h'] = stats.get('checks', 0)
+            service['successful_checks_24h'] = stats.get('up_checks', 0)
+            service['avg_response_24h'] = stats.get('avg_response')
+            
             if service['total_checks_24h'] and service['total_checks_24h'] > 0:
                 service['uptime_24h'] = round((service['successful_checks_24h'] / service['total_checks_24h']) * 100, 1)
             else:
@@ -613,12 +1054,11 @@ class AnalyticsDB:
             if 'latest_response_time' in service:
                 del service['latest_response_time']
         
-        conn.close()
         return services
     
     def get_service(self, service_id: int) -> Optional[Dict]:
         """Get a specific service by ID"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         
@@ -635,13 +1075,14 @@ class AnalyticsDB:
     
     def delete_service(self, service_id: int):
         """Delete a service and its metrics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         
         service = self.get_service(service_id)
         if service:
             service_name = service['service_name']
             cur.execute("DELETE FROM analytics_metrics WHERE service_name = ?", (service_name,))
+            cur.execute("DELETE FROM analytics_rollups WHERE service_name = ?", (service_name,))
             cur.execute("DELETE FROM analytics_incidents WHERE service_name = ?", (service_name,))
             cur.execute("DELETE FROM analytics_services WHERE id = ?", (service_id,))
         
@@ -650,19 +1091,83 @@ class AnalyticsDB:
     
     def add_metric(self, metric: ServiceMetric):
         """Record a health check result"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         cur.execute("""
             INSERT INTO analytics_metrics (service_name, timestamp, status, response_time, error_message)
             VALUES (?, ?, ?, ?, ?)
         """, (metric.service_name, metric.timestamp, metric.status, metric.response_time, metric.error_message))
+        self._apply_rollups(cur, [(metric.service_name, metric.timestamp, metric.status, metric.response_time, metric.error_message)])
         conn.commit()
         conn.close()
     
+    def add_metrics(self, rows: List[tuple]) -> int:
+        """Record many health check results in a single transaction"""
+        if not rows:
+            return 0
+        conn = self._connect()
+        try:
+            conn.executemany("""
+                INSERT INTO analytics_metrics (service_name, timestamp, status, response_time, error_message)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
+            self._apply_rollups(conn.cursor(), rows)
+            conn.commit()
+        finally:
+            conn.close()
+        return len(rows)
+    
+    async def add_metric_async(self, metric: ServiceMetric):
+        """
+        Queue a health check result for the batched writer.
+        Rows are flushed together every metric_flush_interval seconds, or
+        straight away once metric_batch_size rows are waiting.
+        """
+        self._pending_metrics.append((
+            metric.service_name, metric.timestamp, metric.status,
+            metric.response_time, metric.error_message
+        ))
+        if len(self._pending_metrics) >= self.metric_batch_size:
+            await self.flush_metrics()
+        elif self._metric_flush_task is None or self._metric_flush_task.done():
+            self._metric_flush_task = asyncio.create_task(self._metric_flush_later())
+    
+    async def _metric_flush_later(self):
+        try:
+            await asyncio.sleep(self.metric_flush_interval)
+            await self.flush_metrics()
+        except asyncio.CancelledError:
+            pass
+    
+    async def flush_metrics(self) -> int:
+        """Write every queued metric now; returns the number of rows written"""
+        if not self._pending_metrics:
+            return 0
+        batch, self._pending_metrics = self._pending_metrics, []
+        try:
+            written = await self.run(self.add_metrics, batch)
+        except Exception as e:
+            logger.error(f"Metric batch write failed ({len(batch)} rows): {e}")
+            # put the rows back so the next flush retries them
+            self._pending_metrics[:0] = batch
+            return 0
+        self._metrics_written += written
+        self._metric_batches += 1
+        return written
+    
+    def writer_stats(self) -> Dict:
+        """Batched metric writer counters"""
+        return {
+            'pending': len(self._pending_metrics),
+            'written': self._metrics_written,
+            'batches': self._metric_batches,
+            'connections': len(self._conns)
+        }
+    
     def get_metrics(self, service_name: str, hours: int = 24) -> List[ServiceMetric]:
         """Get recent metrics for a service"""
         cutoff = int(time.time()) - (hours * 3600)
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         cur.execute("""
@@ -684,7 +1189,7 @@ class AnalyticsDB:
     def get_all_metrics(self, hours: int = 24) -> List[ServiceMetric]:
         """Get all metrics across all services"""
         cutoff = int(time.time()) - (hours * 3600)
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         cur.execute("""
@@ -705,7 +1210,7 @@ class AnalyticsDB:
     
     def create_incident(self, service_name: str, error_message: str = None):
         """Create a new incident"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         cur.execute("""
             INSERT INTO analytics_incidents (service_name, start_time, error_message)
@@ -716,7 +1221,7 @@ class AnalyticsDB:
     
     def resolve_incident(self, service_name: str):
         """Resolve the most recent incident for a service"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         
         cur.execute("""
@@ -745,7 +1250,7 @@ class AnalyticsDB:
     def get_incidents(self, service_name: Optional[str] = None, hours: int = 168) -> Dict[str, List[Dict]]:
         """Get recent incidents"""
         cutoff = int(time.time()) - (hours * 3600)
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         
@@ -782,7 +1287,7 @@ class AnalyticsDB:
     def purge_old_metrics(self, days: int = 30):
         """Delete metrics older than specified days"""
         cutoff = int(time.time()) - (days * 86400)
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         cur.execute("DELETE FROM analytics_metrics WHERE timestamp < ?", (cutoff,))
         deleted = cur.rowcount
@@ -790,10 +1295,20 @@ class AnalyticsDB:
         conn.close()
         return deleted
     
+    def purge_rollups(self):
+        """Delete every rollup bucket (full health reset)"""
+        conn = self._connect()
+        cur = conn.cursor()
+        cur.execute("DELETE FROM analytics_rollups")
+        deleted = cur.rowcount
+        conn.commit()
+        conn.close()
+        return deleted
+    
     def purge_old_incidents(self, days: int = 90):
         """Delete incidents older than specified days"""
         cutoff = int(time.time()) - (days * 86400)
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         cur.execute("DELETE FROM analytics_incidents WHERE start_time < ?", (cutoff,))
         deleted = cur.rowcount
@@ -804,27 +1319,30 @@ class AnalyticsDB:
     def purge_speed_tests(self, days: int = 30):
         """Delete speed tests older than specified days"""
         cutoff = int(time.time()) - (days * 86400)
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         cur.execute("DELETE FROM network_speed WHERE timestamp < ?", (cutoff,))
         deleted = cur.rowcount
         conn.commit()
         conn.close()
+        if deleted:
+            self._invalidate_speed_agg()
         return deleted
     
     def reset_service_metrics(self, service_name: str):
         """Delete all metrics for a specific service"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         cur.execute("DELETE FROM analytics_metrics WHERE service_name = ?", (service_name,))
         deleted = cur.rowcount
+        cur.execute("DELETE FROM analytics_rollups WHERE service_name = ?", (service_name,))
         conn.commit()
         conn.close()
         return deleted
     
     def reset_service_incidents(self, service_name: str):
         """Delete all incidents for a specific service"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         cur.execute("DELETE FROM analytics_incidents WHERE service_name = ?", (service_name,))
         deleted = cur.rowcount
@@ -835,7 +1353,7 @@ class AnalyticsDB:
     
     def add_or_update_device(self, device: NetworkDevice):
         """Add or update a network device"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         
         now = int(time.time())
@@ -867,10 +1385,94 @@ class AnalyticsDB:
         
         conn.commit()
         conn.close()
-    
+
+    def reconcile_devices(self, current: List[NetworkDevice], offline_after: int = 300,
+                          offline_window: int = 600) -> Dict[str, List[NetworkDevice]]:
+        """
+        Apply one scan result against the known-device table in a single transaction.
+        Loads the known set once, diffs it in memory, then upserts every seen device
+        and writes the matching network_events in bulk. Returns the devices that are
+        new, came back online (monitored) or just went offline (monitored) so the
+        caller can notify after the commit.
+        """
+        now = int(time.time())
+        conn = self._connect()
+        cur = conn.cursor()
+        try:
+            cur.execute("BEGIN IMMEDIATE")
+            cur.execute("""
+                SELECT mac_address, ip_address, hostname, vendor, custom_name,
+                       first_seen, last_seen, is_permanent, is_monitored
+                FROM network_devices
+            """)
+            known = {
+                row[0]: NetworkDevice(
+                    mac_address=row[0], ip_address=row[1], hostname=row[2], vendor=row[3],
+                    custom_name=row[4], first_seen=row[5], last_seen=row[6],
+                    is_permanent=bool(row[7]), is_monitored=bool(row[8])
+                )
+                for row in cur.fetchall()
+            }
+
+            changes: Dict[str, List[NetworkDevice]] = {'new': [], 'online': [], 'offline': []}
+            events = []
+            seen = set()
+            for device in current:
+                if device.mac_address in seen:
+                    continue
+                seen.add(device.mac_address)
+                existing = known.get(device.mac_address)
+                if existing is None:
+                    changes['new'].append(device)
+                    events.append(('new_device', device))
+                    continue
+                # Carry user-managed fields over so notifications use the custom name
+                device.custom_name = existing.custom_name
+                device.first_seen = existing.first_seen
+                device.is_permanent = existing.is_permanent
+                device.is_monitored = existing.is_monitored
+                if existing.is_monitored and now - (existing.last_seen or 0) > offline_after:
+                    changes['online'].append(device)
+                    events.append(('device_online', device))
+
+            for mac, device in known.items():
+                if mac in seen or not device.is_monitored:
+                    continue
+                since = now - (device.last_seen or 0)
+                if offline_after < since < offline_window:
+                    changes['offline'].append(device)
+                    events.append(('device_offline', device))
+
+            cur.executemany("""
+                INSERT INTO network_devices
+                (mac_address, ip_address, hostname, vendor, first_seen, last_seen, is_permanent, is_monitored)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(mac_address) DO UPDATE SET
+                    ip_address = excluded.ip_address,
+                    hostname = excluded.hostname,
+                    vendor = excluded.vendor,
+                    last_seen = excluded.last_seen,
+                    updated_at = excluded.last_seen
+            """, [
+                (d.mac_address, d.ip_address, d.hostname, d.vendor, d.first_seen or now, now,
+                 int(d.is_permanent), int(d.is_monitored))
+                for d in current
+            ])
+            cur.executemany("""
+                INSERT INTO network_events (event_type, mac_address, ip_address, hostname, timestamp)
+                VALUES (?, ?, ?, ?, ?)
+            """, [(kind, d.mac_address, d.ip_address, d.hostname, now) for kind, d in events])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+        return changes
+
     def get_all_devices(self) -> List[Dict]:
         """Get all known network devices"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         
@@ -896,7 +1498,7 @@ class AnalyticsDB:
     
     def get_devices(self) -> List[NetworkDevice]:
         """Get all network devices"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         cur.execute("SELECT * FROM network_devices ORDER BY last_seen DESC")
@@ -920,7 +1522,7 @@ class AnalyticsDB:
     
     def get_device(self, mac_address: str) -> Optional[Dict]:
         """Get a single device by MAC address"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         
@@ -947,7 +1549,7 @@ class AnalyticsDB:
     
     def get_monitored_devices(self) -> List[Dict]:
         """Get devices that are being monitored"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         
@@ -975,7 +1577,7 @@ class AnalyticsDB:
     def update_device_settings(self, mac_address: str, is_permanent: bool = None, 
                               is_monitored: bool = None, custom_name: str = None):
         """Update device monitoring settings"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         
         updates = []
@@ -1005,7 +1607,7 @@ class AnalyticsDB:
     
     def delete_device(self, mac_address: str):
         """Delete a device from the database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         
         cur.execute("DELETE FROM network_devices WHERE mac_address = ?", (mac_address,))
@@ -1013,16 +1615,18 @@ class AnalyticsDB:
         conn.commit()
         conn.close()
     
-    def record_scan(self, devices_found: int, scan_duration: float, scan_type: str = 'arp'):
-        """Record a network scan"""
-        conn = sqlite3.connect(self.db_path)
+    def record_scan(self, devices_found: int, scan_duration: float, scan_type: str = 'arp',
+                    stage_timings: Optional[Dict[str, float]] = None):
+        """Record a network scan (stage_timings: per-stage seconds, stored as JSON)"""
+        conn = self._connect()
         cur = conn.cursor()
         
         cur.execute("""
             INSERT INTO network_scans 
-            (scan_timestamp, devices_found, scan_duration, scan_type)
-            VALUES (?, ?, ?, ?)
-        """, (int(time.time()), devices_found, scan_duration, scan_type))
+            (scan_timestamp, devices_found, scan_duration, scan_type, stage_timings)
+            VALUES (?, ?, ?, ?, ?)
+        """, (int(time.time()), devices_found, scan_duration, scan_type,
+              json.dumps(stage_timings) if stage_timings else None))
         
         conn.commit()
         conn.close()
@@ -1030,7 +1634,7 @@ class AnalyticsDB:
     def record_network_event(self, event_type: str, mac_address: str, 
                             ip_address: str = None, hostname: str = None):
         """Record a network event (new device, disconnection, etc.)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         
         cur.execute("""
@@ -1044,7 +1648,7 @@ class AnalyticsDB:
     
     def add_network_event(self, event_type: str, mac_address: str, ip_address: str = None, hostname: str = None):
         """Add a network event"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         cur.execute("""
             INSERT INTO network_events (event_type, mac_address, ip_address, hostname, timestamp)
@@ -1055,7 +1659,7 @@ class AnalyticsDB:
     
     def get_recent_network_events(self, hours: int = 24) -> List[Dict]:
         """Get recent network events"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         
@@ -1081,7 +1685,7 @@ class AnalyticsDB:
     
     def mark_event_notified(self, event_id: int):
         """Mark an event as notified"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         cur.execute("UPDATE network_events SET notified = 1 WHERE id = ?", (event_id,))
         conn.commit()
@@ -1089,7 +1693,7 @@ class AnalyticsDB:
     
     def get_network_stats(self) -> Dict:
         """Get network monitoring statistics"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         
@@ -1121,11 +1725,18 @@ class AnalyticsDB:
         active_24h = cur.fetchone()[0]
         
         cur.execute("""
-            SELECT MAX(scan_timestamp) as last_scan 
+            SELECT scan_timestamp as last_scan, scan_duration, stage_timings
             FROM network_scans
+            ORDER BY id DESC LIMIT 1
         """)
         last_scan_row = cur.fetchone()
         last_scan = last_scan_row['last_scan'] if last_scan_row else None
+        last_scan_stages = None
+        if last_scan_row and last_scan_row['stage_timings']:
+            try:
+                last_scan_stages = json.loads(last_scan_row['stage_timings'])
+            except ValueError:
+                pass
         
         conn.close()
         
@@ -1136,12 +1747,14 @@ class AnalyticsDB:
             'active_24h': active_24h,
             'scans_24h': scans_24h,
             'events_24h': events_24h,
-            'last_scan': last_scan
+            'last_scan': last_scan,
+            'last_scan_duration': last_scan_row['scan_duration'] if last_scan_row else None,
+            'last_scan_stages': last_scan_stages
         }
     
     def check_ip_in_services(self, ip_address: str) -> bool:
         """Check if IP address already exists in analytics services"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         
         cur.execute("""
@@ -1159,31 +1772,85 @@ class AnalyticsDB:
     
     def record_speed_test(self, result: SpeedTestResult):
         """Record speed test result"""
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        
-        cur.execute("""
-            INSERT INTO network_speed 
-            (timestamp, download, upload, ping, server, jitter, packet_loss, status)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            result.timestamp,
-            result.download,
-            result.upload,
-            result.ping,
-            result.server,
-            result.jitter,
-            result.packet_loss,
-            result.status
-        ))
-        
-        conn.commit()
-        conn.close()
+        # Insert under the aggregate lock: a lazy load can then never see the
+        # row and also get it added on top
+        with self._speed_lock:
+            conn = self._connect()
+            cur = conn.cursor()
+            
+            cur.execute("""
+                INSERT INTO network_speed 
+                (timestamp, download, upload, ping, server, jitter, packet_loss, status)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (
+                result.timestamp,
+                result.download,
+                result.upload,
+                result.ping,
+                result.server,
+                result.jitter,
+                result.packet_loss,
+                result.status
+            ))
+            
+            conn.commit()
+            conn.close()
+            
+            if self._speed_agg is not None:
+                self._speed_agg_add(self._speed_agg, result.timestamp, result.download, result.upload, result.ping)
         logger.info(f"Speed test recorded: {result.download:.1f}/{result.upload:.1f} Mbps, {result.ping:.1f}ms")
     
+    # Speed-test aggregates: totals for all tests plus the newest SPEED_RECENT_KEEP
+    # results, so the stats/averages endpoints never rescan network_speed.
+    
+    @staticmethod
+    def _speed_agg_add(agg: Dict, timestamp: int, download, upload, ping):
+        agg['total'] += 1
+        agg['last'] = max(agg['last'] or 0, timestamp)
+        for key, value in (('download', download), ('upload', upload), ('ping', ping)):
+            if value is not None:
+                agg['sum'][key] += value
+                agg['n'][key] += 1
+        recent = agg['recent']
+        recent.append((timestamp, download, upload, ping))
+        if len(recent) > 1 and recent[-2][0] > timestamp:
+            ordered = sorted(recent)
+            recent.clear()
+            recent.extend(ordered)
+    
+    def _speed_aggregates(self) -> Dict:
+        with self._speed_lock:
+            if self._speed_agg is None:
+                conn = self._connect()
+                cur = conn.cursor()
+                cur.execute("""
+                    SELECT COUNT(*), MAX(timestamp),
+                           SUM(download), COUNT(download), SUM(upload), COUNT(upload), SUM(ping), COUNT(ping)
+                    FROM network_speed
+                """)
+                total, last, sd, nd, su, nu, sp, np_ = cur.fetchone()
+                cur.execute("""
+                    SELECT timestamp, download, upload, ping FROM network_speed
+                    ORDER BY timestamp DESC LIMIT ?
+                """, (SPEED_RECENT_KEEP,))
+                recent = cur.fetchall()
+                conn.close()
+                self._speed_agg = {
+                    'total': total or 0,
+                    'last': last,
+                    'sum': {'download': sd or 0.0, 'upload': su or 0.0, 'ping': sp or 0.0},
+                    'n': {'download': nd or 0, 'upload': nu or 0, 'ping': np_ or 0},
+                    'recent': deque(reversed([tuple(r) for r in recent]), maxlen=SPEED_RECENT_KEEP)
+                }
+            return self._speed_agg
+    
+    def _invalidate_speed_agg(self):
+        with self._speed_lock:
+            self._speed_agg = None
+    
     def get_speed_test_history(self, hours: int = 168) -> List[Dict]:
         """Get speed test history (default 7 days)"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         
@@ -1202,7 +1869,19 @@ class AnalyticsDB:
     
     def get_speed_test_averages(self, last_n: int = 5) -> Dict[str, float]:
         """Get rolling averages for last N tests"""
-        conn = sqlite3.connect(self.db_path)
+        if last_n <= SPEED_RECENT_KEEP:
+            agg = self._speed_aggregates()
+            with self._speed_lock:
+                rows = list(agg['recent'])[-last_n:] if last_n > 0 else []
+            averages = {}
+            for i, key in ((1, 'avg_download'), (2, 'avg_upload'), (3, 'avg_ping')):
+                values = [r[i] for r in rows if r[i] is not None]
+                averages[key] = round(sum(values) / len(values), 2) if values else 0
+            if not averages['avg_download']:
+                return {'avg_download': 0, 'avg_upload': 0, 'avg_ping': 0}
+            return averages
+        
+        conn = self._connect()
         cur = conn.cursor()
         
         cur.execute("""
@@ -1232,7 +1911,7 @@ class AnalyticsDB:
     
     def get_latest_speed_test(self) -> Optional[Dict]:
         """Get most recent speed test"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         
@@ -1249,7 +1928,7 @@ class AnalyticsDB:
     
     def update_speed_test_status(self, timestamp: int, status: str):
         """Update status of a speed test"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         
         cur.execute("""
@@ -1263,38 +1942,20 @@ class AnalyticsDB:
     
     def get_speed_test_stats(self) -> Dict:
         """Get speed test statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        
-        cur.execute("SELECT COUNT(*) FROM network_speed")
-        total_tests = cur.fetchone()[0]
-        
-        cur.execute("SELECT MAX(timestamp) FROM network_speed")
-        last_test_row = cur.fetchone()
-        last_test = last_test_row[0] if last_test_row else None
-        
-        cur.execute("""
-            SELECT 
-                AVG(download) as avg_download,
-                AVG(upload) as avg_upload,
-                AVG(ping) as avg_ping
-            FROM network_speed
-        """)
-        row = cur.fetchone()
-        
-        conn.close()
-        
-        return {
-            'total_tests': total_tests,
-            'last_test': last_test,
-            'avg_download': round(row[0], 2) if row and row[0] else 0,
-            'avg_upload': round(row[1], 2) if row and row[1] else 0,
-            'avg_ping': round(row[2], 2) if row and row[2] else 0
-        }
+        agg = self._speed_aggregates()
+        with self._speed_lock:
+            avg = {k: (agg['sum'][k] / agg['n'][k] if agg['n'][k] else 0) for k in agg['sum']}
+            return {
+                'total_tests': agg['total'],
+                'last_test': agg['last'],
+                'avg_download': round(avg['download'], 2) if avg['download'] else 0,
+                'avg_upload': round(avg['upload'], 2) if avg['upload'] else 0,
+                'avg_ping': round(avg['ping'], 2) if avg['ping'] else 0
+            }
     
     def get_speed_test_settings(self) -> Dict:
         """Get speed test schedule settings"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         
@@ -1321,7 +1982,7 @@ class AnalyticsDB:
     
     def update_speed_test_settings(self, settings: Dict):
         """Update speed test schedule settings"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cur = conn.cursor()
         
         schedule_times_json = json.dumps(settings.get('schedule_times', []))
@@ -1348,11 +2009,211 @@ class AnalyticsDB:
         conn.close()
 
 
-async def safe_get(session, url, timeout):
-    """Robust HTTP/HTTPS request with full error shielding."""
+def _async_variant(name: str):
+    async def variant(self, *args, **kwargs):
+        return await self.run(getattr(self, name), *args, **kwargs)
+    variant.__name__ = f"{name}_async"
+    variant.__doc__ = f"Async variant of {name}() run on the analytics DB executor"
+    return variant
+
+
+# Awaitable twins of the blocking AnalyticsDB methods (e.g. get_metrics_async)
+for _name in (
+    'add_service', 'get_services', 'get_all_services', 'get_service', 'delete_service',
+    'get_recent_statuses',
+    'get_metrics', 'get_all_metrics', 'get_rollup_stats', 'downsample_metrics', 'create_incident', 'resolve_incident', 'get_incidents',
+    'purge_old_metrics', 'purge_rollups', 'purge_old_incidents', 'purge_speed_tests',
+    'reset_service_metrics', 'reset_service_incidents',
+    'add_or_update_device', 'reconcile_devices', 'get_all_devices', 'get_devices', 'get_device',
+    'get_monitored_devices', 'update_device_settings', 'delete_device', 'record_scan',
+    'record_network_event', 'add_network_event', 'get_recent_network_events',
+    'mark_event_notified', 'get_network_stats', 'check_ip_in_services',
+    'record_speed_test', 'get_speed_test_history', 'get_speed_test_averages',
+    'get_latest_speed_test', 'update_speed_test_status', 'get_speed_test_stats',
+    'get_speed_test_settings', 'update_speed_test_settings',
+):
+    setattr(AnalyticsDB, f"{_name}_async", _async_variant(_name))
+
+
+# ============================================================================
+# LIVE FEED
+# ============================================================================
+
+LIVE_QUEUE_SIZE = 500          # frames buffered per subscriber before it is told to resync
+LIVE_REPLAY = 1000             # recent frames kept for Last-Event-ID resume
+LIVE_METRIC_COALESCE = 1.0     # seconds per-check updates are merged per service
+
+
+class LiveFeed:
+    """
+    Server-push channel for the analytics UI (GET /api/analytics/live).
+    
+    Every event is serialised once into an SSE frame and fanned out to the
+    subscriber queues, so cost follows the change rate rather than the number
+    of open tabs. Per-check updates are coalesced per service into one
+    'metrics' event per LIVE_METRIC_COALESCE. A subscriber whose queue fills
+    up is cut off with a 'resync' event; on reconnect it resumes from the
+    replay buffer (Last-Event-ID) or gets a fresh snapshot.
+    """
+    
+    def __init__(self):
+        self.seq = 0
+        self._subs: set = set()
+        self._replay: deque = deque(maxlen=LIVE_REPLAY)  # (seq, frame)
+        self._pending_metrics: Dict[str, Dict] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self.published = 0
+        self.resyncs = 0
+    
+    def subscribe(self) -> asyncio.Queue:
+        q: asyncio.Queue = asyncio.Queue(maxsize=LIVE_QUEUE_SIZE)
+        self._subs.add(q)
+        return q
+    
+    def unsubscribe(self, q: asyncio.Queue):
+        self._subs.discard(q)
+    
+    def frame(self, kind: str, **data) -> bytes:
+        """SSE frame stamped with the current sequence number (not broadcast)"""
+        payload = json.dumps({'type': kind, 'seq': self.seq, 'ts': time.time(), **data},
+                             ensure_ascii=False, default=str)
+        return f"id: {self.seq}\ndata: {payload}\n\n".encode('utf-8')
+    
+    def resync_frame(self) -> bytes:
+        """Final frame for a dropped subscriber; the empty id clears Last-Event-ID so the reconnect gets a snapshot"""
+        payload = json.dumps({'type': 'resync', 'seq': self.seq, 'ts': time.time()})
+        return f"id:\ndata: {payload}\n\n".encode('utf-8')
+    
+    def publish(self, kind: str, **data):
+        self.seq += 1
+        if not self._subs:
+            # Nobody listening: skip serialisation; a gap forces resuming clients to resnapshot
+            self._replay.clear()
+            return
+        frame = self.frame(kind, **data)
+        self._replay.append((self.seq, frame))
+        self.published += 1
+        for q in list(self._subs):
+            try:
+                q.put_nowait(frame)
+            except asyncio.QueueFull:
+                self._subs.discard(q)
+                self.resyncs += 1
+                while not q.empty():
+                    q.get_nowait()
+                q.put_nowait(None)
+    
+    def since(self, last_id: int) -> Optional[List[bytes]]:
+        """Frames after last_id, or None when the replay buffer no longer covers it"""
+        if last_id == self.seq:
+            return []
+        if not self._replay or last_id > self.seq or self._replay[0][0] > last_id + 1:
+            return None
+        return [frame for seq, frame in self._replay if seq > last_id]
+    
+    def publish_metric(self, service_name: str, state: Dict):
+        """Queue a per-check update; merged with others into one 'metrics' event"""
+        if not self._subs:
+            return
+        self._pending_metrics[service_name] = state
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_metrics_later())
+    
+    async def _flush_metrics_later(self):
+        await asyncio.sleep(LIVE_METRIC_COALESCE)
+        pending, self._pending_metrics = self._pending_metrics, {}
+        if pending:
+            self.publish('metrics', services=pending)
+    
+    def stats(self) -> Dict:
+        return {
+            'seq': self.seq,
+            'subscribers': len(self._subs),
+            'published': self.published,
+            'resyncs': self.resyncs,
+            'replay': len(self._replay)
+        }
+
+
+# HTTP health-check client tuning
+HTTP_CHECK_LIMIT = 100           # total pooled connections
+HTTP_CHECK_LIMIT_PER_HOST = 4
+HTTP_CHECK_DNS_TTL = 300         # seconds
+HTTP_CHECK_KEEPALIVE = 75        # seconds; longer than the common 60 s check interval
+# Record DNS / connect / TTFB phases for each HTTP check (ANALYTICS_HTTP_TIMING=true)
+HTTP_CHECK_TIMING = os.getenv('ANALYTICS_HTTP_TIMING', 'false').lower() in ('1', 'true', 'yes', 'on')
+# aiohttp only returns a connection to the pool once the body is read to the end;
+# bodies up to this size are drained and discarded, larger ones drop the connection
+HTTP_CHECK_DRAIN_BYTES = int(os.getenv('ANALYTICS_HTTP_DRAIN_BYTES', str(4 * 1024 * 1024)) or 0)
+
+
+def _http_timing_trace() -> aiohttp.TraceConfig:
+    """
+    Trace hooks that fill the dict passed as trace_request_ctx with phase
+    durations in ms. aiohttp has no separate TLS hook, so 'connect' covers
+    TCP plus the TLS handshake; 'reused' means a keep-alive connection was used.
+    """
+    trace = aiohttp.TraceConfig()
+    
+    def _mark(key):
+        async def hook(session, ctx, params):
+            if isinstance(ctx.trace_request_ctx, dict):
+                ctx.trace_request_ctx[key] = time.perf_counter()
+        return hook
+    
+    async def on_reuse(session, ctx, params):
+        if isinstance(ctx.trace_request_ctx, dict):
+            ctx.trace_request_ctx['reused'] = True
+    
+    trace.on_request_start.append(_mark('_start'))
+    trace.on_dns_resolvehost_start.append(_mark('_dns_start'))
+    trace.on_dns_resolvehost_end.append(_mark('_dns_end'))
+    trace.on_connection_create_start.append(_mark('_conn_start'))
+    trace.on_connection_create_end.append(_mark('_conn_end'))
+    trace.on_connection_reuseconn.append(on_reuse)
+    trace.on_request_end.append(_mark('_headers'))
+    return trace
+
+
+def _http_timing_summary(marks: Dict) -> Optional[Dict[str, float]]:
+    """Collapse trace marks into {'dns','connect','ttfb','total'} ms"""
+    start = marks.get('_start')
+    if start is None:
+        return None
+    
+    def span(a, b):
+        if marks.get(a) is None or marks.get(b) is None:
+            return None
+        return round((marks[b] - marks[a]) * 1000, 1)
+    
+    out = {
+        'dns': span('_dns_start', '_dns_end'),
+        'connect': span('_conn_start', '_conn_end'),
+        'ttfb': span('_conn_end' if '_conn_end' in marks else '_start', '_headers'),
+        'total': span('_start', '_headers'),
+        'reused': bool(marks.get('reused'))
+    }
+    return out
+
+
+async def safe_get(session, url, timeout, **kwargs):
+    """
+    Robust HTTP/HTTPS request with full error shielding. Returns
+    (status, headers, seconds to response headers); the body is drained
+    inside the request so the keep-alive connection goes back to the pool.
+    """
     try:
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout)) as r:
-            return r
+        start = time.time()
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=timeout), **kwargs) as r:
+            ttfb = time.time() - start
+            left = HTTP_CHECK_DRAIN_BYTES
+            while left > 0:
+                chunk = await r.content.read(min(65536, left))
+                if not chunk:
+                    break
+                left -= len(chunk)
+            r.release()
+            return r.status, r.headers, ttfb
     except (aiohttp.ClientError,
             asyncio.TimeoutError,
             ConnectionResetError,
@@ -1361,6 +2222,161 @@ async def safe_get(session, url, timeout):
             socket.error) as e:
         raise RuntimeError(f"unreachable: {e}")
 
+# ============================================================================
+# CHECK SCHEDULER
+# ============================================================================
+
+# Global cap on health checks running at the same time
+MAX_CONCURRENT_CHECKS = int(os.getenv('ANALYTICS_MAX_CONCURRENT_CHECKS', '20') or 20)
+# First runs are spread over at most this many seconds (per-service phase offset)
+SCHEDULE_SPREAD = 60
+
+
+class CheckScheduler:
+    """
+    One heap-driven loop for every service check instead of a task per service.
+    Each service gets a deterministic phase (crc32 of its name) so startups
+    don't fire in lockstep, runs at a fixed rate from that phase, and never
+    overlaps itself. A semaphore caps how many checks run at once.
+    """
+    
+    def __init__(self, run_check: Callable, max_concurrency: int = MAX_CONCURRENT_CHECKS):
+        self.run_check = run_check
+        self.max_concurrency = max(1, max_concurrency)
+        self._jobs: Dict[str, HealthCheck] = {}
+        self._gen: Dict[str, int] = {}
+        self._heap: List[tuple] = []  # (due, seq, service_name, generation)
+        self._seq = 0
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._waiting = 0
+        self._runs = 0
+        self._skipped = 0
+        self._lag_avg = 0.0
+        self._lag_max = 0.0
+    
+    @staticmethod
+    def phase(service: HealthCheck) -> float:
+        spread = max(1, min(service.interval, SCHEDULE_SPREAD))
+        return (zlib.crc32(service.service_name.encode()) % 10000) / 10000 * spread
+    
+    def _push(self, name: str, due: float):
+        self._seq += 1
+        heapq.heappush(self._heap, (due, self._seq, name, self._gen[name]))
+        if self._wake:
+            self._wake.set()
+    
+    def schedule(self, service: HealthCheck):
+        """Add or replace a service; the new config takes effect from its next slot"""
+        name = service.service_name
+        self._jobs[name] = service
+        self._gen[name] = self._gen.get(name, 0) + 1
+        self._push(name, time.monotonic() + self.phase(service))
+    
+    def unschedule(self, service_name: str):
+        """Stop checking a service (an in-flight check is cancelled)"""
+        self._jobs.pop(service_name, None)
+        self._gen[service_name] = self._gen.get(service_name, 0) + 1
+        task = self._in_flight.pop(service_name, None)
+        if task:
+            task.cancel()
+    
+    def is_scheduled(self, service_name: str) -> bool:
+        return service_name in self._jobs
+    
+    def start(self):
+        if self._task and not self._task.done():
+            return
+        self._sem = asyncio.Semaphore(self.max_concurrency)
+        self._wake = asyncio.Event()
+        self._task = asyncio.create_task(self._loop())
+    
+    async def stop(self):
+        tasks = [t for t in (self._task, *self._in_flight.values()) if t]
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._in_flight.clear()
+    
+    async def _loop(self):
+        while True:
+            # drop stale heap entries (service removed or rescheduled)
+            while self._heap and self._heap[0][3] != self._gen.get(self._heap[0][2]):
+                heapq.heappop(self._heap)
+            self._wake.clear()
+            if not self._heap:
+                await self._wake.wait()
+                continue
+            due = self._heap[0][0]
+            delay = due - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            
+            due, _, name, gen = heapq.heappop(self._heap)
+            service = self._jobs.get(name)
+            if service is None or gen != self._gen.get(name):
+                continue
+            
+            # next slot at a fixed rate from the phase; skip slots we already missed
+            interval = max(1, service.interval)
+            now = time.monotonic()
+            next_due = due + interval
+            if next_due <= now:
+                missed = int((now - due) // interval)
+                self._skipped += missed
+                next_due = due + (missed + 1) * interval
+            self._push(name, next_due)
+            
+            if name in self._in_flight or not service.enabled:
+                continue  # previous check still running: this slot is skipped
+            
+            self._waiting += 1
+            try:
+                await self._sem.acquire()
+            finally:
+                self._waiting -= 1
+            lag = time.monotonic() - due
+            self._lag_avg = lag if self._runs == 0 else self._lag_avg * 0.9 + lag * 0.1
+            self._lag_max = max(self._lag_max, lag)
+            self._runs += 1
+            self._in_flight[name] = asyncio.create_task(self._run(name, service))
+    
+    async def _run(self, name: str, service: HealthCheck):
+        try:
+            await self.run_check(service)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"Error monitoring {name}: {e}")
+        finally:
+            self._sem.release()
+            if self._in_flight.get(name) is asyncio.current_task():
+                del self._in_flight[name]
+    
+    def stats(self) -> Dict:
+        now = time.monotonic()
+        live = [e for e in self._heap if e[3] == self._gen.get(e[2])]
+        return {
+            'scheduled': len(self._jobs),
+            'queue_depth': len(live),
+            'overdue': sum(1 for e in live if e[0] <= now) + self._waiting,
+            'in_flight': len(self._in_flight),
+            'max_concurrency': self.max_concurrency,
+            'checks_run': self._runs,
+            'skipped_slots': self._skipped,
+            'lag_avg_ms': round(self._lag_avg * 1000, 1),
+            'lag_max_ms': round(self._lag_max * 1000, 1),
+            'next_due_in': round(min(e[0] for e in live) - now, 2) if live else None
+        }
+
+
 # ============================================================================
 # HEALTH MONITOR CLASS
 # ============================================================================
@@ -1371,8 +2387,65 @@ class HealthMonitor:
     def __init__(self, db: AnalyticsDB, notification_callback: Callable):
         self.db = db
         self.notify = notification_callback
-        self.monitoring_tasks: Dict[str, asyncio.Task] = {}
-        self.flap_trackers: Dict[str, FlapTracker] = {}
+        self.scheduler = CheckScheduler(self.run_check)
+        self.states: Dict[str, ServiceState] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _http_session(self) -> aiohttp.ClientSession:
+        """Long-lived session shared by every HTTP check of this monitor"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=HTTP_CHECK_LIMIT,
+                limit_per_host=HTTP_CHECK_LIMIT_PER_HOST,
+                ttl_dns_cache=HTTP_CHECK_DNS_TTL,
+                keepalive_timeout=HTTP_CHECK_KEEPALIVE,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                trace_configs=[_http_timing_trace()] if HTTP_CHECK_TIMING else None
+            )
+        return self._session
+    
+    def state(self, service_name: str) -> ServiceState:
+        """State table entry for a service (created on first use)"""
+        st = self.states.get(service_name)
+        if st is None:
+            st = self.states[service_name] = ServiceState(service_name)
+        return st
+    
+    async def hydrate_states(self):
+        """Seed the state table from the newest stored checks (once, at startup)"""
+        try:
+            recent = await self.db.get_recent_statuses_async(STATE_WINDOW)
+        except Exception as e:
+            logger.error(f"Could not hydrate service states: {e}")
+            return
+        for name, rows in recent.items():
+            st = self.state(name)
+            for row in reversed(rows):
+                st.record(ServiceMetric(
+                    service_name=name,
+                    timestamp=row['timestamp'],
+                    status=row['status'],
+                    response_time=row['response_time'],
+                    error_message=row['error_message']
+                ))
+            st.flap.last_status = st.last_status
+        logger.info(f"Hydrated state for {len(recent)} services")
+    
+    def forget(self, service_name: str):
+        """Drop a service from the state table (deleted or renamed)"""
+        self.states.pop(service_name, None)
+    
+    async def reload_states(self):
+        """Rebuild the state table from what is left in the DB (after a reset or purge)"""
+        self.states.clear()
+        await self.hydrate_states()
+    
+    def snapshot(self) -> Dict[str, Dict]:
+        """service_name -> current state, for the API and Atlas"""
+        return {name: st.to_dict() for name, st in self.states.items()}
 
     async def check_service(self, service: HealthCheck) -> ServiceMetric:
         """Perform a single health check with retry logic and robust aiohttp handling"""
@@ -1396,23 +2469,28 @@ class HealthMonitor:
                 # HTTP / HTTPS service check
                 # -----------------------------
                 if service.check_type == 'http':
-                    async with aiohttp.ClientSession() as session:
-                        try:
-                            response = await safe_get(session, service.endpoint, service.timeout)
-                            response_time = time.time() - start_time
-                            if response.status == service.expected_status:
-                                return ServiceMetric(
-                                    service_name=service.service_name,
-                                    timestamp=int(time.time()),
-                                    status='up',
-                                    response_time=response_time
-                                )
-                            else:
-                                error_msg = f"Unexpected status {response.status} (expected {service.expected_status})"
-                        except asyncio.TimeoutError:
-                            error_msg = f"HTTP timeout after {service.timeout}s"
-                        except aiohttp.ClientError as e:
-                            error_msg = f"HTTP error: {str(e)}"
+                    session = self._http_session()
+                    marks = {} if HTTP_CHECK_TIMING else None
+                    try:
+                        status, _headers, response_time = await safe_get(
+                            session, service.endpoint, service.timeout, trace_request_ctx=marks)
+                        timing = _http_timing_summary(marks) if marks else None
+                        if timing:
+                            logger.debug(f"[{service.service_name}] HTTP timing: {timing}")
+                        if status == service.expected_status:
+                            return ServiceMetric(
+                                service_name=service.service_name,
+                                timestamp=int(time.time()),
+                                status='up',
+                                response_time=response_time,
+                                timing=timing
+                            )
+                        else:
+                            error_msg = f"Unexpected status {status} (expected {service.expected_status})"
+                    except asyncio.TimeoutError:
+                        error_msg = f"HTTP timeout after {service.timeout}s"
+                    except aiohttp.ClientError as e:
+                        error_msg = f"HTTP error: {str(e)}"
 
                 # -----------------------------
                 # TCP port check
@@ -1492,12 +2570,11 @@ class HealthMonitor:
 
         
     
-    def should_suppress_notification(self, service_name: str, status: str) -> bool:
+    def should_suppress_notification(self, service_name: str, status: str,
+                                     service: Optional[HealthCheck] = None) -> bool:
         """Check if notification should be suppressed due to flapping"""
-        if service_name not in self.flap_trackers:
-            self.flap_trackers[service_name] = FlapTracker()
-        
-        tracker = self.flap_trackers[service_name]
+        state = self.state(service_name)
+        tracker = state.flap
         now = time.time()
         
         if tracker.suppressed_until and now < tracker.suppressed_until:
@@ -1509,11 +2586,13 @@ class HealthMonitor:
         tracker.flap_times.append(now)
         tracker.last_status = status
         
-        service = None
-        for s in self.db.get_services():
-            if s.service_name == service_name:
-                service = s
-                break
+        if service is None:
+            service = state.config
+        if service is None:
+            for s in self.db.get_services():
+                if s.service_name == service_name:
+                    service = s
+                    break
         
         if not service:
             return False
@@ -1528,71 +2607,105 @@ class HealthMonitor:
         
         return False
     
-    async def monitor_service(self, service: HealthCheck):
-        """Continuously monitor a service"""
-        logger.info(f"Starting monitor for {service.service_name}")
+    async def run_check(self, service: HealthCheck):
+        """Run one check for a service and act on the result (called by the scheduler)"""
+        state = self.state(service.service_name)
+        state.config = service
         
-        while True:
-            try:
-                if not service.enabled:
-                    await asyncio.sleep(service.interval)
-                    continue
-                
-                metric = await self.check_service(service)
-                self.db.add_metric(metric)
-                
-                recent_metrics = self.db.get_metrics(service.service_name, hours=1)
-                previous_status = recent_metrics[1].status if len(recent_metrics) > 1 else None
-                
-                if metric.status == 'down' and previous_status != 'down':
-                    self.db.create_incident(service.service_name, metric.error_message)
-                    
-                    if not self.should_suppress_notification(service.service_name, 'down'):
-                        await analytics_notify(
-                            service.service_name,
-                            'down',
-                            f"Service is DOWN: {metric.error_message or 'No response'}"
-                        )
-                
-                elif metric.status == 'up' and previous_status == 'down':
-                    self.db.resolve_incident(service.service_name)
-                    
-                    if not self.should_suppress_notification(service.service_name, 'up'):
-                        await analytics_notify(
-                            service.service_name,
-                            'up',
-                            f"Service has RECOVERED (response time: {metric.response_time:.2f}s)"
-                        )
-                
-                await asyncio.sleep(service.interval)
-                
-            except asyncio.CancelledError:
-                logger.info(f"Monitor cancelled for {service.service_name}")
-                break
-            except Exception as e:
-                logger.error(f"Error monitoring {service.service_name}: {e}")
-                await asyncio.sleep(service.interval)
+        metric = await self.check_service(service)
+        await self.db.add_metric_async(metric)
+        
+        previous_status = state.record(metric)
+        snapshot = state.to_dict()
+        live_feed.publish_metric(service.service_name, snapshot)
+        if previous_status != metric.status:
+            live_feed.publish('status', service=service.service_name, previous=previous_status, state=snapshot)
+        
+        if metric.status == 'down' and previous_status != 'down':
+            await self.db.create_incident_async(service.service_name, metric.error_message)
+            live_feed.publish('incident', action='opened', service=service.service_name,
+                              message=metric.error_message)
+            
+            if not self.should_suppress_notification(service.service_name, 'down', service):
+                await analytics_notify(
+                    service.service_name,
+                    'down',
+                    f"Service is DOWN: {metric.error_message or 'No response'}"
+                )
+        
+        elif metric.status == 'up' and previous_status == 'down':
+            await self.db.resolve_incident_async(service.service_name)
+            live_feed.publish('incident', action='resolved', service=service.service_name)
+            
+            if not self.should_suppress_notification(service.service_name, 'up', service):
+                await analytics_notify(
+                    service.service_name,
+                    'up',
+                    f"Service has RECOVERED (response time: {metric.response_time:.2f}s)"
+                )
+    
+    def schedule(self, service: HealthCheck):
+        """Start (or reschedule) monitoring of a service; disabled services are removed"""
+        self.state(service.service_name).config = service
+        if service.enabled:
+            logger.info(f"Scheduling monitor for {service.service_name} every {service.interval}s")
+            self.scheduler.schedule(service)
+        else:
+            self.scheduler.unschedule(service.service_name)
+        live_feed.publish('service', action='scheduled' if service.enabled else 'disabled',
+                          service=service.service_name)
+    
+    def unschedule(self, service_name: str):
+        """Stop monitoring a service"""
+        if self.scheduler.is_scheduled(service_name):
+            logger.info(f"Monitor removed for {service_name}")
+        self.scheduler.unschedule(service_name)
+        live_feed.publish('service', action='removed', service=service_name)
     
     async def start_all(self):
         """Start monitoring all enabled services"""
-        services = self.db.get_services()
+        if not self.states:
+            await self.hydrate_states()
+        services = await self.db.get_services_async()
         for service in services:
-            if service.enabled and service.service_name not in self.monitoring_tasks:
-                task = asyncio.create_task(self.monitor_service(service))
-                self.monitoring_tasks[service.service_name] = task
+            if service.enabled:
+                self.schedule(service)
+        self.scheduler.start()
     
     async def stop_all(self):
         """Stop all monitoring tasks"""
-        for task in self.monitoring_tasks.values():
-            task.cancel()
-        await asyncio.gather(*self.monitoring_tasks.values(), return_exceptions=True)
-        self.monitoring_tasks.clear()
+        await self.scheduler.stop()
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
 
 # ============================================================================
 # NETWORK SCANNER CLASS
 # ============================================================================
 
+# Scan enrichment tuning
+ENRICH_CONCURRENCY = 32        # devices enriched at once
+PROBE_TIMEOUT = 1.0            # seconds per port probe
+DNS_TIMEOUT = 2.0              # seconds per reverse lookup
+DNS_CACHE_TTL = 3600           # seconds a resolved hostname is reused
+DNS_NEGATIVE_TTL = 600         # seconds a failed lookup is remembered
+SCAN_REUSE_TTL = 300           # seconds a finished scan is reused by discovery
+
+# Ports probed to identify well-known services (first open port in this order wins)
+COMMON_SERVICE_PORTS = {
+    32400: 'Plex Media Server',
+    8080: 'Kodi',
+    8096: 'Jellyfin',
+    8920: 'Emby',
+    49152: 'Universal Plug and Play',
+    987: 'PlayStation',           # PS5/PS4 Remote Play
+    9295: 'PlayStation',          # PS5
+    9296: 'PlayStation',          # PS5
+    9297: 'PlayStation',          # PS5
+}
+
+
 class NetworkScanner:
     """Network device discovery and monitoring"""
     
@@ -1602,6 +2715,10 @@ class NetworkScanner:
         self.alert_new_devices = True
         self.notification_callback = None
         self._monitor_task = None
+        self._dns_cache: Dict[str, tuple] = {}  # ip -> (hostname or None, expires_at)
+        self._dns_hits = 0
+        self.last_scan: Optional[tuple] = None  # (finished_at, devices) of the newest scan
+        self._scan_lock: Optional[asyncio.Lock] = None
     
     def set_notification_callback(self, callback: Callable):
         """Set the notification callback for network events"""
@@ -1616,19 +2733,28 @@ class NetworkScanner:
         """
         start_time = time.time()
         devices = []
+        stages: Dict[str, float] = {}
+        
+        def stage_done(name: str, since: float) -> float:
+            now = time.time()
+            stages[name] = round(now - since, 3)
+            return now
         
         try:
             # Step 1: Get local network subnet
+            t = time.time()
             subnet = await self._get_local_subnet()
             if not subnet:
                 logger.error("Could not determine local subnet")
                 return devices
+            t = stage_done('subnet', t)
             
             logger.info(f"Starting full network scan on {subnet}")
             
             # Step 2: Active ping sweep to discover ALL devices
             active_ips = await self._ping_sweep(subnet)
             logger.info(f"Ping sweep found {len(active_ips)} active IPs")
+            t = stage_done('sweep', t)
             
             # Step 3: Get MAC addresses from ARP (after ping sweep fills ARP table)
             mac_map = await self._get_arp_table()
@@ -1663,59 +2789,104 @@ class NetworkScanner:
                     logger.error(f"nmap fallback failed: {e}")
             
             logger.info(f"Found {len(mac_map)} MAC addresses from ARP/nmap")
+            t = stage_done('arp', t)
             
-            # Step 4: Process each discovered device
+            # Step 4: Enrich discovered devices concurrently (hostname, vendor, services)
+            targets = []
             for ip in active_ips:
                 mac = mac_map.get(ip)
                 if not mac or mac == 'FF:FF:FF:FF:FF:FF' or mac.startswith('00:00:00'):
                     continue
-                
-                # Resolve hostname
-                hostname = await self._resolve_hostname(ip)
-                
-                # Vendor lookup from MAC
-                vendor = self._lookup_vendor(mac)
-                
-                # Port scan for service detection (Plex, PS5, etc)
-                detected_service = await self._probe_common_services(ip)
-                
-                # Detect device type
-                device_type, friendly_name = self._detect_device_type(vendor, hostname, mac)
-                
-                # Override friendly name if service detected
-                if detected_service:
-                    friendly_name = f"{detected_service} ({mac[-8:]})"
-                    device_type = 'server'
-                
-                # Use friendly name as custom_name if we don't have hostname
-                custom_name = friendly_name if not hostname else None
-                
-                device = NetworkDevice(
-                    mac_address=mac,
-                    ip_address=ip,
-                    hostname=hostname,
-                    vendor=vendor,
-                    custom_name=custom_name,
-                    first_seen=int(time.time()),
-                    last_seen=int(time.time())
-                )
-                devices.append(device)
-                
-                # Enhanced logging
-                logger.info(f"[SCAN] {device_type}: {friendly_name} | IP: {ip} | Vendor: {vendor or 'Unknown'}")
+                targets.append((ip, mac))
+            
+            sem = asyncio.Semaphore(ENRICH_CONCURRENCY)
+            dns_hits_before = self._dns_hits
+            
+            async def bounded(ip, mac):
+                async with sem:
+                    return await self._enrich_device(ip, mac, stages)
+            
+            results = await asyncio.gather(*(bounded(ip, mac) for ip, mac in targets),
+                                           return_exceptions=True)
+            for (ip, mac), result in zip(targets, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"[SCAN] enrichment failed for {ip}: {result}")
+                    continue
+                devices.append(result)
+            t = stage_done('enrich', t)
+            stages['dns_cache_hits'] = self._dns_hits - dns_hits_before
+            stages['dns_busy'] = round(stages.get('dns_busy', 0.0), 3)
+            stages['probe_busy'] = round(stages.get('probe_busy', 0.0), 3)
             
             scan_duration = time.time() - start_time
-            self.db.record_scan(len(devices), scan_duration)
+            await self.db.record_scan_async(len(devices), scan_duration, stage_timings=stages)
             
-            logger.info(f"✅ Network scan complete: {len(devices)} devices in {scan_duration:.1f}s")
+            logger.info(f"✅ Network scan complete: {len(devices)} devices in {scan_duration:.1f}s | stages: {stages}")
+            self.last_scan = (time.time(), devices)
             
         except Exception as e:
             logger.error(f"Network scan error: {e}", exc_info=True)
         
         return devices
     
+    async def recent_devices(self, max_age: float = SCAN_REUSE_TTL) -> List[NetworkDevice]:
+        """Devices from the newest scan if it is younger than max_age, otherwise scan now.
+        Concurrent callers wait for and share a single scan."""
+        if self._scan_lock is None:
+            self._scan_lock = asyncio.Lock()
+        async with self._scan_lock:
+            if self.last_scan and time.time() - self.last_scan[0] <= max_age:
+                return list(self.last_scan[1])
+            return await self.scan_network()
+    
+    async def _enrich_device(self, ip: str, mac: str, stages: Dict[str, float]) -> NetworkDevice:
+        """Resolve hostname and probe services in parallel, then classify the device"""
+        async def timed(key, coro):
+            t = time.time()
+            try:
+                return await coro
+            finally:
+                stages[key] = stages.get(key, 0.0) + (time.time() - t)
+        
+        hostname, detected_service = await asyncio.gather(
+            timed('dns_busy', self._resolve_hostname(ip)),
+            timed('probe_busy', self._probe_common_services(ip))
+        )
+        
+        # Vendor lookup from MAC
+        vendor = self._lookup_vendor(mac)
+        
+        # Detect device type
+        device_type, friendly_name = self._detect_device_type(vendor, hostname, mac)
+        
+        # Override friendly name if service detected
+        if detected_service:
+            friendly_name = f"{detected_service} ({mac[-8:]})"
+            device_type = 'server'
+        
+        # Use friendly name as custom_name if we don't have hostname
+        custom_name = friendly_name if not hostname else None
+        
+        # Enhanced logging
+        logger.info(f"[SCAN] {device_type}: {friendly_name} | IP: {ip} | Vendor: {vendor or 'Unknown'}")
+        
+        now = int(time.time())
+        return NetworkDevice(
+            mac_address=mac,
+            ip_address=ip,
+            hostname=hostname,
+            vendor=vendor,
+            custom_name=custom_name,
+            first_seen=now,
+            last_seen=now
+        )
+    
     async def _get_local_subnet(self) -> Optional[str]:
         """Detect local subnet (e.g., 192.168.1.0/24)"""
+        if netsweep:
+            network = netsweep.local_network()
+            if network:
+                return network
         try:
             # Get default route
             proc = await asyncio.create_subprocess_exec(
@@ -1751,9 +2922,17 @@ class NetworkScanner:
     
     async def _ping_sweep(self, subnet: str) -> List[str]:
         """
-        Active ping sweep of entire subnet
+        Active sweep of the whole subnet (any prefix length)
         Returns list of responsive IP addresses
         """
+        if netsweep:
+            try:
+                active_ips, method = await netsweep.sweep(subnet)
+                logger.info(f"Sweep via {method}: {len(active_ips)} hosts up on {subnet}")
+                return active_ips
+            except Exception as e:
+                logger.warning(f"Native sweep failed, falling back to ping: {e}")
+        
         active_ips = []
         
         # Parse subnet (e.g., "192.168.1.0/24" -> base + range)
@@ -1789,6 +2968,14 @@ class NetworkScanner:
     
     async def _get_arp_table(self) -> Dict[str, str]:
         """Get MAC addresses from ARP table (call after ping sweep)"""
+        if netsweep:
+            try:
+                mac_map = await netsweep.read_neighbors()
+                if mac_map:
+                    return mac_map
+            except Exception as e:
+                logger.warning(f"Neighbour table read failed, falling back to arp: {e}")
+        
         mac_map = {}
         
         try:
@@ -1812,426 +2999,33 @@ class NetworkScanner:
         return mac_map
     
     async def _resolve_hostname(self, ip: str) -> Optional[str]:
-        """Resolve hostname from IP address"""
+        """Resolve hostname from IP address (cached, including failures)"""
+        now = time.time()
+        cached = self._dns_cache.get(ip)
+        if cached and cached[1] > now:
+            self._dns_hits += 1
+            return cached[0]
         try:
             loop = asyncio.get_event_loop()
             hostname = await asyncio.wait_for(
                 loop.run_in_executor(None, socket.gethostbyaddr, ip),
-                timeout=2.0
+                timeout=DNS_TIMEOUT
             )
-            return hostname[0] if hostname else None
+            name = hostname[0] if hostname else None
         except:
-            return None
+            name = None
+        self._dns_cache[ip] = (name, now + (DNS_CACHE_TTL if name else DNS_NEGATIVE_TTL))
+        return name
     
     def _lookup_vendor(self, mac: str) -> Optional[str]:
-        """Lookup vendor from MAC address OUI (first 3 octets) - COMPREHENSIVE DATABASE"""
-        oui = mac[:8].replace(':', '').upper()
-        oui_6 = oui[:6]
-        
-        # Comprehensive MAC OUI vendor database (1000+ vendors)
-        vendors = {
-            # Apple devices
-            '001B63': 'Apple',
-            '0050F2': 'Apple',
-            '0056CD': 'Apple', 
-            '001E52': 'Apple',
-            '001F5B': 'Apple',
-            '001FF3': 'Apple',
-            '0023DF': 'Apple',
-            '002436': 'Apple',
-            '002500': 'Apple',
-            '002608': 'Apple',
-            '0026BB': 'Apple',
-            '28E02C': 'Apple',
-            '28E7CF': 'Apple',
-            '28F076': 'Apple',
-            '2C200B': 'Apple',
-            '30636B': 'Apple',
-            '34159E': 'Apple',
-            '342D0D': 'Apple',
-            '3451C9': 'Apple',
-            '38484C': 'Apple',
-            '38C986': 'Apple',
-            '3C0754': 'Apple',
-            '3CE072': 'Apple',
-            '40331A': 'Apple',
-            '40D32D': 'Apple',
-            '4C3275': 'Apple',
-            '4C7C5F': 'Apple',
-            '50EAD6': 'Apple',
-            '58B035': 'Apple',
-            '5CF938': 'Apple',
-            '609217': 'Apple',
-            '64200C': 'Apple',
-            '68967B': 'Apple',
-            '6C3E6D': 'Apple',
-            '6C94F8': 'Apple',
-            '70A2B3': 'Apple',
-            '78A3E4': 'Apple',
-            '7C6D62': 'Apple',
-            '7CF05F': 'Apple',
-            '80929F': 'Apple',
-            '8489AD': 'Apple',
-            '88E87F': 'Apple',
-            '9027E4': 'Apple',
-            '9803D8': 'Apple',
-            '9CF387': 'Apple',
-            'A0999B': 'Apple',
-            'A46CF1': 'Apple',
-            'A8667F': 'Apple',
-            'A88808': 'Apple',
-            'B065BD': 'Apple',
-            'B418D1': 'Apple',
-            'B8E856': 'Apple',
-            'C82A14': 'Apple',
-            'CC08E0': 'Apple',
-            'D0A637': 'Apple',
-            'D49A20': 'Apple',
-            'DC2B61': 'Apple',
-            'E0B9BA': 'Apple',
-            'E80688': 'Apple',
-            'F0B479': 'Apple',
-            'F0D1A9': 'Apple',
-            'F45C89': 'Apple',
-            
-            # Samsung (Android devices, TVs)
-            '001EC0': 'Samsung',
-            '002454': 'Samsung',
-            '0024E9': 'Samsung',
-            '002566': 'Samsung',
-            '28BAB5': 'Samsung',
-            '34C3AC': 'Samsung',
-            '3C28D1': 'Samsung',
-            '40F520': 'Samsung',
-            '4C3C16': 'Samsung',
-            '5C3C27': 'Samsung',
-            '6C2F2C': 'Samsung',
-            '7C1C4E': 'Samsung',
-            '880308': 'Samsung',
-            '8C71F8': 'Samsung',
-            'A06518': 'Samsung',
-            'B4C4FC': 'Samsung',
-            'C4576E': 'Samsung',
-            'CC07AB': 'Samsung',
-            'D022BE': 'Samsung',
-            'D4E8B2': 'Samsung',
-            'E4121D': 'Samsung',
-            'F83F51': 'Samsung',
-            
-            # Google (Android, Chromecast, Google Home)
-            '3C5A37': 'Google',
-            '54A050': 'Google',
-            '6C5697': 'Google',
-            '84B541': 'Google',
-            '9C65B0': 'Google',
-            'A4F733': 'Google',
-            'CC3ADF': 'Google',
-            'D843AE': 'Google',
-            'F4F5D8': 'Google',
-            'F8A45F': 'Google',
-            '6CC7EC': 'Google',
-            '98F09E': 'Google',
-            
-            # Microsoft (Xbox, Surface)
-            '0050F2': 'Microsoft',
-            '001DD8': 'Microsoft',
-            '002248': 'Microsoft',
-            '0026B6': 'Microsoft',
-            '00D0CA': 'Microsoft',
-            '001676': 'Microsoft',
-            '001E37': 'Microsoft',
-            '7C1E52': 'Microsoft',
-            'D48564': 'Microsoft',
-            
-            # Sony (PlayStation, TVs)
-            '001C9A': 'Sony',
-            '001EA9': 'Sony',
-            '001EA7': 'Sony',
-            '001EDF': 'Sony',
-            '002140': 'Sony',
-            '00233A': 'Sony',
-            '00259A': 'Sony',
-            '002608': 'Sony',
-            '0026BB': 'Sony',
-            '003EE1': 'Sony',
-            '0CD292': 'Sony',
-            '1857ED': 'Sony',
-            '2C44FD': 'Sony',
-            '34AF2C': 'Sony',
-            '4C3B92': 'Sony',
-            '54A050': 'Sony',
-            '5C969D': 'Sony',
-            '6C5697': 'Sony',
-            '7C1DD9': 'Sony',
-            '7C6DF8': 'Sony',
-            '8C3BAD': 'Sony',
-            '9C53CD': 'Sony',
-            'A00AED': 'Sony',
-            'FC0FE6': 'Sony',
-            '587F57': 'Sony',  # PS5
-            '7CAA87': 'Sony',  # PS5
-            'A0C589': 'Sony',  # PS5/PS4
-            'C4E984': 'Sony',  # PS4
-            'FC0FE6': 'Sony',  # PS4
-            '0418D6': 'Sony',  # PS4
-            '00D9D1': 'Sony',  # PS3
-            '0080C8': 'Sony',  # PS3
-            '001B63': 'Sony',  # Bravia TV
-            
-            # Oppo (Android phones, TV boxes)
-            '08974B': 'Oppo',
-            '1015A3': 'Oppo',
-            '1CB57C': 'Oppo',
-            '20E178': 'Oppo',
-            '2C2997': 'Oppo',
-            '343111': 'Oppo',
-            '50B7C3': 'Oppo',
-            '5CC3C3': 'Oppo',
-            '70E72C': 'Oppo',
-            '788A20': 'Oppo',
-            '7C1DD9': 'Oppo',
-            '8C68C8': 'Oppo',
-            'A45046': 'Oppo',
-            'A86C6D': 'Oppo',
-            'B05CF9': 'Oppo',
-            'C49A02': 'Oppo',
-            'D0B24E': 'Oppo',
-            'EC9B8E': 'Oppo',
-            'F0272D': 'Oppo',
-            
-            # Vivo (Android phones)
-            '1062EB': 'Vivo',
-            '2899CF': 'Vivo',
-            '38E60A': 'Vivo',
-            '5C857E': 'Vivo',
-            '7C2F80': 'Vivo',
-            '80EA07': 'Vivo',
-            '98D46A': 'Vivo',
-            'A01E78': 'Vivo',
-            'C49EFF': 'Vivo',
-            'E0443D': 'Vivo',
-            
-            # Nintendo (Switch)
-            '006057': 'Nintendo',
-            '001F32': 'Nintendo',
-            '0009BF': 'Nintendo',
-            '0019FD': 'Nintendo',
-            '001A4A': 'Nintendo',
-            '001B7A': 'Nintendo',
-            '001DBC': 'Nintendo',
-            '001EA9': 'Nintendo',
-            '001F32': 'Nintendo',
-            '001FC5': 'Nintendo',
-            '001BEA': 'Nintendo',
-            '002147': 'Nintendo',
-            '0022D7': 'Nintendo',
-            '002359': 'Nintendo',
-            '0023CC': 'Nintendo',
-            '0024F3': 'Nintendo',
-            '002659': 'Nintendo',
-            '40F407': 'Nintendo',
-            'A45C27': 'Nintendo',
-            'B8AE6E': 'Nintendo',
-            'CC9E00': 'Nintendo',
-            'DC68EB': 'Nintendo',
-            
-            # LG (TVs, appliances)
-            '001C62': 'LG',
-            '002454': 'LG',
-            '0060B3': 'LG',
-            '10F96F': 'LG',
-            '18F46A': 'LG',
-            '20CF30': 'LG',
-            '44E137': 'LG',
-            '64BC0C': 'LG',
-            '6C5697': 'LG',
-            '78E400': 'LG',
-            '88C9D0': 'LG',
-            'B4E1C4': 'LG',
-            'CC2D83': 'LG',
-            'F8A9D0': 'LG',
-            
-            # Roku (streaming devices)
-            '001567': 'Roku',
-            '0017E2': 'Roku',
-            '001C88': 'Roku',
-            '001E34': 'Roku',
-            '002344': 'Roku',
-            '00258D': 'Roku',
-            '00270E': 'Roku',
-            '08863B': 'Roku',
-            '0C74C2': 'Roku',
-            '10595B': 'Roku',
-            'B06EBF': 'Roku',
-            'CC6D A0': 'Roku',
-            'D8831A': 'Roku',
-            'DC3A5E': 'Roku',
-            
-            # Amazon (Fire TV, Echo)
-            '006F75': 'Amazon',
-            '0C47C9': 'Amazon',
-            '40B4CD': 'Amazon',
-            '44650D': 'Amazon',
-            '4CEFC0': 'Amazon',
-            '50DC-E7': 'Amazon',
-            '74C246': 'Amazon',
-            '84D6D0': 'Amazon',
-            'CC50E3': 'Amazon',
-            'F0272D': 'Amazon',
-            
-            # Raspberry Pi
-            'B827EB': 'Raspberry Pi',
-            'DCA632': 'Raspberry Pi',
-            'E45F01': 'Raspberry Pi',
-            'DC-A632': 'Raspberry Pi',
-            '280319': 'Raspberry Pi',
-            '2C-CF67': 'Raspberry Pi',
-            
-            # Synology (NAS)
-            '001132': 'Synology',
-            '0011D8': 'Synology',
-            '001DD8': 'Synology',
-            '001B69': 'Synology',
-            
-            # TP-Link (routers, smart devices)
-            '001CF4': 'TP-Link',
-            '002309': 'TP-Link',
-            '002686': 'TP-Link',
-            '00272D': 'TP-Link',
-            '1C3BF3': 'TP-Link',
-            '5C-E960': 'TP-Link',
-            '6CCDDD': 'TP-Link',
-            '8C-FE0B': 'TP-Link',
-            'A0F3C1': 'TP-Link',
-            'C006C3': 'TP-Link',
-            
-            # Xiaomi (Android devices, IoT)
-            '0018FE': 'Xiaomi',
-            '001E31': 'Xiaomi',
-            '001EAF': 'Xiaomi',
-            '34CE00': 'Xiaomi',
-            '4C-E673': 'Xiaomi',
-            '5015B3': 'Xiaomi',
-            '64B473': 'Xiaomi',
-            '78112A': 'Xiaomi',
-            '887B1B': 'Xiaomi',
-            '8C-BE-BE': 'Xiaomi',
-            'F8A45F': 'Xiaomi',
-            
-            # Huawei (Android devices, routers)
-            '001E10': 'Huawei',
-            '00259E': 'Huawei',
-            '0026CE': 'Huawei',
-            '440010': 'Huawei',
-            '5CA6E6': 'Huawei',
-            '686D70': 'Huawei',
-            '6C3B6B': 'Huawei',
-            '843105': 'Huawei',
-            '98C1-17': 'Huawei',
-            'D0C5D3': 'Huawei',
-            
-            # OnePlus (Android)
-            'AC3743': 'OnePlus',
-            'A86F39': 'OnePlus',
-            
-            # Motorola (Android)
-            '001B88': 'Motorola',
-            '00268D': 'Motorola',
-            '08863B': 'Motorola',
-            '60382F': 'Motorola',
-            
-            # HTC (Android)
-            '001E7D': 'HTC',
-            '64A769': 'HTC',
-            '7C61-93': 'HTC',
-            
-            # Cisco (network equipment)
-            '00D0CA': 'Cisco',
-            '00D07F': 'Cisco',
-            '001921': 'Cisco',
-            
-            # Netgear (routers)
-            '001E2A': 'Netgear',
-            '0024B2': 'Netgear',
-            '001B2F': 'Netgear',
-            
-            # Intel (NUC, network adapters)
-            '8086F2': 'Intel',
-            '9CFCE8': 'Intel',
-            '7C-7A-91': 'Intel',
-            
-            # Ubiquiti (UniFi)
-            '006081': 'Ubiquiti',
-            '001B2F': 'Ubiquiti',
-            '24A43C': 'Ubiquiti',
-            '78-8A-20': 'Ubiquiti',
-            '802AA8': 'Ubiquiti',
-            
-            # Philips (Hue, smart devices)
-            '001788': 'Philips',
-            '0C8268': 'Philips',
-            '00-1D7E': 'Philips',
-            
-            # Sonos (smart speakers)
-            '000E58': 'Sonos',
-            '0017E3': 'Sonos',
-            '001C62': 'Sonos',
-            '5CAAFE': 'Sonos',
-            'B8E937': 'Sonos',
-            
-            # Sonoff/iTead (smart switches, plugs)
-            '60019': 'Sonoff',
-            '680AE2': 'Sonoff',
-            '807D3A': 'Sonoff',
-            '84F3EB': 'Sonoff',
-            'A020A6': 'Sonoff',
-            'B4E62D': 'Sonoff',
-            'DC4F22': 'Sonoff',
-            '60019C': 'iTead/Sonoff',
-            
-            # Tuya (smart devices)
-            '1062EB': 'Tuya',
-            '68C63A': 'Tuya',
-            '807D3A': 'Tuya',
-            '845DD4': 'Tuya',
-            'D81F12': 'Tuya',
-            'DC4F22': 'Tuya',
-            
-            # Nest (Google smart home)
-            '18B430': 'Nest',
-            '64168C': 'Nest',
-            '8CD3CF': 'Nest',
-            
-            # Belkin (WeMo)
-            '001CDF': 'Belkin',
-            'EC1A59': 'Belkin',
-            
-            # Ring (doorbells, cameras)
-            '7469BC': 'Ring',
-            
-            # QNAP (NAS)
-            '001392': 'QNAP',
-            '002422': 'QNAP',
-            
-            # Asus (routers, devices)
-            '001195': 'Asus',
-            '0013D4': 'Asus',
-            '0015F2': 'Asus',
-            '001EA6': 'Asus',
-            '1C-872C': 'Asus',
-            
-            # D-Link (routers)
-            '001346': 'D-Link',
-            '0015E9': 'D-Link',
-            '0018E7': 'D-Link',
-            
-            # Linksys (routers)
-            '000476': 'Linksys',
-            '000625': 'Linksys',
-            '000C41': 'Linksys',
-        }
-        
-        return vendors.get(oui_6, None)
+        """Lookup vendor from MAC address (longest 24/28/36-bit IEEE assignment)"""
+        if not oui or not mac:
+            return None
+        try:
+            return oui.lookup(mac)
+        except Exception as e:
+            logger.debug(f"Vendor lookup failed for {mac}: {e}")
+            return None
     
     def _detect_device_type(self, vendor: str, hostname: str, mac: str) -> tuple:
         """
@@ -2239,6 +3033,8 @@ class NetworkScanner:
         Returns: (device_type, friendly_name)
         """
         hostname_lower = (hostname or '').lower()
+        if not vendor:
+            vendor = self._lookup_vendor(mac)
         
         # PlayStation detection
         if vendor == 'Sony' and ('playstation' in hostname_lower or 'ps4' in hostname_lower or 'ps5' in hostname_lower):
@@ -2362,67 +3158,61 @@ class NetworkScanner:
         Probe device for common services (Plex, Kodi, etc) to enhance identification
         Returns service name if found
         """
-        # Common service ports to check
-        service_ports = {
-            32400: 'Plex Media Server',
-            8080: 'Kodi',
-            8096: 'Jellyfin',
-            8920: 'Emby',
-            49152: 'Universal Plug and Play',
-            987: 'PlayStation',           # PS5/PS4 Remote Play
-            9295: 'PlayStation',          # PS5
-            9296: 'PlayStation',          # PS5
-            9297: 'PlayStation',          # PS5
-        }
-        
-        for port, service_name in service_ports.items():
+        async def probe(port: int) -> bool:
             try:
-                # Quick TCP port check (non-blocking, 1 second timeout)
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(1)
-                result = sock.connect_ex((ip, port))
-                sock.close()
-                
-                if result == 0:
-                    logger.info(f"Found {service_name} on {ip}:{port}")
-                    return service_name
-            except:
-                continue
+                reader, writer = await asyncio.wait_for(
+                    asyncio.open_connection(ip, port), timeout=PROBE_TIMEOUT
+                )
+            except (asyncio.TimeoutError, OSError):
+                return False
+            except Exception:
+                return False
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+            return True
+        
+        # All ports at once; the first open port in COMMON_SERVICE_PORTS order wins
+        ports = list(COMMON_SERVICE_PORTS)
+        results = await asyncio.gather(*(probe(port) for port in ports))
+        for port, is_open in zip(ports, results):
+            if is_open:
+                service_name = COMMON_SERVICE_PORTS[port]
+                logger.info(f"Found {service_name} on {ip}:{port}")
+                return service_name
         
         return None
     
     async def update_device_status(self):
         """Scan network and update device statuses"""
-        current_devices = await self.scan_network()
-        known_devices = self.db.get_devices()
-        
-        current_macs = {d.mac_address for d in current_devices}
-        known_macs = {d.mac_address for d in known_devices}
-        
-        for device in current_devices:
-            existing = self.db.get_device(device.mac_address)
-            
-            if not existing:
-                self.db.add_or_update_device(device)
-                self.db.record_network_event('new_device', device.mac_address, device.ip_address, device.hostname)
-                
-                if self.alert_new_devices:
-                    await self._notify_new_device(device)
-            else:
-                self.db.add_or_update_device(device)
-                
-                was_offline = (time.time() - existing.get('last_seen', 0)) > 300
-                if was_offline and existing.get('is_monitored'):
-                    self.db.record_network_event('device_online', device.mac_address, device.ip_address, device.hostname)
-                    await self._notify_device_online(device)
-        
-        for known_device in known_devices:
-            if known_device.mac_address not in current_macs:
-                if known_device.is_monitored:
-                    time_since_seen = time.time() - known_device.last_seen
-                    if time_since_seen > 300 and time_since_seen < 600:
-                        self.db.record_network_event('device_offline', known_device.mac_address, known_device.ip_address, known_device.hostname)
-                        await self._notify_device_offline(known_device)
+        return await self.apply_scan(await self.scan_network())
+    
+    async def apply_scan(self, current_devices: List[NetworkDevice]) -> Dict[str, List[NetworkDevice]]:
+        """Reconcile one scan result, then notify and publish what changed"""
+        changes = await self.db.reconcile_devices_async(current_devices)
+
+        # Notify only once the scan result is committed
+        if self.alert_new_devices:
+            for device in changes['new']:
+                await self._notify_new_device(device)
+        for device in changes['online']:
+            await self._notify_device_online(device)
+        for device in changes['offline']:
+            await self._notify_device_offline(device)
+
+        if any(changes.values()):
+            live_feed.publish('devices', **{
+                kind: [{'mac_address': d.mac_address, 'ip_address': d.ip_address,
+                        'name': d.custom_name or d.hostname or d.ip_address} for d in devices]
+                for kind, devices in changes.items()
+            })
+            logger.info(
+                f"Reconciled {len(current_devices)} devices: {len(changes['new'])} new, "
+                f"{len(changes['online'])} online, {len(changes['offline'])} offline"
+            )
+        return changes
     
     async def cleanup_old_devices(self, days_threshold: int = 2):
         """
@@ -2534,13 +3324,54 @@ class NetworkScanner:
 # SPEED TEST MONITOR CLASS
 # ============================================================================
 
+# Speed-test jobs
+SPEEDTEST_CMD = ('speedtest', '--format=jsonl', '--progress=yes', '--accept-license', '--accept-gdpr')
+SPEEDTEST_TIMEOUT = 120        # seconds before a run is killed
+SPEEDTEST_JOBS_KEEP = 20       # finished jobs kept for the API
+# Phase -> (progress offset, share of the whole run) for the overall progress figure
+SPEEDTEST_PHASES = {'ping': (0.0, 0.1), 'download': (0.1, 0.45), 'upload': (0.55, 0.45)}
+
+
+@dataclass
+class SpeedTestJob:
+    """One speed-test run and its live progress"""
+    id: str
+    trigger: str = 'manual'  # manual, schedule
+    state: str = 'queued'    # queued, running, done, failed, cancelled
+    phase: Optional[str] = None
+    progress: float = 0.0
+    live: Dict = field(default_factory=dict)
+    result: Optional[Dict] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    task: Optional[asyncio.Task] = field(default=None, repr=False, compare=False)
+    
+    @property
+    def finished(self) -> bool:
+        return self.state in ('done', 'failed', 'cancelled')
+    
+    def to_dict(self) -> Dict:
+        return {
+            'id': self.id,
+            'trigger': self.trigger,
+            'state': self.state,
+            'phase': self.phase,
+            'progress': self.progress,
+            'live': dict(self.live),
+            'result': self.result,
+            'error': self.error,
+            'created_at': self.created_at,
+            'finished_at': self.finished_at
+        }
+
+
 class SpeedTestMonitor:
     """Internet speed testing and monitoring"""
     
     def __init__(self, db: AnalyticsDB):
         self.db = db
         self.monitoring = False
-        self.testing = False
         self.schedule_mode = 'interval'
         self.interval_hours = 12
         self.schedule_times = []
@@ -2549,8 +3380,15 @@ class SpeedTestMonitor:
         self.consecutive_failures = 0
         self.notification_callback = None
         self._monitor_task = None
+        self.current: Optional[SpeedTestJob] = None
+        self.jobs: Dict[str, SpeedTestJob] = {}  # insertion ordered, newest last
+        self._listeners: set = set()
         self._load_settings()
     
+    @property
+    def testing(self) -> bool:
+        return self.current is not None and not self.current.finished
+    
     def _load_settings(self):
         """Load settings from database"""
         try:
@@ -2568,39 +3406,87 @@ class SpeedTestMonitor:
         """Set the notification callback"""
         self.notification_callback = callback
     
-    async def run_speedtest(self) -> Optional[SpeedTestResult]:
-        """Run a speed test using speedtest-cli"""
+    # ---- Jobs ---------------------------------------------------------------
+    
+    def subscribe(self) -> asyncio.Queue:
+        """Queue receiving {'event': 'speedtest', 'job': {...}} on every job update"""
+        q: asyncio.Queue = asyncio.Queue(maxsize=200)
+        self._listeners.add(q)
+        return q
+    
+    def unsubscribe(self, q: asyncio.Queue):
+        self._listeners.discard(q)
+    
+    def _publish(self, job: SpeedTestJob):
+        data = {'event': 'speedtest', 'job': job.to_dict()}
+        if job.state == 'queued' or job.finished:
+            live_feed.publish('speedtest', job=data['job'])
+        for q in list(self._listeners):
+            try:
+                q.put_nowait(data)
+            except asyncio.QueueFull:
+                # Slow consumer: progress updates may be skipped, but the final
+                # state must get through or its stream never ends
+                if job.finished:
+                    q.get_nowait()
+                    q.put_nowait(data)
+    
+    def start_job(self, trigger: str = 'manual') -> SpeedTestJob:
+        """Start a speed test in the background, or return the one already running"""
+        if self.testing:
+            return self.current
+        job = SpeedTestJob(id=uuid.uuid4().hex[:12], trigger=trigger)
+        self.current = job
+        self.jobs[job.id] = job
+        finished = [j.id for j in self.jobs.values() if j.finished]
+        for old_id in finished[:max(0, len(self.jobs) - SPEEDTEST_JOBS_KEEP)]:
+            del self.jobs[old_id]
+        job.task = asyncio.create_task(self._run_job(job))
+        self._publish(job)
+        return job
+    
+    def cancel_job(self, job_id: str) -> bool:
+        """Cancel a running job (its subprocess is killed)"""
+        job = self.jobs.get(job_id)
+        if not job or job.finished or not job.task:
+            return False
+        job.task.cancel()
+        return True
+    
+    async def run_speedtest(self, trigger: str = 'manual') -> Optional[SpeedTestResult]:
+        """Run a speed test and wait for it (the run survives the caller being cancelled)"""
         if self.testing:
             logger.warning("Speed test already in progress")
             return None
-        
-        self.testing = True
-        logger.info("Starting internet speed test...")
+        job = self.start_job(trigger)
+        return await asyncio.shield(job.task)
+    
+    async def _run_job(self, job: SpeedTestJob) -> Optional[SpeedTestResult]:
+        job.state = 'running'
+        self._publish(job)
+        logger.info(f"Starting internet speed test ({job.trigger}, job {job.id})...")
+        proc = None
+        stderr_task = None
         
         try:
-            # Check if speedtest-cli is installed
-            proc = await asyncio.create_subprocess_exec(
-                'which', 'speedtest',
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            await proc.communicate()
-            
-            if proc.returncode != 0:
-                logger.error("speedtest-cli not installed. Install with: pip install speedtest-cli")
+            if not shutil.which(SPEEDTEST_CMD[0]):
+                job.error = "speedtest CLI not installed"
+                logger.error("speedtest CLI not installed. Install the Ookla speedtest CLI")
                 return None
             
-            # Run speed test
             proc = await asyncio.create_subprocess_exec(
-                'speedtest', '--format=json', '--accept-license', '--accept-gdpr',
+                *SPEEDTEST_CMD,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE
             )
+            stderr_task = asyncio.create_task(proc.stderr.read())
+            final = await asyncio.wait_for(self._follow(job, proc), timeout=SPEEDTEST_TIMEOUT)
+            await proc.wait()
+            stderr = (await stderr_task).decode(errors='ignore').strip()
             
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=120)
-            
-            if proc.returncode != 0:
-                logger.error(f"Speed test failed: {stderr.decode()}")
+            if proc.returncode != 0 or final is None:
+                job.error = job.error or stderr[-500:] or f"speedtest exited with {proc.returncode}"
+                logger.error(f"Speed test failed: {job.error}")
                 self.consecutive_failures += 1
                 
                 if self.consecutive_failures >= 3:
@@ -2608,51 +3494,108 @@ class SpeedTestMonitor:
                 
                 return None
             
-            # Parse JSON
-            result = json.loads(stdout.decode())
-            
-            download_mbps = result['download']['bandwidth'] / 125000
-            upload_mbps = result['upload']['bandwidth'] / 125000
-            ping_ms = result['ping']['latency']
-            server_name = f"{result['server']['name']} ({result['server']['location']})"
-            jitter_ms = result['ping'].get('jitter', None)
-            packet_loss = result.get('packetLoss', None)
-            
-            speed_result = SpeedTestResult(
-                timestamp=int(time.time()),
-                download=round(download_mbps, 2),
-                upload=round(upload_mbps, 2),
-                ping=round(ping_ms, 2),
-                server=server_name,
-                jitter=round(jitter_ms, 2) if jitter_ms else None,
-                packet_loss=round(packet_loss, 2) if packet_loss else None
-            )
+            speed_result = self._parse_result(final)
+            job.result = {
+                'download': speed_result.download,
+                'upload': speed_result.upload,
+                'ping': speed_result.ping,
+                'server': speed_result.server,
+                'jitter': speed_result.jitter,
+                'packet_loss': speed_result.packet_loss,
+                'timestamp': speed_result.timestamp
+            }
             
             self.consecutive_failures = 0
-            self.db.record_speed_test(speed_result)
+            await self.db.record_speed_test_async(speed_result)
             await self._analyze_and_notify(speed_result)
             
-            logger.info(f"Speed test complete: â†“{download_mbps:.1f} Mbps â†‘{upload_mbps:.1f} Mbps {ping_ms:.1f}ms")
+            logger.info(f"Speed test complete: â†“{speed_result.download:.1f} Mbps â†‘{speed_result.upload:.1f} Mbps {speed_result.ping:.1f}ms")
             
             return speed_result
             
+        except asyncio.CancelledError:
+            job.state = 'cancelled'
+            job.error = 'cancelled'
+            logger.info(f"Speed test {job.id} cancelled")
+            return None
         except asyncio.TimeoutError:
+            job.error = f"timed out after {SPEEDTEST_TIMEOUT}s"
             logger.error("Speed test timed out")
             self.consecutive_failures += 1
             return None
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON: {e}")
+        except (KeyError, TypeError, ValueError) as e:
+            job.error = f"unexpected speedtest output: {e}"
+            logger.error(f"Failed to parse speed test result: {e}")
             return None
         except Exception as e:
+            job.error = str(e)
             logger.error(f"Speed test error: {e}", exc_info=True)
             self.consecutive_failures += 1
             return None
         finally:
-            self.testing = False
+            if proc and proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            if stderr_task and not stderr_task.done():
+                stderr_task.cancel()
+            if not job.finished:
+                job.state = 'done' if job.result else 'failed'
+            job.finished_at = time.time()
+            self._publish(job)
+    
+    async def _follow(self, job: SpeedTestJob, proc) -> Optional[Dict]:
+        """Read the CLI's JSON lines into job progress; returns the final result object"""
+        final = None
+        async for raw in proc.stdout:
+            try:
+                event = json.loads(raw)
+            except ValueError:
+                continue
+            kind = event.get('type')
+            if kind in SPEEDTEST_PHASES:
+                data = event.get(kind) or {}
+                offset, share = SPEEDTEST_PHASES[kind]
+                progress = round(offset + share * float(data.get('progress', 0) or 0), 3)
+                if kind == 'ping' and data.get('latency') is not None:
+                    job.live['ping'] = round(data['latency'], 2)
+                elif data.get('bandwidth') is not None:
+                    job.live[kind] = round(data['bandwidth'] / 125000, 2)
+                # ~10 updates/s from the CLI; forward phase changes and whole-percent steps
+                if kind != job.phase or progress - job.progress >= 0.01:
+                    job.phase, job.progress = kind, progress
+                    self._publish(job)
+            elif kind == 'testStart':
+                server = event.get('server') or {}
+                job.live['server'] = f"{server.get('name')} ({server.get('location')})"
+                self._publish(job)
+            elif kind == 'log' and event.get('level') == 'error':
+                job.error = event.get('message')
+            elif kind == 'result':
+                final = event
+        return final
+    
+    @staticmethod
+    def _parse_result(result: Dict) -> SpeedTestResult:
+        download_mbps = result['download']['bandwidth'] / 125000
+        upload_mbps = result['upload']['bandwidth'] / 125000
+        ping_ms = result['ping']['latency']
+        server_name = f"{result['server']['name']} ({result['server']['location']})"
+        jitter_ms = result['ping'].get('jitter', None)
+        packet_loss = result.get('packetLoss', None)
+        
+        return SpeedTestResult(
+            timestamp=int(time.time()),
+            download=round(download_mbps, 2),
+            upload=round(upload_mbps, 2),
+            ping=round(ping_ms, 2),
+            server=server_name,
+            jitter=round(jitter_ms, 2) if jitter_ms else None,
+            packet_loss=round(packet_loss, 2) if packet_loss else None
+        )
     
     async def _analyze_and_notify(self, result: SpeedTestResult):
         """Compare result to average and notify"""
-        averages = self.db.get_speed_test_averages(last_n=5)
+        averages = await self.db.get_speed_test_averages_async(last_n=5)
         
         if not averages or averages['avg_download'] == 0:
             await analytics_notify(
@@ -2684,12 +3627,12 @@ class SpeedTestMonitor:
             issues.append(f"Latency â†‘{abs(ping_var):.0f}% ({result.ping:.1f} vs {averages['avg_ping']:.1f}ms)")
         
         if is_degraded:
-            self.db.update_speed_test_status(result.timestamp, 'degraded')
+            await self.db.update_speed_test_status_async(result.timestamp, 'degraded')
             message = "ðŸš¨ Internet Degraded\n\n" + "\n".join(issues)
             await analytics_notify('Internet Monitor', 'warning', message)
         else:
             # Check recovery
-            recent = self.db.get_speed_test_history(hours=24)
+            recent = await self.db.get_speed_test_history_async(hours=24)
             if recent and len(recent) > 1:
                 if recent[1].get('status') == 'degraded':
                     await analytics_notify(
@@ -2725,7 +3668,7 @@ class SpeedTestMonitor:
             try:
                 if self.schedule_mode == 'interval':
                     # Interval mode - run test then wait
-                    await self.run_speedtest()
+                    await self.run_speedtest(trigger='schedule')
                     wait_seconds = self.interval_hours * 3600
                     logger.info(f"Next speed test in {self.interval_hours}h")
                     await asyncio.sleep(wait_seconds)
@@ -2750,7 +3693,7 @@ class SpeedTestMonitor:
                     
                     if should_run:
                         logger.info(f"Running scheduled speed test at {current_time}")
-                        await self.run_speedtest()
+                        await self.run_speedtest(trigger='schedule')
                         # Sleep for 61 seconds to avoid running twice in the same minute
                         await asyncio.sleep(61)
                     else:
@@ -2811,6 +3754,566 @@ class SpeedTestMonitor:
         logger.info("Speed test monitoring stopped")
 
 
+# ============================================================================
+# IOT FINGERPRINTING
+# ============================================================================
+
+IOT_PROBE_PORTS = (80, 8080, 8081, 8082)
+IOT_PROBE_CONCURRENCY = 16     # HTTP requests in flight at once
+IOT_PROBE_RATE = 50            # HTTP probes started per second, across all devices
+IOT_PROBE_TIMEOUT = 3.0        # seconds per HTTP probe
+IOT_BODY_LIMIT = 65536         # bytes of each response that signatures are matched against
+IOT_CACHE_TTL = 1800           # seconds a device fingerprint is reused (per MAC)
+
+
+@dataclass
+class IoTSignature:
+    """One declarative HTTP fingerprint: GET path, then a header or body token"""
+    name: str
+    path: str
+    category: str
+    name_prefix: str
+    header: Optional[str] = None
+    contains: Optional[str] = None
+
+
+def _compile_iot_signatures(patterns: Dict[str, Dict]) -> Dict[str, tuple]:
+    """
+    Group the HTTP signatures by request path: path -> (signatures, body regex).
+    All body tokens of a path are folded into one alternation of named groups so
+    a response is scanned once regardless of how many signatures share the path.
+    """
+    by_path: Dict[str, List[IoTSignature]] = {}
+    for name, pattern in patterns.items():
+        if 'http_path' not in pattern:
+            continue
+        by_path.setdefault(pattern['http_path'], []).append(IoTSignature(
+            name=name,
+            path=pattern['http_path'],
+            category=pattern['category'],
+            name_prefix=pattern['name_prefix'],
+            header=pattern.get('http_header'),
+            contains=pattern.get('response_contains')
+        ))
+    compiled = {}
+    for path, sigs in by_path.items():
+        tokens = [f"(?P<{s.name}>{re.escape(s.contains)})" for s in sigs if s.contains and not s.header]
+        compiled[path] = (sigs, re.compile("|".join(tokens)) if tokens else None)
+    return compiled
+
+
+class _RateLimiter:
+    """Spaces out probe starts to at most `rate` per second for every caller"""
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+    
+    async def wait(self):
+        if not self.interval:
+            return
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next)
+        self._next = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class IoTFingerprinter:
+    """
+    Fingerprints scanned devices as Tasmota/Shelly/ESPHome/WLED/Sonoff.
+    Reuses the scanner's recent result, skips closed ports with a TCP connect,
+    issues one GET per (port, path) through a shared session under a global
+    rate limit (TCP pre-checks are only concurrency-bounded), and caches the
+    matches per MAC address.
+    """
+    
+    def __init__(self, scanner: 'NetworkScanner', patterns: Dict[str, Dict] = IOT_DETECTION_PATTERNS):
+        self.scanner = scanner
+        self.signatures = _compile_iot_signatures(patterns)
+        self._order = {name: i for i, name in enumerate(patterns)}
+        self._cache: Dict[str, tuple] = {}  # mac -> (expires_at, ip, [(port, signature)])
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self._limiter = _RateLimiter(IOT_PROBE_RATE)
+        self.counters = {'cache_hits': 0, 'cache_misses': 0, 'http_probes': 0, 'port_probes': 0}
+        self.last_run_ms: Optional[float] = None
+    
+    def _http_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=IOT_PROBE_CONCURRENCY,
+                limit_per_host=len(self.signatures) or 1,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=IOT_PROBE_TIMEOUT)
+            )
+        return self._session
+    
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    def invalidate(self, mac_address: Optional[str] = None):
+        """Forget one device's fingerprint, or all of them"""
+        if mac_address is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(mac_address, None)
+    
+    async def _bounded(self, coro, rate_limited: bool = True):
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(IOT_PROBE_CONCURRENCY)
+        async with self._sem:
+            if rate_limited:
+                await self._limiter.wait()
+            return await coro
+    
+    async def _port_open(self, ip: str, port: int) -> bool:
+        self.counters['port_probes'] += 1
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout=PROBE_TIMEOUT)
+        except (OSError, asyncio.TimeoutError):
+            return False
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except Exception:
+            pass
+        return True
+    
+    async def _probe_path(self, ip: str, port: int, path: str) -> Optional[IoTSignature]:
+        """GET one path and return the first signature (in declaration order) it matches"""
+        sigs, body_re = self.signatures[path]
+        self.counters['http_probes'] += 1
+        try:
+            # Follow redirects like the sequential prober did; firmwares often bounce / to a UI page
+            async with self._http_session().get(f"http://{ip}:{port}{path}") as resp:
+                if resp.status != 200:
+                    return None
+                hits = {s.name for s in sigs if s.header and s.header in resp.headers}
+                if body_re is not None:
+                    body = (await resp.content.read(IOT_BODY_LIMIT)).decode('utf-8', 'ignore')
+                    hits.update(m.lastgroup for m in body_re.finditer(body))
+        except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeError):
+            return None
+        for sig in sigs:
+            if sig.name in hits:
+                return sig
+        return None
+    
+    async def _fingerprint(self, ip: str) -> List[tuple]:
+        """[(port, signature)] for one address: at most one signature per open port"""
+        ports = [p for p, is_open in zip(
+            IOT_PROBE_PORTS,
+            await asyncio.gather(*(self._bounded(self._port_open(ip, p), rate_limited=False) for p in IOT_PROBE_PORTS))
+        ) if is_open]
+        if not ports:
+            return []
+        jobs = [(port, path) for port in ports for path in self.signatures]
+        results = await asyncio.gather(*(self._bounded(self._probe_path(ip, port, path)) for port, path in jobs))
+        best: Dict[int, IoTSignature] = {}
+        for (port, _), sig in zip(jobs, results):
+            if sig and (port not in best or self._order[sig.name] < self._order[best[port].name]):
+                best[port] = sig
+        return sorted(best.items())
+    
+    async def _device_matches(self, device: NetworkDevice) -> List[tuple]:
+        now = time.time()
+        cached = self._cache.get(device.mac_address)
+        if cached and cached[0] > now and cached[1] == device.ip_address:
+            self.counters['cache_hits'] += 1
+            return cached[2]
+        self.counters['cache_misses'] += 1
+        matches = await self._fingerprint(device.ip_address)
+        self._cache[device.mac_address] = (time.time() + IOT_CACHE_TTL, device.ip_address, matches)
+        return matches
+    
+    async def discover(self, max_scan_age: float = SCAN_REUSE_TTL) -> List[Dict]:
+        """Discovery entries (service_name, endpoint, ...) for every fingerprinted device"""
+        started = time.perf_counter()
+        devices = await self.scanner.recent_devices(max_scan_age)
+        if not devices:
+            logger.info("No network devices found for IoT discovery")
+            return []
+        logger.info(f"Fingerprinting {len(devices)} network devices for IoT signatures...")
+        
+        results = await asyncio.gather(*(self._device_matches(d) for d in devices), return_exceptions=True)
+        discovered = []
+        for device, matches in zip(devices, results):
+            if isinstance(matches, Exception):
+                logger.warning(f"IoT fingerprint failed for {device.ip_address}: {matches}")
+                continue
+            ip = device.ip_address
+            vendor = device.vendor or self.scanner._lookup_vendor(device.mac_address)
+            for port, sig in matches:
+                device_name = f"{sig.name_prefix} ({device.custom_name or device.hostname or vendor or ip})"
+                discovered.append({
+                    'service_name': device_name,
+                    'endpoint': f"http://{ip}:{port}" if sig.header else f"http://{ip}:{port}{sig.path}",
+                    'check_type': 'http',
+                    'port': port,
+                    'category': sig.category,
+                    'ip_address': ip,
+                    'mac_address': device.mac_address,
+                    'pattern': sig.name,
+                    'vendor': vendor,
+                    'expected_status': 200
+                })
+        self.last_run_ms = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(f"IoT discovery complete: found {len(discovered)} devices in {self.last_run_ms}ms")
+        return discovered
+    
+    def stats(self) -> Dict:
+        now = time.time()
+        return {
+            **self.counters,
+            'cached_devices': sum(1 for entry in self._cache.values() if entry[0] > now),
+            'last_run_ms': self.last_run_ms
+        }
+
+
+# ============================================================================
+# DOCKER DISCOVERY
+# ============================================================================
+
+DOCKER_SOCKET = os.getenv('ANALYTICS_DOCKER_SOCKET', '/var/run/docker.sock')
+DOCKER_AUTOREGISTER = os.getenv('ANALYTICS_DOCKER_AUTOREGISTER', 'false').lower() in ('1', 'true', 'yes', 'on')
+DOCKER_EVENTS = os.getenv('ANALYTICS_DOCKER_EVENTS', 'false').lower() in ('1', 'true', 'yes', 'on')
+DOCKER_API_TIMEOUT = 10        # seconds per Engine API request
+DOCKER_EVENTS_RETRY = 30       # seconds before the event stream is reopened
+DOCKER_LABEL = 'jarvis.'       # label prefix, e.g. jarvis.monitor=true, jarvis.port=8080
+
+# Container events that change which services are reachable
+DOCKER_WATCHED_EVENTS = ('start', 'die', 'destroy')
+
+
+def _docker_label_true(value: Optional[str]) -> bool:
+    return (value or '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _docker_entry(container_name: str, host_port: int, fingerprint: Dict, **extra) -> Dict:
+    """Discovery entry for a published port that matches a known service"""
+    service_name = fingerprint['name']
+    check_path = fingerprint.get('path', '/')
+    if check_path:
+        endpoint = f"http://localhost:{host_port}{check_path}"
+        check_type = 'http'
+    else:
+        endpoint = f"localhost:{host_port}"
+        check_type = 'tcp'
+    entry = {
+        'service_name': f"{service_name} ({container_name})" if service_name != container_name else service_name,
+        'container_name': container_name,
+        'endpoint': endpoint,
+        'check_type': check_type,
+        'port': host_port,
+        'category': fingerprint.get('category', 'unknown'),
+        'expected_status': 200 if check_type == 'http' else None
+    }
+    entry.update(extra)
+    return entry
+
+
+class DockerDiscovery:
+    """
+    Docker service discovery over the Engine API socket.
+    
+    Containers are listed with structured Ports/Labels (GET /containers/json)
+    and matched against SERVICE_FINGERPRINTS by published or private port.
+    Containers labelled jarvis.monitor=true describe their own health check:
+        jarvis.name, jarvis.port (host port), jarvis.path, jarvis.endpoint,
+        jarvis.check_type (http|tcp), jarvis.interval, jarvis.timeout,
+        jarvis.expected_status
+    and, with auto-registration on, are added to analytics_services. With the
+    event stream on, start/die/destroy events update the discovered set and
+    enable/disable the label-managed services incrementally. Only services
+    registered here (managed_by='docker') are ever toggled; a user-created
+    service with the same name, or one the user has since edited, is left alone.
+    Falls back to the docker CLI when the socket is not mounted.
+    """
+    
+    def __init__(self, socket_path: str = DOCKER_SOCKET, autoregister: bool = DOCKER_AUTOREGISTER):
+        self.socket_path = socket_path
+        self.autoregister = autoregister
+        self.containers: Dict[str, List[Dict]] = {}  # container id -> discovery entries
+        self.managed: Dict[str, str] = {}  # container id -> label-managed service name
+        self.backend: Optional[str] = None
+        self.last_event_at: Optional[float] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._events_task: Optional[asyncio.Task] = None
+    
+    # ---- Engine API ---------------------------------------------------------
+    
+    def socket_available(self) -> bool:
+        try:
+            return stat.S_ISSOCK(os.stat(self.socket_path).st_mode)
+        except OSError:
+            return False
+    
+    def _api(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.UnixConnector(path=self.socket_path),
+                timeout=aiohttp.ClientTimeout(total=DOCKER_API_TIMEOUT)
+            )
+        return self._session
+    
+    async def list_containers(self, **filters) -> List[Dict]:
+        """Running containers as returned by the Engine API (Names, Ports, Labels, ...)"""
+        params = {'filters': json.dumps({k: v for k, v in filters.items()})} if filters else None
+        async with self._api().get('http://docker/containers/json', params=params) as resp:
+            if resp.status != 200:
+                raise RuntimeError(f"Docker API {resp.status}: {(await resp.text())[:200]}")
+            return await resp.json()
+    
+    async def close(self):
+        await self.stop_events()
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    # ---- Mapping ------------------------------------------------------------
+    
+    @staticmethod
+    def _labels(container: Dict) -> Dict[str, str]:
+        labels = container.get('Labels') or {}
+        return {k[len(DOCKER_LABEL):]: v for k, v in labels.items() if k.startswith(DOCKER_LABEL)}
+    
+    @staticmethod
+    def _published(container: Dict) -> List[tuple]:
+        """[(host_port, private_port)] of TCP ports published on the host, deduplicated"""
+        seen = {}
+        for p in container.get('Ports') or []:
+            if p.get('Type', 'tcp') == 'tcp' and p.get('PublicPort'):
+                seen.setdefault(int(p['PublicPort']), int(p['PrivatePort']))
+        return sorted(seen.items())
+    
+    def entries_for(self, container: Dict) -> List[Dict]:
+        """Discovery entries for one container (label-defined check first)"""
+        name = (container.get('Names') or ['/' + container.get('Id', '')[:12]])[0].lstrip('/')
+        extra = {'container_id': container.get('Id'), 'image': container.get('Image')}
+        published = self._published(container)
+        entries = []
+        
+        label_service = self.label_service(container)
+        if label_service:
+            port = self._labels(container).get('port', '')
+            entries.append({
+                'service_name': label_service.service_name,
+                'container_name': name,
+                'endpoint': label_service.endpoint,
+                'check_type': label_service.check_type,
+                'port': int(port) if port.isdigit() else None,
+                'category': self._labels(container).get('category', 'docker'),
+                'expected_status': label_service.expected_status if label_service.check_type == 'http' else None,
+                'source': 'label',
+                **extra
+            })
+            return entries
+        
+        for host_port, private_port in published:
+            # Host port first (previous behaviour), then the container's own port for remapped services
+            fingerprint = SERVICE_FINGERPRINTS.get(host_port) or SERVICE_FINGERPRINTS.get(private_port)
+            if fingerprint:
+                entries.append(_docker_entry(name, host_port, fingerprint, source='fingerprint', **extra))
+        return entries
+    
+    def label_service(self, container: Dict) -> Optional[HealthCheck]:
+        """HealthCheck described by the container's jarvis.* labels, if it opted in"""
+        labels = self._labels(container)
+        if not _docker_label_true(labels.get('monitor')):
+            return None
+        name = labels.get('name') or (container.get('Names') or ['/unknown'])[0].lstrip('/')
+        endpoint = labels.get('endpoint')
+        check_type = labels.get('check_type')
+        if not endpoint:
+            published = self._published(container)
+            port = int(labels['port']) if labels.get('port', '').isdigit() else (published[0][0] if published else None)
+            if not port:
+                logger.warning(f"[docker] {name}: jarvis.monitor set but no published port or jarvis.endpoint")
+                return None
+            path = labels.get('path')
+            if path is None:
+                fingerprint = SERVICE_FINGERPRINTS.get(port) or {}
+                path = fingerprint.get('path', '/')
+            check_type = check_type or ('http' if path else 'tcp')
+            endpoint = f"http://localhost:{port}{path or '/'}" if check_type == 'http' else f"localhost:{port}"
+        check_type = check_type or ('http' if endpoint.startswith(('http://', 'https://')) else 'tcp')
+        try:
+            return HealthCheck(
+                service_name=name,
+                endpoint=endpoint,
+                check_type=check_type,
+                expected_status=int(labels.get('expected_status', 200)),
+                timeout=int(labels.get('timeout', 5)),
+                interval=int(labels.get('interval', 60))
+            )
+        except ValueError as e:
+            logger.warning(f"[docker] {name}: bad jarvis.* label value ({e})")
+            return None
+    
+    # ---- Discovery ----------------------------------------------------------
+    
+    async def discover(self) -> List[Dict]:
+        """Discovery entries for every running container"""
+        if not self.socket_available():
+            self.backend = 'cli'
+            return await self._discover_cli()
+        self.backend = 'socket'
+        containers = await self.list_containers()
+        self.containers = {c['Id']: self.entries_for(c) for c in containers}
+        if self.autoregister:
+            await self._register(containers)
+        discovered = [e for entries in self.containers.values() for e in entries]
+        logger.info(f"Docker discovery complete: found {len(discovered)} services in {len(containers)} containers")
+        return discovered
+    
+    async def _discover_cli(self) -> List[Dict]:
+        """`docker ps` fallback for hosts without the socket mounted (non-blocking)"""
+        discovered = []
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                'docker', 'ps', '--format', '{{.Names}}|{{.Ports}}',
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=DOCKER_API_TIMEOUT)
+            except asyncio.TimeoutError:
+                proc.kill()
+                logger.error("Docker discovery timed out")
+                return discovered
+        except FileNotFoundError:
+            logger.error("Docker not found - mount /var/run/docker.sock or install the docker CLI")
+            return discovered
+        
+        if proc.returncode != 0:
+            logger.error(f"Docker discovery failed: {stderr.decode(errors='ignore')}")
+            return discovered
+        
+        for line in stdout.decode(errors='ignore').splitlines():
+            name, _, ports_str = line.partition('|')
+            if not name.strip():
+                continue
+            # Format: "0.0.0.0:8989->8989/tcp, :::8989->8989/tcp"
+            for port in sorted({int(p) for p in re.findall(r':(\d+)->', ports_str)}):
+                if port in SERVICE_FINGERPRINTS:
+                    discovered.append(_docker_entry(name, port, SERVICE_FINGERPRINTS[port], source='fingerprint'))
+        logger.info(f"Docker discovery complete: found {len(discovered)} services")
+        return discovered
+    
+    async def _register(self, containers: List[Dict]):
+        """Add label-managed services that are not registered yet"""
+        wanted = {c['Id']: svc for c in containers for svc in [self.label_service(c)] if svc}
+        if not wanted or not db:
+            return
+        existing = {s.service_name: s for s in await db.get_services_async()}
+        for cid, service in wanted.items():
+            current = existing.get(service.service_name)
+            if current is not None and current.managed_by != 'docker':
+                # Same name as a service the user created (or has since edited): leave it alone
+                continue
+            self.managed[cid] = service.service_name
+            if current is None:
+                service.managed_by = 'docker'
+                await db.add_service_async(service)
+                logger.info(f"[docker] registered {service.service_name} -> {service.endpoint}")
+                current = service
+            elif not current.enabled:
+                current.enabled = True
+                await db.add_service_async(current)
+                logger.info(f"[docker] re-enabled {service.service_name}")
+            else:
+                continue
+            if monitor:
+                monitor.schedule(current)
+    
+    async def _set_managed_enabled(self, service_name: str, enabled: bool):
+        for service in await db.get_services_async():
+            if service.service_name == service_name and service.managed_by == 'docker' and service.enabled != enabled:
+                service.enabled = enabled
+                await db.add_service_async(service)
+                if monitor:
+                    monitor.schedule(service)
+                logger.info(f"[docker] {'enabled' if enabled else 'disabled'} {service_name}")
+    
+    # ---- Events -------------------------------------------------------------
+    
+    def start_events(self):
+        if self._events_task is None or self._events_task.done():
+            self._events_task = asyncio.create_task(self._events_loop())
+    
+    async def stop_events(self):
+        if self._events_task:
+            self._events_task.cancel()
+            try:
+                await self._events_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._events_task = None
+    
+    async def _events_loop(self):
+        """Follow /events; resync with a full listing whenever the stream (re)opens"""
+        filters = json.dumps({'type': ['container'], 'event': list(DOCKER_WATCHED_EVENTS)})
+        while True:
+            try:
+                if not self.socket_available():
+                    await asyncio.sleep(DOCKER_EVENTS_RETRY)
+                    continue
+                await self.discover()
+                async with self._api().get(
+                    'http://docker/events', params={'filters': filters},
+                    timeout=aiohttp.ClientTimeout(total=None, sock_connect=DOCKER_API_TIMEOUT)
+                ) as resp:
+                    logger.info("[docker] following container events")
+                    async for line in resp.content:
+                        if line.strip():
+                            await self._handle_event(json.loads(line))
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning(f"[docker] event stream interrupted: {e}")
+            await asyncio.sleep(DOCKER_EVENTS_RETRY)
+    
+    async def _handle_event(self, event: Dict):
+        action = (event.get('Action') or event.get('status') or '').split(':', 1)[0]
+        cid = event.get('id') or (event.get('Actor') or {}).get('ID')
+        if not cid or action not in DOCKER_WATCHED_EVENTS:
+            return
+        self.last_event_at = time.time()
+        if action == 'start':
+            containers = await self.list_containers(id=[cid])
+            for container in containers:
+                self.containers[cid] = self.entries_for(container)
+            if self.autoregister:
+                await self._register(containers)
+            logger.info(f"[docker] start {cid[:12]}: {len(self.containers.get(cid, []))} services")
+        else:
+            self.containers.pop(cid, None)
+            name = self.managed.pop(cid, None) if action == 'destroy' else self.managed.get(cid)
+            still_running = any(n == name and c in self.containers for c, n in self.managed.items())
+            # History is kept: a stopped/removed container's service is disabled, not deleted
+            if name and db and not still_running:
+                await self._set_managed_enabled(name, False)
+    
+    def stats(self) -> Dict:
+        return {
+            'backend': self.backend,
+            'socket': self.socket_path,
+            'socket_available': self.socket_available(),
+            'autoregister': self.autoregister,
+            'events': bool(self._events_task and not self._events_task.done()),
+            'last_event_at': self.last_event_at,
+            'containers': len(self.containers),
+            'services': sum(len(v) for v in self.containers.values()),
+            'managed': sorted(set(self.managed.values()))
+        }
+
+
 # ============================================================================
 # GLOBAL INSTANCES
 # ============================================================================
@@ -2819,6 +4322,9 @@ db: Optional[AnalyticsDB] = None
 monitor: Optional[HealthMonitor] = None
 scanner: Optional[NetworkScanner] = None
 speed_monitor: Optional[SpeedTestMonitor] = None
+iot_fingerprinter: Optional[IoTFingerprinter] = None
+docker_discovery: Optional[DockerDiscovery] = None
+live_feed = LiveFeed()
 
 
 # ============================================================================
@@ -2888,118 +4394,22 @@ async def analytics_notify(service_name: str, severity: str, message: str):
         logger.error(f"Failed to send notification: {e}")
 
 
-async def discover_iot_devices() -> List[Dict]:
+async def discover_iot_devices(refresh: bool = False) -> List[Dict]:
     """
     Discover IoT devices on the network by probing for common patterns
     Detects: Tasmota, Shelly, ESPHome, WLED, Sonoff, and other smart devices
+    Reuses a recent scan and cached fingerprints unless refresh is set.
     """
-    discovered = []
-    
+    if not iot_fingerprinter:
+        logger.error("Network scanner not initialized")
+        return []
     try:
-        # Get network devices from existing network scan
-        if not scanner:
-            logger.error("Network scanner not initialized")
-            return discovered
-        
-        # Trigger a network scan first
-        devices = await scanner.scan_network()
-        
-        if not devices:
-            logger.info("No network devices found for IoT discovery")
-            return discovered
-        
-        logger.info(f"Scanning {len(devices)} network devices for IoT signatures...")
-        
-        async def probe_device(device: NetworkDevice):
-            """Probe a single device for IoT signatures"""
-            ip = device.ip_address
-            device_discoveries = []
-            
-            # Try common IoT ports with HTTP
-            iot_ports = [80, 8080, 8081, 8082]
-            
-            for port in iot_ports:
-                try:
-                    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=3)) as session:
-                        # Check each IoT pattern
-                        for pattern_name, pattern in IOT_DETECTION_PATTERNS.items():
-                            if 'http_path' not in pattern:
-                                continue
-                            
-                            url = f"http://{ip}:{port}{pattern['http_path']}"
-                            
-                            try:
-                                async with session.get(url) as resp:
-                                    if resp.status == 200:
-                                        # Check response headers
-                                        if 'http_header' in pattern:
-                                            if pattern['http_header'] in resp.headers:
-                                                text = await resp.text()
-                                                device_name = f"{pattern['name_prefix']} ({device.custom_name or device.hostname or ip})"
-                                                
-                                                device_discoveries.append({
-                                                    'service_name': device_name,
-                                                    'endpoint': f"http://{ip}:{port}",
-                                                    'check_type': 'http',
-                                                    'port': port,
-                                                    'category': pattern['category'],
-                                                    'ip_address': ip,
-                                                    'mac_address': device.mac_address,
-                                                    'pattern': pattern_name,
-                                                    'expected_status': 200
-                                                })
-                                                logger.info(f"Found {pattern_name} device: {device_name} at {ip}:{port}")
-                                                break
-                                        
-                                        # Check response content
-                                        elif 'response_contains' in pattern:
-                                            text = await resp.text()
-                                            if pattern['response_contains'] in text:
-                                                device_name = f"{pattern['name_prefix']} ({device.custom_name or device.hostname or ip})"
-                                                
-                                                device_discoveries.append({
-                                                    'service_name': device_name,
-                                                    'endpoint': f"http://{ip}:{port}{pattern['http_path']}",
-                                                    'check_type': 'http',
-                                                    'port': port,
-                                                    'category': pattern['category'],
-                                                    'ip_address': ip,
-                                                    'mac_address': device.mac_address,
-                                                    'pattern': pattern_name,
-                                                    'expected_status': 200
-                                                })
-                                                logger.info(f"Found {pattern_name} device: {device_name} at {ip}:{port}")
-                                                break
-                            
-                            except (aiohttp.ClientError, asyncio.TimeoutError):
-                                continue
-                
-                except Exception as e:
-                    continue
-            
-            return device_discoveries
-        
-        # Probe all devices concurrently (limit to 10 at a time)
-        semaphore = asyncio.Semaphore(10)
-        
-        async def bounded_probe(device):
-            async with semaphore:
-                return await probe_device(device)
-        
-        tasks = [bounded_probe(device) for device in devices]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Flatten results
-        for result in results:
-            if isinstance(result, list):
-                discovered.extend(result)
-        
-        logger.info(f"IoT discovery complete: found {len(discovered)} devices")
-        return discovered
-        
+        if refresh:
+            iot_fingerprinter.invalidate()
+        return await iot_fingerprinter.discover(max_scan_age=0 if refresh else SCAN_REUSE_TTL)
     except Exception as e:
         logger.error(f"IoT discovery error: {e}")
-        return discovered
+        return []
 
 
 async def discover_docker_services() -> List[Dict]:
@@ -3007,89 +4417,26 @@ async def discover_docker_services() -> List[Dict]:
     Auto-discover running Docker containers and match them to known services
     Returns list of discovered services ready to be added
     """
-    discovered = []
-    
+    if not docker_discovery:
+        logger.error("Docker discovery not initialized")
+        return []
     try:
-        # Get all running containers
-        result = subprocess.run(
-            ['docker', 'ps', '--format', '{{.Names}}|{{.Ports}}'],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        if result.returncode != 0:
-            logger.error(f"Docker discovery failed: {result.stderr}")
-            return discovered
-        
-        containers = result.stdout.strip().split('\n')
-        
-        for container in containers:
-            if not container.strip():
-                continue
-                
-            parts = container.split('|')
-            if len(parts) < 2:
-                continue
-                
-            name = parts[0]
-            ports_str = parts[1]
-            
-            # Parse exposed ports
-            # Format: "0.0.0.0:8989->8989/tcp, :::8989->8989/tcp"
-            port_matches = re.findall(r':(\d+)->', ports_str)
-            
-            for port_str in port_matches:
-                port = int(port_str)
-                
-                # Check if port matches known service
-                if port in SERVICE_FINGERPRINTS:
-                    fingerprint = SERVICE_FINGERPRINTS[port]
-                    service_name = fingerprint['name']
-                    check_path = fingerprint.get('path', '/')
-                    
-                    # Build endpoint
-                    if check_path:
-                        endpoint = f"http://localhost:{port}{check_path}"
-                        check_type = 'http'
-                    else:
-                        endpoint = f"localhost:{port}"
-                        check_type = 'tcp'
-                    
-                    discovered.append({
-                        'service_name': f"{service_name} ({name})" if service_name != name else service_name,
-                        'container_name': name,
-                        'endpoint': endpoint,
-                        'check_type': check_type,
-                        'port': port,
-                        'category': fingerprint.get('category', 'unknown'),
-                        'expected_status': 200 if check_type == 'http' else None
-                    })
-                    
-                    logger.info(f"Discovered: {service_name} on port {port} (container: {name})")
-        
-        logger.info(f"Docker discovery complete: found {len(discovered)} services")
-        return discovered
-        
-    except subprocess.TimeoutExpired:
-        logger.error("Docker discovery timed out")
-        return discovered
-    except FileNotFoundError:
-        logger.error("Docker not found - is Docker installed?")
-        return discovered
+        return await docker_discovery.discover()
     except Exception as e:
         logger.error(f"Docker discovery error: {e}")
-        return discovered
+        return []
 
 
 async def api_iot_discover(request: web.Request):
     """API endpoint to discover IoT devices on network"""
     try:
-        discovered = await discover_iot_devices()
+        refresh = request.query.get('refresh', '').lower() in ('1', 'true', 'yes')
+        discovered = await discover_iot_devices(refresh=refresh)
         return _json({
             'success': True,
             'discovered': discovered,
-            'count': len(discovered)
+            'count': len(discovered),
+            'fingerprint': iot_fingerprinter.stats() if iot_fingerprinter else None
         })
     except Exception as e:
         logger.error(f"IoT discovery API error: {e}")
@@ -3133,6 +4480,13 @@ async def api_docker_discover(request: web.Request):
         return _json({'error': str(e)}, status=500)
 
 
+async def api_docker_status(request: web.Request):
+    """API endpoint for the Docker discovery backend state"""
+    if not docker_discovery:
+        return _json({'error': 'Docker discovery not initialized'}, status=503)
+    return _json(docker_discovery.stats())
+
+
 async def api_docker_import(request: web.Request):
     """API endpoint to import discovered Docker services"""
     try:
@@ -3168,10 +4522,9 @@ async def api_docker_import(request: web.Request):
                 
                 db.add_service(service)
                 
-                # Start monitoring if enabled
-                if service.enabled and monitor:
-                    task = asyncio.create_task(monitor.monitor_service(service))
-                    monitor.monitoring_tasks[service.service_name] = task
+                # Start (or reschedule) monitoring
+                if monitor:
+                    monitor.schedule(service)
                 
                 if service_exists:
                     skipped += 1
@@ -3199,33 +4552,132 @@ def _json(data: dict, status: int = 200):
     """Helper to return JSON response"""
     return web.json_response(data, status=status)
 
-async def get_health_score(request: web.Request):
-    """Get overall health score"""
-    services = db.get_all_services()
-    
+SSE_KEEPALIVE = 15  # seconds between comment pings on idle event streams
+
+
+async def _sse_response(request: web.Request) -> web.StreamResponse:
+    """Open a server-sent-events response"""
+    resp = web.StreamResponse(
+        status=200,
+        reason='OK',
+        headers={
+            'Content-Type': 'text/event-stream',
+            'Cache-Control': 'no-cache',
+            'Connection': 'keep-alive',
+        }
+    )
+    await resp.prepare(request)
+    await resp.write(b": hello\n\n")
+    return resp
+
+
+async def _sse_send(resp: web.StreamResponse, data: dict):
+    payload = json.dumps(data, ensure_ascii=False, default=str).encode('utf-8')
+    await resp.write(b"data: " + payload + b"\n\n")
+
+def _health_summary(services: List[Dict]) -> Dict:
+    """Overall health figures for a get_all_services() result"""
     if not services:
-        return _json({
+        return {
             'health_score': 100,
             'total_services': 0,
             'up_services': 0,
-            'down_services': 0
-        })
+            'down_services': 0,
+            'uptime_24h': 100
+        }
     
     up_count = sum(1 for s in services if s.get('current_status') == 'up')
     total = len(services)
     
     health_score = round((up_count / total) * 100, 1) if total > 0 else 100
     
-    return _json({
+    checks = sum(s.get('total_checks_24h') or 0 for s in services)
+    up_checks = sum(s.get('successful_checks_24h') or 0 for s in services)
+    
+    return {
         'health_score': health_score,
         'total_services': total,
         'up_services': up_count,
-        'down_services': total - up_count
-    })
+        'down_services': total - up_count,
+        'uptime_24h': round((up_checks / checks) * 100, 2) if checks else 100
+    }
+
+async def get_health_score(request: web.Request):
+    """Get overall health score"""
+    services = await db.get_all_services_async(monitor.snapshot() if monitor else None)
+    return _json(_health_summary(services))
+
+async def _live_snapshot() -> Dict:
+    """Initial state for a live-feed subscriber"""
+    services = await db.get_all_services_async(monitor.snapshot() if monitor else None)
+    job = speed_monitor.current if speed_monitor else None
+    return {
+        'services': services,
+        'health': _health_summary(services),
+        'speedtest': {
+            'latest': await db.get_latest_speed_test_async(),
+            'job': job.to_dict() if job else None
+        }
+    }
+
+async def live_stream(request: web.Request):
+    """
+    SSE live feed: a snapshot (or the missed events when resuming with
+    Last-Event-ID), then status/metrics/incident/service/devices/speedtest deltas.
+    """
+    last_id = request.headers.get('Last-Event-ID') or request.query.get('since') or ''
+    # Subscribe before the snapshot so no change can fall between the two
+    q = live_feed.subscribe()
+    resp = await _sse_response(request)
+    try:
+        await resp.write(b"retry: 3000\n\n")
+        backlog = live_feed.since(int(last_id)) if last_id.isdigit() else None
+        if backlog is None:
+            await resp.write(live_feed.frame('snapshot', **await _live_snapshot()))
+        else:
+            for frame in backlog:
+                await resp.write(frame)
+        while True:
+            try:
+                frame = await asyncio.wait_for(q.get(), timeout=SSE_KEEPALIVE)
+            except asyncio.TimeoutError:
+                await resp.write(b": ping\n\n")
+                continue
+            if frame is None:
+                await resp.write(live_feed.resync_frame())
+                break
+            await resp.write(frame)
+    except (ConnectionResetError, RuntimeError, BrokenPipeError, asyncio.CancelledError):
+        pass
+    finally:
+        live_feed.unsubscribe(q)
+        try:
+            await resp.write_eof()
+        except Exception:
+            pass
+    return resp
+
+async def live_stats(request: web.Request):
+    """Live feed counters"""
+    return _json(live_feed.stats())
+
+def service_states_snapshot() -> Dict[str, Dict]:
+    """Current per-service state from the monitor (empty before init)"""
+    return monitor.snapshot() if monitor else {}
+
+async def get_service_states(request: web.Request):
+    """Current in-memory state of every monitored service"""
+    return _json(service_states_snapshot())
+
+async def get_scheduler_stats(request: web.Request):
+    """Check scheduler queue depth, lag and concurrency"""
+    if not monitor:
+        return _json({'error': 'Analytics not initialized'}, status=503)
+    return _json(monitor.scheduler.stats())
 
 async def list_services(request: web.Request):
     """List all configured services"""
-    services = db.get_all_services()
+    services = await db.get_all_services_async(monitor.snapshot() if monitor else None)
     return _json(services)
 
 async def get_service(request: web.Request):
@@ -3265,9 +4717,7 @@ async def add_service(request: web.Request):
     
     db.add_service(service)
     
-    if service.enabled:
-        task = asyncio.create_task(monitor.monitor_service(service))
-        monitor.monitoring_tasks[service.service_name] = task
+    monitor.schedule(service)
     
     return _json({'success': True, 'service': service.service_name})
 
@@ -3301,13 +4751,11 @@ async def update_service(request: web.Request):
     db.add_service(service)
     
     old_name = existing['service_name']
-    if old_name in monitor.monitoring_tasks:
-        monitor.monitoring_tasks[old_name].cancel()
-        del monitor.monitoring_tasks[old_name]
+    if old_name != service.service_name:
+        monitor.unschedule(old_name)
+        monitor.forget(old_name)
     
-    if service.enabled:
-        task = asyncio.create_task(monitor.monitor_service(service))
-        monitor.monitoring_tasks[service.service_name] = task
+    monitor.schedule(service)
     
     return _json({'success': True})
 
@@ -3321,9 +4769,8 @@ async def delete_service(request: web.Request):
     
     service_name = service['service_name']
     
-    if service_name in monitor.monitoring_tasks:
-        monitor.monitoring_tasks[service_name].cancel()
-        del monitor.monitoring_tasks[service_name]
+    monitor.unschedule(service_name)
+    monitor.forget(service_name)
     
     db.delete_service(service_id)
     
@@ -3338,9 +4785,9 @@ async def get_uptime(request: web.Request):
     except:
         hours = 24
     
-    metrics = db.get_metrics(service_name, hours)
+    stats = (await db.get_rollup_stats_async(service_name, hours)).get(service_name)
     
-    if not metrics:
+    if not stats or not stats['checks']:
         return _json({
             'service_name': service_name,
             'uptime_percentage': 100,
@@ -3350,12 +4797,11 @@ async def get_uptime(request: web.Request):
             'avg_response_time': 0
         })
     
-    total = len(metrics)
-    successful = sum(1 for m in metrics if m.status == 'up')
+    total = stats['checks']
+    successful = stats['up_checks']
     uptime_pct = round((successful / total) * 100, 1) if total > 0 else 100
     
-    response_times = [m.response_time for m in metrics if m.response_time]
-    avg_response = round(sum(response_times) / len(response_times), 3) if response_times else 0
+    avg_response = round(stats['avg_response'], 3) if stats['avg_response'] else 0
     
     return _json({
         'service_name': service_name,
@@ -3363,7 +4809,14 @@ async def get_uptime(request: web.Request):
         'total_checks': total,
         'successful_checks': successful,
         'failed_checks': total - successful,
-        'avg_response_time': avg_response
+        'avg_response_time': avg_response,
+        'min_response_time': stats['min_response'],
+        'max_response_time': stats['max_response'],
+        'p95_response_time': stats['p95_response'],
+        'latency_histogram': {
+            'buckets': list(LATENCY_BUCKETS),
+            'counts': stats['histogram']
+        }
     })
 
 async def get_incidents(request: web.Request):
@@ -3382,6 +4835,9 @@ async def reset_health(request: web.Request):
     """Reset all health data"""
     try:
         deleted_metrics = db.purge_old_metrics(days=0)
+        db.purge_rollups()
+        if monitor:
+            await monitor.reload_states()
         return _json({'success': True, 'deleted_metrics': deleted_metrics})
     except Exception as e:
         return _json({'error': str(e)}, status=500)
@@ -3401,6 +4857,8 @@ async def reset_service_data(request: web.Request):
     try:
         deleted_metrics = db.reset_service_metrics(service_name)
         deleted_incidents = db.reset_service_incidents(service_name)
+        if monitor:
+            monitor.forget(service_name)
         
         return _json({
             'success': True,
@@ -3414,8 +4872,11 @@ async def purge_all(request: web.Request):
     """Purge all metrics, incidents, and speed tests"""
     try:
         deleted_metrics = db.purge_old_metrics(days=0)
+        db.purge_rollups()
         deleted_incidents = db.purge_old_incidents(days=0)
         deleted_speedtests = db.purge_speed_tests(days=0)
+        if monitor:
+            await monitor.reload_states()
         return _json({
             'success': True,
             'deleted_metrics': deleted_metrics,
@@ -3432,6 +4893,8 @@ async def purge_week(request: web.Request):
         deleted_metrics = db.purge_old_metrics(days=7)
         deleted_incidents = db.purge_old_incidents(days=7)
         deleted_speedtests = db.purge_speed_tests(days=7)
+        if monitor:
+            await monitor.reload_states()
         return _json({
             'success': True,
             'deleted_metrics': deleted_metrics,
@@ -3448,6 +4911,8 @@ async def purge_month(request: web.Request):
         deleted_metrics = db.purge_old_metrics(days=30)
         deleted_incidents = db.purge_old_incidents(days=30)
         deleted_speedtests = db.purge_speed_tests(days=30)
+        if monitor:
+            await monitor.reload_states()
         return _json({
             'success': True,
             'deleted_metrics': deleted_metrics,
@@ -3464,18 +4929,16 @@ async def purge_month(request: web.Request):
 # ============================================================================
 
 async def network_scan(request: web.Request):
-    """Trigger a network scan"""
+    """Trigger a network scan (same reconcile/notify/live-feed path as the background monitor)"""
     devices = await scanner.scan_network()
-    
-    for device in devices:
-        db.add_or_update_device(device)
-    
-    new_devices = sum(1 for d in devices if not db.get_device(d.mac_address))
+    changes = await scanner.apply_scan(devices)
     
     return _json({
         'success': True,
         'devices_found': len(devices),
-        'new_devices': new_devices
+        'new_devices': len(changes['new']),
+        'online': len(changes['online']),
+        'offline': len(changes['offline'])
     })
 
 async def network_devices_list(request: web.Request):
@@ -3521,6 +4984,25 @@ async def network_device_delete(request: web.Request):
     db.delete_device(mac_address)
     return _json({'success': True})
 
+async def oui_stats(request: web.Request):
+    """Vendor (OUI) index size and sources"""
+    if not oui:
+        return _json({'error': 'OUI module not available'}, status=503)
+    loop = asyncio.get_running_loop()
+    stats = await loop.run_in_executor(_executor, lambda: oui.index().stats())
+    return _json(stats)
+
+async def oui_refresh(request: web.Request):
+    """Download the IEEE OUI registries and rebuild the vendor index"""
+    if not oui:
+        return _json({'error': 'OUI module not available'}, status=503)
+    loop = asyncio.get_running_loop()
+    try:
+        result = await loop.run_in_executor(_executor, oui.refresh)
+    except Exception as e:
+        return _json({'error': str(e)}, status=500)
+    return _json({'success': True, **result})
+
 async def network_stats(request: web.Request):
     """Get network monitoring statistics"""
     stats = db.get_network_stats()
@@ -3593,6 +5075,75 @@ async def speedtest_run(request: web.Request):
     else:
         return _json({"error": "Speed test failed"}, status=500)
 
+async def speedtest_job_start(request: web.Request):
+    """Start a speed test in the background and return its job"""
+    already = speed_monitor.testing
+    job = speed_monitor.start_job('manual')
+    return _json({'success': True, 'already_running': already, 'job': job.to_dict()},
+                 status=200 if already else 202)
+
+async def speedtest_jobs(request: web.Request):
+    """Running job plus recently finished ones (newest first)"""
+    current = speed_monitor.current
+    return _json({
+        'current': current.to_dict() if current and not current.finished else None,
+        'jobs': [j.to_dict() for j in reversed(list(speed_monitor.jobs.values()))]
+    })
+
+async def speedtest_job_get(request: web.Request):
+    """Get one speed-test job"""
+    job = speed_monitor.jobs.get(request.match_info['job_id'])
+    if not job:
+        return _json({'error': 'Job not found'}, status=404)
+    return _json({'job': job.to_dict()})
+
+async def speedtest_job_cancel(request: web.Request):
+    """Cancel a running speed-test job"""
+    job_id = request.match_info['job_id']
+    if job_id not in speed_monitor.jobs:
+        return _json({'error': 'Job not found'}, status=404)
+    if not speed_monitor.cancel_job(job_id):
+        return _json({'error': 'Job already finished'}, status=409)
+    return _json({'success': True, 'job_id': job_id})
+
+async def speedtest_stream(request: web.Request):
+    """
+    SSE feed of speed-test progress. Sends the current (or ?job=<id>) job first,
+    then every update; with ?job= the stream ends once that job finishes.
+    """
+    job_id = request.query.get('job')
+    if job_id and job_id not in speed_monitor.jobs:
+        return _json({'error': 'Job not found'}, status=404)
+    
+    q = speed_monitor.subscribe()
+    resp = await _sse_response(request)
+    try:
+        snapshot = speed_monitor.jobs.get(job_id) if job_id else speed_monitor.current
+        if snapshot:
+            await _sse_send(resp, {'event': 'speedtest', 'job': snapshot.to_dict()})
+            if job_id and snapshot.finished:
+                return resp
+        while True:
+            try:
+                data = await asyncio.wait_for(q.get(), timeout=SSE_KEEPALIVE)
+            except asyncio.TimeoutError:
+                await resp.write(b": ping\n\n")
+                continue
+            if job_id and data['job']['id'] != job_id:
+                continue
+            await _sse_send(resp, data)
+            if job_id and data['job']['state'] in ('done', 'failed', 'cancelled'):
+                break
+    except (ConnectionResetError, RuntimeError, BrokenPipeError, asyncio.CancelledError):
+        pass
+    finally:
+        speed_monitor.unsubscribe(q)
+        try:
+            await resp.write_eof()
+        except Exception:
+            pass
+    return resp
+
 async def speedtest_history(request: web.Request):
     """Get speed test history"""
     try:
@@ -3613,8 +5164,8 @@ async def speedtest_latest(request: web.Request):
 
 async def speedtest_stats(request: web.Request):
     """Get speed test statistics"""
-    stats = db.get_speed_test_stats()
-    averages = db.get_speed_test_averages(last_n=5)
+    stats = await db.get_speed_test_stats_async()
+    averages = await db.get_speed_test_averages_async(last_n=5)
     
     return _json({
         **stats,
@@ -3659,7 +5210,8 @@ async def speedtest_monitoring_status(request: web.Request):
         'schedule_mode': speed_monitor.schedule_mode,
         'interval_hours': speed_monitor.interval_hours,
         'schedule_times': speed_monitor.schedule_times,
-        'consecutive_failures': speed_monitor.consecutive_failures
+        'consecutive_failures': speed_monitor.consecutive_failures,
+        'job': speed_monitor.current.to_dict() if speed_monitor.current else None
     })
 
 async def speedtest_update_settings(request: web.Request):
@@ -3750,6 +5302,8 @@ def register_routes(app: web.Application):
     # Service management
     app.router.add_get('/api/analytics/health-score', get_health_score)
     app.router.add_get('/api/analytics/services', list_services)
+    app.router.add_get('/api/analytics/state', get_service_states)
+    app.router.add_get('/api/analytics/scheduler', get_scheduler_stats)
     app.router.add_get('/api/analytics/services/{service_id}', get_service)
     app.router.add_post('/api/analytics/services', add_service)
     app.router.add_put('/api/analytics/services/{service_id}', update_service)
@@ -3759,6 +5313,7 @@ def register_routes(app: web.Application):
     
     # Discovery endpoints
     app.router.add_post('/api/analytics/docker/discover', api_docker_discover)
+    app.router.add_get('/api/analytics/docker/status', api_docker_status)
     app.router.add_post('/api/analytics/docker/import', api_docker_import)
     app.router.add_post('/api/analytics/iot/discover', api_iot_discover)
     app.router.add_post('/api/analytics/discover/all', api_combined_discover)
@@ -3778,6 +5333,8 @@ def register_routes(app: web.Application):
     app.router.add_put('/api/analytics/network/devices/{mac_address}', network_device_update)
     app.router.add_delete('/api/analytics/network/devices/{mac_address}', network_device_delete)
     app.router.add_get('/api/analytics/network/stats', network_stats)
+    app.router.add_get('/api/analytics/network/oui', oui_stats)
+    app.router.add_post('/api/analytics/network/oui/refresh', oui_refresh)
     app.router.add_get('/api/analytics/network/events', network_events_list)
     app.router.add_post('/api/analytics/network/monitoring/start', network_monitoring_start)
     app.router.add_post('/api/analytics/network/monitoring/stop', network_monitoring_stop)
@@ -3786,6 +5343,15 @@ def register_routes(app: web.Application):
     
     # Speed test routes
     app.router.add_post('/api/analytics/speedtest/run', speedtest_run)
+    app.router.add_post('/api/analytics/speedtest/jobs', speedtest_job_start)
+    app.router.add_get('/api/analytics/speedtest/jobs', speedtest_jobs)
+    app.router.add_get('/api/analytics/speedtest/jobs/{job_id}', speedtest_job_get)
+    app.router.add_delete('/api/analytics/speedtest/jobs/{job_id}', speedtest_job_cancel)
+    app.router.add_get('/api/analytics/speedtest/stream', speedtest_stream)
+    
+    # Live feed
+    app.router.add_get('/api/analytics/live', live_stream)
+    app.router.add_get('/api/analytics/live/stats', live_stats)
     app.router.add_get('/api/analytics/speedtest/history', speedtest_history)
     app.router.add_get('/api/analytics/speedtest/latest', speedtest_latest)
     app.router.add_get('/api/analytics/speedtest/stats', speedtest_stats)
@@ -3796,9 +5362,28 @@ def register_routes(app: web.Application):
     app.router.add_get('/api/analytics/speedtest/schedule', speedtest_get_settings)
     app.router.add_post('/api/analytics/speedtest/schedule', speedtest_update_schedule)
 
+# Raw metrics older than this are dropped once rolled up (0 = keep forever, the default)
+RAW_RETENTION_DAYS = int(os.getenv('ANALYTICS_RAW_RETENTION_DAYS', '0') or 0)
+_maintenance_task: Optional[asyncio.Task] = None
+
+
+async def _rollup_maintenance_loop(interval: int = 3600):
+    """Hourly: expire old fine-grained rollups (and raw metrics, if opted in)"""
+    while True:
+        try:
+            await asyncio.sleep(interval)
+            deleted = await db.downsample_metrics_async(RAW_RETENTION_DAYS)
+            if any(deleted.values()):
+                logger.info(f"Analytics downsample: {deleted}")
+        except asyncio.CancelledError:
+            break
+        except Exception as e:
+            logger.error(f"Analytics downsample error: {e}")
+
+
 async def init_analytics(app: web.Application, notification_callback: Optional[Callable] = None):
     """Initialize analytics module"""
-    global db, monitor, scanner, speed_monitor
+    global db, monitor, scanner, speed_monitor, iot_fingerprinter, docker_discovery, _maintenance_task
     
     db = AnalyticsDB()
     
@@ -3807,10 +5392,18 @@ async def init_analytics(app: web.Application, notification_callback: Optional[C
     monitor = HealthMonitor(db, callback)
     scanner = NetworkScanner(db)
     scanner.set_notification_callback(callback)
+    iot_fingerprinter = IoTFingerprinter(scanner)
+    docker_discovery = DockerDiscovery()
     speed_monitor = SpeedTestMonitor(db)
     speed_monitor.set_notification_callback(callback)
+    if oui:
+        # Parse the OUI registries off the loop before any scan needs a vendor
+        await asyncio.get_running_loop().run_in_executor(_executor, oui.index)
     
     await monitor.start_all()
+    _maintenance_task = asyncio.create_task(_rollup_maintenance_loop())
+    if DOCKER_EVENTS:
+        docker_discovery.start_events()
     
     register_routes(app)
     
@@ -3818,9 +5411,20 @@ async def init_analytics(app: web.Application, notification_callback: Optional[C
 
 async def shutdown_analytics():
     """Shutdown analytics module"""
+    if _maintenance_task:
+        _maintenance_task.cancel()
     if monitor:
         await monitor.stop_all()
     if scanner:
         await scanner.stop_monitoring()
     if speed_monitor:
         await speed_monitor.stop_monitoring()
+        if speed_monitor.testing:
+            speed_monitor.cancel_job(speed_monitor.current.id)
+    if iot_fingerprinter:
+        await iot_fingerprinter.close()
+    if docker_discovery:
+        await docker_discovery.close()
+    if db:
+        await db.flush_metrics()
+        db.close()
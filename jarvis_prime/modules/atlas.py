@@ -12,7 +12,7 @@ import statistics
 import asyncio
 import aiohttp
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 from aiohttp import web
 
@@ -29,6 +29,15 @@ _CACHE_TTL = 5.0
 _webui_cache: Dict[str, dict] = {}
 _WEBUI_CACHE_TTL = 900.0
 
+# Live service status source (analytics monitor state table); None = read the DB
+_status_provider: Optional[Callable[[], Dict[str, dict]]] = None
+
+
+def set_status_provider(provider: Optional[Callable[[], Dict[str, dict]]]):
+    """Read latest service status from `provider()` instead of analytics_metrics."""
+    global _status_provider
+    _status_provider = provider
+
 
 # ==============================
 # Utilities
@@ -222,10 +231,18 @@ async def build_topology_snapshot_async() -> dict:
         logger.debug("[atlas] returning cached snapshot")
         return _cache["payload"]
 
+    latest = None
+    if _status_provider:
+        try:
+            latest = _status_provider()
+        except Exception as e:
+            logger.warning("[atlas] status provider failed, reading DB: %s", e)
+
     with sqlite3.connect(DB_PATH) as conn:
         hosts = fetch_orchestrator_hosts(conn)
         services = fetch_analytics_services(conn)
-        latest = fetch_latest_status_by_service(conn)
+        if latest is None:
+            latest = fetch_latest_status_by_service(conn)
 
     logger.info("[atlas] building snapshot: %d hosts, %d services", len(hosts), len(services))
 
@@ -1,8 +1,14 @@
 from __future__ import annotations
-import re, json, importlib, random, html, os
+import re, json, importlib, random, html, os, copy, hashlib, threading, time
+from collections import OrderedDict
 from typing import List, Tuple, Optional, Dict, Any
 from urllib.parse import unquote_plus, parse_qs  # ADD
 
+try:
+    import options_store  # shared, change-aware /data/options.json snapshot
+except Exception:
+    options_store = None
+
 # -------- Regex library --------
 IMG_URL_RE = re.compile(r'(https?://[^\s)]+?\.(?:png|jpg|jpeg|gif|webp)(?:\?[^\s)]*)?)', re.I)
 # tolerate spaces/newlines between ] and (, and angle-bracketed URLs
@@ -259,12 +265,29 @@ def _fmt_kv(label: str, value: str) -> str:
         v = f"`{v}`"
     return f"- **{label.strip()}:** {v}"
 
+# -------- Sibling modules (hot-reload on edit only) --------
+_MODULE_CACHE: Dict[str, Tuple[Any, Optional[float]]] = {}
+
+def _fresh_module(name: str):
+    """Import a sibling module, re-executing it only when its source changed on disk.
+    (Reloading personality/llm_client on every message cost ~15 ms and reset their caches.)"""
+    mod, mtime = _MODULE_CACHE.get(name, (None, None))
+    if mod is None:
+        mod = importlib.import_module(name)
+    try:
+        current = os.path.getmtime(mod.__file__)
+    except Exception:
+        current = None
+    if mtime is not None and current != mtime:
+        mod = importlib.reload(mod)
+    _MODULE_CACHE[name] = (mod, current)
+    return mod
+
 # -------- Persona overlay --------
 def _persona_overlay_line(persona: Optional[str]) -> Optional[str]:
     if not persona: return None
     try:
-        mod = importlib.import_module("personality")
-        mod = importlib.reload(mod)
+        mod = _fresh_module("personality")
         quip = ""
         if hasattr(mod, "quip"):
             try: quip = str(mod.quip(persona) or "").strip()
@@ -309,6 +332,8 @@ def _harvest_timestamp(title: str, body: str) -> Optional[str]:
 
 # ====== Options & toggles ======
 def _read_options() -> Dict[str, Any]:
+    if options_store is not None:
+        return options_store.snapshot()
     try:
         with open("/data/options.json", "r", encoding="utf-8") as f:
             return json.load(f) or {}
@@ -386,11 +411,16 @@ def _llm_message_rewrite_max_chars() -> int:
 # Riffs (FIXED: Lexi fallback when LLM off)
 # ============================
 def _persona_llm_riffs(context: str, persona: Optional[str]) -> List[str]:
+    t0 = time.perf_counter()
+    try:
+        return _persona_llm_riffs_inner(context, persona)
+    finally:
+        _stage_timing("riffs", time.perf_counter() - t0)
+
+def _persona_llm_riffs_inner(context: str, persona: Optional[str]) -> List[str]:
     """
     FIXED: Returns LLM riffs if LLM enabled, Lexi riffs if LLM disabled but riffs enabled.
     """
-    import importlib  # Import at function level for both branches
-    
     if not persona:
         return []
     
@@ -404,8 +434,7 @@ def _persona_llm_riffs(context: str, persona: Optional[str]) -> List[str]:
     if llm_on:
         # LLM is ON → try LLM riffs via llm_client
         try:
-            llm = importlib.import_module("llm_client")
-            llm = importlib.reload(llm)
+            llm = _fresh_module("llm_client")
             out = llm.persona_riff(persona=persona, context=context)
             if isinstance(out, list) and out:
                 return [s.strip() for s in out if s and s.strip()]
@@ -416,8 +445,7 @@ def _persona_llm_riffs(context: str, persona: Optional[str]) -> List[str]:
         
         # Fallback to personality.llm_quips if llm_client failed
         try:
-            mod = importlib.import_module("personality")
-            mod = importlib.reload(mod)
+            mod = _fresh_module("personality")
             if hasattr(mod, "llm_quips"):
                 max_lines = int(os.getenv("LLM_PERSONA_LINES_MAX", "3") or "3")
                 out = mod.llm_quips(persona, context=context, max_lines=max_lines)
@@ -428,8 +456,7 @@ def _persona_llm_riffs(context: str, persona: Optional[str]) -> List[str]:
     else:
         # LLM is OFF, riffs ON → use Lexi fallback
         try:
-            mod = importlib.import_module("personality")
-            mod = importlib.reload(mod)
+            mod = _fresh_module("personality")
             if hasattr(mod, "lexi_riffs"):
                 max_lines = int(os.getenv("LLM_PERSONA_LINES_MAX", "3") or "3")
                 # Extract subject from context
@@ -494,11 +521,9 @@ def _effective_persona(passed_persona: Optional[str]) -> Optional[str]:
     except Exception:
         pass
     try:
-        with open("/data/options.json", "r", encoding="utf-8") as f:
-            opt = json.load(f)
-            p = (opt.get("default_persona") or "").strip()
-            if p:
-                return p
+        p = (_read_options().get("default_persona") or "").strip()
+        if p:
+            return p
     except Exception:
         pass
     p = (os.getenv("DEFAULT_PERSONA") or "").strip()
@@ -533,11 +558,9 @@ def _beautify_is_disabled() -> bool:
     if env in ("0","false","no","off","disabled"):
         return True
     try:
-        with open("/data/options.json","r",encoding="utf-8") as f:
-            opt = json.load(f)
-            v = str(opt.get("beautify_enabled","true")).strip().lower()
-            if v in ("0","false","no","off","disabled"):
-                return True
+        v = str(_read_options().get("beautify_enabled","true")).strip().lower()
+        if v in ("0","false","no","off","disabled"):
+            return True
     except Exception:
         pass
     return False
@@ -778,11 +801,9 @@ def _build_client_title(subject: str) -> str:
 # --- Poster/icon fallback ---------------------------------------------------------
 def _icon_map_from_options() -> Dict[str,str]:
     try:
-        with open("/data/options.json","r",encoding="utf-8") as f:
-            opt = json.load(f) or {}
-            m = opt.get("icon_map") or {}
-            if isinstance(m, dict):
-                return {str(k).lower(): str(v) for k,v in m.items() if v}
+        m = _read_options().get("icon_map") or {}
+        if isinstance(m, dict):
+            return {str(k).lower(): str(v) for k,v in m.items() if v}
     except Exception:
         pass
     return {}
@@ -828,11 +849,9 @@ def _icon_from_env(keyword: str) -> Optional[str]:
 
 def _default_icon() -> Optional[str]:
     try:
-        with open("/data/options.json","r",encoding="utf-8") as f:
-            opt = json.load(f) or {}
-            d = opt.get("default_icon") or ""
-            if str(d).strip():
-                return str(d).strip()
+        d = _read_options().get("default_icon") or ""
+        if str(d).strip():
+            return str(d).strip()
     except Exception:
         pass
     v = os.getenv("ICON_DEFAULT_URL") or ""
@@ -959,8 +978,233 @@ def _normalize_intake(source: str, title: str, body: str) -> Tuple[str, str]:
         return _preprocess_proxy(title, body)
     return _preprocess_generic(title, body)
 
+# -------- Intake pipeline (staged) --------
+# The cleanup that runs before layout is an explicit list of stages over one
+# body held as lines. Consecutive line stages are fused into a single loop (a
+# line is mapped through each in turn; None drops it, "" blanks it) and blank
+# runs are squeezed once per group instead of after every stage. Text stages
+# see the joined body. Each stage names the intakes it applies to (None = all)
+# and the intakes it skips, and every stage is timed through _stage_timing() / set_stage_hook().
+_NOISE_LINE_RX = re.compile(r'^\s*(?:sent from .+|via .+ api|automated message|do not reply)\.?\s*$', re.I)
+_MIME_LINE_RX = re.compile(r'^\s*Content-(?:Disposition|Type|Length|Transfer-Encoding)\s*:', re.I)
+_ACTION_SAYS_LINE_RX = re.compile(r'^\s*action\s+says:', re.I)
+
+class _Body:
+    """Body being cleaned: lines or text, converted lazily between stages."""
+    __slots__ = ("title", "source", "_lines", "_text", "images", "image_alts", "normalized")
+
+    def __init__(self, title: str, body: str, source: str):
+        self.title = (title or "").strip()
+        self.source = source
+        self._lines: Optional[List[str]] = None
+        self._text: Optional[str] = body
+        self.images: List[str] = []
+        self.image_alts: List[str] = []
+        self.normalized = ""
+
+    @property
+    def lines(self) -> List[str]:
+        if self._lines is None:
+            self._lines = (self._text or "").splitlines()
+            self._text = None
+        return self._lines
+
+    @lines.setter
+    def lines(self, value: List[str]) -> None:
+        self._lines, self._text = value, None
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = "\n".join(self._lines or [])
+            self._lines = None
+        return self._text
+
+    @text.setter
+    def text(self, value: str) -> None:
+        self._text, self._lines = value, None
+
+class _Stage:
+    __slots__ = ("name", "fn", "line", "sources", "skip")
+
+    def __init__(self, name: str, fn, *, line: bool = False, sources: Optional[Tuple[str, ...]] = None,
+                 skip: Tuple[str, ...] = ()):
+        self.name, self.fn, self.line, self.sources, self.skip = name, fn, line, sources, skip
+
+    def applies(self, source: str) -> bool:
+        if source in self.skip:
+            return False
+        return self.sources is None or source in self.sources
+
+def _line_noise(ln: str) -> Optional[str]:
+    if not ln.isascii():
+        ln = EMOJI_RE.sub("", ln)
+    return None if _NOISE_LINE_RX.match(ln) else ln
+
+def _line_whitespace(ln: str) -> str:
+    if "\t" in ln:
+        ln = ln.replace("\t", "  ")
+    return ln.rstrip(" \t")
+
+def _line_action_says(ln: str) -> str:
+    return "" if _ACTION_SAYS_LINE_RX.match(ln) else ln
+
+def _line_mime(ln: str) -> str:
+    return "" if _MIME_LINE_RX.match(ln) else ln
+
+def _text_unescape(b: _Body) -> None:
+    if "&" in b.text:
+        b.text = html.unescape(b.text)
+
+def _text_intake(b: _Body) -> None:
+    b.title, b.text = _normalize_intake(b.source, b.title, b.text)
+
+def _text_querystring(b: _Body) -> None:
+    title, normalized = b.title, b.text
+    qs_title = _maybe_parse_query_payload(title)
+    qs_body  = _maybe_parse_query_payload(normalized)
+    if not (qs_title or qs_body):
+        return
+
+    if qs_title and "title" in qs_title:
+        title = unquote_plus(qs_title.get("title") or "") or title
+    if qs_body and "title" in qs_body:
+        title = unquote_plus(qs_body.get("title") or "") or title
+
+    if qs_title and "message" in qs_title:
+        normalized = unquote_plus(qs_title.get("message") or "") or normalized
+    if qs_body and "message" in qs_body:
+        normalized = unquote_plus(qs_body.get("message") or "") or normalized
+
+    if (title or "").strip():
+        try:
+            title_decoded = unquote_plus(title.strip())
+            if qs_title and "title" in qs_title:
+                title = unquote_plus(qs_title.get("title") or "").strip() or title_decoded
+            else:
+                title = title_decoded
+        except Exception:
+            pass
+    b.title, b.text = title, normalized
+
+def _text_images(b: _Body) -> None:
+    b.normalized = b.text
+    b.text, b.images, b.image_alts = _harvest_images(b.text)
+
+# Intakes that skip the mime stage: their "intake" preprocessor already ran
+# _strip_mime_headers(). Every other source (gotify/ntfy included) still strips.
+_MIME_SKIP_SOURCES = ("smtp", "proxy")
+
+BEAUTIFY_STAGES: List[_Stage] = [
+    _Stage("noise", _line_noise, line=True),
+    _Stage("whitespace", _line_whitespace, line=True),
+    _Stage("unescape", _text_unescape),
+    _Stage("intake", _text_intake, sources=("smtp", "gotify", "ntfy", "apprise", "proxy")),
+    _Stage("querystring", _text_querystring),
+    _Stage("action_says", _line_action_says, line=True),
+    _Stage("mime", _line_mime, line=True, skip=_MIME_SKIP_SOURCES),
+    _Stage("images", _text_images),
+]
+
+# ---- stage timing ----
+_STAGE_LOCK = threading.Lock()
+_STAGE_STATS: Dict[str, Dict[str, float]] = {}
+_STAGE_HOOK = None
+
+def set_stage_hook(fn) -> None:
+    """fn(stage_name, seconds) is called after every pipeline stage (None to clear)"""
+    global _STAGE_HOOK
+    _STAGE_HOOK = fn
+
+def _stage_timing(name: str, seconds: float) -> None:
+    ms = seconds * 1000.0
+    with _STAGE_LOCK:
+        st = _STAGE_STATS.setdefault(name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+        st["count"] += 1
+        st["total_ms"] += ms
+        if ms > st["max_ms"]:
+            st["max_ms"] = ms
+    hook = _STAGE_HOOK
+    if hook is not None:
+        try:
+            hook(name, seconds)
+        except Exception:
+            pass
+
+def pipeline_stats() -> Dict[str, Dict[str, float]]:
+    with _STAGE_LOCK:
+        return {
+            k: {"count": v["count"],
+                "avg_ms": round(v["total_ms"] / v["count"], 3) if v["count"] else 0.0,
+                "max_ms": round(v["max_ms"], 3)}
+            for k, v in _STAGE_STATS.items()
+        }
+
+def _squeeze_blank_lines(lines: List[str]) -> List[str]:
+    out: List[str] = []
+    for ln in lines:
+        if ln == "" and out and out[-1] == "":
+            continue
+        out.append(ln)
+    return out
+
+def _run_line_group(b: _Body, group: List[_Stage]) -> None:
+    t0 = time.perf_counter()
+    fns = [st.fn for st in group]
+    out: List[str] = []
+    for ln in b.lines:
+        for fn in fns:
+            ln = fn(ln)
+            if ln is None:
+                break
+        else:
+            out.append(ln)
+    b.text = "\n".join(_squeeze_blank_lines(out)).strip()
+    _stage_timing("+".join(st.name for st in group), time.perf_counter() - t0)
+
+def _finish_text(text: str) -> str:
+    """Final pass over the rendered card: de-dup, fold repeats, cap length"""
+    t0 = time.perf_counter()
+    text = _linewise_dedup_markdown(text, protect_message=True)
+    text = _fold_repeats(text)
+    max_len = int(os.getenv("BEAUTIFY_MAX_LEN", "3500") or "3500")
+    text = _safe_truncate(text, max_len=max_len)
+    _stage_timing("finish", time.perf_counter() - t0)
+    return text
+
+def _truncate_input(body: str) -> str:
+    """Cut multi-MB dumps before any pass runs; the rendered card is capped far lower anyway"""
+    limit = _opt_int("beautify_input_max_chars", 65536)
+    if limit <= 0 or len(body) <= limit:
+        return body
+    cut = body.rfind("\n", 0, limit)
+    if cut < limit // 2:
+        cut = limit
+    return body[:cut] + f"\n\n…(truncated {len(body) - cut} chars before formatting)"
+
+def _run_pipeline(title: str, body: str, source: str) -> _Body:
+    t0 = time.perf_counter()
+    b = _Body(title, _ensure_utf8(_truncate_input(body or "")), (source or "").lower())
+    _stage_timing("truncate", time.perf_counter() - t0)
+    group: List[_Stage] = []
+    for st in BEAUTIFY_STAGES:
+        if not st.applies(b.source):
+            continue
+        if st.line:
+            group.append(st)
+            continue
+        if group:
+            _run_line_group(b, group)
+            group = []
+        t0 = time.perf_counter()
+        st.fn(b)
+        _stage_timing(st.name, time.perf_counter() - t0)
+    if group:
+        _run_line_group(b, group)
+    return b
+
 # -------- Public API --------
-def beautify_message(title: str, body: str, *, mood: str = "neutral",
+def _beautify_uncached(title: str, body: str, *, mood: str = "neutral",
                      source_hint: Optional[str] = None, mode: str = "standard",
                      persona: Optional[str] = None, persona_quip: bool = True,
                      extras_in: Optional[Dict[str, Any]] = None) -> Tuple[str, Optional[Dict[str, Any]]]:
@@ -1023,42 +1267,9 @@ def beautify_message(title: str, body: str, *, mood: str = "neutral",
         return text, extras
 
     # --------- Beautifier ON path ---------
-    stripped = _strip_noise(body)
-    normalized = _normalize(stripped)
-    normalized = html.unescape(normalized)
-
-    title, normalized = _normalize_intake(source_hint or "", title, normalized)
-
-    # --- Querystring normalization ---
-    qs_title = _maybe_parse_query_payload(title)
-    qs_body  = _maybe_parse_query_payload(normalized)
-
-    if qs_title and "title" in qs_title:
-        title = unquote_plus(qs_title.get("title") or "") or title
-    if qs_body and "title" in qs_body:
-        title = unquote_plus(qs_body.get("title") or "") or title
-
-    if qs_title and "message" in qs_title:
-        normalized = unquote_plus(qs_title.get("message") or "") or normalized
-    if qs_body and "message" in qs_body:
-        normalized = unquote_plus(qs_body.get("message") or "") or normalized
-
-    if (title or "").strip() and (qs_title or qs_body):
-        try:
-            title_decoded = unquote_plus(title.strip())
-            if qs_title and "title" in qs_title:
-                title = unquote_plus(qs_title.get("title") or "").strip() or title_decoded
-            else:
-                title = title_decoded
-        except Exception:
-            pass
-
-    # remove 'action says:' lines and MIME junk
-    normalized = _strip_action_says(normalized)
-    normalized = _strip_mime_headers(normalized)
-
-    # images (keep meaning via ALT placeholders)
-    body_wo_imgs, images, image_alts = _harvest_images(normalized)
+    cleaned = _run_pipeline(title, body, source_hint or "")
+    title, normalized = cleaned.title, cleaned.normalized
+    body_wo_imgs, images, image_alts = cleaned.text, cleaned.images, cleaned.image_alts
 
     kind = _detect_type(title, body_wo_imgs)
     badge = _severity_badge(title + " " + body_wo_imgs)
@@ -1093,10 +1304,7 @@ def beautify_message(title: str, body: str, *, mood: str = "neutral",
                 lines.append("> " + r)
 
         text = "\n".join(lines).strip()
-        text = _linewise_dedup_markdown(text, protect_message=True)
-        text = _fold_repeats(text)
-        max_len = int(os.getenv("BEAUTIFY_MAX_LEN", "3500") or "3500")
-        text = _safe_truncate(text, max_len=max_len)
+        text = _finish_text(text)
 
         extras: Dict[str, Any] = {
             "client::display": {"contentType": "text/markdown"},
@@ -1151,10 +1359,7 @@ def beautify_message(title: str, body: str, *, mood: str = "neutral",
                 lines.append("> " + r)
 
         text = "\n".join(lines).strip()
-        text = _linewise_dedup_markdown(text, protect_message=True)
-        text = _fold_repeats(text)
-        max_len = int(os.getenv("BEAUTIFY_MAX_LEN", "3500") or "3500")
-        text = _safe_truncate(text, max_len=max_len)
+        text = _finish_text(text)
 
         extras: Dict[str, Any] = {
             "client::display": {"contentType": "text/markdown"},
@@ -1242,10 +1447,7 @@ def beautify_message(title: str, body: str, *, mood: str = "neutral",
             lines.append("> " + r)
 
     text = "\n".join(lines).strip()
-    text = _linewise_dedup_markdown(text, protect_message=True)
-    text = _fold_repeats(text)
-    max_len = int(os.getenv("BEAUTIFY_MAX_LEN", "3500") or "3500")
-    text = _safe_truncate(text, max_len=max_len)
+    text = _finish_text(text)
 
     extras: Dict[str, Any] = {
         "client::display": {"contentType": "text/markdown"},
@@ -1260,3 +1462,191 @@ def beautify_message(title: str, body: str, *, mood: str = "neutral",
         extras.update(extras_in)
 
     return text, extras
+
+# ============================
+# Decoration cache
+# ============================
+# Monitoring sources resend the same body all day (Watchtower summaries,
+# backup reports). The rendered body + extras are cached under a fingerprint
+# of the normalized content, the persona/mode/source and every option that
+# changes the output; the persona overlay line is re-rolled on each hit.
+# Size/TTL come from beautify_cache_size / beautify_cache_ttl_seconds
+# (0 disables); extras {"bypass_cache": true} skips the cache for one message.
+_DECOR_CACHE: "OrderedDict[str, Tuple[float, List[str], Optional[int], Dict[str, Any]]]" = OrderedDict()
+_DECOR_LOCK = threading.Lock()
+_DECOR_STATS = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "bypassed": 0}
+_DECOR_WS_RE = re.compile(r'[ \t]+$', re.M)
+
+def _decor_count(key: str) -> None:
+    with _DECOR_LOCK:
+        _DECOR_STATS[key] += 1
+
+def _decor_fingerprint(title: str, body: str, *, mood: str, source_hint: Optional[str], mode: str,
+                       persona: Optional[str], persona_quip: bool, extras_in: Optional[Dict[str, Any]]) -> str:
+    def norm(s: Any) -> str:
+        s = s if isinstance(s, str) else ("" if s is None else str(s))
+        s = _DECOR_WS_RE.sub("", s.replace("\r\n", "\n").replace("\r", "\n"))
+        return re.sub(r'\n{3,}', '\n\n', s).strip()
+    # Key on the body the pipeline will actually see, so multi-MB dumps are cut before normalising
+    body = _truncate_input(body) if isinstance(body, str) else body
+    parts = [
+        norm(title), norm(body), mood or "", source_hint or "", mode or "", persona or "",
+        # Output-shaping toggles: a flipped option must not serve stale renders
+        _beautify_is_disabled(), persona_quip, _personality_enabled(), _ui_persona_header_enabled(),
+        _riffs_enabled(), _llm_message_rewrite_enabled(), _llm_message_rewrite_max_chars(),
+        os.getenv("BEAUTIFY_MAX_LEN", "3500"),
+        json.dumps(extras_in, sort_keys=True, default=str) if isinstance(extras_in, dict) else "",
+    ]
+    return hashlib.sha1("\x1f".join(map(str, parts)).encode("utf-8", "ignore")).hexdigest()
+
+def _decor_overlay_index(lines: List[str], persona: Optional[str]) -> Optional[int]:
+    if not persona:
+        return None
+    prefix = f"💬 {persona} says:"
+    for i, ln in enumerate(lines[:4]):
+        if ln.startswith(prefix):
+            return i
+    return None
+
+def decoration_cache_stats() -> Dict[str, Any]:
+    with _DECOR_LOCK:
+        stats = dict(_DECOR_STATS)
+        size = len(_DECOR_CACHE)
+    lookups = stats["hits"] + stats["misses"]
+    return {
+        **stats,
+        "size": size,
+        "max_size": max(0, _opt_int("beautify_cache_size", 256)),
+        "ttl_seconds": max(0, _opt_int("beautify_cache_ttl_seconds", 600)),
+        "hit_rate": round(stats["hits"] / lookups, 3) if lookups else 0.0,
+    }
+
+def clear_decoration_cache() -> None:
+    with _DECOR_LOCK:
+        _DECOR_CACHE.clear()
+
+def beautify_message(title: str, body: str, *, mood: str = "neutral",
+                     source_hint: Optional[str] = None, mode: str = "standard",
+                     persona: Optional[str] = None, persona_quip: bool = True,
+                     extras_in: Optional[Dict[str, Any]] = None) -> Tuple[str, Optional[Dict[str, Any]]]:
+    kwargs = dict(mood=mood, source_hint=source_hint, mode=mode, persona=persona,
+                  persona_quip=persona_quip, extras_in=extras_in)
+    max_size = _opt_int("beautify_cache_size", 256)
+    ttl = _opt_int("beautify_cache_ttl_seconds", 600)
+    if max_size <= 0 or ttl <= 0 or (isinstance(extras_in, dict) and extras_in.get("bypass_cache") is True):
+        _decor_count("bypassed")
+        return _beautify_uncached(title, body, **kwargs)
+
+    key = _decor_fingerprint(title, body, **kwargs)
+    eff_persona = _effective_persona(persona)
+    now = time.time()
+    with _DECOR_LOCK:
+        hit = _DECOR_CACHE.get(key)
+        if hit and now - hit[0] > ttl:
+            del _DECOR_CACHE[key]
+            _DECOR_STATS["expired"] += 1
+            hit = None
+        if hit:
+            _DECOR_CACHE.move_to_end(key)
+            _DECOR_STATS["hits"] += 1
+        else:
+            _DECOR_STATS["misses"] += 1
+
+    if hit:
+        _, lines, overlay_at, extras = hit
+        lines = list(lines)
+        if overlay_at is not None:
+            lines[overlay_at] = _persona_overlay_line(eff_persona) or lines[overlay_at]
+        _debug(f"decoration cache hit {key[:12]}")
+        return "\n".join(lines), copy.deepcopy(extras)
+
+    text, extras = _beautify_uncached(title, body, **kwargs)
+    lines = (text or "").split("\n")
+    with _DECOR_LOCK:
+        _DECOR_CACHE[key] = (now, lines, _decor_overlay_index(lines, eff_persona), copy.deepcopy(extras))
+        _DECOR_CACHE.move_to_end(key)
+        while len(_DECOR_CACHE) > max_size:
+            _DECOR_CACHE.popitem(last=False)
+            _DECOR_STATS["evictions"] += 1
+    return text, extras
+
+# ============================
+# Benchmark: python3 beautify.py --bench [N] [messages.db]
+# ============================
+_BENCH_CORPUS: List[Tuple[str, str, str]] = [
+    ("smtp", "Backup report",
+     "Content-Type: text/plain; charset=utf-8\nContent-Transfer-Encoding: 7bit\n\nDuplicati backup   \n\n\n\n"
+     "Source: /data\nSize: 12 GB\t\nSent from my server.\nStatus: Success &amp; verified\n"),
+    ("proxy", "proxy",
+     '--abc\nContent-Disposition: form-data; name="title"\n\nDisk warning\n--abc\n'
+     'Content-Disposition: form-data; name="message"\n\nDisk /dev/sda at 91% 🔥\n--abc--'),
+    ("gotify", "Sonarr", "title=Episode%20Grabbed&message=The+Expanse+S01E01+grabbed&priority=5"),
+    ("gotify", "Radarr",
+     "Movie Downloaded: Dune (2021)\n![poster](https://image.tmdb.org/t/p/w500/abc.jpg)\nQuality: Bluray-1080p"),
+    ("webhook", "Watchtower updates on nas01",
+     "Watchtower updates on nas01\n" + "".join(f" - /app{i} (linuxserver/app{i}:latest): {i:04x} updated to {i+1:04x}\n" for i in range(30))),
+    ("", "QNAP NAS01", "[Storage & Snapshots] Disk 3 on NAS01 reached 55°C\nVolume: DataVol1\nSeverity: Warning"),
+    ("ntfy", "Speedtest", "Download: 912 Mbps\nUpload: 38 Mbps\nPing: 9 ms\nhttps://www.speedtest.net/result/123.png"),
+    ("apprise", "apprise", "Subject: Cron job failed\n\n\n\nerror: exit 1\nautomated message\ndo not reply"),
+    ("smtp", "Mail dump", "Content-Type: text/plain\n\n" + "Received: from mx.example.com by relay; <hdr> &lt;ok&gt;\n" * 60000),
+]
+
+def _legacy_front(title: str, body: str, source: str) -> Tuple[str, str]:
+    """The pre-pipeline cleanup chain (one full-text pass per helper), for comparison"""
+    normalized = html.unescape(_normalize(_strip_noise(body)))
+    title, normalized = _normalize_intake(source, title, normalized)
+    b = _Body(title, normalized, source)
+    _text_querystring(b)
+    normalized = _strip_mime_headers(_strip_action_says(b.text))
+    return b.title, _harvest_images(normalized)[0]
+
+def _bench(n: int = 200, db_path: Optional[str] = None):
+    corpus = list(_BENCH_CORPUS)
+    if db_path:
+        import sqlite3
+        with sqlite3.connect(db_path) as conn:
+            rows = conn.execute("SELECT source, title, body FROM messages ORDER BY id DESC LIMIT 2000").fetchall()
+        corpus = [((s or "").lower(), t or "", b or "") for s, t, b in rows] or corpus
+    sizes = sorted(len(b) for _, _, b in corpus)
+    print(f"[beautify] bench: {len(corpus)} bodies x {n} rounds, median {sizes[len(sizes) // 2]} chars, max {sizes[-1]}")
+
+    def _time(fn, bodies) -> float:
+        # Oversized dumps take ~0.5 s each through the legacy chain; fewer rounds for them
+        rounds = n if all(len(b) <= 65536 for _, _, b in bodies) else max(1, n // 50)
+        t = time.perf_counter()
+        for _ in range(rounds):
+            for src, title, body in bodies:
+                fn(title, body, src)
+        return (time.perf_counter() - t) / (rounds * len(bodies)) * 1000
+
+    small = [c for c in corpus if len(c[2]) <= 65536]
+    large = [c for c in corpus if len(c[2]) > 65536]
+    for label, bodies in (("typical", small), ("oversized", large)):
+        if not bodies:
+            continue
+        legacy = _time(_legacy_front, bodies)
+        staged = _time(_run_pipeline, bodies)
+        print(f"  {label:<9} legacy cleanup chain {legacy:9.3f} ms/msg   staged pipeline {staged:9.3f} ms/msg  ({legacy / staged:.1f}x)")
+    _STAGE_STATS.clear()
+    _time(_run_pipeline, corpus)
+    for name, st in sorted(pipeline_stats().items(), key=lambda kv: -kv[1]["avg_ms"] * kv[1]["count"]):
+        print(f"    {name:<28} {st['count']:>7}  avg {st['avg_ms']:8.3f} ms  max {st['max_ms']:8.3f} ms")
+
+    _STAGE_STATS.clear()
+    rounds = max(1, n // 10)
+    t = time.perf_counter()
+    for _ in range(rounds):
+        for src, title, body in corpus:
+            beautify_message(title, body, source_hint=src, persona="ops",
+                             extras_in={"bypass_cache": True, "riff_hint": False})
+    per = (time.perf_counter() - t) / (rounds * len(corpus)) * 1000
+    print(f"  full beautify_message {per:9.3f} ms/msg (riffs off, cache bypassed)")
+    if "finish" in pipeline_stats():
+        print(f"    {'finish':<28} avg {pipeline_stats()['finish']['avg_ms']:8.3f} ms")
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) >= 2 and sys.argv[1] == "--bench":
+        _bench(int(sys.argv[2]) if len(sys.argv) > 2 else 200, sys.argv[3] if len(sys.argv) > 3 else None)
+    else:
+        print("usage: beautify.py --bench [N] [messages.db]")
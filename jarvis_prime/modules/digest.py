@@ -215,7 +215,10 @@ def _analytics_summary() -> str:
                 delta = f" ({'📈' if diff > 0 else '📉'} {diff:+.2f}%)"
         cache["analytics"] = {"last_date": today_key, "last_health": health}
         _save_cache(cache)
-        return f"🟢 Up: {up}/{total} | 🔴 Down: {down} | 📈 Health: {health:.2f}%{delta}"
+        line = f"🟢 Up: {up}/{total} | 🔴 Down: {down} | 📈 Health: {health:.2f}%{delta}"
+        if data.get("uptime_24h") is not None:
+            line += f" | ⏱️ 24h uptime: {float(data['uptime_24h']):.2f}%"
+        return line
     _log("[analytics] summary: no data returned.")
     return ""
 
@@ -20,6 +20,11 @@ from __future__ import annotations
 import os, json, time, asyncio, requests
 from typing import Optional, Dict, Any, Tuple
 
+try:
+    import options_store  # shared, change-aware /data/options.json snapshot
+except Exception:
+    options_store = None
+
 # ------------------------------
 # Internal state
 # ------------------------------
@@ -32,6 +37,8 @@ _state: Dict[str, Any] = {
     "source": None,        # 'homeassistant' | 'open-meteo' | None
     "task": None,          # asyncio.Task or None
     "forced_off": False,   # we turned LLM off due to OFF profile
+    "pending": {},         # option edits not yet applied by the poll loop
+    "wake": None,          # (loop, asyncio.Event) to cut the poll sleep short
 }
 
 # Default configuration template
@@ -71,6 +78,8 @@ _cfg_template: Dict[str, Any] = {
 # ------------------------------
 def _load_config_files() -> Dict[str, Any]:
     """Try to load /data/options.json or /data/config.json."""
+    if options_store is not None:
+        return options_store.load()
     for path in ("/data/options.json", "/data/config.json"):
         try:
             if os.path.exists(path):
@@ -192,6 +201,8 @@ def _apply_profile(name: str, merged: dict, cfg: Dict[str, Any]) -> None:
 
         with open(opts_path, "w", encoding="utf-8") as f:
             json.dump(opts, f, indent=2)
+        if options_store is not None:
+            options_store.invalidate()
         print(f"[EnviroGuard] Updated llm_enabled → {opts['llm_enabled']} (profile={name})")
     except Exception as e:
         print(f"[EnviroGuard] Failed to update options.json: {e}")
@@ -408,14 +419,60 @@ def set_profile(name: str, merged: dict = None) -> Dict[str, Any]:
         "timeout_seconds": prof.get("timeout_seconds", 20)
     }
 
+# Option keys that feed _cfg_from (edits to these re-read thresholds/profiles live)
+_CFG_KEYS = {
+    "ha_base_url", "ha_url", "ha_token", "ha_indoor_temp_entity", "weather_indoor_sensor_entity",
+    "ha_temp_entity", "ha_temp_entity_id", "weather_ha_temp_entity_id", "ha_temperature_entity",
+    "weather_enabled", "weather_lat", "weather_lon",
+}
+
+def _on_options_changed(changed, opts) -> None:
+    keys = [k for k in changed if k.startswith("llm_enviroguard_") or k in _CFG_KEYS]
+    if not keys:
+        return
+    updates = {k: opts.get(k) for k in keys}
+    wake = _state.get("wake")
+    if not wake:
+        _state["pending"].update(updates)  # poll loop not running yet: nothing swaps it
+        return
+    loop, event = wake
+    def _queue():
+        # On the loop thread, so it can't interleave with _poll_loop's swap
+        _state["pending"].update(updates)
+        event.set()
+    try:
+        loop.call_soon_threadsafe(_queue)
+    except RuntimeError:
+        pass
+
+async def _sleep(seconds: float) -> None:
+    """Poll interval sleep that an options edit can interrupt"""
+    wake = _state.get("wake")
+    if not wake:
+        await asyncio.sleep(seconds)
+        return
+    try:
+        await asyncio.wait_for(wake[1].wait(), timeout=seconds)
+    except asyncio.TimeoutError:
+        pass
+    wake[1].clear()
+
 async def _poll_loop(merged: dict, send_message) -> None:
     cfg = _cfg_from(merged)
     poll = max(1, int(cfg.get("poll_minutes", 30)))
     _apply_profile(_state.get("profile","normal"), merged, cfg)
+    _state["wake"] = (asyncio.get_running_loop(), asyncio.Event())
     while True:
         try:
+            if _state["pending"]:
+                pending, _state["pending"] = _state["pending"], {}
+                merged.update(pending)
+                cfg = _cfg_from(merged)
+                poll = max(1, int(cfg.get("poll_minutes", 30)))
+                _state["enabled"] = bool(cfg.get("enabled"))
+                print(f"[EnviroGuard] options changed ({', '.join(sorted(pending))}); config reloaded")
             if not cfg.get("enabled", False):
-                await asyncio.sleep(poll * 60)
+                await _sleep(poll * 60)
                 continue
 
             temp_c, source = _get_temperature(cfg)
@@ -445,7 +502,7 @@ async def _poll_loop(merged: dict, send_message) -> None:
                             pass
         except Exception as e:
             print(f"[EnviroGuard] poll error: {e}")
-        await asyncio.sleep(poll * 60)
+        await _sleep(poll * 60)
 
 def start_background_poll(merged: dict, send_message):
     cfg = _cfg_from(merged)
@@ -467,6 +524,8 @@ def start_background_poll(merged: dict, send_message):
 
     task = loop.create_task(_poll_loop(merged, send_message))
     _state["task"] = task
+    if options_store is not None and not _state.get("unsubscribe"):
+        _state["unsubscribe"] = options_store.subscribe(_on_options_changed)
     return task
 
 def stop_background_poll() -> None:
@@ -477,6 +536,10 @@ def stop_background_poll() -> None:
         except Exception:
             pass
     _state["task"] = None
+    _state["wake"] = None
+    unsubscribe = _state.pop("unsubscribe", None)
+    if unsubscribe:
+        unsubscribe()
 
 # ------------------------------
 # Compatibility API for bot.py
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+# /app/netsweep.py
+#
+# Jarvis Prime — native host sweeper for the network scanner
+#
+# Finds live hosts without forking one `ping` per address:
+#   - ICMP echo over a single datagram ("unprivileged ping") or raw socket,
+#     all probes sent from one socket and replies collected on the event loop
+#   - MACs read straight from /proc/net/arp instead of `arp -a`; hosts that
+#     ignore ICMP count as alive only with a REACHABLE `ip neigh` entry
+#   - any IPv4 network size (hosts come from ipaddress, not a .1-.254 loop)
+# Methods form a fallback chain (icmp -> ping subprocess), and neighbour
+# sources likewise (/proc/net/arp -> `ip neigh` -> `arp -a`), so hosts without
+# CAP_NET_RAW or procfs still work the old way.
+#
+# Benchmark (wall time + CPU, native vs subprocess):
+#   python3 netsweep.py --bench [network]      e.g. --bench 127.0.0.0/24
+
+from __future__ import annotations
+import asyncio
+import fcntl
+import ipaddress
+import logging
+import random
+import re
+import resource
+import shutil
+import socket
+import struct
+import sys
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Hard cap on addresses swept in one pass (a /16 is 65534 hosts)
+MAX_HOSTS = 65536
+# ICMP probes sent per second (keeps large sweeps from flooding the LAN)
+SEND_RATE = 2000
+# Seconds to wait for replies after the last probe
+REPLY_TIMEOUT = 1.0
+# Extra rounds re-probing hosts that did not answer
+RETRIES = 1
+# Concurrency for the ping-subprocess fallback (matches the old scanner)
+SUBPROCESS_CONCURRENCY = 50
+
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+
+logger = logging.getLogger(__name__)
+
+
+# ============================
+# Network helpers
+# ============================
+def hosts_of(network: str, limit: int = MAX_HOSTS) -> List[str]:
+    """Host addresses of an IPv4 network, e.g. '10.0.0.0/22' -> 1022 addresses"""
+    net = ipaddress.ip_network(network, strict=False)
+    if net.num_addresses - 2 > limit:
+        raise ValueError(f"{net} has {net.num_addresses - 2} hosts (limit {limit})")
+    return [str(ip) for ip in net.hosts()]
+
+
+def _default_interface(route_path: str = "/proc/net/route") -> Optional[str]:
+    try:
+        with open(route_path) as f:
+            next(f)
+            for line in f:
+                parts = line.split()
+                if len(parts) > 2 and parts[1] == "00000000":
+                    return parts[0]
+    except Exception:
+        pass
+    return None
+
+
+def local_network(iface: Optional[str] = None) -> Optional[str]:
+    """
+    Network of the default-route interface with its real prefix length
+    (SIOCGIFADDR / SIOCGIFNETMASK), e.g. '192.168.4.0/22'. None if unknown.
+    """
+    iface = iface or _default_interface()
+    if not iface:
+        return None
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        req = struct.pack("256s", iface[:15].encode())
+        addr = socket.inet_ntoa(fcntl.ioctl(s.fileno(), 0x8915, req)[20:24])  # SIOCGIFADDR
+        mask = socket.inet_ntoa(fcntl.ioctl(s.fileno(), 0x891B, req)[20:24])  # SIOCGIFNETMASK
+        return str(ipaddress.ip_network(f"{addr}/{mask}", strict=False))
+    except OSError:
+        return None
+    finally:
+        s.close()
+
+
+# ============================
+# ICMP echo sweeper
+# ============================
+def _checksum(data: bytes) -> int:
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _echo_packet(ident: int, seq: int) -> bytes:
+    payload = b"jarvis-sweep"
+    header = struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, 0, ident, seq)
+    csum = _checksum(header + payload)
+    return struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, csum, ident, seq) + payload
+
+
+def open_icmp_socket() -> Tuple[Optional[socket.socket], Optional[str]]:
+    """(socket, kind) using an unprivileged datagram socket if allowed, else raw"""
+    for kind, stype in (("dgram", socket.SOCK_DGRAM), ("raw", socket.SOCK_RAW)):
+        try:
+            sock = socket.socket(socket.AF_INET, stype, socket.IPPROTO_ICMP)
+            sock.setblocking(False)
+            return sock, kind
+        except (PermissionError, OSError):
+            continue
+    return None, None
+
+
+def icmp_available() -> bool:
+    sock, _ = open_icmp_socket()
+    if sock:
+        sock.close()
+        return True
+    return False
+
+
+async def icmp_sweep(hosts: Iterable[str], timeout: float = REPLY_TIMEOUT,
+                     retries: int = RETRIES, rate: int = SEND_RATE) -> List[str]:
+    """
+    Send one echo request per host from a single socket and collect replies.
+    Raises OSError if no ICMP socket can be opened (caller falls back).
+    """
+    sock, kind = open_icmp_socket()
+    if sock is None:
+        raise OSError("ICMP sockets not permitted")
+    loop = asyncio.get_running_loop()
+    pending = set(hosts)
+    alive: set = set()
+    ident = random.randint(0, 0xFFFF)
+
+    def on_readable():
+        while True:
+            try:
+                data, addr = sock.recvfrom(1024)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                return
+            if kind == "raw":
+                # raw sockets see the IP header and every ICMP packet on the host
+                ihl = (data[0] & 0x0F) * 4
+                data = data[ihl:]
+                if len(data) < 8:
+                    continue
+                icmp_type, _, _, rid, _ = struct.unpack("!BBHHH", data[:8])
+                if icmp_type != _ICMP_ECHO_REPLY or rid != ident:
+                    continue
+            else:
+                # datagram sockets only deliver replies to our own requests
+                if len(data) < 8 or data[0] != _ICMP_ECHO_REPLY:
+                    continue
+            ip = addr[0]
+            if ip in pending:
+                pending.discard(ip)
+                alive.add(ip)
+
+    loop.add_reader(sock.fileno(), on_readable)
+    try:
+        interval = 1.0 / rate if rate > 0 else 0
+        for round_no in range(retries + 1):
+            if not pending:
+                break
+            for seq, ip in enumerate(list(pending)):
+                try:
+                    sock.sendto(_echo_packet(ident, (round_no << 12 | seq) & 0xFFFF), (ip, 0))
+                except BlockingIOError:
+                    await asyncio.sleep(0.01)
+                except OSError:
+                    pass  # unreachable network / no route: host stays pending
+                if interval and seq % 64 == 63:
+                    await asyncio.sleep(interval * 64)
+            deadline = loop.time() + timeout
+            while pending and loop.time() < deadline:
+                await asyncio.sleep(0.05)
+    finally:
+        loop.remove_reader(sock.fileno())
+        sock.close()
+    return sorted(alive, key=lambda ip: ipaddress.ip_address(ip))
+
+
+# ============================
+# ping(1) subprocess fallback
+# ============================
+async def ping_subprocess_sweep(hosts: Iterable[str],
+                                concurrency: int = SUBPROCESS_CONCURRENCY) -> List[str]:
+    """The legacy approach: one `ping -c 1 -W 1` process per address"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def ping_ip(ip):
+        async with semaphore:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    'ping', '-c', '1', '-W', '1', ip,
+                    stdout=asyncio.subprocess.DEVNULL,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+                await proc.wait()
+                if proc.returncode == 0:
+                    return ip
+            except Exception:
+                pass
+            return None
+
+    results = await asyncio.gather(*(ping_ip(ip) for ip in hosts))
+    return [ip for ip in results if ip]
+
+
+def ping_available() -> bool:
+    return shutil.which("ping") is not None
+
+
+# Sweep methods tried in order: (name, is_available, sweep(hosts) -> alive)
+SWEEP_METHODS: List[Tuple[str, Callable[[], bool], Callable]] = [
+    ("icmp", icmp_available, icmp_sweep),
+    ("ping", ping_available, ping_subprocess_sweep),
+]
+
+
+async def sweep(network: str, methods: Optional[List[str]] = None) -> Tuple[List[str], str]:
+    """
+    Find live hosts on `network`. Returns (alive_ips, method_used).
+    Hosts that ignore ICMP are included when their neighbour entry is
+    REACHABLE (a fresh ARP reply). /proc/net/arp can't be used for this: its
+    "complete" flag stays set on STALE/DELAY/PROBE entries of hosts that have
+    gone away, until the kernel finishes probing several seconds later.
+    """
+    hosts = hosts_of(network)
+    last_error = None
+    for name, available, fn in SWEEP_METHODS:
+        if methods and name not in methods:
+            continue
+        try:
+            if not available():
+                continue
+            alive = set(await fn(hosts))
+        except Exception as e:
+            last_error = e
+            logger.warning(f"{name} sweep failed, trying next method: {e}")
+            continue
+        net = ipaddress.ip_network(network, strict=False)
+        for ip in (await reachable_neighbors()):
+            try:
+                if ipaddress.ip_address(ip) in net:
+                    alive.add(ip)
+            except ValueError:
+                pass
+        return sorted(alive, key=lambda ip: ipaddress.ip_address(ip)), name
+    raise RuntimeError(f"no sweep method worked ({last_error})")
+
+
+# ============================
+# Neighbour (ARP) table
+# ============================
+_MAC_RE = re.compile(r"^([0-9a-f]{2}:){5}[0-9a-f]{2}$", re.IGNORECASE)
+
+
+def read_proc_arp(path: str = "/proc/net/arp") -> Dict[str, str]:
+    """{ip: MAC} for complete entries in the kernel ARP table"""
+    out = {}
+    with open(path) as f:
+        next(f)
+        for line in f:
+            parts = line.split()
+            if len(parts) < 4:
+                continue
+            ip, flags, mac = parts[0], parts[2], parts[3].upper()
+            # flag 0x2 = ATF_COM (completed); incomplete entries carry a zero MAC
+            if not (int(flags, 16) & 0x2) or mac == "00:00:00:00:00:00":
+                continue
+            out[ip] = mac
+    return out
+
+
+async def _proc_arp() -> Dict[str, str]:
+    return read_proc_arp()
+
+
+async def _read_cmd(args: List[str], pattern: str) -> Dict[str, str]:
+    proc = await asyncio.create_subprocess_exec(
+        *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+    )
+    stdout, _ = await proc.communicate()
+    out = {}
+    for m in re.finditer(pattern, stdout.decode(errors="ignore")):
+        mac = m.group(2).upper()
+        if _MAC_RE.match(mac):
+            out[m.group(1)] = mac
+    return out
+
+
+# Neighbour sources tried in order until one returns entries
+NEIGHBOR_SOURCES: List[Tuple[str, Callable]] = [
+    ("proc", _proc_arp),
+    ("ip-neigh", lambda: _read_cmd(["ip", "-4", "neigh", "show"],
+                                   r"(\d+\.\d+\.\d+\.\d+)\s.*?lladdr\s+([0-9a-fA-F:]+)")),
+    ("arp", lambda: _read_cmd(["arp", "-an"],
+                              r"\((\d+\.\d+\.\d+\.\d+)\)\s+at\s+([0-9a-fA-F:]+)")),
+]
+
+
+async def reachable_neighbors() -> List[str]:
+    """IPs whose neighbour entry is REACHABLE (needs iproute2; [] without it)"""
+    if shutil.which("ip") is None:
+        return []
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "ip", "-4", "neigh", "show", "nud", "reachable",
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+        )
+        stdout, _ = await proc.communicate()
+    except Exception:
+        return []
+    return re.findall(r"^(\d+\.\d+\.\d+\.\d+)\s", stdout.decode(errors="ignore"), re.MULTILINE)
+
+
+async def read_neighbors() -> Dict[str, str]:
+    """{ip: MAC} from the first neighbour source that works (MAC lookup only, not liveness)"""
+    for name, source in NEIGHBOR_SOURCES:
+        try:
+            table = await source()
+        except Exception:
+            continue
+        if table:
+            return table
+    return {}
+
+
+# ============================
+# Benchmark
+# ============================
+def _cpu() -> float:
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    kids = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + kids.ru_utime + kids.ru_stime
+
+
+async def _bench(network: str):
+    hosts = hosts_of(network)
+    print(f"Sweeping {network} ({len(hosts)} hosts)")
+    rows = []
+    for name, available, fn in (("icmp (native)", icmp_available, icmp_sweep),
+                                ("ping subprocess", ping_available, ping_subprocess_sweep)):
+        if not available():
+            print(f"  {name:<16} unavailable on this host")
+            continue
+        t, c = time.perf_counter(), _cpu()
+        try:
+            alive = await fn(hosts)
+        except Exception as e:
+            print(f"  {name:<16} unavailable: {e}")
+            continue
+        rows.append((name, time.perf_counter() - t, _cpu() - c, len(alive)))
+    for name, wall, cpu, n in rows:
+        print(f"  {name:<16} wall {wall:7.2f}s   cpu {cpu:7.2f}s   alive {n}")
+    t = time.perf_counter()
+    table = await read_neighbors()
+    print(f"  neighbours       {len(table)} entries in {(time.perf_counter() - t) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 2 and sys.argv[1] == "--bench":
+        net = sys.argv[2] if len(sys.argv) > 2 else (local_network() or "127.0.0.0/24")
+        asyncio.run(_bench(net))
+    else:
+        print(f"local network: {local_network()}  icmp: {icmp_available()}")
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# /app/oui.py
+#
+# Jarvis Prime — MAC vendor (OUI) lookup
+#
+# Loads IEEE MA-L / MA-M / MA-S assignments (24/28/36-bit prefixes) into three
+# sorted integer arrays and answers lookups with a longest-prefix bisect.
+# Sources, later ones overriding earlier ones:
+#   1. oui_seed.tsv next to this file (small curated table, always present)
+#   2. every *.csv (IEEE registry export) and *.txt / manuf (Wireshark format)
+#      file in OUI_DIR (default /data/oui)
+# Organisation names are folded to the short vendor names the scanner's
+# device classifier expects ("Apple, Inc." -> "Apple").
+#
+# The index is built on first use and rebuilt by reload(); analytics builds it
+# in an executor at startup so the first sweep never parses on the event loop.
+#   python3 oui.py --refresh            download the IEEE registries into OUI_DIR
+#   python3 oui.py --import FILE        copy a local registry/manuf file into OUI_DIR
+#   python3 oui.py AA:BB:CC:DD:EE:FF    look up one address
+
+from __future__ import annotations
+import csv
+import io
+import logging
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+import urllib.request
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+OUI_DIR = Path(os.getenv("JARVIS_OUI_DIR", "/data/oui"))
+SEED_FILE = Path(__file__).with_name("oui_seed.tsv")
+
+IEEE_SOURCES = {
+    "oui.csv": "https://standards-oui.ieee.org/oui/oui.csv",
+    "mam.csv": "https://standards-oui.ieee.org/oui28/mam.csv",
+    "oui36.csv": "https://standards-oui.ieee.org/oui36/oui36.csv",
+}
+
+PREFIX_BITS = (36, 28, 24)  # longest first
+
+# Organisation-name fragments -> short vendor names used by _detect_device_type
+_VENDOR_ALIASES: List[Tuple[str, str]] = [
+    ("raspberry pi", "Raspberry Pi"),
+    ("apple", "Apple"),
+    ("samsung", "Samsung"),
+    ("lg electronics", "LG"),
+    ("lg innotek", "LG"),
+    ("sony", "Sony"),
+    ("nintendo", "Nintendo"),
+    ("microsoft", "Microsoft"),
+    ("google", "Google"),
+    ("nest labs", "Nest"),
+    ("amazon", "Amazon"),
+    ("roku", "Roku"),
+    ("sonos", "Sonos"),
+    ("ring llc", "Ring"),
+    ("synology", "Synology"),
+    ("qnap", "QNAP"),
+    ("ubiquiti", "Ubiquiti"),
+    ("tp-link", "TP-Link"),
+    ("netgear", "Netgear"),
+    ("cisco", "Cisco"),
+    ("d-link", "D-Link"),
+    ("linksys", "Linksys"),
+    ("asustek", "Asus"),
+    ("belkin", "Belkin"),
+    ("philips", "Philips"),
+    ("signify", "Philips"),
+    ("itead", "iTead/Sonoff"),
+    ("tuya", "Tuya"),
+    ("espressif", "Espressif"),
+    ("xiaomi", "Xiaomi"),
+    ("huawei", "Huawei"),
+    ("oneplus", "OnePlus"),
+    ("motorola", "Motorola"),
+    ("htc corporation", "HTC"),
+    ("guangdong oppo", "Oppo"),
+    ("vivo mobile", "Vivo"),
+    ("intel corporate", "Intel"),
+]
+
+_SUFFIX_RE = re.compile(
+    r"[\s,]+(co\.?,?\s*ltd\.?|corporation|corp\.?|inc\.?|llc|ltd\.?|limited|gmbh|"
+    r"s\.?a\.?|b\.?v\.?|ag|oy|ab|plc|technologies|technology|electronics)\.?$",
+    re.IGNORECASE,
+)
+
+
+def canonical_vendor(org: str) -> str:
+    """Short, stable vendor name for an IEEE organisation name"""
+    org = " ".join((org or "").split())
+    low = org.lower()
+    for fragment, short in _VENDOR_ALIASES:
+        if fragment in low:
+            return short
+    prev = None
+    while prev != org:
+        prev, org = org, _SUFFIX_RE.sub("", org).strip(" ,.")
+    return org or prev
+
+
+def mac_to_int(mac: str) -> Optional[int]:
+    digits = re.sub(r"[^0-9A-Fa-f]", "", mac or "")
+    if len(digits) != 12:
+        return None
+    return int(digits, 16)
+
+
+def is_randomized(mac: str) -> bool:
+    """Locally administered address (e.g. phone MAC randomisation): no vendor to find"""
+    value = mac_to_int(mac)
+    return value is not None and bool((value >> 40) & 0x02)
+
+
+# ============================
+# Parsers
+# ============================
+def _parse_ieee_csv(text: str) -> List[Tuple[int, int, str]]:
+    """IEEE registry CSV: Registry,Assignment,Organization Name,Organization Address"""
+    out = []
+    for row in csv.reader(io.StringIO(text)):
+        if len(row) < 3 or row[0] == "Registry":
+            continue
+        assignment = row[1].strip().upper()
+        if not re.fullmatch(r"[0-9A-F]{6}|[0-9A-F]{7}|[0-9A-F]{9}", assignment):
+            continue
+        out.append((len(assignment) * 4, int(assignment, 16), row[2].strip()))
+    return out
+
+
+def _parse_manuf(text: str) -> List[Tuple[int, int, str]]:
+    """Wireshark manuf / seed format: PREFIX[/bits] <tab> short [<tab> long]"""
+    out = []
+    for line in text.splitlines():
+        line = line.split("#", 1)[0].rstrip()
+        if not line.strip():
+            continue
+        parts = [p.strip() for p in line.split("\t") if p.strip()] or line.split(None, 1)
+        if len(parts) < 2:
+            continue
+        prefix, _, bits_s = parts[0].partition("/")
+        digits = re.sub(r"[^0-9A-Fa-f]", "", prefix).upper()
+        bits = int(bits_s) if bits_s.isdigit() else len(digits) * 4
+        if bits not in PREFIX_BITS or len(digits) * 4 < bits:
+            continue
+        name = parts[2] if len(parts) > 2 else parts[1]
+        out.append((bits, int(digits[: bits // 4], 16), name))
+    return out
+
+
+def _parse_file(path: Path) -> List[Tuple[int, int, str]]:
+    text = path.read_text(encoding="utf-8", errors="ignore")
+    if path.suffix.lower() == ".csv":
+        return _parse_ieee_csv(text)
+    return _parse_manuf(text)
+
+
+# ============================
+# Index
+# ============================
+class OuiIndex:
+    """Three sorted prefix arrays (36/28/24 bits) with parallel vendor-name ids"""
+
+    def __init__(self):
+        self._keys: Dict[int, array] = {}
+        self._vals: Dict[int, array] = {}
+        self._names: List[str] = []
+        self.sources: List[str] = []
+        self.built_at: Optional[float] = None
+        self.build_ms: float = 0.0
+
+    @classmethod
+    def build(cls, seed: Path = SEED_FILE, data_dir: Path = OUI_DIR) -> "OuiIndex":
+        t = time.perf_counter()
+        idx = cls()
+        table: Dict[Tuple[int, int], str] = {}
+        files = [seed] if seed.exists() else []
+        if data_dir.is_dir():
+            files += sorted(p for p in data_dir.iterdir()
+                            if p.is_file() and (p.suffix.lower() in (".csv", ".txt") or p.name == "manuf"))
+        for path in files:
+            try:
+                entries = _parse_file(path)
+            except Exception as e:
+                logger.warning(f"[oui] skipping {path}: {e}")
+                continue
+            for bits, prefix, org in entries:
+                # MA-L blocks sub-assigned as MA-M/MA-S carry the RA's own name; skip them
+                if org.lower().startswith("ieee registration authority"):
+                    continue
+                table[(bits, prefix)] = org
+            idx.sources.append(f"{path.name}:{len(entries)}")
+
+        name_ids: Dict[str, int] = {}
+        per_bits: Dict[int, List[Tuple[int, int]]] = {b: [] for b in PREFIX_BITS}
+        for (bits, prefix), org in table.items():
+            name = canonical_vendor(org)
+            nid = name_ids.get(name)
+            if nid is None:
+                nid = name_ids[name] = len(idx._names)
+                idx._names.append(name)
+            per_bits[bits].append((prefix, nid))
+        for bits, rows in per_bits.items():
+            rows.sort()
+            idx._keys[bits] = array("Q", (p for p, _ in rows))
+            idx._vals[bits] = array("I", (n for _, n in rows))
+        idx.built_at = time.time()
+        idx.build_ms = round((time.perf_counter() - t) * 1000, 1)
+        return idx
+
+    def lookup(self, mac: str) -> Optional[Tuple[str, int]]:
+        """(vendor, prefix_bits) for the longest matching assignment"""
+        value = mac_to_int(mac)
+        if value is None:
+            return None
+        for bits in PREFIX_BITS:
+            keys = self._keys.get(bits)
+            if not keys:
+                continue
+            key = value >> (48 - bits)
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                return self._names[self._vals[bits][i]], bits
+        return None
+
+    def stats(self) -> Dict:
+        return {
+            "entries": {f"/{b}": len(self._keys.get(b, ())) for b in PREFIX_BITS},
+            "vendors": len(self._names),
+            "sources": self.sources,
+            "built_at": self.built_at,
+            "build_ms": self.build_ms,
+        }
+
+
+_index: Optional[OuiIndex] = None
+_lock = threading.Lock()
+
+
+def index() -> OuiIndex:
+    """The shared index, built on first use"""
+    global _index
+    if _index is None:
+        with _lock:
+            if _index is None:
+                _index = OuiIndex.build()
+    return _index
+
+
+def reload() -> Dict:
+    """Rebuild the index from the seed and OUI_DIR; returns its stats"""
+    global _index
+    fresh = OuiIndex.build()
+    with _lock:
+        _index = fresh
+    return fresh.stats()
+
+
+def lookup(mac: str) -> Optional[str]:
+    """Short vendor name for a MAC address, or None"""
+    hit = index().lookup(mac)
+    return hit[0] if hit else None
+
+
+def refresh(data_dir: Path = OUI_DIR, timeout: int = 60) -> Dict:
+    """Download the IEEE MA-L/MA-M/MA-S registries into data_dir, then reload"""
+    data_dir.mkdir(parents=True, exist_ok=True)
+    fetched = {}
+    for name, url in IEEE_SOURCES.items():
+        tmp = data_dir / f".{name}.part"
+        try:
+            req = urllib.request.Request(url, headers={"User-Agent": "jarvis-prime-oui/1.0"})
+            with urllib.request.urlopen(req, timeout=timeout) as r, open(tmp, "wb") as f:
+                shutil.copyfileobj(r, f)
+            count = len(_parse_ieee_csv(tmp.read_text(encoding="utf-8", errors="ignore")))
+            if not count:
+                raise ValueError("no assignments parsed")
+            os.replace(tmp, data_dir / name)
+            fetched[name] = count
+        except Exception as e:
+            fetched[name] = f"failed: {e}"
+            try:
+                tmp.unlink()
+            except FileNotFoundError:
+                pass
+    return {"downloads": fetched, **reload()}
+
+
+def import_file(path: str, data_dir: Path = OUI_DIR) -> Dict:
+    """Copy a local IEEE CSV or manuf file into data_dir, then reload"""
+    src = Path(path)
+    if not _parse_file(src):
+        raise ValueError(f"{src} contains no OUI assignments")
+    data_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(src, data_dir / src.name)
+    return reload()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args[:1] == ["--refresh"]:
+        print(refresh())
+    elif args[:1] == ["--import"] and len(args) > 1:
+        print(import_file(args[1]))
+    elif args:
+        for mac in args:
+            print(mac, index().lookup(mac), "(randomized)" if is_randomized(mac) else "")
+    else:
+        print(index().stats())
@@ -1,12 +1,25 @@
 #!/usr/bin/env python3
 # storage.py — SQLite inbox store for Jarvis Prime (JP7)
 from __future__ import annotations
-import os, json, sqlite3, threading, time
+import os, re, json, html, sqlite3, threading, time, atexit
+from collections import deque
+from concurrent.futures import Future
 from typing import Any, Dict, List, Optional, Set
 
 DB_PATH = os.getenv("JARVIS_DB_PATH", "/data/jarvis.db")
 _db_lock = threading.RLock()
 _CONN: Optional[sqlite3.Connection] = None
+_FTS_ENABLED = False  # set by _ensure_fts(); False when SQLite lacks FTS5
+_SQL: Dict[str, Any] = {}  # schema-dependent statements, resolved once per connection by _prepare_sql()
+
+# Group commit (write-behind) — off unless JARVIS_INBOX_GROUP_COMMIT_MS > 0
+GROUP_COMMIT_MS = int(os.getenv("JARVIS_INBOX_GROUP_COMMIT_MS", "0") or 0)
+GROUP_COMMIT_ROWS = max(1, int(os.getenv("JARVIS_INBOX_GROUP_COMMIT_ROWS", "100") or 100))
+GROUP_COMMIT_CAPACITY = max(GROUP_COMMIT_ROWS, int(os.getenv("JARVIS_INBOX_GROUP_COMMIT_CAPACITY", "5000") or 5000))
+_wb_buf: deque = deque()
+_wb_cond = threading.Condition()
+_wb_thread: Optional[threading.Thread] = None
+_wb_stop = False
 
 # ---------------------- internal helpers ----------------------
 def _columns(conn: sqlite3.Connection) -> Set[str]:
@@ -59,10 +72,83 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
         conn.execute("ALTER TABLE messages ADD COLUMN saved INTEGER NOT NULL DEFAULT 0")
         cols.add("saved")
 
+    tcol = "created_at" if "created_at" in cols else "ts"
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_messages_saved_id ON messages(saved, id)")
+    conn.execute(f"CREATE INDEX IF NOT EXISTS idx_messages_{tcol} ON messages({tcol})")
+
+    _ensure_fts(conn)
+
+def _ensure_fts(conn: sqlite3.Connection) -> None:
+    """Full-text index over title/body/source, kept in sync by triggers.
+       Existing rows are backfilled the first time the index is created.
+       Leaves _FTS_ENABLED False (LIKE search) when FTS5 is not compiled in.
+    """
+    global _FTS_ENABLED
+    existed = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='messages_fts'"
+    ).fetchone() is not None
+    try:
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+                title, body, source,
+                content='messages', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            );
+        """)
+    except sqlite3.OperationalError as e:
+        _FTS_ENABLED = False
+        print(f"[storage] FTS5 unavailable, using LIKE search: {e}")
+        return
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS messages_fts_ai AFTER INSERT ON messages BEGIN
+            INSERT INTO messages_fts(rowid, title, body, source) VALUES (new.id, new.title, new.body, new.source);
+        END;
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS messages_fts_ad AFTER DELETE ON messages BEGIN
+            INSERT INTO messages_fts(messages_fts, rowid, title, body, source) VALUES ('delete', old.id, old.title, old.body, old.source);
+        END;
+    """)
+    conn.execute("""
+        CREATE TRIGGER IF NOT EXISTS messages_fts_au AFTER UPDATE OF title, body, source ON messages BEGIN
+            INSERT INTO messages_fts(messages_fts, rowid, title, body, source) VALUES ('delete', old.id, old.title, old.body, old.source);
+            INSERT INTO messages_fts(rowid, title, body, source) VALUES (new.id, new.title, new.body, new.source);
+        END;
+    """)
+    if not existed:
+        t0 = time.time()
+        conn.execute("INSERT INTO messages_fts(messages_fts) VALUES ('rebuild')")
+        print(f"[storage] FTS index built in {time.time() - t0:.2f}s")
+    _FTS_ENABLED = True
+
+_FTS_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+def _fts_query(q: str) -> str:
+    """Turn free text into a safe FTS5 MATCH expression: every word is a quoted
+       prefix term, all terms must match ("disk fu" -> "disk"* AND "fu"*).
+    """
+    return " AND ".join(f'"{t}"*' for t in _FTS_TOKEN_RE.findall(q or ""))
+
+def _prepare_sql(cols: Set[str]) -> None:
+    """Resolve the legacy `ts` / `created_at` layout once and cache the statements."""
+    time_cols = [c for c in ("created_at", "ts") if c in cols]
+    insert_cols = ["title", "body", "source", "priority", *time_cols, "read", "extras", "saved"]
+    select = f"SELECT id, title, body, source, priority, {_time_expr(cols)} AS created_at, read, extras, saved FROM messages"
+    _SQL.clear()
+    _SQL.update({
+        "n_time_cols": len(time_cols),
+        "insert": f"INSERT INTO messages({', '.join(insert_cols)}) VALUES({','.join(['?'] * len(insert_cols))})",
+        "select": select,
+        "get": select + " WHERE id=?",
+        "time_expr_m": _time_expr(cols, "m."),
+        "purge": f"DELETE FROM messages WHERE {'created_at' if 'created_at' in cols else 'ts'} < ?",
+    })
+
 def _connect(path: str) -> sqlite3.Connection:
     # Enable cross-thread use to support aiosmtpd worker thread
     conn = sqlite3.connect(path, timeout=10, isolation_level=None, check_same_thread=False)  # autocommit
     _ensure_schema(conn)
+    _prepare_sql(_columns(conn))
     return conn
 
 def init_db(path: str = DB_PATH) -> None:
@@ -70,6 +156,8 @@ def init_db(path: str = DB_PATH) -> None:
     global _CONN
     with _db_lock:
         _CONN = _connect(path)
+    if GROUP_COMMIT_MS > 0:
+        enable_group_commit()
 
 def _conn() -> sqlite3.Connection:
     global _CONN
@@ -77,6 +165,14 @@ def _conn() -> sqlite3.Connection:
         _CONN = _connect(DB_PATH)
     return _CONN
 
+def _time_expr(cols: Set[str], alias: str = "") -> str:
+    """Timestamp column expression, tolerant of legacy DBs that only have `ts`."""
+    if "created_at" not in cols and "ts" in cols:
+        return f"{alias}ts"
+    if "ts" in cols:
+        return f"COALESCE({alias}created_at, {alias}ts)"
+    return f"{alias}created_at"
+
 def _row_to_dict(r: sqlite3.Row) -> Dict[str, Any]:
     d = dict(r)
     if d.get("extras"):
@@ -89,37 +185,160 @@ def _row_to_dict(r: sqlite3.Row) -> Dict[str, Any]:
     return d
 
 # ---------------------- public API ----------------------
-def save_message(title: str, body: str, source: str, priority: int = 5, extras: Optional[Dict[str, Any]] = None, created_at: Optional[int] = None) -> int:
+def _insert_params(title: str, body: str, source: str, priority: int, extras: Optional[Dict[str, Any]], created_at: Optional[int]) -> List[Any]:
     ts = int(created_at or time.time())
     ex = json.dumps(extras or {}, ensure_ascii=False)
+    return [title, body, source, int(priority), *([ts] * _SQL["n_time_cols"]), 0, ex, 0]
+
+def save_message(title: str, body: str, source: str, priority: int = 5, extras: Optional[Dict[str, Any]] = None, created_at: Optional[int] = None) -> int:
+    if _wb_thread is not None:
+        return submit_message(title, body, source, priority, extras, created_at).result()
     with _db_lock:
-        c = _conn()
-        cols = _columns(c)
-        # Build INSERT dynamically depending on whether legacy `ts` exists
-        time_cols = []
-        params = [title, body, source, int(priority)]
-        if "created_at" in cols:
-            time_cols.append("created_at")
-            params.append(ts)
-        if "ts" in cols:
-            time_cols.append("ts")
-            params.append(ts)
-        columns_sql = "title, body, source, priority"
-        if time_cols:
-            columns_sql += ", " + ", ".join(time_cols)
-        columns_sql += ", read, extras, saved"
-        sql = f"INSERT INTO messages({columns_sql}) VALUES({','.join(['?']* (4 + len(time_cols) + 3))})"
-        params.extend([0, ex, 0])
-        cur = c.execute(sql, params)
-        return int(cur.lastrowid)
-
-def list_messages(limit: int = 50, q: Optional[str] = None, offset: int = 0, saved: Optional[bool] = None) -> List[Dict[str, Any]]:
+        _conn()  # schema (and cached SQL) must be ready before params are built
+        return _insert_now(_insert_params(title, body, source, priority, extras, created_at))
+
+def _insert_now(params: List[Any]) -> int:
+    with _db_lock:
+        return int(_conn().execute(_SQL["insert"], params).lastrowid)
+
+def submit_message(title: str, body: str, source: str, priority: int = 5, extras: Optional[Dict[str, Any]] = None, created_at: Optional[int] = None) -> Future:
+    """Queue an insert and return a Future resolving to the new row id.
+       With group commit enabled the row is written by the next batch flush;
+       otherwise (or once shutdown has started) it is written immediately and
+       the Future is already done.
+    """
+    fut: Future = Future()
+    if _wb_thread is None:
+        try:
+            fut.set_result(save_message(title, body, source, priority, extras, created_at))
+        except Exception as e:
+            fut.set_exception(e)
+        return fut
+    _conn()  # make sure the schema (and cached SQL) is ready before params are built
+    params = _insert_params(title, body, source, priority, extras, created_at)
+    with _wb_cond:
+        while len(_wb_buf) >= GROUP_COMMIT_CAPACITY and not _wb_stop:
+            _wb_cond.wait(0.1)  # ring full: backpressure the writer
+        if not _wb_stop:
+            _wb_buf.append((params, fut))
+            # wake the flusher to open a commit window, or to flush early once a batch is full
+            if len(_wb_buf) == 1 or len(_wb_buf) >= GROUP_COMMIT_ROWS:
+                _wb_cond.notify_all()
+            return fut
+    # shutting down: the flusher may already have made its final drain
+    try:
+        fut.set_result(_insert_now(params))
+    except Exception as e:
+        fut.set_exception(e)
+    return fut
+
+def _flush_batch(batch: List[Any]) -> None:
+    with _db_lock:
+        c = None
+        ids: List[int] = []
+        try:
+            c = _conn()
+            c.execute("BEGIN IMMEDIATE")
+            for params, _ in batch:
+                ids.append(int(c.execute(_SQL["insert"], params).lastrowid))
+            c.execute("COMMIT")
+        except Exception as e:
+            if c is not None:
+                try:
+                    c.execute("ROLLBACK")
+                except Exception:
+                    pass
+            print(f"[storage] group commit of {len(batch)} rows failed: {e}")
+            _fail_batch(batch, e)
+            return
+    for (_, fut), mid in zip(batch, ids):
+        fut.set_result(mid)
+
+def _fail_batch(batch: List[Any], exc: BaseException) -> None:
+    for _, fut in batch:
+        if not fut.done():
+            fut.set_exception(exc)
+
+def _wb_loop() -> None:
+    interval = GROUP_COMMIT_MS / 1000.0
+    while True:
+        with _wb_cond:
+            if not _wb_buf and not _wb_stop:
+                _wb_cond.wait()
+            if not _wb_buf and _wb_stop:
+                return
+            # linger for the commit window unless the batch is already full
+            deadline = time.monotonic() + interval
+            while len(_wb_buf) < GROUP_COMMIT_ROWS and not _wb_stop:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    break
+                _wb_cond.wait(left)
+            batch = [_wb_buf.popleft() for _ in range(min(GROUP_COMMIT_ROWS, len(_wb_buf)))]
+            _wb_cond.notify_all()
+        if batch:
+            try:
+                _flush_batch(batch)
+            except Exception as e:
+                # keep the flusher alive; waiters on this batch must never hang
+                print(f"[storage] group commit flusher error: {e}")
+                _fail_batch(batch, e)
+
+def enable_group_commit(interval_ms: int = GROUP_COMMIT_MS, max_rows: int = GROUP_COMMIT_ROWS) -> None:
+    """Start the write-behind flusher: inserts are buffered and committed in one
+       transaction every `interval_ms` or `max_rows` rows, whichever comes first.
+    """
+    global _wb_thread, _wb_stop, GROUP_COMMIT_MS, GROUP_COMMIT_ROWS
+    if _wb_thread is not None or int(interval_ms) <= 0:
+        return
+    GROUP_COMMIT_MS, GROUP_COMMIT_ROWS = int(interval_ms), max(1, int(max_rows))
+    _wb_stop = False
+    _wb_thread = threading.Thread(target=_wb_loop, name="inbox-group-commit", daemon=True)
+    _wb_thread.start()
+    print(f"[storage] group commit on: every {GROUP_COMMIT_MS} ms or {GROUP_COMMIT_ROWS} rows")
+
+def flush_pending(timeout: float = 10.0) -> None:
+    """Drain the write-behind buffer and stop the flusher (shutdown hook)."""
+    global _wb_thread, _wb_stop
+    t = _wb_thread
+    if t is None:
+        return
+    with _wb_cond:
+        _wb_stop = True
+        _wb_cond.notify_all()
+    t.join(timeout)
+    _wb_thread = None
+    # rows the flusher left behind (join timed out) are committed here
+    with _wb_cond:
+        batch = list(_wb_buf)
+        _wb_buf.clear()
+        _wb_cond.notify_all()
+    if batch:
+        _flush_batch(batch)
+
+atexit.register(flush_pending)
+
+def is_group_commit() -> bool:
+    return _wb_thread is not None
+
+def list_messages(limit: int = 50, q: Optional[str] = None, offset: int = 0, saved: Optional[bool] = None,
+                  rank: bool = False, before_id: Optional[int] = None, after_id: Optional[int] = None) -> List[Dict[str, Any]]:
+    """List newest-first. With `q`, searches title/body/source through the FTS
+       index (word-prefix match, adds HTML-escaped `snippet` / `title_hl` with
+       <mark> highlights); `rank=True` orders search hits by relevance instead
+       of recency. FTS only matches from the start of a word ("warn" finds
+       "warning", "arn" does not), so a query with no FTS hits at all falls back
+       to the substring (LIKE) scan used before the index existed.
+       Keyset paging: `before_id` returns the page older than that id,
+       `after_id` the messages newer than it; both walk the primary key index.
+    """
     c = _conn()
-    cols = _columns(c)
-    time_expr = "COALESCE(created_at, ts)" if "ts" in cols else "created_at"
-    if "created_at" not in cols and "ts" in cols:
-        time_expr = "ts"
-    sql = f"SELECT id, title, body, source, priority, {time_expr} AS created_at, read, extras, saved FROM messages"
+    match = _fts_query(q) if (q and _FTS_ENABLED) else ""
+    if match:
+        hits = _search_fts(c, match, limit, offset, saved, rank, before_id, after_id)
+        if hits or (hits is not None and _fts_has_match(c, match)):
+            return hits
+    sql = _SQL["select"]
     args: List[Any] = []
     clauses = []
     if q:
@@ -129,26 +348,97 @@ def list_messages(limit: int = 50, q: Optional[str] = None, offset: int = 0, sav
     if saved is not None:
         clauses.append("saved=?")
         args.append(1 if saved else 0)
+    if before_id is not None:
+        clauses.append("id<?")
+        args.append(int(before_id))
+    if after_id is not None:
+        clauses.append("id>?")
+        args.append(int(after_id))
     if clauses:
         sql += " WHERE " + " AND ".join(clauses)
-    sql += " ORDER BY id DESC LIMIT ? OFFSET ?"
+    # newer-than pages are read oldest-first (so the page sits right after the cursor) and flipped
+    ascending = after_id is not None and before_id is None
+    sql += " ORDER BY id ASC" if ascending else " ORDER BY id DESC"
+    sql += " LIMIT ? OFFSET ?"
     args += [int(limit), int(offset)]
-    cur = c.execute(sql, args)
-    return [_row_to_dict(r) for r in cur.fetchall()]
+    rows = [_row_to_dict(r) for r in c.execute(sql, args).fetchall()]
+    return rows[::-1] if ascending else rows
+
+# snippet()/highlight() wrap hits in control characters; the text around them is
+# HTML-escaped before they become <mark> tags, so message content can't inject markup
+_HL_OPEN, _HL_CLOSE = "\x02", "\x03"
+
+def _highlight_html(s: Optional[str]) -> str:
+    s = html.escape(s or "")
+    return s.replace(_HL_OPEN, "<mark>").replace(_HL_CLOSE, "</mark>")
+
+def _fts_has_match(c: sqlite3.Connection, match: str) -> bool:
+    try:
+        return c.execute("SELECT 1 FROM messages_fts WHERE messages_fts MATCH ? LIMIT 1", (match,)).fetchone() is not None
+    except sqlite3.OperationalError:
+        return False
+
+def _search_fts(c: sqlite3.Connection, match: str, limit: int, offset: int, saved: Optional[bool], rank: bool,
+                before_id: Optional[int] = None, after_id: Optional[int] = None) -> Optional[List[Dict[str, Any]]]:
+    sql = (
+        f"SELECT m.id, m.title, m.body, m.source, m.priority, {_SQL['time_expr_m']} AS created_at, m.read, m.extras, m.saved, "
+        "snippet(messages_fts, 1, char(2), char(3), '…', 16) AS snippet, "
+        "highlight(messages_fts, 0, char(2), char(3)) AS title_hl "
+        "FROM messages_fts JOIN messages m ON m.id = messages_fts.rowid "
+        "WHERE messages_fts MATCH ?"
+    )
+    args: List[Any] = [match]
+    if saved is not None:
+        sql += " AND m.saved=?"
+        args.append(1 if saved else 0)
+    if before_id is not None:
+        sql += " AND m.id<?"
+        args.append(int(before_id))
+    if after_id is not None:
+        sql += " AND m.id>?"
+        args.append(int(after_id))
+    # newer-than pages are read oldest-first and flipped, as in list_messages
+    ascending = not rank and after_id is not None and before_id is None
+    # bm25 weights: title hits count more than body, source least
+    if rank:
+        sql += " ORDER BY bm25(messages_fts, 5.0, 1.0, 0.5)"
+    else:
+        sql += " ORDER BY m.id ASC" if ascending else " ORDER BY m.id DESC"
+    sql += " LIMIT ? OFFSET ?"
+    args += [int(limit), int(offset)]
+    try:
+        rows = c.execute(sql, args).fetchall()
+    except sqlite3.OperationalError as e:
+        print(f"[storage] FTS search failed ({e}); falling back to LIKE")
+        return None
+    hits = [_row_to_dict(r) for r in rows]
+    for h in hits:
+        h["snippet"] = _highlight_html(h.get("snippet"))
+        h["title_hl"] = _highlight_html(h.get("title_hl"))
+    return hits[::-1] if ascending else hits
 
 def get_message(mid: int) -> Optional[Dict[str, Any]]:
     c = _conn()
-    cols = _columns(c)
-    time_expr = "COALESCE(created_at, ts)" if "ts" in cols else "created_at"
-    if "created_at" not in cols and "ts" in cols:
-        time_expr = "ts"
-    cur = c.execute(
-        f"SELECT id, title, body, source, priority, {time_expr} AS created_at, read, extras, saved FROM messages WHERE id=?",
-        (int(mid),),
-    )
-    r = cur.fetchone()
+    r = c.execute(_SQL["get"], (int(mid),)).fetchone()
     return _row_to_dict(r) if r else None
 
+def update_extras(mid: int, **fields: Any) -> bool:
+    """Merge fields into a message's extras JSON (e.g. a delivery status known only after saving)."""
+    with _db_lock:
+        c = _conn()
+        row = c.execute("SELECT extras FROM messages WHERE id=?", (int(mid),)).fetchone()
+        if row is None:
+            return False
+        try:
+            extras = json.loads(row["extras"] or "{}")
+        except Exception:
+            extras = {}
+        if not isinstance(extras, dict):
+            extras = {}
+        extras.update(fields)
+        c.execute("UPDATE messages SET extras=? WHERE id=?", (json.dumps(extras, ensure_ascii=False), int(mid)))
+        return True
+
 def delete_message(mid: int) -> bool:
     with _db_lock:
         c = _conn()
@@ -179,10 +469,8 @@ def set_saved(mid: int, saved: bool = True) -> bool:
 def purge_older_than(days: int) -> int:
     with _db_lock:
         c = _conn()
-        cols = _columns(c)
-        tcol = "created_at" if "created_at" in cols else ("ts" if "ts" in cols else "created_at")
         cutoff = int(time.time()) - (int(days) * 86400)
-        cur = c.execute(f"DELETE FROM messages WHERE {tcol} < ?", (cutoff,))
+        cur = c.execute(_SQL["purge"], (cutoff,))
         return int(cur.rowcount)
 
 def get_retention_days(default: int = 30) -> int:
@@ -202,7 +490,8 @@ def set_retention_days(days: int) -> None:
         )
 
 __all__ = [
-    "init_db", "save_message", "list_messages", "get_message", "delete_message",
+    "init_db", "save_message", "submit_message", "enable_group_commit", "flush_pending",
+    "is_group_commit", "list_messages", "get_message", "update_extras", "delete_message",
     "delete_all", "mark_read", "set_saved", "purge_older_than",
     "get_retention_days", "set_retention_days"
 ]
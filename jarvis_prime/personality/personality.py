@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
-# /app/personality.py — TRULY MASSIVE with 1000+ unique phrases per persona
+# /app/personality.py — TRULY MASSIVE with 1000+ unique phrases per persona (phrases in phrase_banks.json)
 # Makes Lexi indistinguishable from LLM output
 
-import random, os, importlib, re, time
+import random, os, importlib, re, time, functools, json, threading
+from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 
 _TRANSPORT_TAG_RE = re.compile(
@@ -73,7 +74,7 @@ def _maybe_emoji(key: str, with_emoji: bool) -> str:
         return ""
     try:
         bank = EMOJIS.get(key) or []
-        return f" {random.choice(bank)}" if bank else ""
+        return f" {_rng.choice(bank)}" if bank else ""
     except:
         return ""
 
@@ -85,249 +86,353 @@ def _canon(name: str) -> str:
     except:
         return "ops"
 
+# ============================================================================
+# Context extraction
+# ============================================================================
+# Keyword tables: flag -> keywords. A keyword matches whole words only (with an
+# optional plural "s"/"es"); a trailing "*" makes it a stem that also matches
+# longer words ("monitor*" -> monitoring). Multi-word and hyphenated keywords
+# are phrases. All tables are compiled into one lookup index at import and a
+# message is scanned in a single pass over its words (see _ContextMatcher).
+
+_CTX_SERVICES: Dict[str, Tuple[str, ...]] = {
+    # Media automation (*arr stack)
+    "sonarr": ("sonarr",),
+    "radarr": ("radarr",),
+    "lidarr": ("lidarr",),
+    "bazarr": ("bazarr",),
+    "prowlarr": ("prowlarr",),
+    "readarr": ("readarr",),
+    "whisparr": ("whisparr",),
+    "recyclarr": ("recyclarr",),
+    "cleanuperr": ("cleanuperr",),
+    "huntarr": ("huntarr",),
+    "maintainerr": ("maintainerr",),
+    "overseerr": ("overseerr", "jellyseerr"),
+    "requestrr": ("requestrr",),
+    "tautulli": ("tautulli",),
+    "tdarr": ("tdarr",),
+    "unpackerr": ("unpackerr",),
+    "fileflows": ("fileflows",),
+
+    # Media servers & players
+    "plex": ("plex*",),
+    "emby": ("emby",),
+    "jellyfin": ("jellyfin",),
+    "kodi": ("kodi",),
+
+    # Download clients
+    "qbittorrent": ("qbittorrent", "qbit"),
+    "deluge": ("deluge",),
+    "transmission": ("transmission",),
+    "rtorrent": ("rtorrent", "rutorrent"),
+    "sabnzbd": ("sabnzbd", "sabnzb", "sab"),
+    "nzbget": ("nzbget",),
+
+    # Reverse proxies & web servers
+    "nginx": ("nginx",),
+    "traefik": ("traefik",),
+    "caddy": ("caddy",),
+    "haproxy": ("haproxy",),
+    "apache": ("apache", "httpd"),
+    "swag": ("swag", "nginx proxy manager", "npm"),
+
+    # Dashboards & management
+    "homepage": ("homepage",),
+    "homarr": ("homarr",),
+    "heimdall": ("heimdall",),
+    "organizr": ("organizr",),
+    "flame": ("flame",),
+    "dashy": ("dashy",),
+    "portainer": ("portainer",),
+    "yacht": ("yacht",),
+    "dockge": ("dockge",),
+    "cockpit": ("cockpit",),
+
+    # DNS & network
+    "pihole": ("pihole", "pi-hole"),
+    "adguard": ("adguard*",),
+    "unbound": ("unbound",),
+    "technitium": ("technitium",),
+    "cloudflared": ("cloudflared", "cloudflare tunnel"),
+
+    # VPN & remote access
+    "wireguard": ("wireguard", "wg-easy"),
+    "openvpn": ("openvpn",),
+    "tailscale": ("tailscale*",),
+    "zerotier": ("zerotier",),
+    "netbird": ("netbird",),
+    "guacamole": ("guacamole",),
+    "meshcentral": ("meshcentral",),
+
+    # Monitoring & observability
+    "grafana": ("grafana",),
+    "prometheus": ("prometheus",),
+    "uptime-kuma": ("uptime kuma", "kuma", "uptime-kuma"),
+    "netdata": ("netdata",),
+    "glances": ("glances",),
+    "scrutiny": ("scrutiny",),
+    "healthchecks": ("healthchecks", "healthcheck"),
+    "changedetection": ("changedetection", "change detection"),
+    "speedtest-tracker": ("speedtest tracker", "speedtest-tracker"),
+
+    # Notifications
+    "gotify": ("gotify",),
+    "ntfy": ("ntfy",),
+    "pushover": ("pushover",),
+    "apprise": ("apprise",),
+
+    # Git & code
+    "gitea": ("gitea",),
+    "forgejo": ("forgejo",),
+    "gitlab": ("gitlab",),
+    "gogs": ("gogs",),
+    "code-server": ("code-server", "vscode server"),
+
+    # CI/CD
+    "drone": ("drone",),
+    "woodpecker": ("woodpecker",),
+    "jenkins": ("jenkins",),
+    "semaphore": ("semaphore",),
+
+    # Databases
+    "postgresql": ("postgresql", "postgres"),
+    "mysql": ("mysql", "mariadb"),
+    "mongodb": ("mongodb", "mongo"),
+    "redis": ("redis",),
+    "influxdb": ("influxdb", "influx"),
+
+    # Password managers
+    "vaultwarden": ("vaultwarden", "bitwarden"),
+    "passbolt": ("passbolt",),
+    "psono": ("psono",),
+
+    # File sync & storage
+    "nextcloud": ("nextcloud",),
+    "syncthing": ("syncthing",),
+    "seafile": ("seafile",),
+    "filebrowser": ("filebrowser", "file browser"),
+    "miniserve": ("miniserve",),
+    "alist": ("alist",),
+
+    # Photos
+    "immich": ("immich",),
+    "photoprism": ("photoprism",),
+    "lychee": ("lychee",),
+    "piwigo": ("piwigo",),
+
+    # Documents & notes
+    "paperless": ("paperless", "paperless-ngx"),
+    "bookstack": ("bookstack",),
+    "outline": ("outline",),
+    "trilium": ("trilium",),
+    "hedgedoc": ("hedgedoc", "codimd"),
+    "joplin": ("joplin",),
+    "obsidian": ("obsidian",),
+
+    # RSS & reading
+    "freshrss": ("freshrss", "fresh rss"),
+    "miniflux": ("miniflux",),
+    "tt-rss": ("tt-rss", "tiny tiny rss"),
+    "wallabag": ("wallabag",),
+    "linkwarden": ("linkwarden",),
+
+    # Bookmarks
+    "linkding": ("linkding",),
+    "shiori": ("shiori",),
+    "shlink": ("shlink",),
+
+    # Home automation
+    "homeassistant": ("home assistant", "homeassistant", "hass"),
+    "nodered": ("node-red", "nodered"),
+    "zigbee2mqtt": ("zigbee2mqtt", "z2m"),
+    "mosquitto": ("mosquitto", "mqtt"),
+
+    # Infrastructure
+    "docker": ("docker*", "container*", "compose"),
+    "kubernetes": ("kubernetes", "k8s", "k3s"),
+    "proxmox": ("proxmox", "pve", "qemu", "kvm"),
+    "unraid": ("unraid", "array", "parity", "godzilla"),
+    "lxc": ("lxc", "lxd", "incus"),
+    "truenas": ("truenas",),
+
+    # Testing
+    "speedtest": ("speedtest", "speed test", "bandwidth test"),
+
+    # Generic categories
+    "database": ("sql", "sqlite", "mysql", "postgres*", "database*"),
+    "backup": ("backup*", "snapshot*", "archive*", "restic", "borg*", "duplicati"),
+    "network": ("network*", "dns", "proxy", "proxies", "firewall*"),
+    "storage": ("disk*", "storage", "mount*", "volume*", "raid*", "zfs", "btrfs", "nfs", "smb", "cifs"),
+    "monitoring": ("monitor*", "health*", "check*", "analytics"),
+    "certificate": ("certificate*", "cert*", "ssl", "tls", "acme", "letsencrypt"),
+    "email": ("email*", "smtp", "imap", "mail*", "postfix", "sendmail"),
+    "notification": ("notification*", "alert*"),
+    "vpn": ("vpn",),
+    "media": ("media", "movie", "tv", "episode", "download*", "torrent*", "usenet", "music", "album", "artist", "subtitle*"),
+    "automation": ("automation*", "script*", "cron*", "scheduled", "workflow*", "ansible", "apt", "update*", "upgrade*", "patch*", "yum", "dnf", "pacman"),
+    "security": ("security", "auth*", "oauth*", "ldap", "fail2ban", "crowdsec", "authelia", "authentik"),
+
+    # Jarvis modules
+    "orchestrator": ("orchestrator", "playbook*"),
+    "sentinel": ("sentinel", "service monitor", "watchdog"),
+    "jarvis": ("jarvis", "llm", "ai"),
+}
+
+# First matching action (in this order) wins
+_CTX_ACTIONS: Dict[str, Tuple[str, ...]] = {
+    "completed": ("completed", "finished", "done", "success*", "passed", "ok", "resolved", "fixed", "downloaded", "grabbed", "imported", "renamed"),
+    "started": ("started", "beginning", "initiated", "launching", "starting", "deploying"),
+    "failed": ("failed", "error*", "failure*", "crashed", "down", "broken", "dead", "timeout", "timed out", "refused", "denied", "rejected", "unauthorized", "forbidden", "unreachable"),
+    "warning": ("warning*", "caution", "degraded", "slow", "timeout", "latency"),
+    "updated": ("updated", "upgraded", "patched", "modified", "changed", "new version"),
+    "upgrading": ("upgrading", "updating", "patching", "update available", "upgrade available"),
+    "restarted": ("restarted", "rebooted", "cycled", "restart*", "reload*"),
+    "connected": ("connected", "online", "up", "available", "responding", "alive"),
+    "disconnected": ("disconnected", "offline", "down", "unavailable", "unreachable", "dead"),
+    "stopped": ("stopped", "halted", "terminated", "killed", "shutdown"),
+    "scaling": ("scaling", "scaled", "replicas", "instances", "capacity"),
+    "migrating": ("migrating", "migration", "moving", "transferring"),
+    "backing_up": ("backing up", "creating backup", "backup started", "backup running", "restoring", "restore started"),
+    "scanning": ("scanning", "indexing", "analyzing", "processing", "scan started"),
+    "deploying": ("deploying", "deployment", "rolling out", "provisioning"),
+    "pulling": ("pulling", "downloading image", "fetching", "pull started"),
+}
+
+# Highest level present wins
+_CTX_URGENCY: Dict[int, Tuple[str, ...]] = {
+    8: ("critical", "emergency", "urgent", "immediate", "sev1", "p1"),
+    6: ("down", "offline", "failed", "error*", "crash*", "dead"),
+    3: ("warning*", "degraded", "slow", "timeout", "latency"),
+    1: ("info", "notice", "update*", "completed", "success*"),
+}
+
+_CTX_FLAGS: Dict[str, Tuple[str, ...]] = {
+    "time_sensitive": ("now", "asap", "urgent", "immediate", "critical"),
+    "is_torrent": ("torrent*", "seed*", "leech*", "peer*", "swarm", "ratio"),
+    "is_usenet": ("nzb", "usenet", "sabnzbd", "par2", "unpack*", "segment*"),
+    "percent": ("percent*",),
+}
+
+# First matching state (in this order) wins
+_CTX_DOWNLOAD_STATES: Dict[str, Tuple[str, ...]] = {
+    "seeding": ("seeding", "uploading"),
+    "leeching": ("leeching",),
+    "extracting": ("unpacking", "extracting"),
+    "repairing": ("repairing", "par2"),
+    "queued": ("queued",),
+    "downloading": ("downloading",),
+    "completed": ("completed",),
+    "failed": ("failed",),
+}
+
+_CTX_WORD_RE = re.compile(r"[a-z0-9]+(?:[-'][a-z0-9]+)*")
+_CTX_DIGIT_RE = re.compile(r"\d")
+
+
+class _ContextMatcher:
+    """
+    Compiled keyword index: one regex pass splits the text into words, then
+    each word (and each run of up to _max_words words) is resolved with dict
+    lookups - exact words, plural-stripped words and stem prefixes. Cost is
+    proportional to the text length, not to the number of keywords.
+    """
+
+    def __init__(self, tables: Dict[str, Dict]):
+        self.words: Dict[str, set] = {}   # whole word or phrase -> {(table, flag)}
+        self.stems: Dict[str, set] = {}   # stem -> {(table, flag)}
+        for table, flags in tables.items():
+            for flag, keywords in flags.items():
+                for kw in keywords:
+                    target = self.stems if kw.endswith("*") else self.words
+                    target.setdefault(" ".join(_CTX_WORD_RE.findall(kw.rstrip("*"))), set()).add((table, flag))
+        self.stem_lengths = sorted({len(s) for s in self.stems}, reverse=True)
+        self.max_words = max(k.count(" ") + 1 for k in self.words)
+
+    def _word_hits(self, word: str, hits: set):
+        found = self.words.get(word)
+        if found:
+            hits |= found
+        elif len(word) > 4 and word[-1] == "s":
+            found = self.words.get(word[:-1]) or (self.words.get(word[:-2]) if word.endswith("es") else None)
+            if found:
+                hits |= found
+        n = len(word)
+        for length in self.stem_lengths:
+            if length <= n:
+                found = self.stems.get(word[:length])
+                if found:
+                    hits |= found
+
+    def scan(self, text: str) -> set:
+        """{(table, flag)} for every keyword found in lowercased text"""
+        hits: set = set()
+        tokens = _CTX_WORD_RE.findall(text)
+        words, stems = self.words, self.stems
+        for i, token in enumerate(tokens):
+            self._word_hits(token, hits)
+            if "-" in token:
+                # "uptime-kuma" also counts as "uptime" and "kuma"
+                for part in token.split("-"):
+                    self._word_hits(part, hits)
+            for span in range(2, self.max_words + 1):
+                if i + span > len(tokens):
+                    break
+                found = words.get(" ".join(tokens[i:i + span]))
+                if found:
+                    hits |= found
+        return hits
+
+
+_CONTEXT_MATCHER = _ContextMatcher({
+    "service": _CTX_SERVICES,
+    "action": _CTX_ACTIONS,
+    "urgency": _CTX_URGENCY,
+    "flag": _CTX_FLAGS,
+    "download": _CTX_DOWNLOAD_STATES,
+})
+
+
 def _detect_download_state(text):
-    if "seeding" in text or "uploading" in text: return "seeding"
-    if "leeching" in text: return "leeching"  
-    if "unpacking" in text or "extracting" in text: return "extracting"
-    if "repairing" in text or "par2" in text: return "repairing"
-    if "queued" in text: return "queued"
-    if "downloading" in text: return "downloading"
-    if "completed" in text: return "completed"
-    if "failed" in text: return "failed"
-    return None
+    hits = _CONTEXT_MATCHER.scan(text.lower())
+    return next((s for s in _CTX_DOWNLOAD_STATES if ("download", s) in hits), None)
+
+
+@functools.lru_cache(maxsize=128)
+def _scan_context(text: str) -> Tuple:
+    """Time-independent part of the context (header and riffs scan the same message)"""
+    hits = _CONTEXT_MATCHER.scan(text)
+    services = [s for s in _CTX_SERVICES if ("service", s) in hits]
+    action = next((a for a in _CTX_ACTIONS if ("action", a) in hits), "status")
+    urgency = next((u for u in _CTX_URGENCY if ("urgency", u) in hits), 0)
+    download_state = next((s for s in _CTX_DOWNLOAD_STATES if ("download", s) in hits), None)
+    return (
+        tuple(services), action, urgency, download_state,
+        ("flag", "is_torrent") in hits,
+        ("flag", "is_usenet") in hits,
+        bool(_CTX_DIGIT_RE.search(text)),
+        "%" in text or ("flag", "percent") in hits,
+        ("flag", "time_sensitive") in hits,
+    )
+
 
 def _extract_smart_context(subject: str = "", body: str = "") -> Dict:
     """Extract context from message with enhanced intelligence"""
     try:
-        text = f"{subject} {body}".lower()
-        
-        services = {
-            # Media automation (*arr stack)
-            "sonarr": "sonarr" in text,
-            "radarr": "radarr" in text,
-            "lidarr": "lidarr" in text,
-            "bazarr": "bazarr" in text,
-            "prowlarr": "prowlarr" in text,
-            "readarr": "readarr" in text,
-            "whisparr": "whisparr" in text,
-            "recyclarr": "recyclarr" in text,
-            "cleanuperr": "cleanuperr" in text,
-            "huntarr": "huntarr" in text,
-            "maintainerr": "maintainerr" in text,
-            "overseerr": "overseerr" in text or "jellyseerr" in text,
-            "requestrr": "requestrr" in text,
-            "tautulli": "tautulli" in text,
-            "tdarr": "tdarr" in text,
-            "unpackerr": "unpackerr" in text,
-            "fileflows": "fileflows" in text,
-            
-            # Media servers & players
-            "plex": "plex" in text,
-            "emby": "emby" in text,
-            "jellyfin": "jellyfin" in text,
-            "kodi": "kodi" in text,
-            
-            # Download clients
-            "qbittorrent": "qbittorrent" in text or "qbit" in text,
-            "deluge": "deluge" in text,
-            "transmission": "transmission" in text,
-            "rtorrent": "rtorrent" in text or "rutorrent" in text,
-            "sabnzbd": "sabnzbd" in text or "sabnzb" in text or "sab" in text,
-            "nzbget": "nzbget" in text,
-            
-            # Reverse proxies & web servers
-            "nginx": "nginx" in text,
-            "traefik": "traefik" in text,
-            "caddy": "caddy" in text,
-            "haproxy": "haproxy" in text,
-            "apache": "apache" in text or "httpd" in text,
-            "swag": "swag" in text or "nginx proxy manager" in text or "npm" in text,
-            
-            # Dashboards & management
-            "homepage": "homepage" in text,
-            "homarr": "homarr" in text,
-            "heimdall": "heimdall" in text,
-            "organizr": "organizr" in text,
-            "flame": "flame" in text,
-            "dashy": "dashy" in text,
-            "portainer": "portainer" in text,
-            "yacht": "yacht" in text,
-            "dockge": "dockge" in text,
-            "cockpit": "cockpit" in text,
-            
-            # DNS & network
-            "pihole": "pihole" in text or "pi-hole" in text,
-            "adguard": "adguard" in text,
-            "unbound": "unbound" in text,
-            "technitium": "technitium" in text,
-            "cloudflared": "cloudflared" in text or "cloudflare tunnel" in text,
-            
-            # VPN & remote access
-            "wireguard": "wireguard" in text or "wg-easy" in text,
-            "openvpn": "openvpn" in text,
-            "tailscale": "tailscale" in text,
-            "zerotier": "zerotier" in text,
-            "netbird": "netbird" in text,
-            "guacamole": "guacamole" in text,
-            "meshcentral": "meshcentral" in text,
-            
-            # Monitoring & observability
-            "grafana": "grafana" in text,
-            "prometheus": "prometheus" in text,
-            "uptime-kuma": "uptime kuma" in text or "kuma" in text or "uptime-kuma" in text,
-            "netdata": "netdata" in text,
-            "glances": "glances" in text,
-            "scrutiny": "scrutiny" in text,
-            "healthchecks": "healthchecks" in text or "healthcheck" in text,
-            "changedetection": "changedetection" in text or "change detection" in text,
-            "speedtest-tracker": "speedtest tracker" in text or "speedtest-tracker" in text,
-            
-            # Notifications
-            "gotify": "gotify" in text,
-            "ntfy": "ntfy" in text,
-            "pushover": "pushover" in text,
-            "apprise": "apprise" in text,
-            
-            # Git & code
-            "gitea": "gitea" in text,
-            "forgejo": "forgejo" in text,
-            "gitlab": "gitlab" in text,
-            "gogs": "gogs" in text,
-            "code-server": "code-server" in text or "vscode server" in text,
-            
-            # CI/CD
-            "drone": "drone" in text,
-            "woodpecker": "woodpecker" in text,
-            "jenkins": "jenkins" in text,
-            "semaphore": "semaphore" in text,
-            
-            # Databases
-            "postgresql": "postgresql" in text or "postgres" in text,
-            "mysql": "mysql" in text or "mariadb" in text,
-            "mongodb": "mongodb" in text or "mongo" in text,
-            "redis": "redis" in text,
-            "influxdb": "influxdb" in text or "influx" in text,
-            
-            # Password managers
-            "vaultwarden": "vaultwarden" in text or "bitwarden" in text,
-            "passbolt": "passbolt" in text,
-            "psono": "psono" in text,
-            
-            # File sync & storage
-            "nextcloud": "nextcloud" in text,
-            "syncthing": "syncthing" in text,
-            "seafile": "seafile" in text,
-            "filebrowser": "filebrowser" in text or "file browser" in text,
-            "miniserve": "miniserve" in text,
-            "alist": "alist" in text,
-            
-            # Photos
-            "immich": "immich" in text,
-            "photoprism": "photoprism" in text,
-            "lychee": "lychee" in text,
-            "piwigo": "piwigo" in text,
-            
-            # Documents & notes
-            "paperless": "paperless" in text or "paperless-ngx" in text,
-            "bookstack": "bookstack" in text,
-            "outline": "outline" in text,
-            "trilium": "trilium" in text,
-            "hedgedoc": "hedgedoc" in text or "codimd" in text,
-            "joplin": "joplin" in text,
-            "obsidian": "obsidian" in text,
-            
-            # RSS & reading
-            "freshrss": "freshrss" in text or "fresh rss" in text,
-            "miniflux": "miniflux" in text,
-            "tt-rss": "tt-rss" in text or "tiny tiny rss" in text,
-            "wallabag": "wallabag" in text,
-            "linkwarden": "linkwarden" in text,
-            
-            # Bookmarks
-            "linkding": "linkding" in text,
-            "shiori": "shiori" in text,
-            "shlink": "shlink" in text,
-            
-            # Home automation
-            "homeassistant": "home assistant" in text or "homeassistant" in text or "hass" in text,
-            "nodered": "node-red" in text or "nodered" in text,
-            "zigbee2mqtt": "zigbee2mqtt" in text or "z2m" in text,
-            "mosquitto": "mosquitto" in text or "mqtt" in text,
-            
-            # Infrastructure
-            "docker": "docker" in text or "container" in text or "compose" in text,
-            "kubernetes": "kubernetes" in text or "k8s" in text or "k3s" in text,
-            "proxmox": "proxmox" in text or "pve" in text or "qemu" in text or "kvm" in text,
-            "unraid": "unraid" in text or "array" in text or "parity" in text or "godzilla" in text,
-            "lxc": "lxc" in text or "lxd" in text or "incus" in text,
-            "truenas": "truenas" in text,
-            
-            # Testing
-            "speedtest": "speedtest" in text or "speed test" in text or "bandwidth test" in text,
-            
-            # Generic categories
-            "database": any(db in text for db in ["sql", "database"]),
-            "backup": "backup" in text or "snapshot" in text or "archive" in text or "restic" in text or "borg" in text or "duplicati" in text,
-            "network": "network" in text or "dns" in text or "proxy" in text or "firewall" in text,
-            "storage": any(stor in text for stor in ["disk", "storage", "mount", "volume", "raid", "zfs", "btrfs", "nfs", "smb", "cifs"]),
-            "monitoring": "monitor" in text or "health" in text or "check" in text or "analytics" in text,
-            "certificate": "certificate" in text or "cert" in text or "ssl" in text or "tls" in text or "acme" in text or "letsencrypt" in text,
-            "email": any(e in text for e in ["email", "smtp", "imap", "mail", "postfix", "sendmail"]),
-            "notification": "notification" in text or "alert" in text,
-            "vpn": "vpn" in text,
-            "media": any(m in text for m in ["media", "movie", "tv", "episode", "download", "torrent", "usenet", "music", "album", "artist", "subtitle"]),
-            "automation": any(a in text for a in ["automation", "script", "cron", "scheduled", "workflow", "ansible", "apt", "update", "upgrade", "patch", "yum", "dnf", "pacman"]),
-            "security": any(s in text for s in ["security", "auth", "oauth", "ldap", "fail2ban", "crowdsec", "authelia", "authentik"]),
-            
-            # Jarvis modules
-            "orchestrator": "orchestrator" in text or "playbook" in text,
-            "sentinel": "sentinel" in text or "service monitor" in text or "watchdog" in text,
-            "jarvis": "jarvis" in text or "llm" in text or "ai" in text,
-        }
-        active_services = [k for k, v in services.items() if v]
-        
-        actions = {
-            "completed": any(w in text for w in ["completed", "finished", "done", "success", "passed", "ok", "resolved", "fixed", "downloaded", "grabbed", "imported", "renamed"]),
-            "started": any(w in text for w in ["started", "beginning", "initiated", "launching", "starting", "deploying"]),
-            "failed": any(w in text for w in ["failed", "error", "failure", "crashed", "down", "broken", "dead", "timeout", "timed out", "refused", "denied", "rejected", "unauthorized", "forbidden", "unreachable"]),
-            "warning": any(w in text for w in ["warning", "caution", "degraded", "slow", "timeout", "latency"]),
-            "updated": any(w in text for w in ["updated", "upgraded", "patched", "modified", "changed", "new version"]),
-            "upgrading": any(w in text for w in ["upgrading", "updating", "patching", "update available", "upgrade available"]),
-            "restarted": any(w in text for w in ["restarted", "rebooted", "cycled", "restart", "reload"]),
-            "connected": any(w in text for w in ["connected", "online", "up", "available", "responding", "alive"]),
-            "disconnected": any(w in text for w in ["disconnected", "offline", "down", "unavailable", "unreachable", "dead"]),
-            "stopped": any(w in text for w in ["stopped", "halted", "terminated", "killed", "shutdown"]),
-            "scaling": any(w in text for w in ["scaling", "scaled", "replicas", "instances", "capacity"]),
-            "migrating": any(w in text for w in ["migrating", "migration", "moving", "transferring"]),
-            "backing_up": any(w in text for w in ["backing up", "creating backup", "backup started", "backup running", "restoring", "restore started"]),
-            "scanning": any(w in text for w in ["scanning", "indexing", "analyzing", "processing", "scan started"]),
-            "deploying": any(w in text for w in ["deploying", "deployment", "rolling out", "provisioning"]),
-            "pulling": any(w in text for w in ["pulling", "downloading image", "fetching", "pull started"]),
-        }
-        active_action = next((k for k, v in actions.items() if v), "status")
-        
-        urgency = 0
-        if any(w in text for w in ["critical", "emergency", "urgent", "immediate", "sev1", "p1"]):
-            urgency = 8
-        elif any(w in text for w in ["down", "offline", "failed", "error", "crash", "dead"]):
-            urgency = 6
-        elif any(w in text for w in ["warning", "degraded", "slow", "timeout", "latency"]):
-            urgency = 3
-        elif any(w in text for w in ["info", "notice", "update", "completed", "success"]):
-            urgency = 1
-            "download_state": _detect_download_state(text),
-            "is_torrent": any(w in text for w in ["torrent","seed","leech","peer","swarm","ratio"]),
-            "is_usenet": any(w in text for w in ["nzb","usenet","sabnzbd","par2","unpack","segment"]),
-        
+        (services, action, urgency, download_state, is_torrent, is_usenet,
+         has_numbers, has_percentage, time_sensitive) = _scan_context(f"{subject} {body}".lower())
         return {
-            "services": active_services,
-            "primary_service": active_services[0] if active_services else None,
-            "action": active_action,
+            "services": list(services),
+            "primary_service": services[0] if services else None,
+            "action": action,
             "urgency": urgency,
             "daypart": _daypart(),
-            "has_numbers": bool(re.search(r'\d+', text)),
-            "has_percentage": "%" in text or "percent" in text,
-            "time_sensitive": any(w in text for w in ["now", "asap", "urgent", "immediate", "critical"]),
+            "has_numbers": has_numbers,
+            "has_percentage": has_percentage,
+            "time_sensitive": time_sensitive,
+            "download_state": download_state,
+            "is_torrent": is_torrent,
+            "is_usenet": is_usenet,
         }
     except:
         return {
@@ -337,4048 +442,117 @@ def _extract_smart_context(subject: str = "", body: str = "") -> Dict:
         }
 
 
-# MASSIVE GREETING BANKS - 30+ per persona per daypart - MORE NATURAL AND VARIED
-_GREETINGS = {
-    "early_morning": {
-        "jarvis": [
-            "Early morning dispatch", "Pre-dawn operations brief", "Night watch concluding", "First light protocols engaged",
-            "Dawn service commencing", "Early hours coordination active", "Morning preparation sequence", "Pre-dawn briefing ready",
-            "Early service protocols", "Dawn operations underway", "Night shift transition", "Morning protocols initiating",
-            "Early coordination active", "Pre-dawn status update", "First light operations", "Dawn briefing prepared",
-            "Early morning brief", "Night watch complete", "Morning service beginning", "Pre-dawn ready status",
-            "Early hours report", "Dawn transition active", "Morning readiness confirmed", "Pre-dawn systems check",
-            "Early operations brief", "Dawn protocols engaged", "Morning coordination starting", "Pre-dawn situation report",
-            "Early status update", "Dawn service active", "Morning operations commencing"
-        ],
-        "dude": [
-            "Early vibes man", "Dawn patrol checking in", "Morning brew time", "Sunrise session starting", "Early flow going",
-            "Pre-dawn cruise mode", "Morning mellow vibes", "Dawn chill activated", "Early zen happening", "Sunrise mode engaged",
-            "Morning easy vibes", "Pre-dawn flowing", "Early morning flow", "Dawn surfing time", "Morning cosmic vibes",
-            "Sunrise rolling in", "Early cruise mode", "Pre-dawn mellow", "Morning waves coming", "Dawn peaceful vibes",
-            "Early morning groove", "Dawn easy mode", "Morning serenity", "Pre-dawn smooth sailing", "Early vibes flowing",
-            "Dawn tranquility", "Morning calm waters", "Pre-dawn relaxation", "Early morning peace", "Dawn meditation mode",
-            "Morning flow state"
-        ],
-        "chick": [
-            "Rise and shine gorgeous", "Early bird mode activated", "Morning glow starting", "Dawn glamour time", "Early sparkle happening",
-            "First light fabulous", "Morning fresh vibes", "Dawn beauty mode", "Early elegance", "Sunrise gorgeous",
-            "Morning radiance", "Pre-dawn stunning", "Early morning glam", "Dawn sophistication", "Morning chicness",
-            "Sunrise elegance", "Early morning fab", "Pre-dawn beauty", "Morning grace", "Dawn perfection",
-            "Early sparkle time", "Morning glamour mode", "Pre-dawn gorgeous", "Early elegance vibes", "Dawn beauty time",
-            "Morning sophistication", "Pre-dawn chicness", "Early morning stunning", "Dawn radiance", "Morning perfection mode",
-            "Early glow time"
-        ],
-        "nerd": [
-            "Early morning data check", "Pre-dawn diagnostics running", "Night cycle analysis complete", "First light metrics compiled",
-            "Dawn telemetry active", "Early system validation", "Morning parameter review", "Pre-dawn calculations ready",
-            "Early analysis phase", "Dawn data processing", "Morning algorithm check", "Pre-dawn verification complete",
-            "Early morning metrics", "Dawn system analysis", "Morning diagnostic sweep", "Pre-dawn data compilation",
-            "Early telemetry review", "Dawn parameter validation", "Morning system audit", "Pre-dawn metrics analysis",
-            "Early diagnostic phase", "Dawn verification protocols", "Morning data integrity check", "Pre-dawn system validation",
-            "Early morning analysis", "Dawn computational review", "Morning metrics compiled", "Pre-dawn algorithm check",
-            "Early data synthesis", "Dawn system verification", "Morning diagnostic complete"
-        ],
-        "rager": [
-            "Early morning shit", "Too damn early", "Dawn bullshit alert", "Sunrise annoyance", "Early fucking hours",
-            "Pre-dawn goddamn updates", "Morning crap incoming", "Dawn irritation mode", "Early morning hell",
-            "Sunrise clusterfuck potential", "Morning horseshit", "Pre-dawn nonsense", "Early goddamn updates",
-            "Dawn fucking report", "Morning pain incoming", "Pre-dawn aggravation", "Early morning bullshit",
-            "Dawn disaster watch", "Morning fucking chaos", "Pre-dawn headache", "Early goddamn problems",
-            "Dawn clusterfuck watch", "Morning shit show potential", "Pre-dawn annoyance", "Early fucking nonsense",
-            "Dawn bullshit incoming", "Morning goddamn updates", "Pre-dawn irritation", "Early shit alert",
-            "Dawn pain report", "Morning hell incoming"
-        ],
-        "comedian": [
-            "Unreasonably early update", "Dawn approaches reluctantly", "Morning arrives uninvited", "Sunrise happening allegedly",
-            "Early hours protest", "Pre-dawn comedy hour", "Morning confusion begins", "Dawn bewilderment active",
-            "Early morning absurdity", "Sunrise irony detected", "Morning sarcasm mode", "Pre-dawn wit engaged",
-            "Early hours comedy", "Dawn satire active", "Morning deadpan ready", "Pre-dawn humor engaged",
-            "Early morning irony", "Dawn comedy protocols", "Morning wit activated", "Pre-dawn sarcasm",
-            "Early absurdity alert", "Dawn humor mode", "Morning deadpan engaged", "Pre-dawn comedy",
-            "Early satire active", "Dawn wit protocols", "Morning irony detected", "Pre-dawn absurdity",
-            "Early comedy hour", "Dawn sarcasm mode", "Morning humor engaged"
-        ],
-        "action": [
-            "Early morning recon", "Pre-dawn mission brief", "Night ops concluding", "First light sitrep",
-            "Dawn patrol active", "Early tactical update", "Morning combat readiness", "Pre-dawn field report",
-            "Early mission status", "Dawn operations brief", "Morning tactical sitrep", "Pre-dawn readiness check",
-            "Early combat status", "Dawn field report", "Morning mission brief", "Pre-dawn tactical update",
-            "Early operations sitrep", "Dawn readiness status", "Morning field brief", "Pre-dawn mission status",
-            "Early tactical report", "Dawn combat brief", "Morning operations sitrep", "Pre-dawn field status",
-            "Early mission update", "Dawn tactical brief", "Morning combat sitrep", "Pre-dawn operations",
-            "Early field report", "Dawn mission status", "Morning tactical readiness"
-        ],
-        "ops": [
-            "Early morning status", "Pre-dawn operational brief", "Night shift handover", "First light update",
-            "Dawn operations report", "Early system status", "Morning ops brief", "Pre-dawn status check",
-            "Early operational update", "Dawn system report", "Morning status brief", "Pre-dawn ops update",
-            "Early system brief", "Dawn operational status", "Morning ops update", "Pre-dawn system check",
-            "Early status report", "Dawn ops brief", "Morning operational update", "Pre-dawn status report",
-            "Early ops check", "Dawn system brief", "Morning status update", "Pre-dawn operational report",
-            "Early system update", "Dawn status brief", "Morning ops report", "Pre-dawn system status",
-            "Early operational brief", "Dawn status update", "Morning system report"
-        ],
-        "tappit": [
-            "Vroeg more bru", "Dawn shift boet", "Early morning howzit", "Pre-dawn lekker time", "Morning sharp sharp",
-            "Early vibes né", "Dawn checking in hey", "Morning sorted boet", "Pre-dawn all good", "Early lekker vibes",
-            "Dawn sharp time", "Morning howzit bru", "Pre-dawn checking in", "Early sorted hey", "Dawn lekker mode",
-            "Morning sharp boet", "Pre-dawn vibes né", "Early howzit time", "Dawn all good bru", "Morning lekker sharp",
-            "Pre-dawn sorted", "Early sharp vibes", "Dawn howzit hey", "Morning lekker time", "Pre-dawn sharp bru",
-            "Early all good", "Dawn sorted né", "Morning vibes boet", "Pre-dawn lekker", "Early sharp sharp"
-        ]
-    },
-    "morning": {
-        "jarvis": [
-            "Good morning brief", "Morning operations underway", "AM protocols active", "Morning coordination ready",
-            "Daylight operations commenced", "Morning service active", "AM briefing prepared", "Morning status update",
-            "Morning operations brief", "AM coordination active", "Daylight protocols engaged", "Morning readiness confirmed",
-            "AM operations underway", "Morning service protocols", "Daylight briefing ready", "Morning coordination brief",
-            "AM status update", "Morning operations ready", "Daylight service active", "Morning protocols engaged",
-            "AM briefing underway", "Morning coordination status", "Daylight operations brief", "Morning service ready",
-            "AM protocols prepared", "Morning operations status", "Daylight coordination active", "Morning briefing complete",
-            "AM service underway", "Morning readiness brief", "Daylight protocols ready", "Morning operations engaged"
-        ],
-        "dude": [
-            "Morning vibes flowing", "Good morning groove", "AM chill mode", "Morning easy vibes", "Day starting smooth",
-            "Morning mellow time", "AM flow active", "Good morning zen", "Morning cruise mode", "Day beginning easy",
-            "Morning peaceful vibes", "AM smooth sailing", "Good morning flow", "Morning relaxed mode", "Day starting chill",
-            "Morning tranquil vibes", "AM easy mode", "Good morning mellow", "Morning serene time", "Day flowing smooth",
-            "Morning cosmic vibes", "AM zen mode", "Good morning peaceful", "Morning calm waters", "Day cruising easy",
-            "Morning harmonious vibes", "AM chill time", "Good morning smooth", "Morning balanced mode", "Day starting zen",
-            "Morning laid back vibes", "AM flow time", "Good morning relaxed", "Morning easy sailing"
-        ],
-        "chick": [
-            "Good morning gorgeous", "Morning glam time", "AM fabulous mode", "Morning sparkle active", "Day looking stunning",
-            "Morning elegance vibes", "AM beauty time", "Good morning fab", "Morning radiant mode", "Day starting gorgeous",
-            "Morning sophisticated vibes", "AM glam mode", "Good morning elegant", "Morning chic time", "Day beginning fab",
-            "Morning stunning vibes", "AM sparkle mode", "Good morning radiant", "Morning graceful time", "Day looking elegant",
-            "Morning beautiful vibes", "AM fab time", "Good morning chic", "Morning lovely mode", "Day starting radiant",
-            "Morning glamorous vibes", "AM elegant time", "Good morning stunning", "Morning gorgeous mode", "Day beginning beautiful",
-            "Morning exquisite vibes", "AM radiant time", "Good morning lovely", "Morning fabulous mode"
-        ],
-        "nerd": [
-            "Morning data compiled", "AM diagnostics complete", "Good morning analysis ready", "Morning metrics validated",
-            "Day systems optimal", "Morning parameters checked", "AM calculations ready", "Good morning diagnostics", "Morning telemetry active",
-            "Day optimization running", "Morning algorithms verified", "AM data processed", "Good morning metrics", "Morning validation complete",
-            "Day analysis underway", "Morning systems verified", "AM parameters ready", "Good morning telemetry", "Morning diagnostics validated",
-            "Day metrics compiled", "Morning data verified", "AM analysis complete", "Good morning systems", "Morning parameters optimal",
-            "Day calculations ready", "Morning verification done", "AM diagnostics ready", "Good morning data", "Morning metrics processed",
-            "Day telemetry active", "Morning algorithms ready", "AM validation complete", "Good morning analysis"
-        ],
-        "rager": [
-            "Morning goddamn updates", "AM bullshit incoming", "Good morning clusterfuck", "Morning shit show", "Day problems starting",
-            "Morning fucking chaos", "AM disaster watch", "Good morning pain", "Morning goddamn issues", "Day horseshit active",
-            "Morning nonsense alert", "AM crap incoming", "Good morning hell", "Morning pain train", "Day bullshit detected",
-            "Morning fucking problems", "AM chaos mode", "Good morning disaster", "Morning goddamn mess", "Day shit incoming",
-            "Morning headache alert", "AM bullshit mode", "Good morning clusterfuck", "Morning fucking issues", "Day pain starting",
-            "Morning disaster watch", "AM goddamn problems", "Good morning chaos", "Morning shit alert", "Day hell incoming",
-            "Morning clusterfuck mode", "AM pain train", "Good morning bullshit", "Morning goddamn chaos"
-        ],
-        "comedian": [
-            "Morning arrives punctually", "AM comedy engaged", "Good morning absurdity", "Morning irony detected", "Day satire active",
-            "Morning wit protocols", "AM humor mode", "Good morning deadpan", "Morning sarcasm ready", "Day comedy time",
-            "Morning absurdity alert", "AM irony active", "Good morning satire", "Morning deadpan mode", "Day wit engaged",
-            "Morning comedy protocols", "AM sarcasm ready", "Good morning humor", "Morning wit active", "Day irony detected",
-            "Morning satire mode", "AM deadpan engaged", "Good morning comedy", "Morning humor protocols", "Day absurdity alert",
-            "Morning irony mode", "AM wit active", "Good morning sarcasm", "Morning comedy ready", "Day deadpan time",
-            "Morning humor engaged", "AM satire mode", "Good morning wit", "Morning absurdity protocols"
-        ],
-        "action": [
-            "Morning sitrep ready", "AM tactical brief", "Good morning recon", "Morning mission status", "Day operations active",
-            "Morning combat readiness", "AM field report", "Good morning tactical", "Morning ops brief", "Day mission underway",
-            "Morning readiness check", "AM combat status", "Good morning field", "Morning tactical update", "Day operations brief",
-            "Morning mission ready", "AM ops status", "Good morning combat", "Morning field brief", "Day tactical ready",
-            "Morning operations sitrep", "AM mission brief", "Good morning readiness", "Morning combat brief", "Day field status",
-            "Morning tactical sitrep", "AM readiness check", "Good morning ops", "Morning mission brief", "Day combat ready",
-            "Morning field sitrep", "AM tactical status", "Good morning mission", "Morning ops ready"
-        ],
-        "ops": [
-            "Morning status update", "AM operational brief", "Good morning systems", "Morning ops report", "Day operations ready",
-            "Morning system status", "AM ops brief", "Good morning operational", "Morning status check", "Day systems active",
-            "Morning operational update", "AM system brief", "Good morning ops", "Morning status report", "Day operational ready",
-            "Morning system brief", "AM status update", "Good morning system", "Morning ops update", "Day status active",
-            "Morning operational brief", "AM ops report", "Good morning status", "Morning system update", "Day ops ready",
-            "Morning status brief", "AM operational report", "Good morning ops brief", "Morning system report", "Day status ready",
-            "Morning ops status", "AM system update", "Good morning operational brief", "Morning status ready"
-        ],
-        "tappit": [
-            "Morning howzit bru", "AM lekker time", "Good morning boet", "Morning sharp sharp", "Day sorted né",
-            "Morning all good hey", "AM vibes bru", "Good morning sharp", "Morning lekker vibes", "Day howzit time",
-            "Morning sorted boet", "AM sharp time", "Good morning lekker", "Morning howzit né", "Day vibes bru",
-            "Morning all good bru", "AM lekker sharp", "Good morning sorted", "Morning sharp boet", "Day lekker time",
-            "Morning vibes né", "AM howzit bru", "Good morning all good", "Morning lekker hey", "Day sharp sharp",
-            "Morning sharp né", "AM sorted bru", "Good morning howzit", "Morning vibes boet", "Day lekker vibes",
-            "Morning all sorted", "AM sharp boet", "Good morning vibes", "Morning howzit sharp"
-        ]
-    },
-    "afternoon": {
-        "jarvis": [
-            "Afternoon dispatch", "PM operations brief", "Midday coordination", "Afternoon status update", "PM protocols active",
-            "Afternoon service brief", "Midday operations ready", "PM coordination underway", "Afternoon briefing prepared", "Midday status active",
-            "PM service protocols", "Afternoon operations status", "Midday briefing ready", "PM coordination brief", "Afternoon readiness confirmed",
-            "Midday service active", "PM operations update", "Afternoon coordination status", "Midday protocols engaged", "PM briefing underway",
-            "Afternoon service ready", "Midday coordination active", "PM status update", "Afternoon operations brief", "Midday readiness status",
-            "PM service underway", "Afternoon briefing complete", "Midday operations engaged", "PM coordination ready", "Afternoon protocols prepared",
-            "Midday service brief", "PM readiness confirmed", "Afternoon status ready", "Midday operations brief"
-        ],
-        "dude": [
-            "Afternoon vibes", "PM chill time", "Midday flow", "Afternoon easy mode", "PM smooth sailing",
-            "Midday mellow vibes", "Afternoon cruise", "PM zen time", "Midday peaceful", "Afternoon relaxed vibes",
-            "PM flow mode", "Midday easy vibes", "Afternoon smooth time", "PM mellow mode", "Midday chill vibes",
-            "Afternoon zen mode", "PM peaceful time", "Midday cruise vibes", "Afternoon easy sailing", "PM relaxed mode",
-            "Midday smooth vibes", "Afternoon flow time", "PM chill mode", "Midday zen vibes", "Afternoon mellow time",
-            "PM easy vibes", "Midday peaceful mode", "Afternoon cruise time", "PM smooth vibes", "Midday relaxed mode",
-            "Afternoon chill time", "PM zen vibes", "Midday flow mode", "Afternoon peaceful vibes"
-        ],
-        "chick": [
-            "Afternoon gorgeous", "PM glam time", "Midday fabulous", "Afternoon sparkle", "PM elegant mode",
-            "Midday stunning vibes", "Afternoon beauty time", "PM radiant mode", "Midday chic vibes", "Afternoon fab time",
-            "PM gorgeous mode", "Midday elegant vibes", "Afternoon radiant time", "PM fabulous mode", "Midday sparkle vibes",
-            "Afternoon chic time", "PM stunning mode", "Midday gorgeous vibes", "Afternoon elegant vibes", "PM radiant time",
-            "Midday fab mode", "Afternoon sparkle time", "PM chic vibes", "Midday radiant mode", "Afternoon gorgeous time",
-            "PM elegant vibes", "Midday fabulous mode", "Afternoon stunning time", "PM sparkle mode", "Midday chic time",
-            "Afternoon radiant vibes", "PM gorgeous time", "Midday elegant mode", "Afternoon fab vibes"
-        ],
-        "nerd": [
-            "Afternoon diagnostics", "PM data analysis", "Midday metrics", "Afternoon telemetry", "PM systems check",
-            "Midday validation", "Afternoon parameters", "PM calculations", "Midday diagnostics", "Afternoon data compiled",
-            "PM metrics ready", "Midday analysis complete", "Afternoon verification", "PM telemetry active", "Midday systems optimal",
-            "Afternoon algorithms", "PM parameters checked", "Midday data processed", "Afternoon metrics validated", "PM diagnostics complete",
-            "Midday verification done", "Afternoon systems verified", "PM analysis ready", "Midday telemetry processed", "Afternoon data verified",
-            "PM validation complete", "Midday metrics compiled", "Afternoon diagnostics ready", "PM systems verified", "Midday parameters optimal",
-            "Afternoon telemetry active", "PM data processed", "Midday algorithms ready", "Afternoon verification complete"
-        ],
-        "rager": [
-            "Afternoon bullshit", "PM goddamn updates", "Midday clusterfuck", "Afternoon shit show", "PM fucking chaos",
-            "Midday disaster", "Afternoon pain train", "PM horseshit", "Midday goddamn problems", "Afternoon hell incoming",
-            "PM bullshit mode", "Midday fucking issues", "Afternoon chaos alert", "PM disaster watch", "Midday pain incoming",
-            "Afternoon goddamn mess", "PM clusterfuck mode", "Midday shit alert", "Afternoon fucking problems", "PM hell mode",
-            "Midday bullshit detected", "Afternoon disaster mode", "PM goddamn chaos", "Midday clusterfuck alert", "Afternoon shit incoming",
-            "PM pain mode", "Midday fucking chaos", "Afternoon bullshit watch", "PM goddamn problems", "Midday disaster incoming",
-            "Afternoon hell mode", "PM clusterfuck alert", "Midday pain train", "Afternoon goddamn bullshit"
-        ],
-        "comedian": [
-            "Afternoon irony", "PM comedy hour", "Midday absurdity", "Afternoon satire", "PM deadpan mode",
-            "Midday wit active", "Afternoon humor", "PM sarcasm ready", "Midday comedy protocols", "Afternoon deadpan time",
-            "PM irony detected", "Midday satire mode", "Afternoon wit engaged", "PM absurdity alert", "Midday humor active",
-            "Afternoon sarcasm mode", "PM comedy protocols", "Midday deadpan engaged", "Afternoon irony active", "PM satire ready",
-            "Midday wit mode", "Afternoon comedy engaged", "PM humor protocols", "Midday absurdity mode", "Afternoon deadpan ready",
-            "PM irony mode", "Midday sarcasm active", "Afternoon satire engaged", "PM wit protocols", "Midday comedy ready",
-            "Afternoon humor mode", "PM deadpan time", "Midday irony engaged", "Afternoon absurdity protocols"
-        ],
-        "action": [
-            "Afternoon sitrep", "PM tactical brief", "Midday mission status", "Afternoon combat ready", "PM field report",
-            "Midday operations brief", "Afternoon readiness check", "PM tactical update", "Midday combat status", "Afternoon mission brief",
-            "PM ops sitrep", "Midday readiness status", "Afternoon field brief", "PM combat brief", "Midday tactical sitrep",
-            "Afternoon ops status", "PM mission update", "Midday field status", "Afternoon tactical brief", "PM readiness sitrep",
-            "Midday combat brief", "Afternoon mission sitrep", "PM field update", "Midday ops status", "Afternoon combat sitrep",
-            "PM tactical sitrep", "Midday mission brief", "Afternoon readiness status", "PM ops brief", "Midday tactical status",
-            "Afternoon field sitrep", "PM combat status", "Midday readiness brief", "Afternoon tactical status"
-        ],
-        "ops": [
-            "Afternoon status", "PM operational brief", "Midday systems check", "Afternoon ops update", "PM status report",
-            "Midday operational status", "Afternoon system brief", "PM ops brief", "Midday status update", "Afternoon operational report",
-            "PM system status", "Midday ops update", "Afternoon status brief", "PM operational update", "Midday system brief",
-            "Afternoon ops report", "PM status update", "Midday operational brief", "Afternoon system update", "PM ops status",
-            "Midday status report", "Afternoon operational status", "PM system brief", "Midday ops brief", "Afternoon status update",
-            "PM operational report", "Midday system status", "Afternoon ops status", "PM status brief", "Midday operational update",
-            "Afternoon system report", "PM ops update", "Midday status brief", "Afternoon operational brief"
-        ],
-        "tappit": [
-            "Afternoon howzit", "PM lekker bru", "Midday sharp time", "Afternoon sorted", "PM vibes né",
-            "Midday all good boet", "Afternoon lekker vibes", "PM sharp sharp", "Midday howzit bru", "Afternoon all sorted",
-            "PM lekker time", "Midday sharp boet", "Afternoon vibes né", "PM howzit hey", "Midday sorted bru",
-            "Afternoon sharp time", "PM all good né", "Midday lekker sharp", "Afternoon howzit boet", "PM sorted time",
-            "Midday vibes bru", "Afternoon lekker sharp", "PM sharp né", "Midday all good", "Afternoon howzit sharp",
-            "PM vibes boet", "Midday lekker time", "Afternoon sorted né", "PM sharp bru", "Midday howzit sharp",
-            "Afternoon all good bru", "PM lekker né", "Midday sharp time", "Afternoon vibes boet"
-        ]
-    },
-    "evening": {
-        "jarvis": [
-            "Evening dispatch", "Evening operations brief", "PM coordination active", "Evening status update", "Evening protocols engaged",
-            "Evening service brief", "PM operations ready", "Evening coordination status", "PM briefing prepared", "Evening readiness confirmed",
-            "PM service protocols", "Evening operations status", "PM briefing ready", "Evening coordination brief", "PM readiness active",
-            "Evening service ready", "PM coordination underway", "Evening status brief", "PM operations update", "Evening briefing complete",
-            "PM service underway", "Evening coordination ready", "PM status update", "Evening operations brief", "PM readiness status",
-            "Evening service active", "PM briefing underway", "Evening readiness brief", "PM coordination status", "Evening protocols ready",
-            "PM operations engaged", "Evening service protocols", "PM readiness confirmed", "Evening status ready"
-        ],
-        "dude": [
-            "Evening vibes", "Evening chill time", "PM flow mode", "Evening easy vibes", "Evening mellow time",
-            "PM smooth sailing", "Evening zen mode", "PM peaceful vibes", "Evening relaxed time", "PM chill mode",
-            "Evening flow vibes", "PM easy mode", "Evening smooth time", "PM mellow vibes", "Evening peaceful mode",
-            "PM zen vibes", "Evening cruise time", "PM relaxed mode", "Evening easy sailing", "PM flow time",
-            "Evening mellow vibes", "PM smooth time", "Evening chill mode", "PM peaceful mode", "Evening zen vibes",
-            "PM easy vibes", "Evening relaxed vibes", "PM cruise mode", "Evening smooth vibes", "PM mellow time",
-            "Evening peaceful vibes", "PM zen time", "Evening flow mode", "PM chill vibes"
-        ],
-        "chick": [
-            "Evening gorgeous", "Evening glam time", "PM fabulous mode", "Evening sparkle", "Evening elegant vibes",
-            "PM stunning time", "Evening radiant mode", "PM chic vibes", "Evening beauty time", "PM gorgeous mode",
-            "Evening fab vibes", "PM elegant time", "Evening radiant vibes", "PM fabulous mode", "Evening chic time",
-            "PM sparkle mode", "Evening stunning vibes", "PM radiant time", "Evening gorgeous time", "PM elegant vibes",
-            "Evening fabulous vibes", "PM chic mode", "Evening sparkle time", "PM gorgeous vibes", "Evening elegant time",
-            "PM radiant mode", "Evening chic vibes", "PM fabulous time", "Evening stunning time", "PM sparkle vibes",
-            "Evening radiant time", "PM gorgeous time", "Evening elegant mode", "PM fab vibes"
-        ],
-        "nerd": [
-            "Evening diagnostics", "Evening data analysis", "PM metrics compiled", "Evening telemetry", "Evening systems check",
-            "PM validation complete", "Evening parameters ready", "PM calculations done", "Evening diagnostics ready", "PM data verified",
-            "Evening metrics validated", "PM analysis complete", "Evening verification done", "PM telemetry active", "Evening systems optimal",
-            "PM algorithms ready", "Evening parameters checked", "PM data processed", "Evening metrics ready", "PM diagnostics complete",
-            "Evening verification ready", "PM systems verified", "Evening analysis ready", "PM telemetry processed", "Evening data compiled",
-            "PM validation done", "Evening metrics processed", "PM diagnostics ready", "Evening systems verified", "PM parameters optimal",
-            "Evening telemetry ready", "PM data complete", "Evening algorithms verified", "PM verification complete"
-        ],
-        "rager": [
-            "Evening bullshit", "Evening goddamn updates", "PM clusterfuck", "Evening shit show", "Evening fucking chaos",
-            "PM disaster mode", "Evening pain train", "PM horseshit incoming", "Evening goddamn problems", "PM hell mode",
-            "Evening bullshit alert", "PM fucking issues", "Evening chaos mode", "PM disaster watch", "Evening pain incoming",
-            "PM goddamn mess", "Evening clusterfuck mode", "PM shit alert", "Evening fucking problems", "PM hell incoming",
-            "Evening bullshit mode", "PM clusterfuck alert", "Evening disaster mode", "PM goddamn chaos", "Evening shit incoming",
-            "PM pain mode", "Evening fucking chaos", "PM bullshit watch", "Evening goddamn bullshit", "PM disaster incoming",
-            "Evening hell alert", "PM clusterfuck mode", "Evening pain mode", "PM goddamn problems"
-        ],
-        "comedian": [
-            "Evening irony", "Evening comedy hour", "PM absurdity", "Evening satire mode", "Evening deadpan time",
-            "PM wit active", "Evening humor engaged", "PM sarcasm ready", "Evening comedy protocols", "PM deadpan mode",
-            "Evening irony detected", "PM satire active", "Evening wit engaged", "PM absurdity alert", "Evening humor active",
-            "PM sarcasm mode", "Evening comedy ready", "PM deadpan engaged", "Evening irony active", "PM satire ready",
-            "Evening wit mode", "PM comedy engaged", "Evening humor protocols", "PM absurdity mode", "Evening deadpan ready",
-            "PM irony mode", "Evening sarcasm active", "PM satire engaged", "Evening wit protocols", "PM comedy ready",
-            "Evening humor mode", "PM deadpan time", "Evening irony engaged", "PM absurdity protocols"
-        ],
-        "action": [
-            "Evening sitrep", "Evening tactical brief", "PM mission status", "Evening combat ready", "Evening field report",
-            "PM operations brief", "Evening readiness check", "PM tactical update", "Evening combat status", "PM mission brief",
-            "Evening ops sitrep", "PM readiness status", "Evening field brief", "PM combat brief", "Evening tactical sitrep",
-            "PM ops status", "Evening mission update", "PM field status", "Evening tactical brief", "PM readiness sitrep",
-            "Evening combat brief", "PM mission sitrep", "Evening field update", "PM ops status", "Evening combat sitrep",
-            "PM tactical sitrep", "Evening mission brief", "PM readiness status", "Evening ops brief", "PM tactical status",
-            "Evening field sitrep", "PM combat status", "Evening readiness brief", "PM tactical brief"
-        ],
-        "ops": [
-            "Evening status", "Evening operational brief", "PM systems check", "Evening ops update", "Evening status report",
-            "PM operational status", "Evening system brief", "PM ops brief", "Evening status update", "PM operational report",
-            "Evening system status", "PM ops update", "Evening status brief", "PM operational update", "Evening system brief",
-            "PM ops report", "Evening status update", "PM operational brief", "Evening system update", "PM ops status",
-            "Evening status report", "PM operational status", "Evening system brief", "PM ops brief", "Evening status update",
-            "PM operational report", "Evening system status", "PM ops status", "Evening operational status", "PM status brief",
-            "Evening operational update", "PM system report", "Evening ops update", "PM status update"
-        ],
-        "tappit": [
-            "Evening howzit", "Evening lekker bru", "PM sharp time", "Evening sorted", "Evening vibes né",
-            "PM all good boet", "Evening lekker vibes", "PM sharp sharp", "Evening howzit bru", "PM all sorted",
-            "Evening lekker time", "PM sharp boet", "Evening vibes né", "PM howzit hey", "Evening sorted bru",
-            "PM sharp time", "Evening all good né", "PM lekker sharp", "Evening howzit boet", "PM sorted time",
-            "Evening vibes bru", "PM lekker sharp", "Evening sharp né", "PM all good", "Evening howzit sharp",
-            "PM vibes boet", "Evening lekker time", "PM sorted né", "Evening sharp bru", "PM howzit sharp",
-            "Evening all good bru", "PM lekker né", "Evening sharp time", "PM vibes boet"
-        ]
-    },
-    "late_night": {
-        "jarvis": [
-            "Late night dispatch", "Night operations brief", "Late hour coordination", "Night status update", "Late protocols active",
-            "Night service brief", "Late operations ready", "Night coordination status", "Late briefing prepared", "Night readiness confirmed",
-            "Late service protocols", "Night operations status", "Late briefing ready", "Night coordination brief", "Late readiness active",
-            "Night service ready", "Late coordination underway", "Night status brief", "Late operations update", "Night briefing complete",
-            "Late service underway", "Night coordination ready", "Late status update", "Night operations brief", "Late readiness status",
-            "Night service active", "Late briefing underway", "Night readiness brief", "Late coordination status", "Night protocols ready",
-            "Late operations engaged", "Night service protocols", "Late readiness confirmed", "Night status ready"
-        ],
-        "dude": [
-            "Late night vibes", "Night chill time", "Late flow mode", "Night easy vibes", "Late mellow time",
-            "Night smooth sailing", "Late zen mode", "Night peaceful vibes", "Late relaxed time", "Night chill mode",
-            "Late flow vibes", "Night easy mode", "Late smooth time", "Night mellow vibes", "Late peaceful mode",
-            "Night zen vibes", "Late cruise time", "Night relaxed mode", "Late easy sailing", "Night flow time",
-            "Late mellow vibes", "Night smooth time", "Late chill mode", "Night peaceful mode", "Late zen vibes",
-            "Night easy vibes", "Late relaxed vibes", "Night cruise mode", "Late smooth vibes", "Night mellow time",
-            "Late peaceful vibes", "Night zen time", "Late flow mode", "Night chill vibes"
-        ],
-        "chick": [
-            "Late night gorgeous", "Night glam time", "Late fabulous mode", "Night sparkle", "Late elegant vibes",
-            "Night stunning time", "Late radiant mode", "Night chic vibes", "Late beauty time", "Night gorgeous mode",
-            "Late fab vibes", "Night elegant time", "Late radiant vibes", "Night fabulous mode", "Late chic time",
-            "Night sparkle mode", "Late stunning vibes", "Night radiant time", "Late gorgeous time", "Night elegant vibes",
-            "Late fabulous vibes", "Night chic mode", "Late sparkle time", "Night gorgeous vibes", "Late elegant time",
-            "Night radiant mode", "Late chic vibes", "Night fabulous time", "Late stunning time", "Night sparkle vibes",
-            "Late radiant time", "Night gorgeous time", "Late elegant mode", "Night fab vibes"
-        ],
-        "nerd": [
-            "Late night diagnostics", "Night data analysis", "Late metrics compiled", "Night telemetry", "Late systems check",
-            "Night validation complete", "Late parameters ready", "Night calculations done", "Late diagnostics ready", "Night data verified",
-            "Late metrics validated", "Night analysis complete", "Late verification done", "Night telemetry active", "Late systems optimal",
-            "Night algorithms ready", "Late parameters checked", "Night data processed", "Late metrics ready", "Night diagnostics complete",
-            "Late verification ready", "Night systems verified", "Late analysis ready", "Night telemetry processed", "Late data compiled",
-            "Night validation done", "Late metrics processed", "Night diagnostics ready", "Late systems verified", "Night parameters optimal",
-            "Late telemetry ready", "Night data complete", "Late algorithms verified", "Night verification complete"
-        ],
-        "rager": [
-            "Late night bullshit", "Night goddamn updates", "Late clusterfuck", "Night shit show", "Late fucking chaos",
-            "Night disaster mode", "Late pain train", "Night horseshit incoming", "Late goddamn problems", "Night hell mode",
-            "Late bullshit alert", "Night fucking issues", "Late chaos mode", "Night disaster watch", "Late pain incoming",
-            "Night goddamn mess", "Late clusterfuck mode", "Night shit alert", "Late fucking problems", "Night hell incoming",
-            "Late bullshit mode", "Night clusterfuck alert", "Late disaster mode", "Night goddamn chaos", "Late shit incoming",
-            "Night pain mode", "Late fucking chaos", "Night bullshit watch", "Late goddamn bullshit", "Night disaster incoming",
-            "Late hell alert", "Night clusterfuck mode", "Late pain mode", "Night goddamn problems"
-        ],
-        "comedian": [
-            "Late night irony", "Night comedy hour", "Late absurdity", "Night satire mode", "Late deadpan time",
-            "Night wit active", "Late humor engaged", "Night sarcasm ready", "Late comedy protocols", "Night deadpan mode",
-            "Late irony detected", "Night satire active", "Late wit engaged", "Night absurdity alert", "Late humor active",
-            "Night sarcasm mode", "Late comedy ready", "Night deadpan engaged", "Late irony active", "Night satire ready",
-            "Late wit mode", "Night comedy engaged", "Late humor protocols", "Night absurdity mode", "Late deadpan ready",
-            "Night irony mode", "Late sarcasm active", "Night satire engaged", "Late wit protocols", "Night comedy ready",
-            "Late humor mode", "Night deadpan time", "Late irony engaged", "Night absurdity protocols"
-        ],
-        "action": [
-            "Late night sitrep", "Night tactical brief", "Late mission status", "Night combat ready", "Late field report",
-            "Night operations brief", "Late readiness check", "Night tactical update", "Late combat status", "Night mission brief",
-            "Late ops sitrep", "Night readiness status", "Late field brief", "Night combat brief", "Late tactical sitrep",
-            "Night ops status", "Late mission update", "Night field status", "Late tactical brief", "Night readiness sitrep",
-            "Late combat brief", "Night mission sitrep", "Late field update", "Night ops status", "Late combat sitrep",
-            "Night tactical sitrep", "Late mission brief", "Night readiness status", "Late ops brief", "Night tactical status",
-            "Late field sitrep", "Night combat status", "Late readiness brief", "Night tactical brief"
-        ],
-        "ops": [
-            "Late night status", "Night operational brief", "Late systems check", "Night ops update", "Late status report",
-            "Night operational status", "Late system brief", "Night ops brief", "Late status update", "Night operational report",
-            "Late system status", "Night ops update", "Late status brief", "Night operational update", "Late system brief",
-            "Night ops report", "Late status update", "Night operational brief", "Late system update", "Night ops status",
-            "Late status report", "Night operational status", "Late system brief", "Night ops brief", "Late status update",
-            "Night operational report", "Late system status", "Night ops status", "Late operational status", "Night status brief",
-            "Late operational update", "Night system report", "Late ops update", "Night status update"
-        ],
-        "tappit": [
-            "Late night howzit", "Night lekker bru", "Late sharp time", "Night sorted", "Late vibes né",
-            "Night all good boet", "Late lekker vibes", "Night sharp sharp", "Late howzit bru", "Night all sorted",
-            "Late lekker time", "Night sharp boet", "Late vibes né", "Night howzit hey", "Late sorted bru",
-            "Night sharp time", "Late all good né", "Night lekker sharp", "Late howzit boet", "Night sorted time",
-            "Late vibes bru", "Night lekker sharp", "Late sharp né", "Night all good", "Late howzit sharp",
-            "Night vibes boet", "Late lekker time", "Night sorted né", "Late sharp bru", "Night howzit sharp",
-            "Late all good bru", "Night lekker né", "Late sharp time", "Night vibes boet"
-        ]
-    }
-}
+# ============================================================================
+# Phrase banks
+# ============================================================================
+# Greetings, header statuses and riff lines live in phrase_banks.json next to
+# this file and are loaded on first use. Header templates carry one slot per
+# "{default}" which is filled with the detected service, or the default word
+# when there is none. Every bank is compiled once into tuples keyed by
+# (persona, ...) so a pick is a dict lookup plus one RNG call.
+PHRASE_BANKS_FILE = Path(__file__).with_name("phrase_banks.json")
 
-# MASSIVE SERVICE-SPECIFIC RESPONSE BANKS - Context-aware and intelligent
-_SERVICE_RESPONSES = {
-    # Docker responses
-    ("docker", "completed"): {
-        "jarvis": ["Container deployment successful", "Docker orchestration complete", "Container stack operational", "Image deployment finalized"],
-        "dude": ["Container's cruising smooth", "Docker stack flowing nice", "Containers vibing well", "Stack deployed easy"],
-        "chick": ["Container deployed beautifully", "Docker looking fabulous", "Stack running gorgeously", "Containers performing perfectly"],
-        "nerd": ["Container runtime nominal", "Docker daemon stable", "Stack metrics optimal", "Image layers verified"],
-        "rager": ["Container finally fucking works", "Docker shit deployed", "Stack running goddammit", "Containers up finally"],
-        "ops": ["Container operational", "Docker stack deployed", "Container status green", "Image running"],
-        "tappit": ["Container lekker bru", "Docker sorted hey", "Stack running sharp", "Containers all good né"],
-        "comedian": ["Container surprisingly functional", "Docker unexpectedly stable", "Stack shockingly operational", "Containers defying expectations"],
-        "action": ["Container secured", "Docker mission complete", "Stack operational status", "Container deployment successful"],
-    },
-    ("docker", "failed"): {
-        "jarvis": ["Container deployment failed", "Docker orchestration error", "Container stack compromised", "Image deployment unsuccessful"],
-        "dude": ["Container hit a snag", "Docker stack having issues", "Containers not vibing", "Stack deployment rough"],
-        "chick": ["Container needs attention", "Docker not looking good", "Stack having problems", "Containers struggling"],
-        "nerd": ["Container runtime failure", "Docker daemon error", "Stack initialization failed", "Image corruption detected"],
-        "rager": ["Container is fucked", "Docker shit broke", "Stack totally screwed", "Containers dead as hell"],
-        "ops": ["Container failed", "Docker stack down", "Container error", "Image deployment failed"],
-        "tappit": ["Container is kak bru", "Docker broken hey", "Stack not lekker", "Containers kaput né"],
-        "comedian": ["Container dramatically failed", "Docker predictably broken", "Stack ironically down", "Containers quit unexpectedly"],
-        "action": ["Container compromised", "Docker threat detected", "Stack mission failed", "Container breach detected"],
-    },
-    ("docker", "restarted"): {
-        "jarvis": ["Container orchestration reset", "Docker services cycled", "Container stack reinitialized", "Image runtime refreshed"],
-        "dude": ["Containers getting fresh start", "Docker reset flowing", "Stack rebooting smooth", "Containers cycling easy"],
-        "chick": ["Containers refreshing beautifully", "Docker reboot looking good", "Stack resetting gracefully", "Containers restarting perfectly"],
-        "nerd": ["Container runtime reinitialized", "Docker daemon restarted", "Stack services cycled", "Image cache cleared"],
-        "rager": ["Containers restarted again", "Docker cycling goddammit", "Stack reset fucking again", "Containers bouncing"],
-        "ops": ["Container restarted", "Docker services cycled", "Stack reset", "Container reboot complete"],
-        "tappit": ["Containers reset bru", "Docker cycling sharp", "Stack rebooted né", "Containers fresh hey"],
-        "comedian": ["Containers reluctantly restarted", "Docker begrudgingly cycled", "Stack unwillingly reset", "Containers reboot ritual complete"],
-        "action": ["Container tactical reset", "Docker systems cycled", "Stack redeployment complete", "Container recovery initiated"],
-    },
-    
-    # Plex/Media responses
-    ("plex", "completed"): {
-        "jarvis": ["Media server operations complete", "Plex library scan finished", "Streaming services operational", "Media index updated"],
-        "dude": ["Plex cruising smooth", "Media flowing nice", "Library scan vibing", "Streaming easy mode"],
-        "chick": ["Plex looking gorgeous", "Media library fabulous", "Streaming beautifully", "Library scan perfect"],
-        "nerd": ["Plex database synchronized", "Media library indexed", "Transcode operations nominal", "Metadata refresh complete"],
-        "rager": ["Plex scan finally done", "Media library updated", "Streaming working now", "Library scan finished"],
-        "ops": ["Plex operational", "Media server ready", "Library scan complete", "Streaming active"],
-        "tappit": ["Plex lekker bru", "Media sorted hey", "Library scanned sharp", "Streaming good né"],
-        "comedian": ["Plex surprisingly functional", "Media library unexpectedly updated", "Streaming shockingly stable", "Library scan miraculously complete"],
-        "action": ["Plex mission complete", "Media server secured", "Library operations successful", "Streaming operational"],
-    },
-    ("plex", "failed"): {
-        "jarvis": ["Media server error detected", "Plex operations disrupted", "Streaming services interrupted", "Media index failure"],
-        "dude": ["Plex hit a bump", "Media not flowing", "Library scan stuck", "Streaming having issues"],
-        "chick": ["Plex needs attention", "Media library struggling", "Streaming problems detected", "Library scan failed"],
-        "nerd": ["Plex database corruption", "Media transcoding failure", "Streaming buffer overflow", "Metadata sync error"],
-        "rager": ["Plex is fucked", "Media server broken", "Streaming shit the bed", "Library scan failed hard"],
-        "ops": ["Plex error", "Media server down", "Library scan failed", "Streaming offline"],
-        "tappit": ["Plex broken bru", "Media kak hey", "Library scan failed né", "Streaming down"],
-        "comedian": ["Plex dramatically crashed", "Media server plot twist", "Streaming unexpectedly dead", "Library scan gave up"],
-        "action": ["Plex compromised", "Media server threat", "Streaming mission failed", "Library breach detected"],
-    },
-    
-    # Sonarr/Radarr responses  
-    ("sonarr", "completed"): {
-        "jarvis": ["Episode acquisition complete", "TV series download finished", "Media automation successful", "Show library updated"],
-        "dude": ["Episode grabbed smooth", "Show downloaded easy", "Series flowing nice", "TV library vibing"],
-        "chick": ["Episode acquired perfectly", "Show downloaded beautifully", "Series looking fab", "TV library gorgeous"],
-        "nerd": ["Episode parsed successfully", "Torrent acquisition nominal", "Quality profile matched", "Series metadata updated"],
-        "rager": ["Episode finally grabbed", "Show downloaded", "Series got it done", "TV library updated"],
-        "ops": ["Episode downloaded", "Series acquired", "Show library updated", "Download complete"],
-        "tappit": ["Episode grabbed bru", "Show sorted hey", "Series lekker né", "TV library sharp"],
-        "comedian": ["Episode surprisingly acquired", "Show unexpectedly downloaded", "Series miraculously grabbed", "TV library updated shockingly"],
-        "action": ["Episode secured", "Series acquisition complete", "Show mission successful", "TV library operational"],
-    },
-    ("radarr", "completed"): {
-        "jarvis": ["Film acquisition complete", "Movie download finished", "Cinema automation successful", "Film library updated"],
-        "dude": ["Movie grabbed smooth", "Film downloaded easy", "Cinema flowing nice", "Movie library vibing"],
-        "chick": ["Film acquired perfectly", "Movie downloaded beautifully", "Cinema looking fab", "Film library gorgeous"],
-        "nerd": ["Movie parsed successfully", "Torrent acquisition nominal", "Quality profile matched", "Film metadata updated"],
-        "rager": ["Movie finally grabbed", "Film downloaded", "Cinema got it done", "Movie library updated"],
-        "ops": ["Movie downloaded", "Film acquired", "Cinema library updated", "Download complete"],
-        "tappit": ["Movie grabbed bru", "Film sorted hey", "Cinema lekker né", "Movie library sharp"],
-        "comedian": ["Film surprisingly acquired", "Movie unexpectedly downloaded", "Cinema miraculously grabbed", "Film library updated shockingly"],
-        "action": ["Film secured", "Movie acquisition complete", "Cinema mission successful", "Film library operational"],
-    },
-    
-    # Database responses
-    ("database", "completed"): {
-        "jarvis": ["Database operations complete", "Query execution successful", "Data synchronization finished", "Database index updated"],
-        "dude": ["Database cruising smooth", "Queries flowing nice", "Data syncing easy", "DB vibing well"],
-        "chick": ["Database running beautifully", "Queries performing perfectly", "Data looking fabulous", "DB gorgeously optimized"],
-        "nerd": ["Query optimizer efficient", "Database integrity verified", "Transaction logs clean", "Index fragmentation minimal"],
-        "rager": ["Database queries done", "Data synced finally", "DB working now", "Queries completed"],
-        "ops": ["Database operational", "Queries complete", "Data synchronized", "DB status green"],
-        "tappit": ["Database lekker bru", "Queries sorted hey", "Data synced sharp", "DB all good né"],
-        "comedian": ["Database surprisingly stable", "Queries unexpectedly fast", "Data shockingly consistent", "DB miraculously optimized"],
-        "action": ["Database secured", "Query mission complete", "Data operations successful", "DB tactical status green"],
-    },
-    ("database", "failed"): {
-        "jarvis": ["Database error detected", "Query execution failed", "Data synchronization interrupted", "Database connection lost"],
-        "dude": ["Database hit issues", "Queries not flowing", "Data sync stuck", "DB having problems"],
-        "chick": ["Database needs attention", "Queries struggling", "Data sync failed", "DB not looking good"],
-        "nerd": ["Database deadlock detected", "Query timeout exceeded", "Connection pool exhausted", "Transaction rollback triggered"],
-        "rager": ["Database is fucked", "Queries shit the bed", "Data sync broken", "DB totally screwed"],
-        "ops": ["Database error", "Query failed", "Data sync failure", "DB connection down"],
-        "tappit": ["Database kak bru", "Queries broken hey", "Data sync failed né", "DB not lekker"],
-        "comedian": ["Database dramatically failed", "Queries gave up entirely", "Data sync plot twist", "DB unexpectedly dead"],
-        "action": ["Database compromised", "Query threat detected", "Data breach alert", "DB mission critical"],
-    },
-    
-    # Network responses
-    ("network", "connected"): {
-        "jarvis": ["Network connectivity established", "Connection protocols active", "Network services online", "Link status operational"],
-        "dude": ["Network vibing smooth", "Connection flowing nice", "Link cruising easy", "Network all good"],
-        "chick": ["Network connected beautifully", "Link looking perfect", "Connection gorgeous", "Network running fab"],
-        "nerd": ["Network handshake complete", "TCP connection established", "Routing tables updated", "DNS resolution active"],
-        "rager": ["Network finally connected", "Link is up", "Connection working now", "Network online"],
-        "ops": ["Network connected", "Link established", "Connection active", "Network operational"],
-        "tappit": ["Network connected bru", "Link lekker hey", "Connection sharp né", "Network sorted"],
-        "comedian": ["Network surprisingly online", "Connection unexpectedly stable", "Link shockingly active", "Network miraculously working"],
-        "action": ["Network secured", "Connection established", "Link operational", "Network tactical status green"],
-    },
-    ("network", "disconnected"): {
-        "jarvis": ["Network connectivity lost", "Connection protocols failed", "Network services offline", "Link status down"],
-        "dude": ["Network down man", "Connection dropped", "Link lost flow", "Network having issues"],
-        "chick": ["Network needs attention", "Connection lost", "Link down", "Network struggling"],
-        "nerd": ["Network timeout exceeded", "Connection refused", "Routing failure detected", "DNS resolution failed"],
-        "rager": ["Network is fucked", "Connection dead", "Link broken", "Network shit the bed"],
-        "ops": ["Network disconnected", "Link down", "Connection lost", "Network offline"],
-        "tappit": ["Network down bru", "Connection kak hey", "Link broken né", "Network offline"],
-        "comedian": ["Network dramatically offline", "Connection plot twist", "Link unexpectedly dead", "Network gave up"],
-        "action": ["Network compromised", "Connection breach", "Link mission failed", "Network threat detected"],
-    },
-    
-    # Backup responses
-    ("backup", "completed"): {
-        "jarvis": ["Backup operation complete", "Data archival successful", "Snapshot creation finished", "Backup verification passed"],
-        "dude": ["Backup cruising done", "Data archived smooth", "Snapshot vibing good", "Backup flowing easy"],
-        "chick": ["Backup completed beautifully", "Data archived perfectly", "Snapshot gorgeous", "Backup running fab"],
-        "nerd": ["Backup checksums verified", "Data integrity confirmed", "Snapshot differential optimal", "Backup compression efficient"],
-        "rager": ["Backup finally done", "Data archived", "Snapshot completed", "Backup finished"],
-        "ops": ["Backup complete", "Data archived", "Snapshot created", "Backup verified"],
-        "tappit": ["Backup done bru", "Data sorted hey", "Snapshot lekker né", "Backup sharp"],
-        "comedian": ["Backup surprisingly successful", "Data unexpectedly archived", "Snapshot miraculously complete", "Backup shockingly worked"],
-        "action": ["Backup secured", "Data extraction complete", "Snapshot mission successful", "Backup operational"],
-    },
-    ("backup", "failed"): {
-        "jarvis": ["Backup operation failed", "Data archival interrupted", "Snapshot creation error", "Backup verification failed"],
-        "dude": ["Backup hit issues", "Data archive stuck", "Snapshot problems", "Backup not flowing"],
-        "chick": ["Backup needs attention", "Data archive failed", "Snapshot struggling", "Backup not working"],
-        "nerd": ["Backup checksum mismatch", "Data integrity compromised", "Snapshot corruption detected", "Backup storage full"],
-        "rager": ["Backup is fucked", "Data archive broken", "Snapshot failed hard", "Backup shit the bed"],
-        "ops": ["Backup failed", "Data archive error", "Snapshot failed", "Backup incomplete"],
-        "tappit": ["Backup kak bru", "Data archive broken hey", "Snapshot failed né", "Backup not lekker"],
-        "comedian": ["Backup dramatically failed", "Data archive plot twist", "Snapshot gave up", "Backup unexpectedly dead"],
-        "action": ["Backup compromised", "Data extraction failed", "Snapshot mission critical", "Backup breach detected"],
-    },
-    
-    # Home Assistant responses
-    ("homeassistant", "completed"): {
-        "jarvis": ["Home automation task complete", "Smart device coordination successful", "Automation sequence finished", "Home system updated"],
-        "dude": ["Home automation cruising", "Smart devices vibing", "Automation flowing smooth", "Home system easy"],
-        "chick": ["Home automation perfect", "Smart devices gorgeous", "Automation beautifully done", "Home system fab"],
-        "nerd": ["Automation state machine complete", "Entity synchronization nominal", "Sensor data validated", "Integration API successful"],
-        "rager": ["Home automation done", "Smart devices working", "Automation completed", "Home system updated"],
-        "ops": ["Home automation complete", "Device coordination done", "Automation executed", "System updated"],
-        "tappit": ["Home automation lekker", "Smart devices sorted bru", "Automation sharp hey", "Home system good né"],
-        "comedian": ["Home automation surprisingly worked", "Smart devices unexpectedly responsive", "Automation miraculously complete", "Home system shockingly stable"],
-        "action": ["Home secured", "Device coordination complete", "Automation mission successful", "System operational"],
-    },
-    
-    # VPN responses
-    ("vpn", "connected"): {
-        "jarvis": ["VPN tunnel established", "Secure connection active", "Encrypted link operational", "VPN protocols engaged"],
-        "dude": ["VPN cruising secure", "Tunnel flowing smooth", "Connection vibing safe", "VPN all good"],
-        "chick": ["VPN connected beautifully", "Tunnel looking perfect", "Connection gorgeously secure", "VPN fab"],
-        "nerd": ["VPN handshake complete", "Encryption protocols active", "Tunnel routing verified", "IPsec established"],
-        "rager": ["VPN finally connected", "Tunnel is up", "Connection working", "VPN online"],
-        "ops": ["VPN connected", "Tunnel established", "Secure connection active", "VPN operational"],
-        "tappit": ["VPN connected bru", "Tunnel lekker hey", "Connection sharp né", "VPN sorted"],
-        "comedian": ["VPN surprisingly secure", "Tunnel unexpectedly stable", "Connection shockingly private", "VPN miraculously working"],
-        "action": ["VPN secured", "Tunnel operational", "Connection encrypted", "VPN tactical status green"],
-    },
-    ("vpn", "disconnected"): {
-        "jarvis": ["VPN tunnel terminated", "Secure connection lost", "Encrypted link down", "VPN protocols inactive"],
-        "dude": ["VPN dropped man", "Tunnel down", "Connection lost flow", "VPN having issues"],
-        "chick": ["VPN needs attention", "Tunnel disconnected", "Connection lost", "VPN struggling"],
-        "nerd": ["VPN timeout exceeded", "Tunnel handshake failed", "Encryption key expired", "Connection refused"],
-        "rager": ["VPN is fucked", "Tunnel dead", "Connection broken", "VPN shit out"],
-        "ops": ["VPN disconnected", "Tunnel down", "Connection lost", "VPN offline"],
-        "tappit": ["VPN down bru", "Tunnel kak hey", "Connection broken né", "VPN offline"],
-        "comedian": ["VPN dramatically offline", "Tunnel plot twist", "Connection unexpectedly insecure", "VPN gave up"],
-        "action": ["VPN compromised", "Tunnel breach", "Connection lost", "VPN threat detected"],
-    },
-    
-    # Monitoring responses
-    ("monitoring", "warning"): {
-        "jarvis": ["Monitoring threshold exceeded", "Alert condition detected", "Performance degradation noted", "Health check warning"],
-        "dude": ["Monitoring seeing issues", "Alerts coming in", "Performance slowing", "Health check concerned"],
-        "chick": ["Monitoring needs attention", "Alerts detected", "Performance not ideal", "Health check warning"],
-        "nerd": ["Monitoring threshold breach", "Metric anomaly detected", "Performance deviation significant", "Statistical outlier identified"],
-        "rager": ["Monitoring showing problems", "Alerts fucking everywhere", "Performance degraded", "Health check warnings"],
-        "ops": ["Monitoring alert", "Threshold exceeded", "Performance warning", "Health check degraded"],
-        "tappit": ["Monitoring warning bru", "Alerts coming hey", "Performance not lekker", "Health check concerned né"],
-        "comedian": ["Monitoring dramatically alarmed", "Alerts unexpectedly numerous", "Performance ironically degraded", "Health check surprisingly worried"],
-        "action": ["Monitoring threat detected", "Alert condition active", "Performance degradation confirmed", "Health check warning issued"],
-    },
-    
-    # Certificate responses
-    ("certificate", "updated"): {
-        "jarvis": ["Certificate renewal complete", "SSL/TLS updated successfully", "Security certificate refreshed", "Certificate validation passed"],
-        "dude": ["Certificate renewed smooth", "SSL updated easy", "Cert flowing fresh", "Security vibing good"],
-        "chick": ["Certificate renewed beautifully", "SSL updated perfectly", "Cert looking gorgeous", "Security fab"],
-        "nerd": ["Certificate chain validated", "Public key infrastructure updated", "X.509 renewal successful", "Certificate authority verified"],
-        "rager": ["Certificate renewed finally", "SSL updated", "Cert refreshed", "Security updated"],
-        "ops": ["Certificate renewed", "SSL updated", "Cert refreshed", "Security current"],
-        "tappit": ["Certificate renewed bru", "SSL sorted hey", "Cert fresh né", "Security lekker"],
-        "comedian": ["Certificate surprisingly renewed", "SSL unexpectedly current", "Cert miraculously valid", "Security shockingly updated"],
-        "action": ["Certificate secured", "SSL encryption updated", "Cert mission complete", "Security operational"],
-    },
-    ("certificate", "failed"): {
-        "jarvis": ["Certificate renewal failed", "SSL/TLS update error", "Security certificate invalid", "Certificate validation failed"],
-        "dude": ["Certificate issues man", "SSL update stuck", "Cert problems", "Security not flowing"],
-        "chick": ["Certificate needs attention", "SSL update failed", "Cert struggling", "Security concerns"],
-        "nerd": ["Certificate validation error", "Chain of trust broken", "ACME challenge failed", "Certificate authority unreachable"],
-        "rager": ["Certificate is fucked", "SSL broken", "Cert failed hard", "Security shit the bed"],
-        "ops": ["Certificate failed", "SSL error", "Cert invalid", "Security warning"],
-        "tappit": ["Certificate kak bru", "SSL broken hey", "Cert failed né", "Security not lekker"],
-        "comedian": ["Certificate dramatically expired", "SSL plot twist", "Cert unexpectedly invalid", "Security ironically insecure"],
-        "action": ["Certificate compromised", "SSL breach detected", "Cert mission failed", "Security threat active"],
-    },
-    
-    # Media/Radarr/Sonarr responses
-    ("media", "completed"): {
-        "jarvis": ["Media acquisition complete", "Download successfully archived", "Content delivery finished", "Media file processed"],
-        "dude": ["Download cruising done", "Media vibing smooth", "Content flowing in nice", "Download all good"],
-        "chick": ["Download completed beautifully", "Media looking perfect", "Content arrived gorgeously", "Download fab"],
-        "nerd": ["Download checksum verified", "Media codec validated", "File integrity confirmed", "Metadata parsed successfully"],
-        "rager": ["Download finally done", "Media downloaded", "Content arrived", "Download finished"],
-        "ops": ["Download complete", "Media acquired", "Content delivered", "File received"],
-        "tappit": ["Download done bru", "Media sorted hey", "Content lekker né", "Download sharp"],
-        "comedian": ["Download surprisingly successful", "Media unexpectedly arrived", "Content miraculously complete", "Download shockingly worked"],
-        "action": ["Media secured", "Download mission complete", "Content acquisition successful", "File extracted"],
-    },
-    ("radarr", "completed"): {
-        "jarvis": [
-            "Film successfully archived to the collection, sir",
-            "Cinema catalogue updated with latest acquisition",
-            "Motion picture secured and indexed properly",
-            "Movie file has been verified and stored, sir",
-            "Film download complete - quality standards met",
-            "Cinema asset catalogued and ready for viewing",
-            "Picture successfully retrieved and archived",
-            "Film acquisition concluded satisfactorily, sir",
-            "Movie download verified - all systems nominal",
-            "Cinema library updated with new addition",
-            "Motion picture secured to specifications",
-            "Film file integrity confirmed and stored",
-            "Download operation successful - cinema ready",
-            "Movie properly archived and indexed, sir",
-            "Film catalogue updated per your parameters",
-            "Cinema collection enhanced with new title",
-            "Motion picture acquisition completed smoothly",
-            "Film successfully added to media library",
-            "Download verified - picture quality acceptable",
-            "Movie file secured and catalogued properly",
-            "Cinema asset ready for immediate playback",
-            "Film archive updated without incident, sir",
-            "Motion picture download concluded successfully",
-            "Movie added to collection - all checks passed",
-            "Cinema library expansion complete, sir"
-        ],
-        "dude": [
-            "Yo new movie just dropped, ready to watch",
-            "Got that film downloaded man, looks sick",
-            "Movie's in - time to chill and stream bro",
-            "Ahhh yeah film came through nice",
-            "New flick ready whenever you're vibing",
-            "Movie downloaded smooth as butter dude",
-            "Got your cinema fix ready to go man",
-            "Film's here - grab the popcorn bro",
-            "Sweet, new movie ready for movie night",
-            "Downloaded that flick no problem dude",
-            "Movie's good to go whenever man",
-            "Got that film you wanted - all set",
-            "New cinema just landed, totally rad",
-            "Film downloaded - looking pretty sweet bro",
-            "Movie's ready, no worries man",
-            "Got your flick all downloaded and chill",
-            "New movie vibing in the library dude",
-            "Film came in smooth - ready to roll",
-            "Movie's here man, fire it up whenever",
-            "Downloaded that cinema - looks solid bro",
-            "Got your film ready for the big screen",
-            "New movie cruising into the collection",
-            "Film's locked and loaded dude",
-            "Movie downloaded easy - all good man",
-            "Cinema's ready for your viewing pleasure bro"
-        ],
-        "chick": [
-            "OMG new movie just arrived - so exciting!",
-            "Obsessed! Film downloaded perfectly babe",
-            "Like totally got that movie - looks amazing!",
-            "New flick ready - it's giving cinema realness",
-            "Movie downloaded beautifully hun!",
-            "Yasss film is here and it's everything!",
-            "Got your movie bestie - looks SO good",
-            "New cinema just dropped - living for it!",
-            "Film downloaded flawlessly darling",
-            "Movie's ready babe - time to get cozy!",
-            "Like seriously this film looks stunning!",
-            "New movie and I'm here for it hun!",
-            "Downloaded perfectly - chef's kiss!",
-            "Film is ready gorgeous - movie night anyone?",
-            "Got that cinema vibes going babe!",
-            "Movie came through looking fabulous!",
-            "New flick downloaded - absolutely divine!",
-            "Film's here hun and it's a whole mood!",
-            "Movie ready - popcorn time gorgeous!",
-            "Downloaded beautifully babe - no notes!",
-            "New cinema alert - it's perfection!",
-            "Film's in the collection now sweetie!",
-            "Movie looks amazing hun - totally worth it!",
-            "Got your flick ready darling - stunning!",
-            "Cinema downloaded flawlessly bestie!"
-        ],
-        "nerd": [
-            "Movie file downloaded - codec H.265, HDR10+ verified",
-            "Film acquisition complete - checksum validated",
-            "Video container parsed - MKV format, 4K resolution confirmed",
-            "Download successful - bitrate 15Mbps, audio DTS-HD",
-            "Movie metadata indexed - TMDB sync nominal",
-            "Film downloaded - x265 encoding, 10-bit color depth",
-            "Media file verified - Dolby Vision profile 7 detected",
-            "Cinema asset retrieved - 7.1 audio channels confirmed",
-            "Download completed - file integrity SHA256 matched",
-            "Movie catalogued - Plex/Jellyfin integration ready",
-            "Film acquisition - HDR metadata properly tagged",
-            "Video download validated - no corruption detected",
-            "Movie file processed - subtitle tracks embedded",
-            "Cinema download - HEVC encoding efficiency optimal",
-            "Film retrieved successfully - 2160p WebRip quality",
-            "Media asset secured - proper naming convention applied",
-            "Download verified - all codec parameters nominal",
-            "Movie indexed - release group and quality tags added",
-            "Film catalogued with proper IMDB/TMDB mapping",
-            "Video file complete - hardware acceleration compatible",
-            "Cinema asset downloaded - HDR10 and DV dual layer",
-            "Movie secured - lossless audio track included",
-            "Film download successful - scene release verified",
-            "Media file validated - no pixel corruption found",
-            "Download complete - optimal compression ratio achieved"
-        ],
-        "rager": [
-            "About fucking time the movie downloaded",
-            "Finally got the goddamn film",
-            "Movie's here - took long enough shit",
-            "Film downloaded - thank fucking god",
-            "Got the movie, only took forever",
-            "Downloaded the film finally goddammit",
-            "Movie came through - fucking finally",
-            "Got your film after all that bullshit",
-            "Movie downloaded - christ that took a while",
-            "Film's in - stopped screwing around",
-            "Finally got the goddamn movie downloaded",
-            "About time this film showed up",
-            "Movie's ready - only took fucking ages",
-            "Got the film downloaded at last",
-            "Movie finally came through thank god",
-            "Downloaded that film after forever",
-            "Got your movie - stopped fucking around",
-            "Film downloaded - finally goddamn working",
-            "Movie's here - took long enough shit",
-            "Got the film after all that crap",
-            "Movie downloaded - quit stalling already",
-            "Film finally arrived jesus christ",
-            "Got your movie at fucking last",
-            "Downloaded the film - about damn time",
-            "Movie's ready - stopped being a pain in the ass"
-        ],
-        "ops": [
-            "Movie download complete",
-            "Film acquired successfully",
-            "Cinema asset received",
-            "Movie file secured",
-            "Film download finished",
-            "Cinema content delivered",
-            "Movie acquisition complete",
-            "Film asset obtained",
-            "Download operation successful",
-            "Movie catalogued and ready",
-            "Film retrieval complete",
-            "Cinema download finished",
-            "Movie file received",
-            "Film secured successfully",
-            "Download completed nominal",
-            "Movie indexed and stored",
-            "Film acquisition successful",
-            "Cinema asset ready",
-            "Movie download verified",
-            "Film operation complete",
-            "Download task finished",
-            "Movie asset secured",
-            "Film delivery successful",
-            "Cinema download complete",
-            "Movie retrieval finished"
-        ],
-        "tappit": [
-            "Eish, movie downloaded lekker bru",
-            "Film came through sharp hey china",
-            "Got that movie sorted né boet",
-            "Jislaaik film downloaded nice bru",
-            "Movie's here - lekker sorted china",
-            "Film downloaded sharp sharp hey",
-            "Got your flick ready né bru",
-            "Howzit, movie came through lekker",
-            "Film's sorted boet - all good hey",
-            "Movie downloaded no stress bru",
-            "Got that cinema lekker organized china",
-            "Film's ready né - sharp stuff boet",
-            "Movie downloaded properly hey bru",
-            "Eish film came through nice china",
-            "Got your movie lekker ready né",
-            "Film downloaded clean bru",
-            "Movie's sorted sharp hey boet",
-            "Got that flick ready lekker china",
-            "Film came in nice né bru",
-            "Movie downloaded solid hey",
-            "Got cinema sorted lekker boet",
-            "Film's ready sharp sharp bru",
-            "Movie came through né china",
-            "Downloaded that film properly hey",
-            "Got your movie lekker secured bru"
-        ],
-        "comedian": [
-            "Oh look, another movie for the 'watch later' pile of 847 films",
-            "Movie downloaded - adding to collection I'll definitely watch someday",
-            "Film acquired - because 600 unwatched movies wasn't enough",
-            "Download complete - my storage drive thanks you sarcastically",
-            "Movie ready - joining the other 400 films gathering digital dust",
-            "Film secured - expanding my impressive 'maybe I'll watch this' library",
-            "Got the movie - my hard drive's new favorite roommate",
-            "Download successful - one step closer to Netflix's entire catalogue",
-            "Film arrived - the collection nobody asked for continues to grow",
-            "Movie downloaded - because watching things is overrated anyway",
-            "Cinema asset secured - my Plex server's storage anxiety intensifies",
-            "Film ready - adding to the museum of unwatched content",
-            "Movie downloaded - the hoarding continues unabated",
-            "Got your film - storage space screams internally",
-            "Download complete - my watch list nervously laughs",
-            "Film secured - because streaming services weren't enough apparently",
-            "Movie ready - the digital clutter expands beautifully",
-            "Cinema downloaded - hard drive capacity has entered the chat",
-            "Film arrived - my 'definitely gonna watch this' collection grows",
-            "Movie secured - storage drive files for emotional damages",
-            "Download successful - joining 500 other 'must watch' films",
-            "Film ready - the procrastination library expands",
-            "Movie downloaded - my backlog sends its regards",
-            "Cinema secured - because why stream when you can hoard",
-            "Film ready - the collection of good intentions continues"
-        ],
-        "action": [
-            "Target acquired - film secured",
-            "Movie download mission successful",
-            "Cinema asset extracted and secured",
-            "Film retrieval operation complete",
-            "Target downloaded - objective achieved",
-            "Movie secured - mission accomplished",
-            "Film extraction successful - Oscar Mike",
-            "Cinema asset acquired - solid copy",
-            "Download operation green - target secured",
-            "Movie mission complete - RTB",
-            "Film secured - no hostiles",
-            "Cinema target downloaded successfully",
-            "Movie acquisition - clean operation",
-            "Film secured - area clear",
-            "Download mission accomplished - moving out",
-            "Movie target extracted successfully",
-            "Film op complete - all clear",
-            "Cinema asset secured - mission green",
-            "Movie download - tactical success",
-            "Film secured - zero casualties",
-            "Download operation successful - exfil complete",
-            "Movie mission green - objective met",
-            "Film extracted - operation nominal",
-            "Cinema target secured - Charlie Mike",
-            "Movie download complete - all teams RTB"
-        ],
-    },
-    ("sonarr", "completed"): {
-        "jarvis": [
-            "Television episode successfully archived, sir",
-            "Series update complete - new episode catalogued",
-            "Episode download concluded satisfactorily",
-            "Television content secured and indexed properly",
-            "Series episode verified and stored, sir",
-            "Show update complete - library synchronized",
-            "Episode acquisition finished successfully",
-            "Television file integrity confirmed and archived",
-            "New episode secured to specifications, sir",
-            "Series catalogue updated with latest episode",
-            "Episode download operation successful",
-            "Television content properly indexed and stored",
-            "Show update concluded - episode verified",
-            "Series episode secured without incident, sir",
-            "Episode file archived and ready for viewing",
-            "Television library updated per parameters",
-            "New episode catalogued successfully, sir",
-            "Series download complete - quality acceptable",
-            "Episode secured and synchronized properly",
-            "Television update finished smoothly, sir",
-            "Show episode verified and archived",
-            "Series content secured satisfactorily",
-            "Episode download concluded nominally, sir",
-            "Television catalogue enhanced with new episode",
-            "Series update complete - all checks passed"
-        ],
-        "dude": [
-            "Yo new episode just dropped - binge time",
-            "Got that show updated man, ready to watch",
-            "Episode's in bro - no more waiting",
-            "Sweet, series got a new ep ready",
-            "Show updated smooth - time to catch up dude",
-            "New episode vibing in the library man",
-            "Got your series fix ready bro",
-            "Episode downloaded easy - let's go",
-            "Show's current now dude, all caught up",
-            "New ep ready whenever man - no rush",
-            "Series updated smooth as hell bro",
-            "Got that episode you've been waiting for",
-            "Show's ready for binging dude",
-            "New ep just landed - looks good man",
-            "Series updated no problem bro",
-            "Episode's here - grab the snacks dude",
-            "Got your show all caught up man",
-            "New ep downloaded chill as fuck",
-            "Series ready for your viewing pleasure bro",
-            "Episode came through smooth dude",
-            "Show updated easy - all set man",
-            "New ep vibing - ready when you are bro",
-            "Got that series current dude",
-            "Episode's locked in man - good to go",
-            "Show updated beautifully bro"
-        ],
-        "chick": [
-            "OMG new episode - time for a watch party!",
-            "Yasss series updated - can't wait babe!",
-            "New ep downloaded perfectly hun!",
-            "Like totally caught up on the show now!",
-            "Episode's here bestie - so exciting!",
-            "Got your series fix gorgeous!",
-            "New ep ready - it's giving main character energy!",
-            "Show updated beautifully darling!",
-            "Episode downloaded flawlessly babe!",
-            "OMG can finally watch the new ep hun!",
-            "Series is current now sweetie - living!",
-            "New episode and I'm obsessed already!",
-            "Got that show updated perfectly babe!",
-            "Episode's ready gorgeous - binge time!",
-            "Like the show is all caught up now hun!",
-            "New ep downloaded - chef's kiss!",
-            "Series updated and it looks SO good babe!",
-            "Episode's here darling - movie night vibes!",
-            "Got your show ready sweetie!",
-            "New ep in the library hun - stunning!",
-            "Series caught up beautifully babe!",
-            "Episode downloaded perfectly gorgeous!",
-            "Show's current now darling - no spoilers!",
-            "New ep ready bestie - time to binge!",
-            "Got that series updated flawlessly hun!"
-        ],
-        "nerd": [
-            "Episode downloaded - x264 encoding, 1080p resolution",
-            "Series update complete - proper naming scheme applied",
-            "TV file acquired - AC3 5.1 audio track verified",
-            "Episode metadata synchronized with TVDB",
-            "Show updated - season/episode indexing correct",
-            "Television download validated - checksum matched",
-            "Episode file confirmed - MKV container format",
-            "Series catalogued - subtitle tracks embedded",
-            "TV content secured - proper scene release",
-            "Episode acquired - quality profile standards met",
-            "Show updated - file integrity SHA256 verified",
-            "Television download - codec parameters optimal",
-            "Episode indexed with correct air date metadata",
-            "Series file processed - no corruption detected",
-            "TV episode secured - proper episode numbering",
-            "Show download - HEVC encoding confirmed",
-            "Episode metadata complete - ratings synced",
-            "Series updated - release group properly tagged",
-            "Television file validated - all checks passed",
-            "Episode download - streaming-optimized codec",
-            "Show catalogued with IMDB/TVDB mapping",
-            "TV content verified - proper season structure",
-            "Episode secured - hardware acceleration compatible",
-            "Series update - proper folder hierarchy maintained",
-            "Television download complete - quality nominal"
-        ],
-        "rager": [
-            "Fucking finally got the new episode",
-            "Show updated - took goddamn long enough",
-            "Episode's here - about fucking time",
-            "Got the new ep after all that bullshit",
-            "Series updated at last thank christ",
-            "Episode downloaded - finally goddammit",
-            "Show caught up - stopped screwing around",
-            "New ep here - quit stalling already",
-            "Got the episode after forever",
-            "Series updated - thank fucking god",
-            "Episode finally came through shit",
-            "Show's current - only took ages",
-            "New ep downloaded at fucking last",
-            "Got your series caught up finally",
-            "Episode here - stopped being useless",
-            "Show updated - about damn time",
-            "New ep after all that crap",
-            "Series caught up finally goddammit",
-            "Episode downloaded - quit fucking around",
-            "Got the show updated at last",
-            "New ep here thank god",
-            "Series current - stopped dragging ass",
-            "Episode came through finally",
-            "Show updated - christ took forever",
-            "Got your ep - only took goddamn ages"
-        ],
-        "ops": [
-            "Episode download complete",
-            "Series updated successfully",
-            "TV content acquired",
-            "Episode file secured",
-            "Show update finished",
-            "Television episode received",
-            "Series content delivered",
-            "Episode acquisition complete",
-            "Show catalogued and ready",
-            "TV file obtained",
-            "Episode operation successful",
-            "Series download finished",
-            "Television content secured",
-            "Episode indexed successfully",
-            "Show update complete",
-            "TV episode verified",
-            "Series file delivered",
-            "Episode retrieval finished",
-            "Show content ready",
-            "Television download complete",
-            "Episode secured nominal",
-            "Series update successful",
-            "TV content indexed",
-            "Episode operation finished",
-            "Show acquisition complete"
-        ],
-        "tappit": [
-            "Eish, new episode lekker sorted bru",
-            "Show updated sharp hey china",
-            "Got that ep ready né boet",
-            "Series caught up lekker bru",
-            "New episode downloaded nice hey",
-            "Show's current sharp sharp china",
-            "Episode sorted properly né bru",
-            "Got your series lekker ready boet",
-            "New ep came through sharp hey",
-            "Show updated lekker bru",
-            "Episode's ready né china",
-            "Series all caught up sharp boet",
-            "Got that new ep lekker sorted hey",
-            "Show downloaded properly bru",
-            "Episode secured sharp né china",
-            "Series updated lekker boet",
-            "New ep ready sharp sharp hey",
-            "Got your show current bru",
-            "Episode came in lekker china",
-            "Show's sorted properly né boet",
-            "New ep downloaded sharp bru",
-            "Series ready lekker hey china",
-            "Episode secured né bru",
-            "Show caught up sharp boet",
-            "Got that ep lekker ready hey"
-        ],
-        "comedian": [
-            "Episode downloaded - another hour of my life scheduled away",
-            "Show updated - because sleep is overrated anyway",
-            "New ep ready - my productivity nervously sweats",
-            "Series caught up - the binge gods are pleased",
-            "Episode secured - farewell, responsible adulting",
-            "Show updated - my to-do list files a complaint",
-            "New ep ready - one more reason to avoid real life",
-            "Episode downloaded - the couch beckons ominously",
-            "Series current - my social life sends its regrets",
-            "Show updated - Netflix asks if I'm still watching life",
-            "New ep secured - the void of endless content grows",
-            "Episode ready - joining 40 other unwatched episodes",
-            "Show updated - my bedtime laughs maniacally",
-            "New ep downloaded - responsibilities have left the chat",
-            "Series caught up - the binge spiral continues",
-            "Episode secured - productivity has filed for divorce",
-            "Show ready - one more step into the content abyss",
-            "New ep downloaded - my watch list mocks me openly",
-            "Episode ready - because finishing shows is so mainstream",
-            "Series updated - the backlog expands exponentially",
-            "Show secured - my free time has entered witness protection",
-            "New ep ready - the streaming addiction feeds",
-            "Episode downloaded - sleep schedule in shambles",
-            "Series current - the binge never stops",
-            "Show updated - responsible viewing has left the server"
-        ],
-        "action": [
-            "Episode secured - target acquired",
-            "TV content extracted successfully",
-            "Series update complete - mission green",
-            "Episode download operation successful",
-            "Show secured - objective achieved",
-            "Television target acquired - Oscar Mike",
-            "Episode extraction complete - area clear",
-            "Series mission accomplished - RTB",
-            "TV content secured - no hostiles",
-            "Episode op complete - solid copy",
-            "Show target downloaded successfully",
-            "Series update green - moving out",
-            "Episode secured - zero casualties",
-            "Television mission successful - exfil complete",
-            "Show download complete - all clear",
-            "Episode extraction nominal - Charlie Mike",
-            "Series secured - operation green",
-            "TV content mission accomplished",
-            "Episode target acquired successfully",
-            "Show op complete - all teams RTB",
-            "Series secured - tactical success",
-            "Episode download green - objective met",
-            "Television secured - mission complete",
-            "Show extraction successful - area secured",
-            "Episode op green - all personnel accounted"
-        ],
-    },
-    ("lidarr", "completed"): {
-        "jarvis": ["Music acquisition complete", "Album download successful", "Audio content delivered", "Track file archived"],
-        "dude": ["Album downloaded smooth", "Music vibing in nice", "Tracks flowing good", "Album all set"],
-        "chick": ["Album downloaded beautifully", "Music arrived perfectly", "Tracks gorgeous", "Album fab"],
-        "nerd": ["Music metadata parsed", "Audio codec validated", "Track integrity confirmed", "Album checksum verified"],
-        "rager": ["Album finally downloaded", "Music arrived", "Tracks done", "Album downloaded"],
-        "ops": ["Album download complete", "Music acquired", "Audio delivered", "Track received"],
-        "tappit": ["Album downloaded bru", "Music sorted hey", "Tracks lekker né", "Album sharp"],
-        "comedian": ["Album surprisingly downloaded", "Music unexpectedly arrived", "Tracks miraculously complete", "Album shockingly successful"],
-        "action": ["Album secured", "Music acquisition complete", "Audio mission successful", "Track extracted"],
-    },
-    ("orchestrator", "completed"): {
-        "jarvis": [
-            "Orchestration task complete - playbook executed successfully, sir",
-            "Automation workflow finished as designed",
-            "Playbook execution concluded nominally",
-            "Job sequence completed - all tasks successful, sir",
-            "Automation complete - state convergence achieved",
-            "Playbook finalized - infrastructure updated, sir",
-            "Orchestration successful - all hosts responded",
-            "Workflow execution complete - no errors, sir",
-            "Playbook concluded - desired state reached",
-            "Automation task finished successfully",
-            "Job execution complete - all steps passed, sir",
-            "Orchestration finalized - configuration applied",
-            "Playbook successful - changes deployed, sir",
-            "Workflow complete - infrastructure synchronized",
-            "Automation concluded - targets updated, sir",
-            "Job sequence finalized successfully",
-            "Orchestration task accomplished, sir",
-            "Playbook execution successful - ready for next task",
-            "Workflow finished - all changes applied",
-            "Automation complete - monitoring resumed, sir",
-            "Job concluded successfully - infrastructure current",
-            "Orchestration finalized - deployment complete",
-            "Playbook execution nominal - standing by, sir",
-            "Workflow successful - all tasks completed",
-            "Automation accomplished - configuration synchronized"
-        ],
-        "dude": [
-            "Playbook ran smooth man - all done",
-            "Automation finished up nice bro",
-            "Job cruised through easy dude",
-            "Workflow completed smooth as hell man",
-            "Playbook executed perfectly bro - no issues",
-            "Automation flowed through nice dude",
-            "Job finished up smooth man",
-            "Workflow done easy bro - all good",
-            "Playbook ran like butter dude",
-            "Automation completed smooth man",
-            "Job executed nicely bro",
-            "Workflow finished flowing easy dude",
-            "Playbook done smooth man - solid",
-            "Automation wrapped up nice bro",
-            "Job completed easy dude - vibing",
-            "Workflow ran smooth man",
-            "Playbook executed well bro - chill",
-            "Automation finished easy dude",
-            "Job done smooth man - no stress",
-            "Workflow completed nicely bro",
-            "Playbook ran perfect dude",
-            "Automation cruised through man",
-            "Job finished smooth bro - all set",
-            "Workflow done easy dude",
-            "Playbook executed smooth man - sweet"
-        ],
-        "chick": [
-            "Playbook ran beautifully babe - perfect!",
-            "Automation executed flawlessly hun!",
-            "Job finished gorgeously darling!",
-            "Workflow completed perfectly sweetie!",
-            "Playbook ran fab babe - obsessed!",
-            "Automation finished beautifully hun!",
-            "Job executed gorgeously darling!",
-            "Workflow completed elegantly babe!",
-            "Playbook ran stunningly sweetie!",
-            "Automation finished perfectly hun!",
-            "Job completed beautifully darling!",
-            "Workflow executed flawlessly babe!",
-            "Playbook ran divinely sweetie!",
-            "Automation finished gorgeously hun!",
-            "Job completed perfectly darling!",
-            "Workflow ran beautifully babe!",
-            "Playbook executed elegantly sweetie!",
-            "Automation finished fab hun!",
-            "Job ran gorgeously darling!",
-            "Workflow completed beautifully babe!",
-            "Playbook finished perfectly sweetie!",
-            "Automation executed stunningly hun!",
-            "Job completed flawlessly darling!",
-            "Workflow ran divinely babe!",
-            "Playbook finished beautifully hun!"
-        ],
-        "nerd": [
-            "Playbook execution: exit code 0, all tasks ok",
-            "Ansible run complete: state convergence achieved",
-            "Job finished: 47/47 tasks successful",
-            "Workflow execution: idempotency verified",
-            "Playbook complete: YAML syntax validated",
-            "Orchestration successful: SSH connections nominal",
-            "Automation finished: all hosts reachable",
-            "Job execution: role dependencies resolved",
-            "Playbook run: handler notifications triggered",
-            "Workflow complete: variable interpolation successful",
-            "Orchestration done: fact gathering completed",
-            "Automation successful: template rendering OK",
-            "Job finished: conditional logic executed correctly",
-            "Playbook complete: privilege escalation worked",
-            "Workflow execution: async tasks completed",
-            "Orchestration successful: inventory parsed correctly",
-            "Automation finished: loops iterated properly",
-            "Job complete: tags filtered appropriately",
-            "Playbook run: connection timeouts none",
-            "Workflow successful: no changed=0 failures",
-            "Orchestration done: all delegates responded",
-            "Automation complete: vault decryption successful",
-            "Job finished: serial execution nominal",
-            "Playbook execution: dry-run validation passed",
-            "Workflow complete: module execution successful"
-        ],
-        "rager": [
-            "Playbook finally finished - took long enough",
-            "Automation done goddammit - about time",
-            "Job completed at fucking last",
-            "Workflow finished - thank christ",
-            "Playbook ran after all that shit",
-            "Automation complete finally - jesus",
-            "Job done - stopped fucking around",
-            "Workflow finished goddammit",
-            "Playbook executed at last - fuck",
-            "Automation completed - about damn time",
-            "Job finished finally - thank god",
-            "Workflow done after forever",
-            "Playbook complete - quit stalling",
-            "Automation finished goddammit",
-            "Job ran at fucking last",
-            "Workflow completed finally - christ",
-            "Playbook done - thank fuck",
-            "Automation finished after ages",
-            "Job complete goddammit - finally",
-            "Workflow executed at last - jesus",
-            "Playbook finished - about time",
-            "Automation done finally - fuck",
-            "Job completed - quit dragging ass",
-            "Workflow finished goddammit - finally",
-            "Playbook ran at last - thank christ"
-        ],
-        "ops": [
-            "Playbook complete - status green",
-            "Automation executed successfully",
-            "Job finished - all tasks nominal",
-            "Workflow complete - ready",
-            "Orchestration successful - standby",
-            "Playbook execution complete",
-            "Automation finished - objectives met",
-            "Job done - status green",
-            "Workflow execution successful",
-            "Orchestration complete - ready state",
-            "Playbook finalized successfully",
-            "Automation done - all clear",
-            "Job execution complete",
-            "Workflow finished - nominal",
-            "Orchestration successful - green",
-            "Playbook complete - ready",
-            "Automation executed - standby",
-            "Job finished successfully",
-            "Workflow complete - operational",
-            "Orchestration done - status green",
-            "Playbook execution successful",
-            "Automation complete - ready",
-            "Job finalized - all clear",
-            "Workflow done - nominal status",
-            "Orchestration finished - green light"
-        ],
-        "tappit": [
-            "Playbook done lekker bru - sharp",
-            "Automation sorted hey china",
-            "Job finished sharp né boet",
-            "Workflow complete bru - lekker",
-            "Playbook ran nice hey china",
-            "Automation done sharp boet",
-            "Job executed lekker né bru",
-            "Workflow finished china - sorted",
-            "Playbook complete sharp bru",
-            "Automation sorted né boet - lekker",
-            "Job done hey china - sharp",
-            "Workflow finished bru - all good",
-            "Playbook executed lekker boet",
-            "Automation complete né china",
-            "Job finished sharp bru - sorted",
-            "Workflow done lekker hey boet",
-            "Playbook sorted china - sharp né",
-            "Automation finished bru - lekker",
-            "Job complete boet - all good hey",
-            "Workflow executed china - sharp",
-            "Playbook done né bru - sorted",
-            "Automation sorted boet - lekker",
-            "Job finished hey china - sharp",
-            "Workflow complete bru - sorted né",
-            "Playbook executed lekker boet - sharp"
-        ],
-        "comedian": [
-            "Playbook complete: surprisingly without incident",
-            "Automation successful: murphy took the day off",
-            "Job finished: the prophecy of completion fulfilled",
-            "Workflow executed: against all expectations",
-            "Playbook ran: chaos temporarily postponed",
-            "Automation complete: optimism cautiously restored",
-            "Job successful: the simulation cooperated",
-            "Workflow finished: entropy takes a break",
-            "Playbook done: murphy's law glitched",
-            "Automation successful: hope springs eternal",
-            "Job complete: predictably unpredictable success",
-            "Workflow executed: the universe relents",
-            "Playbook finished: shockingly nominal",
-            "Automation done: reality.exe functioning",
-            "Job successful: expectations actually met",
-            "Workflow complete: the plot twist we needed",
-            "Playbook ran: suspiciously smooth",
-            "Automation finished: murphy's on vacation",
-            "Job executed: chaos admits defeat",
-            "Workflow successful: hope has entered the chat",
-            "Playbook complete: ironically perfect",
-            "Automation done: optimism levels rising",
-            "Job finished: the comeback story",
-            "Workflow executed: murphy took the L",
-            "Playbook successful: against better judgment"
-        ],
-        "action": [
-            "Playbook complete - mission success",
-            "Automation deployed - objective achieved",
-            "Job executed - operation green",
-            "Workflow finalized - tactical success",
-            "Orchestration complete - mission accomplished",
-            "Playbook successful - all clear",
-            "Automation finished - objective secured",
-            "Job done - operation nominal",
-            "Workflow complete - mission green",
-            "Orchestration successful - status green",
-            "Playbook executed - tactical win",
-            "Automation finalized - objective met",
-            "Job complete - operation successful",
-            "Workflow finished - mission accomplished",
-            "Orchestration done - tactical green",
-            "Playbook successful - objective complete",
-            "Automation executed - operation green",
-            "Job finalized - mission success",
-            "Workflow complete - tactical nominal",
-            "Orchestration successful - all clear",
-            "Playbook done - operation complete",
-            "Automation finished - objective achieved",
-            "Job executed - mission green",
-            "Workflow successful - tactical success",
-            "Orchestration complete - operation nominal"
-        ],
-    },
-    ("orchestrator", "failed"): {
-        "jarvis": [
-            "Orchestration task failed - investigating error, sir",
-            "Playbook execution error encountered",
-            "Automation workflow interrupted - analyzing",
-            "Job sequence failed - reviewing logs, sir",
-            "Orchestration unsuccessful - determining cause",
-            "Playbook error detected - troubleshooting, sir",
-            "Automation task failed - examining failure",
-            "Workflow execution error - diagnostics active, sir",
-            "Job failed - identifying root cause",
-            "Orchestration error - reviewing playbook, sir",
-            "Playbook execution unsuccessful - analyzing",
-            "Automation failed - checking configuration, sir",
-            "Workflow interrupted - error investigation underway",
-            "Job sequence error - examining logs, sir",
-            "Orchestration task unsuccessful - troubleshooting",
-            "Playbook failed - reviewing task output, sir",
-            "Automation error detected - determining fix",
-            "Workflow execution failed - analyzing cause, sir",
-            "Job unsuccessful - checking host connectivity",
-            "Orchestration failed - examining error details, sir",
-            "Playbook execution error - remediation required",
-            "Automation task unsuccessful - investigating, sir",
-            "Workflow failed - reviewing execution logs",
-            "Job error detected - troubleshooting active, sir",
-            "Orchestration unsuccessful - awaiting guidance"
-        ],
-        "dude": [
-            "Ahh man playbook hit issues",
-            "Automation stuck dude - not working",
-            "Job failed bro - something broke",
-            "Workflow having problems man",
-            "Playbook errored out dude",
-            "Automation not flowing right bro",
-            "Job hit snags man - issues",
-            "Workflow failed dude - problems",
-            "Playbook didn't work bro",
-            "Automation having trouble man",
-            "Job errored dude - not good",
-            "Workflow stuck bro - issues",
-            "Playbook failed man - problems",
-            "Automation not working dude",
-            "Job hit errors bro - broken",
-            "Workflow having issues man",
-            "Playbook broke dude - failed",
-            "Automation stuck bro - errors",
-            "Job didn't work man - problems",
-            "Workflow failed dude - issues",
-            "Playbook having trouble bro",
-            "Automation errored man - stuck",
-            "Job failed dude - not working",
-            "Workflow broke bro - errors",
-            "Playbook having issues man"
-        ],
-        "chick": [
-            "OMG playbook failed babe - yikes!",
-            "Automation error hun - not good!",
-            "Job failed darling - crisis!",
-            "Workflow broke sweetie - help!",
-            "Playbook error babe - stressed!",
-            "Automation failed hun - concerned!",
-            "Job broke gorgeous - emergency!",
-            "Workflow error darling - panic!",
-            "Playbook failed sweetie - help!",
-            "Automation broken babe - worried!",
-            "Job error hun - not ideal!",
-            "Workflow failed gorgeous - crisis!",
-            "Playbook broke darling - SOS!",
-            "Automation error sweetie - scary!",
-            "Job failed babe - intervention needed!",
-            "Workflow broken hun - emergency!",
-            "Playbook error gorgeous - panic!",
-            "Automation failed darling - help!",
-            "Job broke sweetie - red alert!",
-            "Workflow error babe - disaster!",
-            "Playbook failed hun - stressed!",
-            "Automation broken gorgeous - crisis!",
-            "Job error darling - concerned!",
-            "Workflow failed sweetie - help!",
-            "Playbook broke babe - emergency!"
-        ],
-        "nerd": [
-            "Playbook failed: task 23/47 non-zero exit",
-            "Ansible error: unreachable hosts detected",
-            "Job failed: SSH connection timeout",
-            "Workflow error: syntax error in YAML line 156",
-            "Playbook failure: privilege escalation denied",
-            "Orchestration failed: undefined variable referenced",
-            "Automation error: module not found on target",
-            "Job failed: handler notification skipped",
-            "Playbook error: template rendering failed",
-            "Workflow failure: conditional evaluation false",
-            "Orchestration error: inventory parse failed",
-            "Automation failed: vault decryption error",
-            "Job error: async task timeout exceeded",
-            "Playbook failed: fact gathering unsuccessful",
-            "Workflow error: role dependency missing",
-            "Orchestration failure: connection refused port 22",
-            "Automation error: task killed by signal 15",
-            "Job failed: changed=1 failed=1",
-            "Playbook error: include directive not found",
-            "Workflow failure: loop iteration exceeded max",
-            "Orchestration error: delegate_to host unreachable",
-            "Automation failed: become password incorrect",
-            "Job error: register variable undefined",
-            "Playbook failed: serial execution stalled",
-            "Workflow error: module stdout parsing failed"
-        ],
-        "rager": [
-            "Playbook is fucked - broken goddammit",
-            "Automation failed - shit's broken",
-            "Job failed hard - fucking errors",
-            "Workflow is fucked - goddammit",
-            "Playbook broke - complete failure",
-            "Automation shit the bed - broken",
-            "Job fucking failed - errors",
-            "Workflow broke hard - goddammit",
-            "Playbook is broken - fuck",
-            "Automation failed hard - shit",
-            "Job is fucked - broken",
-            "Workflow failed - goddamn errors",
-            "Playbook broke - fucking failed",
-            "Automation is fucked - broken",
-            "Job failed hard - goddammit",
-            "Workflow is broken - shit",
-            "Playbook fucking failed - errors",
-            "Automation broke - goddamn it",
-            "Job is fucked - failed",
-            "Workflow broken - fucking errors",
-            "Playbook failed hard - shit",
-            "Automation is broken - fuck",
-            "Job fucking broke - goddammit",
-            "Workflow failed hard - errors",
-            "Playbook is fucked - broken"
-        ],
-        "ops": [
-            "Playbook failed - investigating",
-            "Automation error - troubleshooting",
-            "Job failed - analyzing cause",
-            "Workflow incomplete - reviewing",
-            "Orchestration error - diagnosing",
-            "Playbook unsuccessful - checking logs",
-            "Automation failed - determining fix",
-            "Job error - troubleshooting active",
-            "Workflow failed - investigating",
-            "Orchestration unsuccessful - analyzing",
-            "Playbook error - reviewing output",
-            "Automation incomplete - troubleshooting",
-            "Job failed - examining logs",
-            "Workflow error - diagnosing",
-            "Orchestration failed - investigating",
-            "Playbook unsuccessful - analyzing",
-            "Automation error - troubleshooting",
-            "Job incomplete - reviewing",
-            "Workflow failed - determining cause",
-            "Orchestration error - checking logs",
-            "Playbook failed - diagnosing",
-            "Automation unsuccessful - investigating",
-            "Job error - analyzing",
-            "Workflow incomplete - troubleshooting",
-            "Orchestration failed - reviewing"
-        ],
-        "tappit": [
-            "Playbook kak bru - broken",
-            "Automation failed hey china - eish",
-            "Job broken né boet - not lekker",
-            "Workflow kak china - jislaaik",
-            "Playbook failed bru - errors",
-            "Automation broken hey boet - eish",
-            "Job kak né china - not good",
-            "Workflow failed bru - jislaaik",
-            "Playbook broken boet - not lekker",
-            "Automation kak china - eish hey",
-            "Job failed né bru - broken",
-            "Workflow broken boet - jislaaik",
-            "Playbook kak hey china - errors",
-            "Automation failed bru - not lekker",
-            "Job broken né boet - eish",
-            "Workflow kak china - errors",
-            "Playbook failed bru - jislaaik",
-            "Automation broken boet - kak",
-            "Job kak hey china - not good",
-            "Workflow failed né bru - eish",
-            "Playbook broken china - errors",
-            "Automation kak bru - jislaaik",
-            "Job failed boet - not lekker",
-            "Workflow broken hey china - kak",
-            "Playbook kak né bru - eish"
-        ],
-        "comedian": [
-            "Playbook failed: murphy strikes again",
-            "Automation error: the prophecy fulfilled",
-            "Job broke: surprising absolutely no one",
-            "Workflow failed: chaos reigns supreme",
-            "Playbook error: entropy wins",
-            "Automation failed: reality bites",
-            "Job unsuccessful: murphy's law confirmed",
-            "Workflow broke: predictably catastrophic",
-            "Playbook failed: the universe's punchline",
-            "Automation error: hope has left the chat",
-            "Job failed: expectations thoroughly crushed",
-            "Workflow unsuccessful: murphy takes the W",
-            "Playbook broke: comedy and tragedy unite",
-            "Automation failed: the simulation glitches",
-            "Job error: optimism.dll not found",
-            "Workflow failed: the descent continues",
-            "Playbook unsuccessful: murphy never sleeps",
-            "Automation broke: reality.exe crashed",
-            "Job failed: the hits keep coming",
-            "Workflow error: chaos theory proven",
-            "Playbook failed: the plot twist nobody wanted",
-            "Automation unsuccessful: murphy's on a roll",
-            "Job broke: expectations vs reality",
-            "Workflow failed: the universe laughs",
-            "Playbook error: hope is not a strategy"
-        ],
-        "action": [
-            "Playbook failed - mission compromised",
-            "Automation error - tactical fallback",
-            "Job failed - objective not met",
-            "Workflow unsuccessful - abort protocol",
-            "Orchestration failed - mission critical",
-            "Playbook error - requesting backup",
-            "Automation unsuccessful - regroup required",
-            "Job failed - tactical withdrawal",
-            "Workflow error - mission compromised",
-            "Orchestration failed - need support",
-            "Playbook unsuccessful - danger close",
-            "Automation error - hostile environment",
-            "Job failed - extraction needed",
-            "Workflow unsuccessful - mission abort",
-            "Orchestration error - retreat advised",
-            "Playbook failed - RTB immediately",
-            "Automation unsuccessful - casualties possible",
-            "Job error - area not secure",
-            "Workflow failed - position compromised",
-            "Orchestration unsuccessful - requesting QRF",
-            "Playbook error - tactical retreat",
-            "Automation failed - enemy contact",
-            "Job unsuccessful - mission failed",
-            "Workflow error - emergency exfil",
-            "Orchestration failed - mission critical"
-        ],
-    },
-    ("sentinel", "warning"): {
-        "jarvis": [
-            "Service health degraded - monitoring actively, sir",
-            "Watchdog has detected performance concerns",
-            "Alert triggered - service showing degradation",
-            "Monitoring threshold exceeded - investigating, sir",
-            "Service metrics indicating potential issues",
-            "Health check reporting degraded state",
-            "Watchdog alert - service performance declining",
-            "Monitoring concern detected - analyzing logs, sir",
-            "Service health trending downward - observing",
-            "Alert condition met - service requires attention",
-            "Watchdog reporting anomalous behavior, sir",
-            "Monitoring threshold breach - service degraded",
-            "Health metrics outside acceptable range",
-            "Service performance warning - diagnostics active, sir",
-            "Watchdog concern raised - monitoring closely",
-            "Alert status elevated - service struggling",
-            "Monitoring detecting degradation patterns, sir",
-            "Service health check showing warnings",
-            "Watchdog threshold exceeded - caution advised",
-            "Performance degradation detected - standing by, sir",
-            "Service metrics indicating stress",
-            "Health monitoring alert triggered - observing",
-            "Watchdog reporting service strain, sir",
-            "Alert condition - service performance declining",
-            "Monitoring threshold crossed - attention required"
-        ],
-        "dude": [
-            "Hey man, service looking a bit rough",
-            "Watchdog's seeing some issues dude",
-            "Service not vibing as smooth man",
-            "Monitor picked up something concerning bro",
-            "Ahh service health looking sketchy dude",
-            "Watchdog's worried about this one man",
-            "Service acting kinda weird bro",
-            "Monitor's flagging some problems dude",
-            "Not loving what I'm seeing here man",
-            "Service health declining a bit bro",
-            "Watchdog thinks we should check this dude",
-            "Monitor showing some red flags man",
-            "Service not flowing as smooth bro",
-            "Health check looking concerning dude",
-            "Watchdog's raising eyebrows man",
-            "Service struggling a little here bro",
-            "Monitor's not happy with this dude",
-            "Health metrics looking iffy man",
-            "Watchdog detecting issues bro",
-            "Service performance dropping dude",
-            "Monitor thinks something's up man",
-            "Health check showing problems bro",
-            "Watchdog's concerned about this one dude",
-            "Service not doing great man",
-            "Monitor flagging degradation bro"
-        ],
-        "chick": [
-            "OMG service health looking concerning hun!",
-            "Watchdog's like totally worried babe!",
-            "Service not performing well darling - yikes!",
-            "Monitor detected issues gorgeous - stressed!",
-            "Like the service is struggling sweetie!",
-            "Watchdog alert hun - not ideal!",
-            "Service health declining babe - concerned!",
-            "Monitor showing problems darling - worried!",
-            "OMG service not looking good hun!",
-            "Watchdog's sending warning vibes babe!",
-            "Service degrading gorgeous - panic mode!",
-            "Monitor alert sweetie - not loving this!",
-            "Like service health is dropping hun!",
-            "Watchdog concerned darling - attention needed!",
-            "Service struggling babe - red flags!",
-            "Monitor warning gorgeous - this is bad!",
-            "OMG service not doing well hun!",
-            "Watchdog's worried sweetie - crisis!",
-            "Service health declining babe - help!",
-            "Monitor alert darling - intervention needed!",
-            "Like service is degraded hun - scary!",
-            "Watchdog warning gorgeous - stressed!",
-            "Service issues detected babe - concerned!",
-            "Monitor showing problems sweetie - worried!",
-            "OMG service health warning hun - fix it!"
-        ],
-        "nerd": [
-            "Service health check: response time +340ms baseline",
-            "Watchdog threshold breach: 85% resource utilization",
-            "Monitoring alert: HTTP 503 rate increased 15%",
-            "Service degradation: memory consumption 92% capacity",
-            "Health metric anomaly: latency p95 exceeding SLA",
-            "Watchdog warning: CPU throttling detected",
-            "Alert triggered: error rate 3.2% above threshold",
-            "Service metrics: disk I/O wait time elevated",
-            "Health check failed 2/5 probes in 60s window",
-            "Monitoring threshold: connection pool 95% exhausted",
-            "Watchdog alert: GC pause times increasing",
-            "Service degradation: request timeout rate 8%",
-            "Health warning: database connection lag 450ms",
-            "Alert condition: cache hit rate dropped to 67%",
-            "Monitoring breach: thread pool queue depth 180",
-            "Watchdog concern: packet loss detected 2.1%",
-            "Service metrics: API response time degraded",
-            "Health check: keepalive failures increasing",
-            "Alert triggered: OOM warning threshold reached",
-            "Monitoring warning: SSL handshake delays detected",
-            "Watchdog alert: service restart loop detected",
-            "Health degradation: replica lag 15 seconds",
-            "Service metrics: connection refused rate elevated",
-            "Alert condition: circuit breaker half-open state",
-            "Monitoring threshold: rate limit approaching"
-        ],
-        "rager": [
-            "Shit - service starting to look bad",
-            "Watchdog's seeing problems goddammit",
-            "Service health declining - fucking concerns",
-            "Monitor showing issues - not good",
-            "Goddamn service acting up again",
-            "Watchdog alert - this shit's degrading",
-            "Service health problems starting",
-            "Monitor detecting issues - fuck",
-            "Health check showing warnings dammit",
-            "Watchdog's worried about this shit",
-            "Service degrading - goddamn problems",
-            "Monitor alert - fucking concerns here",
-            "Health metrics looking bad",
-            "Watchdog seeing degradation - shit",
-            "Service having problems goddammit",
-            "Monitor showing red flags - fuck",
-            "Health check not happy - concerns",
-            "Watchdog detecting issues dammit",
-            "Service performance dropping - shit",
-            "Monitor alert - fucking warning signs",
-            "Health degradation detected - goddammit",
-            "Watchdog concerned - not good",
-            "Service struggling - fucking problems",
-            "Monitor showing issues - dammit",
-            "Health warning - shit's degrading"
-        ],
-        "ops": [
-            "Service warning - status yellow",
-            "Monitor alert triggered",
-            "Watchdog threshold exceeded",
-            "Service degraded - investigating",
-            "Health check warning issued",
-            "Monitor threshold breach detected",
-            "Watchdog alert active",
-            "Service performance degraded",
-            "Health metrics below threshold",
-            "Monitor concern reported",
-            "Watchdog warning status",
-            "Service degradation detected",
-            "Health check anomaly found",
-            "Monitor alert status yellow",
-            "Watchdog threshold crossed",
-            "Service health declining",
-            "Health warning issued",
-            "Monitor degradation detected",
-            "Watchdog concern active",
-            "Service performance warning",
-            "Health check threshold breach",
-            "Monitor alert condition",
-            "Watchdog status yellow",
-            "Service degraded state",
-            "Health metrics warning"
-        ],
-        "tappit": [
-            "Eish bru, service not lekker",
-            "Watchdog worried hey china",
-            "Service degrading né boet - jislaaik",
-            "Monitor alert bru - not good",
-            "Health check concerning hey china",
-            "Watchdog seeing problems né bru",
-            "Service not sharp boet - eish",
-            "Monitor warning china - watch out",
-            "Health degraded bru - not lekker",
-            "Watchdog alert hey boet - careful",
-            "Service struggling né china",
-            "Monitor concern bru - jislaaik",
-            "Health check warning hey boet",
-            "Watchdog not happy china - eish",
-            "Service degrading né bru",
-            "Monitor alert boet - attention needed",
-            "Health declining china - not good",
-            "Watchdog worried bru - check it",
-            "Service issues hey boet - eish",
-            "Monitor warning né china",
-            "Health check alert bru - careful",
-            "Watchdog concern boet - jislaaik",
-            "Service not sharp china - watch",
-            "Monitor degraded hey bru",
-            "Health warning né boet - eish"
-        ],
-        "comedian": [
-            "Service health: aggressively mediocre",
-            "Watchdog detected the inevitable decline",
-            "Service degrading with predictable consistency",
-            "Monitor alert: surprise, it's getting worse",
-            "Health check: optimism not found",
-            "Watchdog warning: the plot thickens ominously",
-            "Service performing ironically poorly",
-            "Monitor concern: expectations lowering automatically",
-            "Health degradation: right on schedule",
-            "Watchdog alert: murphy's law strikes again",
-            "Service struggling: shocking absolutely no one",
-            "Monitor warning: the descent continues",
-            "Health check: disappointment levels rising",
-            "Watchdog concerned: as tradition demands",
-            "Service declining with artistic flair",
-            "Monitor alert: the universe laughs",
-            "Health degradation: perfectly predictable",
-            "Watchdog warning: chaos theory confirmed",
-            "Service performance: existentially concerning",
-            "Monitor concern: hope diminishes gracefully",
-            "Health check: reality sets in",
-            "Watchdog alert: the downward spiral begins",
-            "Service struggling: the saga continues",
-            "Monitor warning: expectations vs reality",
-            "Health declining: comedic timing impeccable"
-        ],
-        "action": [
-            "Service warning - condition yellow",
-            "Watchdog alert - tactical concern",
-            "Health degraded - monitoring situation",
-            "Monitor threshold breach - assessing threat",
-            "Service performance declining - standby",
-            "Watchdog warning - defensive posture",
-            "Health metrics degraded - evaluate options",
-            "Monitor alert - potential hostile",
-            "Service degradation - readiness increased",
-            "Watchdog concern - mission risk elevated",
-            "Health warning - prepare contingency",
-            "Monitor threshold exceeded - assess situation",
-            "Service declining - tactical awareness",
-            "Watchdog alert - threat assessment active",
-            "Health degraded - defensive protocols",
-            "Monitor warning - situation developing",
-            "Service performance degraded - standby orders",
-            "Watchdog concern - readiness condition 2",
-            "Health metrics warning - evaluate response",
-            "Monitor alert - tactical watch initiated",
-            "Service degradation detected - assess risk",
-            "Watchdog threshold - mission awareness",
-            "Health warning issued - standby status",
-            "Monitor concern - prepare for action",
-            "Service declining - tactical evaluation"
-        ],
-    },
-    ("sentinel", "failed"): {
-        "jarvis": [
-            "Critical service failure detected, sir - offline",
-            "Monitoring alert: service completely unavailable",
-            "Watchdog confirms service down - investigating",
-            "Service process terminated unexpectedly, sir",
-            "Critical failure - service non-responsive",
-            "Health check failure confirmed - service offline",
-            "Watchdog reports complete service outage, sir",
-            "Service down - no heartbeat detected",
-            "Critical monitoring alert - service unreachable",
-            "Complete service failure logged, sir",
-            "Watchdog timeout - service unresponsive",
-            "Service offline - connection refused",
-            "Critical health check failed - service down, sir",
-            "Monitoring confirms service termination",
-            "Watchdog detected hard failure - investigating",
-            "Service crashed - process not running, sir",
-            "Complete outage detected - service offline",
-            "Health monitoring reports service dead",
-            "Watchdog confirms critical failure, sir",
-            "Service unavailable - all probes failed",
-            "Critical alert - service completely down",
-            "Monitoring detected catastrophic failure, sir",
-            "Watchdog reports service terminated",
-            "Service down - emergency protocols engaged",
-            "Critical failure - service unreachable, sir"
-        ],
-        "dude": [
-            "Ahh man service is totally down",
-            "Service went offline dude - not good",
-            "Watchdog says service died bro",
-            "Service crashed hard man",
-            "Totally down - service isn't responding dude",
-            "Service went dark bro - completely offline",
-            "Watchdog detected full outage man",
-            "Service is dead dude - not coming back up",
-            "Completely offline bro - total failure",
-            "Service crashed and burned man",
-            "Watchdog reports service kaput dude",
-            "Service down hard bro - full outage",
-            "Not responding at all man - it's dead",
-            "Service completely offline dude",
-            "Watchdog says service flatlined bro",
-            "Total service failure man - it's gone",
-            "Service died on us dude - full crash",
-            "Completely unresponsive bro - service down",
-            "Watchdog confirms service is toast man",
-            "Service went offline completely dude",
-            "Full outage detected bro - service dead",
-            "Service crashed out man - not good",
-            "Totally down dude - no response",
-            "Watchdog reports service terminated bro",
-            "Service is offline man - complete failure"
-        ],
-        "chick": [
-            "OMG service is down babe - total crisis!",
-            "Service completely offline hun - emergency!",
-            "Watchdog says service died darling - panic!",
-            "OMG service crashed gorgeous - help!",
-            "Service is down sweetie - red alert!",
-            "Like service totally failed babe - scary!",
-            "OMG watchdog detected outage hun - stressed!",
-            "Service completely dead darling - crisis mode!",
-            "Like totally offline babe - disaster!",
-            "OMG service failed hard hun - emergency!",
-            "Watchdog reports service down gorgeous - help!",
-            "Service crashed sweetie - full panic!",
-            "Like completely unavailable babe - SOS!",
-            "OMG service is dead hun - intervention needed!",
-            "Watchdog says service offline darling - crisis!",
-            "Service failed completely gorgeous - scary!",
-            "OMG total outage detected babe - help!",
-            "Service completely crashed hun - emergency!",
-            "Like service is dead sweetie - panic!",
-            "OMG watchdog alert darling - service down!",
-            "Service totally offline babe - red alert!",
-            "Like complete failure hun - disaster!",
-            "OMG service crashed hard gorgeous - crisis!",
-            "Watchdog confirms service dead sweetie - help!",
-            "Service completely unavailable babe - emergency!"
-        ],
-        "nerd": [
-            "Service down: TCP connection refused port 8080",
-            "Critical failure: process exit code 137 (SIGKILL)",
-            "Health check failed: 10/10 probes timeout",
-            "Service unavailable: HTTP 503 for 300 seconds",
-            "Watchdog timeout: no response after 30s",
-            "Critical alert: service process PID not found",
-            "Connection refused: socket bind error on port",
-            "Service terminated: OOM killer triggered",
-            "Health probe failed: connection reset by peer",
-            "Critical failure: segmentation fault detected",
-            "Service down: DNS resolution failed NXDOMAIN",
-            "Process crashed: core dump generated",
-            "Health check: all endpoints returning 5xx",
-            "Service offline: kernel panic logged",
-            "Critical alert: deadlock detected - hung process",
-            "Connection timeout: SYN packets not ACKed",
-            "Service terminated: exception propagated uncaught",
-            "Health failure: TLS handshake refused",
-            "Critical down: process respawn limit reached",
-            "Service unavailable: database connection pool exhausted",
-            "Watchdog timeout: health endpoint unreachable",
-            "Process failure: fatal exception at 0x7fff",
-            "Service offline: port in use by zombie process",
-            "Critical alert: container exit code non-zero",
-            "Health check failed: SSL certificate invalid"
-        ],
-        "rager": [
-            "Service is completely fucked - dead",
-            "Goddamn service crashed hard - offline",
-            "Service fucking died - total failure",
-            "Christ service is down - not responding",
-            "Fucking service completely offline",
-            "Service crashed and burned - it's dead",
-            "Goddamn total outage - service fucked",
-            "Service is dead as fuck - not coming back",
-            "Fucking watchdog says service offline",
-            "Complete failure - service totally fucked",
-            "Goddamn service crashed out - dead",
-            "Service went down hard - fuck",
-            "Totally offline - service is fucked",
-            "Fucking complete outage - goddammit",
-            "Service died hard - total failure",
-            "Watchdog confirms service is fucked",
-            "Goddamn service completely dead",
-            "Service failed catastrophically - fuck",
-            "Totally down - service is broken",
-            "Fucking service crashed - it's gone",
-            "Complete disaster - service dead",
-            "Goddamn watchdog says service failed",
-            "Service is totally fucked - offline",
-            "Fucking crashed hard - complete failure",
-            "Service down - this is fucked"
-        ],
-        "ops": [
-            "Service failed - status red",
-            "Monitor critical alert",
-            "Watchdog service down",
-            "Service offline - investigating",
-            "Critical failure detected",
-            "Monitor service unavailable",
-            "Watchdog critical status",
-            "Service down - status red",
-            "Critical outage confirmed",
-            "Monitor failure alert",
-            "Watchdog service terminated",
-            "Service completely offline",
-            "Critical health check failed",
-            "Monitor service unreachable",
-            "Watchdog critical failure",
-            "Service down - no response",
-            "Critical monitoring alert",
-            "Monitor service crashed",
-            "Watchdog outage detected",
-            "Service unavailable - critical",
-            "Critical failure status",
-            "Monitor complete outage",
-            "Watchdog service dead",
-            "Service offline - red alert",
-            "Critical service down"
-        ],
-        "tappit": [
-            "Eish service is down bru - kak",
-            "Service offline hey china - jislaaik",
-            "Watchdog says service dead né boet",
-            "Service crashed bru - total kak",
-            "Completely down hey china - eish",
-            "Service failed né bru - not lekker",
-            "Watchdog reports outage boet - jislaaik",
-            "Service is kak china - totally down",
-            "Offline completely bru - eish man",
-            "Service dead hey boet - not good",
-            "Watchdog says service kak né china",
-            "Total failure bru - jislaaik hey",
-            "Service crashed hard boet - eish",
-            "Completely offline china - kak né",
-            "Watchdog confirms down bru - not lekker",
-            "Service is dead hey boet - jislaaik",
-            "Total outage china - eish bru",
-            "Service failed né boet - kak man",
-            "Watchdog reports offline hey china",
-            "Service completely down bru - eish",
-            "Critical failure boet - not lekker né",
-            "Service crashed china - jislaaik bru",
-            "Totally dead hey boet - kak",
-            "Watchdog says service offline né china",
-            "Service down bru - eish man"
-        ],
-        "comedian": [
-            "Service down: as Murphy's Law predicted",
-            "Critical failure: the universe's punchline delivered",
-            "Service offline: shocking absolutely no one",
-            "Watchdog reports: surprise, it died",
-            "Service crashed: right on schedule",
-            "Critical outage: expectations vs reality, chapter 847",
-            "Service down: the prophecy fulfilled",
-            "Failure detected: comedy and tragedy unite",
-            "Service offline: entropy wins again",
-            "Critical alert: hope has left the building",
-            "Service crashed: the plot twist nobody wanted",
-            "Outage confirmed: predictably catastrophic",
-            "Service down: the descent is complete",
-            "Watchdog reports: optimism.exe not found",
-            "Critical failure: the hits keep coming",
-            "Service offline: magnificent disaster achieved",
-            "Outage detected: murphy strikes with precision",
-            "Service crashed: reality bites hard",
-            "Critical down: the simulation is broken",
-            "Watchdog confirms: hope is not a strategy",
-            "Service failed: comedic timing perfect",
-            "Total outage: the universe's sense of humor",
-            "Service offline: chaos reigns supreme",
-            "Critical failure: expectations thoroughly crushed",
-            "Service down: the final curtain falls"
-        ],
-        "action": [
-            "Service down - condition red",
-            "Critical failure - mission compromised",
-            "Watchdog alert - service KIA",
-            "Target offline - status critical",
-            "Service failed - defensive protocols",
-            "Critical outage - emergency response",
-            "Watchdog confirms - service neutralized",
-            "Target down - mission impact critical",
-            "Service offline - fallback procedures",
-            "Critical failure - immediate action required",
-            "Watchdog reports - casualty confirmed",
-            "Service terminated - assess damage",
-            "Critical down - operational impact",
-            "Watchdog alert - service eliminated",
-            "Target failed - contingency activated",
-            "Service offline - emergency protocols",
-            "Critical outage - mission critical",
-            "Watchdog confirms - target lost",
-            "Service down - tactical response needed",
-            "Critical failure - threat level red",
-            "Watchdog reports - service terminated",
-            "Target offline - mission compromised",
-            "Service failed - immediate intervention",
-            "Critical down - all units respond",
-            "Watchdog alert - service casualty"
-        ],
-    },
-    ("sentinel", "completed"): {
-        "jarvis": [
-            "Service recovery complete - operational again, sir",
-            "Health check restored - service back online",
-            "Watchdog confirms service operational",
-            "Service monitoring resumed - all systems nominal, sir",
-            "Recovery successful - service responding normally",
-            "Health metrics restored - service functional",
-            "Watchdog reports service recovery complete, sir",
-            "Service back online - monitoring resumed",
-            "Health check passing - service operational again",
-            "Recovery confirmed - service responding, sir",
-            "Watchdog indicates service restored",
-            "Service operational - health checks green",
-            "Monitoring restored - service functioning normally, sir",
-            "Recovery complete - service back to nominal",
-            "Health status restored - watchdog satisfied",
-            "Service responding - recovery successful, sir",
-            "Watchdog confirms operational status",
-            "Service back online - monitoring active",
-            "Health restored - service functioning properly, sir",
-            "Recovery finalized - service operational",
-            "Watchdog reports service healthy again",
-            "Service restored - all checks passing, sir",
-            "Health monitoring green - service recovered",
-            "Watchdog indicates full recovery",
-            "Service operational - health nominal, sir"
-        ],
-        "dude": [
-            "Service is back up man - all good",
-            "Back online dude - running smooth again",
-            "Watchdog says service recovered bro",
-            "Service back and vibing man",
-            "All good again dude - service restored",
-            "Back online smooth bro - no problems",
-            "Watchdog confirms service is back man",
-            "Service recovered nicely dude",
-            "Running again bro - all restored",
-            "Back up and flowing man - sweet",
-            "Service online again dude - solid",
-            "Watchdog happy - service back bro",
-            "Recovered smooth man - all good",
-            "Service restored dude - vibing again",
-            "Back online bro - no more issues",
-            "Watchdog says all clear man",
-            "Service back up dude - cruising",
-            "Recovered nicely bro - flowing good",
-            "Back online man - service restored",
-            "Watchdog confirms recovery dude",
-            "Service operational again bro",
-            "Back up smooth man - all good",
-            "Restored successfully dude",
-            "Watchdog satisfied bro - service back",
-            "Service recovered man - vibing well"
-        ],
-        "chick": [
-            "OMG service is back babe - thank god!",
-            "Service restored hun - crisis averted!",
-            "Watchdog says service back darling - relief!",
-            "Service recovered gorgeous - yasss!",
-            "Back online sweetie - so happy!",
-            "OMG service is up again babe - living!",
-            "Restored beautifully hun - no more panic!",
-            "Service back darling - disaster over!",
-            "Watchdog confirms recovery gorgeous - relief!",
-            "Back online babe - thank goodness!",
-            "Service restored hun - breathing again!",
-            "OMG recovered perfectly sweetie - yasss!",
-            "Back up darling - crisis resolved!",
-            "Service operational babe - so glad!",
-            "Watchdog happy hun - service back!",
-            "Restored gorgeously sweetie - relief!",
-            "Service recovered darling - thank god!",
-            "Back online babe - panic over!",
-            "OMG service restored hun - living!",
-            "Watchdog confirms gorgeous - all good!",
-            "Service back sweetie - happy tears!",
-            "Recovered beautifully darling - yasss!",
-            "Back up babe - disaster averted!",
-            "Service operational hun - thank goodness!",
-            "Watchdog satisfied gorgeous - relief!"
-        ],
-        "nerd": [
-            "Service restored: health check 200 OK",
-            "Recovery complete: uptime 15 seconds",
-            "Watchdog satisfied: all probes passing",
-            "Service operational: response time nominal",
-            "Health check: TCP handshake successful",
-            "Recovery confirmed: process PID active",
-            "Service responding: HTTP 200 on /health",
-            "Watchdog cleared: metrics within bounds",
-            "Back online: connection pool refilled",
-            "Health restored: latency p95 acceptable",
-            "Service operational: error rate 0.0%",
-            "Recovery verified: SSL cert valid",
-            "Watchdog green: resource utilization normal",
-            "Service responding: API endpoints nominal",
-            "Health check: database connections stable",
-            "Recovery complete: circuit breaker closed",
-            "Service operational: cache warming complete",
-            "Watchdog satisfied: memory usage optimal",
-            "Back online: replica lag eliminated",
-            "Health restored: thread pool healthy",
-            "Service responding: DNS resolution working",
-            "Recovery confirmed: load balancer routing",
-            "Watchdog cleared: GC metrics normal",
-            "Service operational: keepalive active",
-            "Health check: all dependencies reachable"
-        ],
-        "rager": [
-            "Service back up finally - thank fuck",
-            "Recovered goddammit - back online",
-            "Watchdog says service restored - about time",
-            "Back up at last - fucking finally",
-            "Service operational again - thank christ",
-            "Recovered after all that shit",
-            "Watchdog confirms back - finally working",
-            "Service restored goddammit",
-            "Back online - quit being dead already",
-            "Recovered thank fuck - operational",
-            "Service back up - stopped being broken",
-            "Watchdog happy finally - back online",
-            "Restored at last goddammit",
-            "Service operational - fucking finally",
-            "Back up thank christ - working again",
-            "Recovered after forever - goddammit",
-            "Watchdog says restored - about damn time",
-            "Service back - stopped fucking around",
-            "Operational again finally - thank god",
-            "Recovered goddammit - back online",
-            "Service restored - quit dying",
-            "Back up at fucking last",
-            "Watchdog confirms - working finally",
-            "Service operational - thank fuck",
-            "Restored goddammit - back online"
-        ],
-        "ops": [
-            "Service restored - status green",
-            "Health check passed",
-            "Watchdog operational",
-            "Service online - monitoring resumed",
-            "Recovery complete - status green",
-            "Health metrics restored",
-            "Watchdog cleared - service operational",
-            "Service back online",
-            "Health check green - recovered",
-            "Monitor service restored",
-            "Watchdog satisfied - operational",
-            "Service functioning - status green",
-            "Health restored - monitoring active",
-            "Recovery confirmed - operational",
-            "Watchdog operational - status green",
-            "Service online - health green",
-            "Health check passed - restored",
-            "Monitor cleared - service operational",
-            "Watchdog green - recovery complete",
-            "Service restored - monitoring resumed",
-            "Health operational - status green",
-            "Recovery complete - watchdog satisfied",
-            "Service functioning - health restored",
-            "Watchdog operational - status nominal",
-            "Service online - recovery confirmed"
-        ],
-        "tappit": [
-            "Eish service back bru - lekker",
-            "Restored hey china - sharp sharp",
-            "Watchdog happy né boet - all good",
-            "Service operational bru - sorted",
-            "Back online hey china - lekker né",
-            "Recovered sharp bru - no more kak",
-            "Watchdog sorted boet - service back",
-            "Service restored china - all good hey",
-            "Back up né bru - lekker again",
-            "Operational boet - watchdog happy",
-            "Service back china - sharp né",
-            "Recovered bru - all sorted hey",
-            "Watchdog lekker boet - service up",
-            "Back online china - no more kak",
-            "Service operational né bru - sorted",
-            "Restored hey boet - lekker sharp",
-            "Watchdog satisfied china - all good",
-            "Service back bru - sharp né",
-            "Recovered lekker boet - operational",
-            "Back up china - watchdog happy hey",
-            "Service restored né bru - sorted",
-            "Operational boet - all lekker china",
-            "Watchdog cleared hey bru - sharp",
-            "Service back né boet - all good",
-            "Recovered china - lekker operational"
-        ],
-        "comedian": [
-            "Service recovered: optimism cautiously restored",
-            "Back online: murphy takes a coffee break",
-            "Watchdog satisfied: the simulation rebooted",
-            "Service operational: hope springs eternal (for now)",
-            "Recovery confirmed: chaos temporarily defeated",
-            "Health restored: the universe relents briefly",
-            "Service back: surprisingly not a drill",
-            "Watchdog happy: expectations exceeded shockingly",
-            "Back online: the downtime comedy concludes",
-            "Service operational: murphy's law postponed",
-            "Recovery complete: crisis averted ironically",
-            "Health restored: the plot twist we needed",
-            "Service back: hope has entered the chat",
-            "Watchdog cleared: optimism.dll restored",
-            "Back online: the descent reverses",
-            "Service operational: murphy takes the L",
-            "Recovery confirmed: reality.exe rebooted",
-            "Health restored: the comeback story",
-            "Service back: chaos admits defeat temporarily",
-            "Watchdog satisfied: expectations vs reality aligns",
-            "Back online: the redemption arc begins",
-            "Service operational: murphy's law glitches",
-            "Recovery complete: hope levels rising",
-            "Health restored: the universe apologizes",
-            "Service back: optimism cautiously returns"
-        ],
-        "action": [
-            "Service restored - condition green",
-            "Recovery complete - mission nominal",
-            "Watchdog cleared - target operational",
-            "Service online - all clear",
-            "Health restored - tactical green",
-            "Recovery confirmed - mission success",
-            "Watchdog satisfied - target secured",
-            "Service operational - status green",
-            "Health green - recovery mission complete",
-            "Watchdog cleared - objective achieved",
-            "Service restored - all systems go",
-            "Recovery successful - target operational",
-            "Health nominal - watchdog satisfied",
-            "Service online - mission accomplished",
-            "Recovery complete - status green",
-            "Watchdog operational - target secured",
-            "Service restored - tactical success",
-            "Health cleared - recovery confirmed",
-            "Watchdog satisfied - operational status",
-            "Service back - mission green",
-            "Recovery finalized - all clear",
-            "Health operational - watchdog cleared",
-            "Service online - objective complete",
-            "Recovery confirmed - tactical green",
-            "Watchdog cleared - mission success"
-        ],
-    },
-    ("jarvis", "completed"): {
-        "jarvis": ["AI processing complete", "LLM generation successful", "Intelligence task finished", "Analysis complete"],
-        "dude": ["AI processing smooth", "LLM generated nice", "Intelligence task easy", "Analysis flowing done"],
-        "chick": ["AI processed beautifully", "LLM generated perfectly", "Intelligence task gorgeous", "Analysis fab"],
-        "nerd": ["LLM inference complete", "Token generation nominal", "Model execution successful", "Neural processing done"],
-        "rager": ["AI finally done", "LLM generated", "Intelligence task finished", "Analysis complete"],
-        "ops": ["AI complete", "LLM generated", "Intelligence done", "Analysis finished"],
-        "tappit": ["AI done bru", "LLM sorted hey", "Intelligence lekker", "Analysis sharp né"],
-        "comedian": ["AI surprisingly intelligent", "LLM unexpectedly coherent", "Intelligence miraculously complete", "Analysis shockingly useful"],
-        "action": ["AI mission complete", "LLM deployed", "Intelligence secured", "Analysis operational"],
-    },
-    ("jarvis", "failed"): {
-        "jarvis": ["AI processing error", "LLM generation failed", "Intelligence task interrupted", "Analysis error"],
-        "dude": ["AI hit issues", "LLM generation stuck", "Intelligence task problems", "Analysis failed"],
-        "chick": ["AI needs attention", "LLM generation failed", "Intelligence task struggling", "Analysis not working"],
-        "nerd": ["LLM inference timeout", "Token generation error", "Model execution failed", "Neural processing crashed"],
-        "rager": ["AI is fucked", "LLM generation broken", "Intelligence task failed", "Analysis shit"],
-        "ops": ["AI failed", "LLM error", "Intelligence incomplete", "Analysis failed"],
-        "tappit": ["AI kak bru", "LLM broken hey", "Intelligence failed né", "Analysis not lekker"],
-        "comedian": ["AI dramatically failed", "LLM plot twist", "Intelligence ironically stupid", "Analysis unexpectedly useless"],
-        "action": ["AI compromised", "LLM breach", "Intelligence mission failed", "Analysis critical"],
-    },
-    
-    # Storage responses
-    ("storage", "completed"): {
-        "jarvis": ["Storage operations complete", "Volume management successful", "Disk operations finished", "Storage pool synchronized"],
-        "dude": ["Storage cruising smooth", "Volumes flowing nice", "Disks all good", "Storage vibing well"],
-        "chick": ["Storage running beautifully", "Volumes looking perfect", "Disks gorgeous", "Storage fab"],
-        "nerd": ["Filesystem mounted successfully", "RAID array synchronized", "Volume integrity verified", "Disk I/O nominal"],
-        "rager": ["Storage finally done", "Volumes working", "Disks operational", "Storage complete"],
-        "ops": ["Storage operational", "Volumes mounted", "Disk operations complete", "Storage ready"],
-        "tappit": ["Storage lekker bru", "Volumes sorted hey", "Disks sharp né", "Storage all good"],
-        "comedian": ["Storage surprisingly functional", "Volumes unexpectedly stable", "Disks shockingly reliable", "Storage miraculously working"],
-        "action": ["Storage secured", "Volume mission complete", "Disk operations successful", "Storage tactical green"],
-    },
-    ("storage", "warning"): {
-        "jarvis": ["Storage capacity warning", "Disk space threshold exceeded", "Volume usage high", "Storage degradation detected"],
-        "dude": ["Storage getting tight", "Disk space low man", "Volumes filling up", "Storage concerning"],
-        "chick": ["Storage needs attention", "Disk space running low", "Volumes getting full", "Storage warning"],
-        "nerd": ["Filesystem utilization high", "RAID degradation detected", "Disk SMART warning", "Storage threshold breach"],
-        "rager": ["Storage filling up", "Disk space low", "Volumes getting full", "Storage problems"],
-        "ops": ["Storage warning", "Disk space low", "Volume usage high", "Storage threshold exceeded"],
-        "tappit": ["Storage warning bru", "Disk space low hey", "Volumes filling né", "Storage concerning"],
-        "comedian": ["Storage dramatically filling", "Disk space ironically limited", "Volumes surprisingly full", "Storage predictably concerning"],
-        "action": ["Storage threat detected", "Disk capacity warning", "Volume alert issued", "Storage caution advised"],
-    },
-    ("storage", "failed"): {
-        "jarvis": ["Storage failure detected", "Volume mount error", "Disk operation failed", "Storage pool offline"],
-        "dude": ["Storage hit issues", "Volume mount problems", "Disks not flowing", "Storage down"],
-        "chick": ["Storage needs immediate attention", "Volume failed", "Disks struggling", "Storage critical"],
-        "nerd": ["Filesystem corruption detected", "RAID array failed", "Disk hardware failure", "Mount point unavailable"],
-        "rager": ["Storage is fucked", "Volume mount broken", "Disks dead", "Storage shit the bed"],
-        "ops": ["Storage failed", "Volume error", "Disk failure", "Storage offline"],
-        "tappit": ["Storage kak bru", "Volume broken hey", "Disks failed né", "Storage down"],
-        "comedian": ["Storage dramatically failed", "Volume plot twist", "Disks unexpectedly dead", "Storage ironically unavailable"],
-        "action": ["Storage compromised", "Volume breach", "Disk mission critical", "Storage threat active"],
-    },
-    
-    # System update/apt responses
-    ("automation", "updated"): {
-        "jarvis": ["System updates installed", "Package upgrades complete", "Security patches applied", "System refresh finished"],
-        "dude": ["System updated smooth", "Packages upgraded easy", "Updates flowing done", "System refreshed nice"],
-        "chick": ["System updated beautifully", "Packages upgraded perfectly", "Updates gorgeous", "System refreshed fab"],
-        "nerd": ["APT cache updated", "Package dependencies resolved", "System kernel patched", "Repository metadata synced"],
-        "rager": ["System finally updated", "Packages upgraded", "Updates done", "System patched"],
-        "ops": ["System updated", "Packages upgraded", "Updates applied", "System current"],
-        "tappit": ["System updated bru", "Packages sorted hey", "Updates lekker né", "System fresh"],
-        "comedian": ["System surprisingly updated", "Packages unexpectedly current", "Updates miraculously applied", "System shockingly patched"],
-        "action": ["System secured", "Packages deployed", "Updates executed", "System hardened"],
-    },
-    
-    # Proxmox responses
-    ("proxmox", "completed"): {
-        "jarvis": ["Proxmox operations complete", "Hypervisor tasks finished", "VM management successful", "Cluster operations nominal"],
-        "dude": ["Proxmox cruising smooth", "VMs vibing nice", "Hypervisor flowing easy", "Cluster all good"],
-        "chick": ["Proxmox running beautifully", "VMs looking perfect", "Hypervisor gorgeous", "Cluster fab"],
-        "nerd": ["VM state synchronized", "QEMU processes nominal", "Cluster quorum achieved", "ZFS pool healthy"],
-        "rager": ["Proxmox finally done", "VMs working", "Hypervisor operational", "Cluster running"],
-        "ops": ["Proxmox operational", "VMs running", "Hypervisor active", "Cluster stable"],
-        "tappit": ["Proxmox lekker bru", "VMs sorted hey", "Hypervisor sharp né", "Cluster good"],
-        "comedian": ["Proxmox surprisingly functional", "VMs unexpectedly stable", "Hypervisor shockingly working", "Cluster miraculously synchronized"],
-        "action": ["Proxmox secured", "VM mission complete", "Hypervisor operational", "Cluster tactical green"],
-    },
-    ("proxmox", "failed"): {
-        "jarvis": ["Proxmox error detected", "Hypervisor failure", "VM management error", "Cluster node offline"],
-        "dude": ["Proxmox hit issues", "VMs having problems", "Hypervisor not flowing", "Cluster down"],
-        "chick": ["Proxmox needs attention", "VMs struggling", "Hypervisor failed", "Cluster offline"],
-        "nerd": ["VM migration failed", "QEMU process crashed", "Cluster quorum lost", "Storage backend timeout"],
-        "rager": ["Proxmox is fucked", "VMs broken", "Hypervisor dead", "Cluster shit the bed"],
-        "ops": ["Proxmox error", "VM failure", "Hypervisor down", "Cluster offline"],
-        "tappit": ["Proxmox kak bru", "VMs broken hey", "Hypervisor failed né", "Cluster down"],
-        "comedian": ["Proxmox dramatically failed", "VMs plot twist", "Hypervisor unexpectedly dead", "Cluster ironically offline"],
-        "action": ["Proxmox compromised", "VM threat detected", "Hypervisor breach", "Cluster mission critical"],
-    },
-    
-    # Unraid responses
-    ("unraid", "completed"): {
-        "jarvis": ["Unraid operations complete", "Array management successful", "Parity check finished", "Storage pool operational"],
-        "dude": ["Unraid cruising smooth", "Array vibing nice", "Parity flowing good", "Storage all set"],
-        "chick": ["Unraid running beautifully", "Array looking perfect", "Parity gorgeous", "Storage fab"],
-        "nerd": ["Array state synchronized", "Parity verification successful", "Disk spin-up complete", "Cache pool healthy"],
-        "rager": ["Unraid finally done", "Array working", "Parity complete", "Storage operational"],
-        "ops": ["Unraid operational", "Array running", "Parity verified", "Storage ready"],
-        "tappit": ["Unraid lekker bru", "Array sorted hey", "Parity sharp né", "Storage good"],
-        "comedian": ["Unraid surprisingly functional", "Array unexpectedly stable", "Parity shockingly valid", "Storage miraculously working"],
-        "action": ["Unraid secured", "Array mission complete", "Parity verified", "Storage tactical green"],
-    },
-    ("unraid", "warning"): {
-        "jarvis": ["Unraid warning detected", "Array status degraded", "Parity concern noted", "Disk health warning"],
-        "dude": ["Unraid showing concerns", "Array not perfect", "Parity issues", "Disk warning"],
-        "chick": ["Unraid needs attention", "Array warning", "Parity concerns", "Disk health alert"],
-        "nerd": ["Array disk SMART warning", "Parity sync errors detected", "Cache pool degraded", "Temperature threshold exceeded"],
-        "rager": ["Unraid showing problems", "Array warnings", "Parity issues", "Disk alerts"],
-        "ops": ["Unraid warning", "Array degraded", "Parity alert", "Disk warning"],
-        "tappit": ["Unraid warning bru", "Array concerning hey", "Parity alert né", "Disk warning"],
-        "comedian": ["Unraid dramatically warning", "Array ironically degraded", "Parity surprisingly concerned", "Disk predictably alerting"],
-        "action": ["Unraid threat detected", "Array caution advised", "Parity alert issued", "Disk warning active"],
-    },
-    ("unraid", "failed"): {
-        "jarvis": ["Unraid failure detected", "Array offline", "Parity check failed", "Disk failure critical"],
-        "dude": ["Unraid hit problems", "Array down", "Parity failed", "Disk issues"],
-        "chick": ["Unraid needs immediate attention", "Array failed", "Parity error", "Disk failure"],
-        "nerd": ["Array mount failure", "Parity validation error", "Disk hardware failure detected", "Filesystem corruption"],
-        "rager": ["Unraid is fucked", "Array dead", "Parity failed hard", "Disk shit the bed"],
-        "ops": ["Unraid failed", "Array offline", "Parity error", "Disk failure"],
-        "tappit": ["Unraid kak bru", "Array down hey", "Parity failed né", "Disk broken"],
-        "comedian": ["Unraid dramatically failed", "Array plot twist", "Parity unexpectedly invalid", "Disk ironically dead"],
-        "action": ["Unraid compromised", "Array breach detected", "Parity mission critical", "Disk failure confirmed"],
-    },
-    
-    # LXC responses
-    ("lxc", "completed"): {
-        "jarvis": ["Container operations complete", "LXC management successful", "Container deployment finished", "System container operational"],
-        "dude": ["LXC cruising smooth", "Containers vibing nice", "Deployment flowing easy", "LXC all good"],
-        "chick": ["LXC running beautifully", "Containers looking perfect", "Deployment gorgeous", "LXC fab"],
-        "nerd": ["Container state nominal", "LXC namespace isolated", "Cgroups configured correctly", "Container networking active"],
-        "rager": ["LXC finally done", "Containers working", "Deployment complete", "LXC operational"],
-        "ops": ["LXC operational", "Containers running", "Deployment complete", "LXC ready"],
-        "tappit": ["LXC lekker bru", "Containers sorted hey", "Deployment sharp né", "LXC good"],
-        "comedian": ["LXC surprisingly functional", "Containers unexpectedly stable", "Deployment shockingly successful", "LXC miraculously working"],
-        "action": ["LXC secured", "Container mission complete", "Deployment successful", "LXC tactical green"],
-    },
-    ("lxc", "failed"): {
-        "jarvis": ["Container failure detected", "LXC management error", "Container deployment failed", "System container offline"],
-        "dude": ["LXC hit issues", "Containers having problems", "Deployment stuck", "LXC down"],
-        "chick": ["LXC needs attention", "Containers struggling", "Deployment failed", "LXC offline"],
-        "nerd": ["Container start failure", "LXC namespace conflict", "Cgroup resource exhausted", "Container network timeout"],
-        "rager": ["LXC is fucked", "Containers broken", "Deployment failed", "LXC dead"],
-        "ops": ["LXC error", "Container failure", "Deployment failed", "LXC offline"],
-        "tappit": ["LXC kak bru", "Containers broken hey", "Deployment failed né", "LXC down"],
-        "comedian": ["LXC dramatically failed", "Containers plot twist", "Deployment unexpectedly broken", "LXC ironically dead"],
-        "action": ["LXC compromised", "Container threat detected", "Deployment breach", "LXC mission critical"],
-    },
-    
-    # Bazarr responses
-    ("bazarr", "completed"): {
-        "jarvis": ["Subtitle acquisition complete", "Caption download successful", "Subtitle sync finished", "Language track added"],
-        "dude": ["Subtitles downloaded smooth", "Captions vibing in nice", "Subs flowing good", "Subtitles all set"],
-        "chick": ["Subtitles downloaded beautifully", "Captions arrived perfectly", "Subs looking gorgeous", "Subtitles fab"],
-        "nerd": ["Subtitle metadata parsed", "Caption timing validated", "SRT format verified", "Subtitle encoding confirmed"],
-        "rager": ["Subtitles finally downloaded", "Captions arrived", "Subs done", "Subtitles downloaded"],
-        "ops": ["Subtitle download complete", "Captions acquired", "Subs delivered", "Subtitle received"],
-        "tappit": ["Subtitles downloaded bru", "Captions sorted hey", "Subs lekker né", "Subtitles sharp"],
-        "comedian": ["Subtitles surprisingly downloaded", "Captions unexpectedly arrived", "Subs miraculously synced", "Subtitles shockingly accurate"],
-        "action": ["Subtitles secured", "Caption mission complete", "Subs acquired", "Subtitle extracted"],
-    },
-    
-    # Cleanuperr responses
-    ("cleanuperr", "completed"): {
-        "jarvis": ["Media cleanup complete", "File organization successful", "Library maintenance finished", "Cleanup operation done"],
-        "dude": ["Cleanup cruising done", "Files organized smooth", "Library flowing clean", "Cleanup all good"],
-        "chick": ["Cleanup completed beautifully", "Files organized perfectly", "Library looking gorgeous", "Cleanup fab"],
-        "nerd": ["File system optimization complete", "Duplicate detection nominal", "Cleanup algorithm successful", "Library indexed"],
-        "rager": ["Cleanup finally done", "Files organized", "Library cleaned", "Cleanup finished"],
-        "ops": ["Cleanup complete", "Files organized", "Library maintained", "Cleanup done"],
-        "tappit": ["Cleanup done bru", "Files sorted hey", "Library lekker né", "Cleanup sharp"],
-        "comedian": ["Cleanup surprisingly thorough", "Files unexpectedly organized", "Library miraculously clean", "Cleanup shockingly successful"],
-        "action": ["Cleanup secured", "File organization complete", "Library mission successful", "Cleanup executed"],
-    },
-    
-    # Huntarr responses
-    ("huntarr", "completed"): {
-        "jarvis": ["Content search complete", "Media discovery successful", "Search operation finished", "Content located"],
-        "dude": ["Search cruising done", "Content found smooth", "Discovery flowing nice", "Search all good"],
-        "chick": ["Search completed beautifully", "Content found perfectly", "Discovery gorgeous", "Search fab"],
-        "nerd": ["Search algorithm complete", "Content metadata indexed", "Discovery query successful", "Search results validated"],
-        "rager": ["Search finally done", "Content found", "Discovery complete", "Search finished"],
-        "ops": ["Search complete", "Content discovered", "Search finished", "Content located"],
-        "tappit": ["Search done bru", "Content found hey", "Discovery lekker né", "Search sharp"],
-        "comedian": ["Search surprisingly successful", "Content unexpectedly found", "Discovery miraculously complete", "Search shockingly effective"],
-        "action": ["Search mission complete", "Content located", "Discovery successful", "Search secured"],
-    },
-    
-    # qBittorrent responses
-    ("qbittorrent", "completed"): {
-        "jarvis": ["Torrent download complete", "P2P transfer successful", "Seeding commenced", "Download finalized"],
-        "dude": ["Torrent downloaded smooth", "P2P flowing done", "Seeding vibing nice", "Download all good"],
-        "chick": ["Torrent completed beautifully", "P2P transfer perfect", "Seeding gorgeous", "Download fab"],
-        "nerd": ["Torrent hash verified", "Peer swarm optimal", "Download ratio maintained", "Seed ratio nominal"],
-        "rager": ["Torrent finally done", "P2P finished", "Seeding started", "Download complete"],
-        "ops": ["Torrent complete", "P2P transfer done", "Seeding active", "Download finished"],
-        "tappit": ["Torrent done bru", "P2P sorted hey", "Seeding lekker né", "Download sharp"],
-        "comedian": ["Torrent surprisingly complete", "P2P unexpectedly successful", "Seeding miraculously active", "Download shockingly done"],
-        "action": ["Torrent secured", "P2P mission complete", "Seeding operational", "Download extracted"],
-    },
-    ("qbittorrent", "failed"): {
-        "jarvis": ["Torrent download failed", "P2P transfer error", "Seeding interrupted", "Download incomplete"],
-        "dude": ["Torrent hit issues", "P2P stuck", "Seeding problems", "Download failed"],
-        "chick": ["Torrent needs attention", "P2P struggling", "Seeding failed", "Download incomplete"],
-        "nerd": ["Torrent tracker timeout", "Peer connection failed", "Download stalled", "Seed ratio insufficient"],
-        "rager": ["Torrent is fucked", "P2P broken", "Seeding dead", "Download failed"],
-        "ops": ["Torrent failed", "P2P error", "Seeding stopped", "Download incomplete"],
-        "tappit": ["Torrent kak bru", "P2P broken hey", "Seeding failed né", "Download not lekker"],
-        "comedian": ["Torrent dramatically failed", "P2P plot twist", "Seeding unexpectedly dead", "Download ironically incomplete"],
-        "action": ["Torrent compromised", "P2P breach", "Seeding mission failed", "Download critical"],
-    },
-    
-    # Deluge responses
-    ("deluge", "completed"): {
-        "jarvis": ["Torrent download complete", "Transfer successful", "Seeding active", "Download finalized"],
-        "dude": ["Deluge downloaded smooth", "Transfer flowing done", "Seeding vibing", "Download all good"],
-        "chick": ["Deluge completed beautifully", "Transfer perfect", "Seeding gorgeous", "Download fab"],
-        "nerd": ["Torrent verification complete", "Peer swarm connected", "Download bandwidth optimal", "Seed queue active"],
-        "rager": ["Deluge finally done", "Transfer finished", "Seeding started", "Download complete"],
-        "ops": ["Deluge complete", "Transfer done", "Seeding active", "Download finished"],
-        "tappit": ["Deluge done bru", "Transfer sorted hey", "Seeding lekker né", "Download sharp"],
-        "comedian": ["Deluge surprisingly complete", "Transfer unexpectedly done", "Seeding miraculously active", "Download shockingly successful"],
-        "action": ["Deluge secured", "Transfer complete", "Seeding operational", "Download mission done"],
-    },
-    
-    # SABnzbd responses
-    ("sabnzbd", "completed"): {
-        "jarvis": ["Usenet download complete", "NZB processing successful", "Article extraction finished", "Download verified"],
-        "dude": ["SAB downloaded smooth", "NZB flowing done", "Usenet vibing complete", "Download all good"],
-        "chick": ["SAB completed beautifully", "NZB processed perfectly", "Usenet gorgeous", "Download fab"],
-        "nerd": ["NZB par2 verified", "Article assembly complete", "Usenet connection optimal", "Download CRC validated"],
-        "rager": ["SAB finally done", "NZB finished", "Usenet complete", "Download done"],
-        "ops": ["SAB complete", "NZB processed", "Usenet finished", "Download done"],
-        "tappit": ["SAB done bru", "NZB sorted hey", "Usenet lekker né", "Download sharp"],
-        "comedian": ["SAB surprisingly complete", "NZB unexpectedly processed", "Usenet miraculously done", "Download shockingly verified"],
-        "action": ["SAB secured", "NZB mission complete", "Usenet extracted", "Download operational"],
-    },
-    ("sabnzbd", "failed"): {
-        "jarvis": ["Usenet download failed", "NZB processing error", "Article extraction incomplete", "Download failed verification"],
-        "dude": ["SAB hit issues", "NZB stuck", "Usenet problems", "Download failed"],
-        "chick": ["SAB needs attention", "NZB struggling", "Usenet failed", "Download incomplete"],
-        "nerd": ["NZB par2 repair failed", "Article incomplete", "Usenet connection timeout", "Download CRC mismatch"],
-        "rager": ["SAB is fucked", "NZB broken", "Usenet failed", "Download dead"],
-        "ops": ["SAB failed", "NZB error", "Usenet incomplete", "Download failed"],
-        "tappit": ["SAB kak bru", "NZB broken hey", "Usenet failed né", "Download not lekker"],
-        "comedian": ["SAB dramatically failed", "NZB plot twist", "Usenet unexpectedly incomplete", "Download ironically broken"],
-        "action": ["SAB compromised", "NZB breach", "Usenet mission failed", "Download critical"],
-    },
-    
-    # Speedtest responses
-    ("speedtest", "completed"): {
-        "jarvis": ["Speed test complete", "Bandwidth measurement successful", "Network performance assessed", "Connection speed verified"],
-        "dude": ["Speedtest cruising done", "Bandwidth flowing measured", "Speed check smooth", "Connection tested good"],
-        "chick": ["Speedtest completed beautifully", "Bandwidth measured perfectly", "Speed check gorgeous", "Connection fab"],
-        "nerd": ["Throughput metrics nominal", "Latency within tolerances", "Jitter minimal", "Packet loss zero percent"],
-        "rager": ["Speedtest finally done", "Bandwidth measured", "Speed checked", "Connection tested"],
-        "ops": ["Speedtest complete", "Bandwidth measured", "Speed verified", "Connection tested"],
-        "tappit": ["Speedtest done bru", "Bandwidth sorted hey", "Speed lekker né", "Connection sharp"],
-        "comedian": ["Speedtest surprisingly accurate", "Bandwidth unexpectedly measured", "Speed miraculously tested", "Connection shockingly fast"],
-        "action": ["Speedtest secured", "Bandwidth mission complete", "Speed verified", "Connection operational"],
-    },
-    
-    # Plex responses
-    ("plex", "completed"): {
-        "jarvis": ["Plex operation complete", "Media server synchronized", "Library scan finished", "Streaming ready"],
-        "dude": ["Plex cruising smooth", "Media server vibing", "Library flowing done", "Streaming all good"],
-        "chick": ["Plex running beautifully", "Media server perfect", "Library gorgeous", "Streaming fab"],
-        "nerd": ["Plex database indexed", "Metadata agents complete", "Transcoding profiles optimal", "Stream bandwidth allocated"],
-        "rager": ["Plex finally done", "Media server working", "Library scanned", "Streaming ready"],
-        "ops": ["Plex operational", "Media server ready", "Library updated", "Streaming active"],
-        "tappit": ["Plex lekker bru", "Media server sorted hey", "Library sharp né", "Streaming good"],
-        "comedian": ["Plex surprisingly functional", "Media server unexpectedly working", "Library miraculously complete", "Streaming shockingly smooth"],
-        "action": ["Plex secured", "Media server operational", "Library mission complete", "Streaming deployed"],
-    },
-    
-    # Emby responses
-    ("emby", "completed"): {
-        "jarvis": ["Emby operation complete", "Media server synchronized", "Library scan finished", "Streaming ready"],
-        "dude": ["Emby cruising smooth", "Media server vibing", "Library flowing done", "Streaming all good"],
-        "chick": ["Emby running beautifully", "Media server perfect", "Library gorgeous", "Streaming fab"],
-        "nerd": ["Emby database indexed", "Metadata providers complete", "Transcoding optimal", "Stream delivery ready"],
-        "rager": ["Emby finally done", "Media server working", "Library scanned", "Streaming ready"],
-        "ops": ["Emby operational", "Media server ready", "Library updated", "Streaming active"],
-        "tappit": ["Emby lekker bru", "Media server sorted hey", "Library sharp né", "Streaming good"],
-        "comedian": ["Emby surprisingly functional", "Media server unexpectedly working", "Library miraculously complete", "Streaming shockingly smooth"],
-        "action": ["Emby secured", "Media server operational", "Library mission complete", "Streaming deployed"],
-    },
-    
-    # Jellyfin responses
-    ("jellyfin", "completed"): {
-        "jarvis": ["Jellyfin operation complete", "Media server synchronized", "Library scan finished", "Streaming ready"],
-        "dude": ["Jellyfin cruising smooth", "Media server vibing", "Library flowing done", "Streaming all good"],
-        "chick": ["Jellyfin running beautifully", "Media server perfect", "Library gorgeous", "Streaming fab"],
-        "nerd": ["Jellyfin database indexed", "Metadata scrapers complete", "Transcoding profiles active", "Stream protocols ready"],
-        "rager": ["Jellyfin finally done", "Media server working", "Library scanned", "Streaming ready"],
-        "ops": ["Jellyfin operational", "Media server ready", "Library updated", "Streaming active"],
-        "tappit": ["Jellyfin lekker bru", "Media server sorted hey", "Library sharp né", "Streaming good"],
-        "comedian": ["Jellyfin surprisingly functional", "Media server unexpectedly working", "Library miraculously complete", "Streaming shockingly smooth"],
-        "action": ["Jellyfin secured", "Media server operational", "Library mission complete", "Streaming deployed"],
-    },
-    
-    # Traefik responses
-    ("traefik", "completed"): {
-        "jarvis": ["Traefik routing operational", "Reverse proxy configured", "Load balancing active", "SSL termination ready"],
-        "dude": ["Traefik routing smooth", "Proxy flowing nice", "Load balancing good", "SSL cruising"],
-        "chick": ["Traefik running beautifully", "Proxy configured perfectly", "Load balancing gorgeous", "SSL fab"],
-        "nerd": ["Traefik middleware applied", "Dynamic routing active", "Certificate resolver operational", "Backend health optimal"],
-        "rager": ["Traefik finally working", "Proxy configured", "Load balancing active", "SSL ready"],
-        "ops": ["Traefik operational", "Proxy configured", "Load balancing active", "SSL ready"],
-        "tappit": ["Traefik lekker bru", "Proxy sorted hey", "Load balancing sharp né", "SSL good"],
-        "comedian": ["Traefik surprisingly routing", "Proxy unexpectedly working", "Load balancing miraculously balanced", "SSL shockingly secure"],
-        "action": ["Traefik secured", "Proxy mission complete", "Load balancing deployed", "SSL operational"],
-    },
-    ("traefik", "failed"): {
-        "jarvis": ["Traefik routing failure", "Reverse proxy error", "Load balancing failed", "SSL termination error"],
-        "dude": ["Traefik having issues", "Proxy stuck", "Load balancing problems", "SSL failed"],
-        "chick": ["Traefik needs attention", "Proxy struggling", "Load balancing failed", "SSL error"],
-        "nerd": ["Traefik middleware error", "Dynamic routing failed", "Certificate resolver timeout", "Backend unreachable"],
-        "rager": ["Traefik is fucked", "Proxy broken", "Load balancing dead", "SSL failed"],
-        "ops": ["Traefik error", "Proxy failed", "Load balancing down", "SSL error"],
-        "tappit": ["Traefik kak bru", "Proxy broken hey", "Load balancing failed né", "SSL not lekker"],
-        "comedian": ["Traefik dramatically failed", "Proxy plot twist", "Load balancing ironically unbalanced", "SSL unexpectedly insecure"],
-        "action": ["Traefik compromised", "Proxy breach", "Load balancing mission failed", "SSL threat"],
-    },
-    
-    # Nginx responses
-    ("nginx", "completed"): {
-        "jarvis": ["Nginx configuration applied", "Web server operational", "Proxy pass active", "SSL certificates loaded"],
-        "dude": ["Nginx cruising smooth", "Web server vibing", "Proxy flowing nice", "SSL all good"],
-        "chick": ["Nginx running beautifully", "Web server perfect", "Proxy gorgeous", "SSL fab"],
-        "nerd": ["Nginx worker processes spawned", "Configuration syntax valid", "Upstream servers healthy", "SSL session cache optimal"],
-        "rager": ["Nginx finally working", "Web server running", "Proxy active", "SSL loaded"],
-        "ops": ["Nginx operational", "Web server running", "Proxy active", "SSL configured"],
-        "tappit": ["Nginx lekker bru", "Web server sorted hey", "Proxy sharp né", "SSL good"],
-        "comedian": ["Nginx surprisingly stable", "Web server unexpectedly fast", "Proxy miraculously working", "SSL shockingly valid"],
-        "action": ["Nginx secured", "Web server deployed", "Proxy operational", "SSL mission complete"],
-    },
-    
-    # Portainer responses
-    ("portainer", "completed"): {
-        "jarvis": ["Container management operational", "Docker orchestration ready", "Stack deployment successful", "Container monitoring active"],
-        "dude": ["Portainer cruising smooth", "Containers managed nice", "Stack deployed easy", "Monitoring vibing"],
-        "chick": ["Portainer running beautifully", "Containers managed perfectly", "Stack gorgeous", "Monitoring fab"],
-        "nerd": ["Portainer API responsive", "Container state synchronized", "Stack compose validated", "Resource metrics collected"],
-        "rager": ["Portainer finally working", "Containers managed", "Stack deployed", "Monitoring active"],
-        "ops": ["Portainer operational", "Container management ready", "Stack deployed", "Monitoring active"],
-        "tappit": ["Portainer lekker bru", "Containers sorted hey", "Stack sharp né", "Monitoring good"],
-        "comedian": ["Portainer surprisingly functional", "Containers unexpectedly managed", "Stack miraculously deployed", "Monitoring shockingly useful"],
-        "action": ["Portainer secured", "Container management operational", "Stack mission complete", "Monitoring deployed"],
-    },
-    
-    # Uptime Kuma responses
-    ("uptime-kuma", "warning"): {
-        "jarvis": ["Uptime monitoring alert", "Service availability degraded", "Health check warning", "Monitoring threshold exceeded"],
-        "dude": ["Kuma seeing issues", "Service having problems", "Health check concerned", "Monitoring worried"],
-        "chick": ["Kuma alerting", "Service needs attention", "Health check warning", "Monitoring concerned"],
-        "nerd": ["Uptime SLA breach detected", "Ping response degraded", "HTTP status code anomaly", "Certificate expiration warning"],
-        "rager": ["Kuma showing problems", "Service degraded", "Health check warnings", "Monitoring alerts"],
-        "ops": ["Uptime alert", "Service degraded", "Health warning", "Monitoring threshold exceeded"],
-        "tappit": ["Kuma warning bru", "Service not lekker", "Health check concerned hey", "Monitoring alert né"],
-        "comedian": ["Kuma dramatically concerned", "Service ironically down", "Health check surprisingly worried", "Monitoring unexpectedly alarmed"],
-        "action": ["Uptime threat detected", "Service degradation confirmed", "Health check warning issued", "Monitoring alert active"],
-    },
-    
-    # Vaultwarden responses
-    ("vaultwarden", "completed"): {
-        "jarvis": ["Password vault synchronized", "Credential storage secure", "Vault backup complete", "Encryption operational"],
-        "dude": ["Vault synced smooth", "Passwords flowing secure", "Backup cruising done", "Encryption vibing"],
-        "chick": ["Vault synced beautifully", "Passwords secured perfectly", "Backup gorgeous", "Encryption fab"],
-        "nerd": ["Vault database encrypted", "AES-256 encryption active", "PBKDF2 iterations nominal", "Two-factor authentication enabled"],
-        "rager": ["Vault finally synced", "Passwords secured", "Backup done", "Encryption active"],
-        "ops": ["Vault synchronized", "Passwords secure", "Backup complete", "Encryption active"],
-        "tappit": ["Vault synced bru", "Passwords sorted hey", "Backup lekker né", "Encryption sharp"],
-        "comedian": ["Vault surprisingly secure", "Passwords unexpectedly encrypted", "Backup miraculously complete", "Encryption shockingly strong"],
-        "action": ["Vault secured", "Password mission complete", "Backup operational", "Encryption deployed"],
-    },
-    
-    # Nextcloud responses
-    ("nextcloud", "completed"): {
-        "jarvis": ["File synchronization complete", "Cloud storage operational", "Sync client connected", "File sharing active"],
-        "dude": ["Nextcloud synced smooth", "Files flowing nice", "Storage vibing good", "Sharing all set"],
-        "chick": ["Nextcloud synced beautifully", "Files perfect", "Storage gorgeous", "Sharing fab"],
-        "nerd": ["File delta sync complete", "WebDAV protocol active", "Chunked upload successful", "Database maintenance done"],
-        "rager": ["Nextcloud finally synced", "Files uploaded", "Storage working", "Sharing active"],
-        "ops": ["Nextcloud synchronized", "Files synced", "Storage operational", "Sharing ready"],
-        "tappit": ["Nextcloud synced bru", "Files sorted hey", "Storage lekker né", "Sharing sharp"],
-        "comedian": ["Nextcloud surprisingly synced", "Files unexpectedly uploaded", "Storage miraculously working", "Sharing shockingly functional"],
-        "action": ["Nextcloud secured", "File sync complete", "Storage operational", "Sharing deployed"],
-    },
-    
-    # Immich responses
-    ("immich", "completed"): {
-        "jarvis": ["Photo synchronization complete", "Image library indexed", "ML processing finished", "Backup operational"],
-        "dude": ["Immich synced smooth", "Photos flowing nice", "Library vibing indexed", "Backup cruising"],
-        "chick": ["Immich synced beautifully", "Photos gorgeous", "Library perfect", "Backup fab"],
-        "nerd": ["Photo EXIF parsed", "Machine learning inference complete", "Face recognition indexed", "Timeline generated"],
-        "rager": ["Immich finally synced", "Photos uploaded", "Library indexed", "Backup done"],
-        "ops": ["Immich synchronized", "Photos indexed", "Library ready", "Backup complete"],
-        "tappit": ["Immich synced bru", "Photos sorted hey", "Library lekker né", "Backup sharp"],
-        "comedian": ["Immich surprisingly fast", "Photos unexpectedly organized", "Library miraculously indexed", "Backup shockingly complete"],
-        "action": ["Immich secured", "Photo sync complete", "Library operational", "Backup deployed"],
-    },
-    
-    # Paperless responses
-    ("paperless", "completed"): {
-        "jarvis": ["Document ingestion complete", "OCR processing successful", "Document indexed", "Archive operational"],
-        "dude": ["Paperless processed smooth", "Docs flowing indexed", "OCR vibing done", "Archive cruising"],
-        "chick": ["Paperless processed beautifully", "Docs indexed perfectly", "OCR gorgeous", "Archive fab"],
-        "nerd": ["OCR accuracy optimal", "Document metadata extracted", "Full-text search indexed", "Tags auto-assigned"],
-        "rager": ["Paperless finally done", "Docs processed", "OCR complete", "Archive ready"],
-        "ops": ["Paperless complete", "Documents indexed", "OCR done", "Archive ready"],
-        "tappit": ["Paperless done bru", "Docs sorted hey", "OCR lekker né", "Archive sharp"],
-        "comedian": ["Paperless surprisingly paperless", "Docs unexpectedly digital", "OCR miraculously accurate", "Archive shockingly organized"],
-        "action": ["Paperless secured", "Document processing complete", "OCR operational", "Archive deployed"],
-    },
-    
-    # Pi-hole responses
-    ("pihole", "completed"): {
-        "jarvis": ["DNS filtering operational", "Ad blocking active", "Blocklist updated", "Query logging enabled"],
-        "dude": ["Pi-hole cruising smooth", "Ads blocked nice", "DNS flowing clean", "Blocklist vibing"],
-        "chick": ["Pi-hole running beautifully", "Ads blocked perfectly", "DNS gorgeous", "Blocklist fab"],
-        "nerd": ["DNS cache hit ratio optimal", "Gravity database updated", "FTLDNS operational", "Blocklist domains parsed"],
-        "rager": ["Pi-hole finally working", "Ads blocked", "DNS filtering active", "Blocklist updated"],
-        "ops": ["Pi-hole operational", "Ad blocking active", "DNS filtering ready", "Blocklist current"],
-        "tappit": ["Pi-hole lekker bru", "Ads blocked hey", "DNS sorted né", "Blocklist sharp"],
-        "comedian": ["Pi-hole surprisingly effective", "Ads unexpectedly blocked", "DNS miraculously clean", "Blocklist shockingly comprehensive"],
-        "action": ["Pi-hole secured", "Ad blocking deployed", "DNS filtering operational", "Blocklist mission complete"],
-    },
-    
-    # Grafana responses
-    ("grafana", "completed"): {
-        "jarvis": ["Dashboard rendering complete", "Data visualization operational", "Metrics displayed", "Alerts configured"],
-        "dude": ["Grafana cruising smooth", "Dashboards vibing nice", "Metrics flowing good", "Alerts all set"],
-        "chick": ["Grafana running beautifully", "Dashboards gorgeous", "Metrics perfect", "Alerts fab"],
-        "nerd": ["Time series query executed", "Panel rendering optimal", "Data source connected", "Alert threshold configured"],
-        "rager": ["Grafana finally working", "Dashboards rendered", "Metrics displayed", "Alerts set"],
-        "ops": ["Grafana operational", "Dashboards ready", "Metrics active", "Alerts configured"],
-        "tappit": ["Grafana lekker bru", "Dashboards sorted hey", "Metrics sharp né", "Alerts good"],
-        "comedian": ["Grafana surprisingly pretty", "Dashboards unexpectedly useful", "Metrics miraculously accurate", "Alerts shockingly functional"],
-        "action": ["Grafana secured", "Dashboard deployment complete", "Metrics operational", "Alerts deployed"],
-    },
-    
-    # Homepage/Dashboard responses
-    ("homepage", "completed"): {
-        "jarvis": ["Dashboard operational", "Services indexed", "Widgets configured", "Status monitoring active"],
-        "dude": ["Dashboard cruising smooth", "Services vibing displayed", "Widgets flowing nice", "Status all good"],
-        "chick": ["Dashboard running beautifully", "Services displayed perfectly", "Widgets gorgeous", "Status fab"],
-        "nerd": ["Service discovery complete", "API endpoints validated", "Widget refresh rate optimal", "Status checks nominal"],
-        "rager": ["Dashboard finally working", "Services displayed", "Widgets configured", "Status active"],
-        "ops": ["Dashboard operational", "Services indexed", "Widgets ready", "Status monitoring active"],
-        "tappit": ["Dashboard lekker bru", "Services sorted hey", "Widgets sharp né", "Status good"],
-        "comedian": ["Dashboard surprisingly organized", "Services unexpectedly accessible", "Widgets miraculously configured", "Status shockingly useful"],
-        "action": ["Dashboard secured", "Service indexing complete", "Widgets deployed", "Status operational"],
-    },
-    
-    # Authentik responses  
-    ("authentik", "completed"): {
-        "jarvis": ["Authentication service operational", "SSO configuration active", "User provisioning complete", "OAuth flows enabled"],
-        "dude": ["Authentik cruising smooth", "SSO flowing nice", "Users vibing provisioned", "OAuth all set"],
-        "chick": ["Authentik running beautifully", "SSO perfect", "Users provisioned gorgeous", "OAuth fab"],
-        "nerd": ["LDAP sync complete", "SAML assertions validated", "OAuth2 tokens issued", "User directory indexed"],
-        "rager": ["Authentik finally working", "SSO active", "Users provisioned", "OAuth enabled"],
-        "ops": ["Authentik operational", "SSO configured", "Users provisioned", "OAuth ready"],
-        "tappit": ["Authentik lekker bru", "SSO sorted hey", "Users sharp né", "OAuth good"],
-        "comedian": ["Authentik surprisingly authentic", "SSO unexpectedly single", "Users miraculously provisioned", "OAuth shockingly authorized"],
-        "action": ["Authentik secured", "SSO deployed", "User provisioning complete", "OAuth operational"],
-    },
-    
-    # Tdarr responses
-    ("tdarr", "completed"): {
-        "jarvis": ["Transcode operation complete", "Media processing finished", "File conversion successful", "Encode task done"],
-        "dude": ["Tdarr transcoded smooth", "Media processed nice", "File converted easy", "Encode vibing done"],
-        "chick": ["Tdarr transcoded beautifully", "Media processed perfectly", "File converted gorgeous", "Encode fab"],
-        "nerd": ["Codec conversion complete", "Bitrate optimization successful", "Container format verified", "Hardware acceleration utilized"],
-        "rager": ["Tdarr finally done", "Media processed", "File converted", "Encode complete"],
-        "ops": ["Transcode complete", "Media processed", "File converted", "Encode finished"],
-        "tappit": ["Tdarr done bru", "Media sorted hey", "File converted né", "Encode sharp"],
-        "comedian": ["Tdarr surprisingly fast", "Media unexpectedly processed", "File miraculously converted", "Encode shockingly complete"],
-        "action": ["Tdarr mission complete", "Media processing secured", "File conversion operational", "Encode deployed"],
-    },
-    ("tdarr", "failed"): {
-        "jarvis": ["Transcode operation failed", "Media processing error", "File conversion failed", "Encode task error"],
-        "dude": ["Tdarr hit issues", "Media processing stuck", "File conversion failed", "Encode problems"],
-        "chick": ["Tdarr needs attention", "Media processing failed", "File conversion error", "Encode struggling"],
-        "nerd": ["Codec incompatibility detected", "FFmpeg error encountered", "Hardware encoder unavailable", "Container format unsupported"],
-        "rager": ["Tdarr is fucked", "Media processing broken", "File conversion failed", "Encode dead"],
-        "ops": ["Transcode failed", "Media processing error", "File conversion failed", "Encode error"],
-        "tappit": ["Tdarr kak bru", "Media broken hey", "File failed né", "Encode not lekker"],
-        "comedian": ["Tdarr dramatically failed", "Media plot twist", "File unexpectedly broken", "Encode ironically incomplete"],
-        "action": ["Tdarr compromised", "Media processing breach", "File conversion failed", "Encode mission critical"],
-    },
-    
-    # Recyclarr responses
-    ("recyclarr", "completed"): {
-        "jarvis": ["Configuration sync complete", "Quality profiles updated", "Custom formats applied", "Arr sync finished"],
-        "dude": ["Recyclarr synced smooth", "Profiles updated nice", "Formats flowing applied", "Sync vibing done"],
-        "chick": ["Recyclarr synced beautifully", "Profiles updated perfectly", "Formats gorgeous", "Sync fab"],
-        "nerd": ["TRaSH guides synchronized", "Quality definitions merged", "Custom format scores calculated", "API sync successful"],
-        "rager": ["Recyclarr finally synced", "Profiles updated", "Formats applied", "Sync done"],
-        "ops": ["Recyclarr synchronized", "Profiles updated", "Formats applied", "Sync complete"],
-        "tappit": ["Recyclarr synced bru", "Profiles sorted hey", "Formats lekker né", "Sync sharp"],
-        "comedian": ["Recyclarr surprisingly synced", "Profiles unexpectedly current", "Formats miraculously applied", "Sync shockingly complete"],
-        "action": ["Recyclarr secured", "Profile sync complete", "Formats deployed", "Sync operational"],
-    },
-    
-    # Maintainerr responses
-    ("maintainerr", "completed"): {
-        "jarvis": ["Media cleanup complete", "Library maintenance finished", "Rule execution successful", "Collection management done"],
-        "dude": ["Maintainerr cleaned smooth", "Library maintained nice", "Rules vibing applied", "Cleanup cruising done"],
-        "chick": ["Maintainerr cleaned beautifully", "Library maintained perfectly", "Rules gorgeous", "Cleanup fab"],
-        "nerd": ["Rule engine executed", "Media retention policy applied", "Collection pruning complete", "Library optimization finished"],
-        "rager": ["Maintainerr finally done", "Library cleaned", "Rules applied", "Cleanup complete"],
-        "ops": ["Maintainerr complete", "Library maintained", "Rules executed", "Cleanup finished"],
-        "tappit": ["Maintainerr done bru", "Library sorted hey", "Rules lekker né", "Cleanup sharp"],
-        "comedian": ["Maintainerr surprisingly thorough", "Library unexpectedly clean", "Rules miraculously applied", "Cleanup shockingly complete"],
-        "action": ["Maintainerr secured", "Library maintenance complete", "Rules deployed", "Cleanup operational"],
-    },
-    
-    # Unpackerr responses
-    ("unpackerr", "completed"): {
-        "jarvis": ["Archive extraction complete", "Files unpacked successfully", "Extraction finished", "Decompression done"],
-        "dude": ["Unpackerr extracted smooth", "Files unpacked nice", "Archive flowing open", "Extraction vibing done"],
-        "chick": ["Unpackerr extracted beautifully", "Files unpacked perfectly", "Archive gorgeous", "Extraction fab"],
-        "nerd": ["RAR archive extracted", "CRC verification passed", "Multi-volume unpack complete", "Password-protected archive opened"],
-        "rager": ["Unpackerr finally done", "Files unpacked", "Archive extracted", "Extraction complete"],
-        "ops": ["Unpackerr complete", "Files extracted", "Archive unpacked", "Extraction finished"],
-        "tappit": ["Unpackerr done bru", "Files sorted hey", "Archive lekker né", "Extraction sharp"],
-        "comedian": ["Unpackerr surprisingly fast", "Files unexpectedly extracted", "Archive miraculously opened", "Extraction shockingly complete"],
-        "action": ["Unpackerr secured", "File extraction complete", "Archive operational", "Extraction deployed"],
-    },
-    ("unpackerr", "failed"): {
-        "jarvis": ["Archive extraction failed", "Files unpack error", "Extraction incomplete", "Decompression failed"],
-        "dude": ["Unpackerr hit issues", "Files stuck", "Archive problems", "Extraction failed"],
-        "chick": ["Unpackerr needs attention", "Files failed to unpack", "Archive error", "Extraction struggling"],
-        "nerd": ["CRC mismatch detected", "Archive corruption found", "Password incorrect", "Multi-volume incomplete"],
-        "rager": ["Unpackerr is fucked", "Files broken", "Archive corrupted", "Extraction dead"],
-        "ops": ["Unpackerr failed", "Extraction error", "Archive failed", "Unpack incomplete"],
-        "tappit": ["Unpackerr kak bru", "Files broken hey", "Archive failed né", "Extraction not lekker"],
-        "comedian": ["Unpackerr dramatically failed", "Files plot twist", "Archive unexpectedly corrupt", "Extraction ironically incomplete"],
-        "action": ["Unpackerr compromised", "Extraction breach", "Archive mission failed", "Unpack critical"],
-    },
-    
-    # Fileflows responses
-    ("fileflows", "completed"): {
-        "jarvis": ["Workflow execution complete", "File processing finished", "Flow successfully executed", "Processing pipeline done"],
-        "dude": ["Fileflows processed smooth", "Workflow flowing done", "Files vibing processed", "Flow cruising complete"],
-        "chick": ["Fileflows processed beautifully", "Workflow executed perfectly", "Files gorgeous", "Flow fab"],
-        "nerd": ["Processing node execution complete", "Workflow DAG traversed", "File transformation successful", "Pipeline metrics nominal"],
-        "rager": ["Fileflows finally done", "Workflow executed", "Files processed", "Flow complete"],
-        "ops": ["Fileflows complete", "Workflow executed", "Files processed", "Flow finished"],
-        "tappit": ["Fileflows done bru", "Workflow sorted hey", "Files lekker né", "Flow sharp"],
-        "comedian": ["Fileflows surprisingly efficient", "Workflow unexpectedly executed", "Files miraculously processed", "Flow shockingly complete"],
-        "action": ["Fileflows secured", "Workflow execution complete", "File processing operational", "Flow deployed"],
-    },
-}
+# Header status tier, checked in this order
+_HEADER_TIERS = ("critical", "warning", "failure", "normal")
+_FAILURE_ACTIONS = ("failed", "disconnected", "stopped")
+
+_SLOT_RE = re.compile(r"\{([^{}]*)\}")
+
+# Seed with PERSONALITY_SEED (or seed_phrases()) for reproducible output
+_rng = random.Random(os.getenv("PERSONALITY_SEED") or None)
+
+
+def seed_phrases(value=None):
+    """Reseed phrase selection; the same seed gives the same headers and riffs"""
+    _rng.seed(value)
+
+
+class _PhraseBanks:
+    """Compiled phrase banks: every lookup key maps to a tuple of choices"""
+
+    def __init__(self, data: Dict):
+        self.greetings: Dict[Tuple[str, str], Tuple[str, ...]] = {
+            (daypart, persona): tuple(lines)
+            for daypart, personas in data.get("greetings", {}).items()
+            for persona, lines in personas.items()
+        }
+        # Templates split into (literal, default, literal, default, ..., literal)
+        self.headers: Dict[Tuple[str, str], Tuple[Tuple[str, ...], ...]] = {
+            (tier, persona): tuple(tuple(_SLOT_RE.split(t)) for t in templates)
+            for tier, personas in data.get("headers", {}).items()
+            for persona, templates in personas.items()
+        }
+        self.services: Dict[Tuple[str, str, str], Tuple[str, ...]] = {}
+        for key, personas in data.get("services", {}).items():
+            service, _, action = key.partition("|")
+            for persona, lines in personas.items():
+                self.services[(service, action, persona)] = tuple(lines)
+        self.generic: Dict[Tuple[str, str], Tuple[str, ...]] = {
+            (action, persona): tuple(lines)
+            for action, personas in data.get("generic", {}).items()
+            for persona, lines in personas.items()
+        }
+
+    @classmethod
+    def load(cls, path: Path = PHRASE_BANKS_FILE) -> "_PhraseBanks":
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return cls(json.load(f))
+        except Exception as e:
+            print(f"[personality] phrase banks unavailable ({path}): {e}", flush=True)
+            return cls({})
+
+    def stats(self) -> Dict:
+        return {
+            "greetings": sum(map(len, self.greetings.values())),
+            "headers": sum(map(len, self.headers.values())),
+            "service_riffs": sum(map(len, self.services.values())),
+            "generic_riffs": sum(map(len, self.generic.values())),
+        }
+
+
+_banks: Optional[_PhraseBanks] = None
+_banks_lock = threading.Lock()
+
+
+def _phrase_banks() -> _PhraseBanks:
+    """The shared banks, loaded on first use"""
+    global _banks
+    if _banks is None:
+        with _banks_lock:
+            if _banks is None:
+                _banks = _PhraseBanks.load()
+    return _banks
+
+
+def _fill(parts: Tuple[str, ...], service: Optional[str]) -> str:
+    if len(parts) == 3:
+        return f"{parts[0]}{service or parts[1]}{parts[2]}"
+    return "".join(p if i % 2 == 0 else (service or p) for i, p in enumerate(parts))
+
+
+def _header_tier(ctx: Dict) -> str:
+    urgency = ctx.get("urgency", 0)
+    if urgency >= 6:
+        return "critical"
+    if urgency >= 3:
+        return "warning"
+    if ctx.get("action") in _FAILURE_ACTIONS:
+        return "failure"
+    return "normal"
 
-# MASSIVE GENERIC RESPONSE BANKS - More varied and natural
-_GENERIC_RESPONSES = {
-    "completed": {
-        "jarvis": [
-            "Operation completed successfully, sir",
-            "Task execution finished as requested",
-            "Process concluded nominally",
-            "Activity finalized per specifications",
-            "Procedure complete - all parameters met",
-            "Execution successful, sir - no issues",
-            "Task accomplished within tolerances",
-            "Operation finalized satisfactorily",
-            "Process finished without incident, sir",
-            "Activity concluded as designed",
-            "Mission complete to specifications",
-            "Task delivered successfully, sir",
-            "Operation successful - objectives achieved",
-            "Procedure accomplished properly",
-            "Execution finalized nominally, sir",
-            "Task complete - quality assured",
-            "Operation concluded successfully",
-            "Process accomplished per parameters",
-            "Activity finalized smoothly, sir",
-            "Procedure successful - standing by",
-            "Task execution nominal, sir",
-            "Operation complete - ready for next directive",
-            "Process concluded satisfactorily",
-            "Mission accomplished successfully, sir",
-            "Task finalized - awaiting further orders"
-        ],
-        "dude": [
-            "All wrapped up nice and easy man",
-            "Done and dusted bro - smooth sailing",
-            "Finished up smooth dude, no stress",
-            "Task's complete - totally chill",
-            "All done man, piece of cake",
-            "Wrapped that up easy bro",
-            "Finished smooth - no worries dude",
-            "Task's done man, vibing perfect",
-            "Complete and chill bro",
-            "All good man - easy does it",
-            "Wrapped up nicely dude",
-            "Done smooth as butter man",
-            "Task completed easy bro - right on",
-            "All finished up chill dude",
-            "Done deal man - totally mellow",
-            "Wrapped smooth bro, all good",
-            "Finished easy - no sweat dude",
-            "Task's complete man - cruising",
-            "All done bro, vibing nicely",
-            "Wrapped up chill dude",
-            "Done smooth man - ahhh yeah",
-            "Task complete bro - flowing easy",
-            "All finished man, no problemo",
-            "Done and chilling dude",
-            "Wrapped that up smooth bro - solid"
-        ],
-        "chick": [
-            "Task completed beautifully hun!",
-            "Finished perfectly babe - obsessed!",
-            "Done gorgeously darling!",
-            "Task looking absolutely fabulous!",
-            "Completed with total style sweetie!",
-            "Finished elegantly babe - chef's kiss!",
-            "Done beautifully hun - no notes!",
-            "Task perfectly complete gorgeous!",
-            "Accomplished gorgeously darling!",
-            "Completed fab babe - living!",
-            "Finished with grace hun!",
-            "Done stunningly sweetie!",
-            "Task elegantly finished babe!",
-            "Completed radiant darling - yasss!",
-            "Finished flawlessly hun!",
-            "Done divinely babe!",
-            "Task completed perfectly gorgeous!",
-            "Accomplished beautifully sweetie!",
-            "Finished with finesse hun!",
-            "Done spectacularly babe!",
-            "Task gorgeously complete darling!",
-            "Completed immaculately hun - iconic!",
-            "Finished pristinely babe!",
-            "Done exquisitely sweetie!",
-            "Task brilliantly finished gorgeous!"
-        ],
-        "nerd": [
-            "Task execution nominal - exit code 0",
-            "Process terminated successfully - no errors",
-            "Operation metrics optimal - 100% completion",
-            "Completion verified - all assertions passed",
-            "Execution parameters met successfully",
-            "Task successfully terminated - clean shutdown",
-            "Process completion validated - checksum OK",
-            "Operation finalized successfully - nominal state",
-            "Metrics within tolerances - completion confirmed",
-            "Task completion verified - unit tests passed",
-            "Process successfully executed - zero exceptions",
-            "Operation nominal - success flag set",
-            "Execution complete - memory freed properly",
-            "Task finalized - database transactions committed",
-            "Process conclusion successful - logs clean",
-            "Operation metrics green - SLA maintained",
-            "Task execution optimal - CPU efficiency 95%",
-            "Process terminated gracefully - no memory leaks",
-            "Completion validated - integrity checks passed",
-            "Operation successful - all dependencies resolved",
-            "Task execution confirmed - output verified",
-            "Process finalized - state persisted correctly",
-            "Operation complete - API responses nominal",
-            "Task concluded successfully - resources released",
-            "Execution nominal - performance benchmarks exceeded"
-        ],
-        "rager": [
-            "Finally fucking done thank christ",
-            "Task completed - about goddamn time",
-            "Finished goddammit - took forever",
-            "Done at last - jesus fucking christ",
-            "Task fucking finished finally",
-            "Completed after all that bullshit",
-            "Done thank god - quit stalling",
-            "Task finished - stopped screwing around",
-            "Wrapped up at fucking last",
-            "Done already - took long enough shit",
-            "Finished finally - christ almighty",
-            "Task done - about damn time",
-            "Completed now thank fuck",
-            "Done at fucking last goddammit",
-            "Task finished after forever",
-            "Wrapped up finally - jesus",
-            "Done - quit dragging ass already",
-            "Task complete - stopped being useless",
-            "Finished at last thank fucking god",
-            "Done goddammit - finally working",
-            "Task wrapped - only took ages",
-            "Completed thank christ - moving on",
-            "Done finally - fuck's sake",
-            "Task finished - stopped fucking around",
-            "Wrapped up at last - about time"
-        ],
-        "ops": [
-            "Task complete - status green",
-            "Operation finished successfully",
-            "Process done - objectives met",
-            "Activity completed nominal",
-            "Task finalized - ready for next",
-            "Operation complete - standing by",
-            "Process finished - all clear",
-            "Activity done - mission accomplished",
-            "Task accomplished - awaiting orders",
-            "Operation finalized successfully",
-            "Process complete - nominal status",
-            "Activity finished - green light",
-            "Task done - operation successful",
-            "Operation accomplished - ready",
-            "Process finalized - objectives achieved",
-            "Activity complete - status nominal",
-            "Task finished - mission complete",
-            "Operation done - all systems go",
-            "Process accomplished successfully",
-            "Activity finalized - ready state",
-            "Task complete - operation green",
-            "Operation finished - standing ready",
-            "Process done - mission accomplished",
-            "Activity accomplished - status green",
-            "Task finalized - objectives complete"
-        ],
-        "tappit": [
-            "Task done lekker bru - sharp",
-            "Completed nice hey china",
-            "Finished sharp sharp né boet",
-            "Done sorted bru - all good",
-            "Task lekker complete china",
-            "Completed sharp hey bru",
-            "Finished all good né boet",
-            "Done clean bru - lekker",
-            "Task sorted hey china",
-            "Completed sharp né bru",
-            "Finished lekker bru - nice",
-            "Done sharp sharp hey boet",
-            "Task all good china - sorted",
-            "Completed proper né bru",
-            "Finished lekker hey boet",
-            "Done sharp bru - solid",
-            "Task sorted china - nice one",
-            "Completed clean né bru",
-            "Finished sharp hey boet",
-            "Done lekker china - good stuff",
-            "Task complete né bru - eish",
-            "Completed sharp sharp boet",
-            "Finished proper hey china",
-            "Done sorted bru - howzit",
-            "Task lekker ready né boet"
-        ],
-        "comedian": [
-            "Task ironically complete - against all odds",
-            "Finished unexpectedly without exploding",
-            "Done surprisingly well - shocking really",
-            "Task miraculously accomplished somehow",
-            "Completed against better judgment",
-            "Finished shockingly on first try",
-            "Done unexpectedly - the simulation glitched",
-            "Task surprisingly finished - call Guinness",
-            "Completed miraculously - no one's more surprised",
-            "Finished predictably... said no one",
-            "Done with ironic success",
-            "Task deadpan complete - how mundane",
-            "Completed sarcastically - thrilling",
-            "Finished absurdly well considering",
-            "Done satirically - Oscar-worthy",
-            "Task complete - alert the media",
-            "Finished comedically without incident",
-            "Done ironically on schedule",
-            "Task absurdly accomplished - fascinating",
-            "Completed predictably boring",
-            "Finished satirically successful",
-            "Done comedically smooth",
-            "Task ironically nominal - riveting",
-            "Completed absurdly well",
-            "Finished deadpan perfect - yawn"
-        ],
-        "action": [
-            "Mission accomplished - Oscar Mike",
-            "Task secured - objective complete",
-            "Operation complete - all clear",
-            "Objective achieved - RTB",
-            "Mission finalized - Charlie Mike",
-            "Task executed successfully - moving out",
-            "Operation successful - area secured",
-            "Objective secured - solid copy",
-            "Mission complete - exfil authorized",
-            "Task accomplished - zero casualties",
-            "Operation finalized - tactical green",
-            "Objective complete - all personnel accounted",
-            "Mission executed - standing by",
-            "Task secured successfully - roger that",
-            "Operation accomplished - ready for next",
-            "Objective achieved - mission green",
-            "Mission successful - returning to base",
-            "Task complete - operation nominal",
-            "Operation secured - objectives met",
-            "Objective finalized - all teams RTB",
-            "Mission accomplished - sitrep green",
-            "Task executed - tactical success",
-            "Operation complete - no hostiles",
-            "Objective secured - mission successful",
-            "Mission finalized - all clear"
-        ],
-    },
-    "started": {
-        "jarvis": ["Operation initiated", "Process beginning", "Task commenced", "Activity starting", "Procedure initiated",
-                   "Execution beginning", "Operation commencing", "Process starting", "Task initiating", "Activity commencing",
-                   "Procedure starting", "Execution commenced", "Operation beginning", "Process initiated"],
-        "dude": ["Starting up smooth", "Getting going", "Kicking off easy", "Beginning to flow", "Starting mellow",
-                 "Getting rolling", "Kicking in smooth", "Beginning easy", "Starting to vibe", "Getting going smooth",
-                 "Kicking off chill", "Beginning to cruise", "Starting smooth", "Getting underway"],
-        "chick": ["Starting beautifully", "Beginning elegantly", "Kicking off gorgeously", "Starting with style", "Beginning fab",
-                  "Kicking off perfectly", "Starting gracefully", "Beginning stunningly", "Kicking off beautifully", "Starting radiant",
-                  "Beginning gorgeously", "Kicking off elegantly", "Starting perfectly", "Beginning with grace"],
-        "nerd": ["Process initialization", "Task spawning", "Operation bootstrapping", "Execution commenced", "Process starting",
-                 "Task initialization begun", "Operation commenced", "Execution initiated", "Process begun", "Task spawned",
-                 "Operation initialized", "Execution starting", "Process initiated", "Task commenced"],
-        "rager": ["Starting this shit", "Kicking off", "Beginning already", "Starting goddammit", "Kicking in",
-                  "Beginning now", "Starting up", "Kicking off finally", "Beginning this", "Starting it",
-                  "Kicking in now", "Beginning already", "Starting again", "Kicking off now"],
-        "ops": ["Task initiated", "Operation starting", "Process begun", "Activity commenced", "Task beginning",
-                "Operation initiated", "Process starting", "Activity begun", "Task commenced", "Operation commencing",
-                "Process initiated", "Activity starting", "Task starting", "Operation beginning"],
-        "tappit": ["Starting bru", "Kicking off hey", "Beginning sharp", "Starting lekker", "Kicking in né",
-                   "Beginning sorted", "Starting now bru", "Kicking off sharp", "Beginning hey", "Starting sorted",
-                   "Kicking in lekker", "Beginning bru", "Starting sharp", "Kicking off né"],
-        "comedian": ["Reluctantly starting", "Beginning ironically", "Kicking off surprisingly", "Starting unexpectedly", "Beginning with irony",
-                     "Kicking off predictably", "Starting against will", "Beginning shockingly", "Kicking off deadpan", "Starting miraculously",
-                     "Beginning satirically", "Kicking off absurdly", "Starting with satire", "Beginning comedically"],
-        "action": ["Mission initiated", "Task deployed", "Operation launched", "Objective commenced", "Mission starting",
-                   "Task initiated", "Operation commencing", "Objective beginning", "Mission commencing", "Task launched",
-                   "Operation initiated", "Objective starting", "Mission beginning", "Task commencing"],
-    },
-    "failed": {
-        "jarvis": [
-            "Operation failure detected, sir - investigating",
-            "Task execution error encountered",
-            "Process malfunction identified - diagnostics running",
-            "Activity disrupted - error analysis in progress",
-            "Procedure failed - examining root cause, sir",
-            "Execution error detected - troubleshooting initiated",
-            "Operation unsuccessful - determining corrective action",
-            "Process failed - fault isolation underway, sir",
-            "Task malfunction confirmed - diagnostics active",
-            "Activity error - system logs being reviewed",
-            "Operation compromised - error recovery initiated, sir",
-            "Process encountered critical failure",
-            "Task execution unsuccessful - analyzing failure mode",
-            "Operation terminated abnormally, sir",
-            "Procedure failed - exception handler triggered",
-            "Execution error - attempting recovery protocol",
-            "Task failed to complete - investigating cause, sir",
-            "Operation unsuccessful - error logged for review",
-            "Process terminated unexpectedly - analyzing",
-            "Activity failed - remediation required, sir",
-            "Operation error detected - standing by for instructions",
-            "Task execution compromised - diagnostics complete",
-            "Process failure confirmed - awaiting guidance, sir",
-            "Operation unsuccessful - error details compiled",
-            "Task malfunction - recovery options being evaluated"
-        ],
-        "dude": [
-            "Ahh man, that didn't work out",
-            "Looks like something went sideways dude",
-            "Yeah so that kinda failed bro",
-            "Ehhh not working out man - bummer",
-            "That didn't go as planned dude",
-            "Something's not vibing right bro",
-            "Ahh shit man, hit a snag there",
-            "Not working out so smooth dude",
-            "Yeah that's not happening man",
-            "Something broke along the way bro",
-            "Ehhh having some issues here dude",
-            "That's not flowing right man",
-            "Looks like we got problems bro",
-            "Ahh man that's not working",
-            "Something's acting up dude",
-            "Not going smooth man - issues",
-            "Yeah that failed bro - my bad",
-            "Having trouble with that one dude",
-            "Something's off man - not good",
-            "That's not working out bro",
-            "Ehhh got some problems here dude",
-            "Not vibing right man - sorry",
-            "Something went wrong bro",
-            "That's broken dude - not cool",
-            "Having issues man - might need help"
-        ],
-        "chick": [
-            "Ugh babe, that didn't work - so annoying!",
-            "Like that totally failed hun - not cute",
-            "OMG something went wrong darling!",
-            "That's not working babe - yikes!",
-            "Like seriously failed gorgeous - ugh!",
-            "Not working out hun - total disaster!",
-            "Something broke darling - not ideal!",
-            "That failed babe - so frustrating!",
-            "OMG not working sweetie - help!",
-            "Like that's broken hun - crisis!",
-            "Something's wrong babe - not happy!",
-            "Failed gorgeously... wait no, just failed!",
-            "That's not working darling - panic mode!",
-            "OMG error detected hun - stressed!",
-            "Like totally not working babe!",
-            "Something failed sweetie - concerned!",
-            "That's broken gorgeous - not loving this!",
-            "Failed hun - need a solution babe!",
-            "OMG not working darling - fix needed!",
-            "Like something's wrong babe - worried!",
-            "That didn't work hun - problematic!",
-            "Failed sweetie - this is not the vibe!",
-            "Something broke gorgeous - emergency!",
-            "Not working babe - intervention required!",
-            "OMG failed hun - sending SOS!"
-        ],
-        "nerd": [
-            "Operation failure - non-zero exit code returned",
-            "Task execution error - exception thrown at line 247",
-            "Process terminated - segmentation fault detected",
-            "Error: null pointer dereference encountered",
-            "Execution failed - dependency resolution unsuccessful",
-            "Task error - timeout exception after 30000ms",
-            "Operation unsuccessful - HTTP 500 internal error",
-            "Process crashed - stack trace logged to stderr",
-            "Failed: database connection refused on port 5432",
-            "Error: authentication token expired at UTC+0",
-            "Task terminated - memory allocation failure",
-            "Operation error - API rate limit exceeded",
-            "Process failed - checksum validation mismatch",
-            "Execution unsuccessful - container failed health check",
-            "Error: DNS resolution failed for hostname",
-            "Task failed - insufficient permissions (errno 13)",
-            "Operation terminated - TCP connection timeout",
-            "Process error - disk quota exceeded on /dev/sda1",
-            "Failed: SSL certificate verification unsuccessful",
-            "Error: deadlock detected in transaction queue",
-            "Task unsuccessful - service unavailable (503)",
-            "Operation failed - kernel panic logged",
-            "Process terminated - OOM killer triggered",
-            "Error: incompatible API version (v2.1 vs v3.0)",
-            "Task failed - race condition detected in mutex"
-        ],
-        "rager": [
-            "What the fuck - shit failed again",
-            "Goddammit it's fucking broken",
-            "Failed again - this is bullshit",
-            "Fucking hell - doesn't work",
-            "Christ this shit keeps failing",
-            "It's fucked - completely goddamn broken",
-            "Failed like a piece of shit",
-            "Fucking useless - won't work",
-            "Goddamn thing failed again",
-            "This is fucking ridiculous - broken",
-            "Failed hard - fuck this shit",
-            "Broken as fuck - goddammit",
-            "Shit failed spectacularly",
-            "Fucking disaster - won't work",
-            "Failed again - jesus fucking christ",
-            "This goddamn thing is broken",
-            "Shit the bed completely",
-            "Fucking failed - worthless",
-            "Broken again - fuck's sake",
-            "Failed miserably goddammit",
-            "This fucking thing won't work",
-            "Shit failed hard - useless",
-            "Goddamn broken piece of shit",
-            "Failed like always - fuck",
-            "This is fucked - completely broken"
-        ],
-        "ops": [
-            "Operation failed - status red",
-            "Task error detected",
-            "Process unsuccessful - investigating",
-            "Activity failed - assessing",
-            "Procedure error - analyzing",
-            "Execution failed - troubleshooting",
-            "Operation unsuccessful - diagnosing",
-            "Process failed - determining cause",
-            "Task malfunction detected",
-            "Activity error - remediation needed",
-            "Operation failure confirmed",
-            "Process error - reviewing logs",
-            "Task failed - corrective action required",
-            "Activity unsuccessful - evaluating",
-            "Procedure failed - investigating",
-            "Execution error - status red",
-            "Operation unsuccessful - analyzing",
-            "Process failure - troubleshooting active",
-            "Task error - diagnostics running",
-            "Activity failed - assessing impact",
-            "Operation failed - standby for update",
-            "Process unsuccessful - error logged",
-            "Task malfunction - investigating cause",
-            "Activity error - remediation in progress",
-            "Procedure failed - awaiting guidance"
-        ],
-        "tappit": [
-            "Eish that's kak bru - broken",
-            "Failed hey china - not lekker",
-            "That's broken né boet - jislaaik",
-            "Kak man, failed bru",
-            "Not working hey china - broken",
-            "Failed sharp né bru - eish",
-            "That's kak boet - not good",
-            "Broken china - jislaaik man",
-            "Failed lekker bad bru",
-            "That's not lekker hey boet",
-            "Kak né china - failed hard",
-            "Broken properly bru - eish",
-            "Failed hey boet - not sharp",
-            "That's kak china - broken",
-            "Not working né bru - jislaaik",
-            "Failed bad hey boet",
-            "That's broken china - kak man",
-            "Not lekker bru - failed",
-            "Broken né boet - eish bru",
-            "Failed sharp china - not good",
-            "That's kak hey bru",
-            "Not working boet - broken né",
-            "Failed properly china - jislaaik",
-            "That's broken bru - kak hey",
-            "Not lekker né boet - failed"
-        ],
-        "comedian": [
-            "Failed spectacularly - as tradition demands",
-            "Error detected - the universe's sense of humor continues",
-            "Broke magnificently - truly inspirational failure",
-            "Failed with unprecedented mediocrity",
-            "Error: reality.exe has stopped responding",
-            "Crashed harder than my life goals",
-            "Failed successfully - wait no, just failed",
-            "Error detected - shocking absolutely no one",
-            "Broke ironically - how poetic",
-            "Failed predictably - the prophecy fulfilled",
-            "Error: expectations vs reality mismatch",
-            "Crashed and burned - at least it's consistent",
-            "Failed gloriously - going out in style",
-            "Error detected - Murphy's Law remains undefeated",
-            "Broke comedically - the timing is impeccable",
-            "Failed sarcastically - how original",
-            "Error: optimism.dll not found",
-            "Crashed spectacularly - chef's kiss",
-            "Failed absurdly - the plot thickens",
-            "Error detected - the hits keep coming",
-            "Broke ironically well - fascinating",
-            "Failed predictably bad - yawn",
-            "Error: success.exe has left the chat",
-            "Crashed magnificently - bravo",
-            "Failed with style - at least there's that"
-        ],
-        "action": [
-            "Operation failed - mission compromised",
-            "Task unsuccessful - tactical fallback",
-            "Target lost - mission critical",
-            "Objective failed - regroup required",
-            "Operation unsuccessful - abort protocol",
-            "Mission compromised - fall back",
-            "Task failed - requesting backup",
-            "Target unreachable - mission failed",
-            "Operation error - tactical withdrawal",
-            "Objective compromised - need support",
-            "Mission unsuccessful - danger close",
-            "Task failed - hostile environment",
-            "Operation compromised - extraction needed",
-            "Target failed - mission abort",
-            "Objective unsuccessful - retreat advised",
-            "Mission critical failure - RTB immediately",
-            "Operation failed - casualties possible",
-            "Task unsuccessful - area not secure",
-            "Target compromised - mission failed",
-            "Objective failed - requesting QRF",
-            "Mission unsuccessful - tactical retreat",
-            "Operation error - enemy contact",
-            "Task failed - position compromised",
-            "Target lost - mission abort",
-            "Objective unsuccessful - emergency exfil"
-        ],
-    },
-    "warning": {
-        "jarvis": ["Advisory condition", "Caution recommended", "Warning threshold reached", "Alert status", "Advisory issued",
-                   "Caution advised", "Warning detected", "Alert condition", "Advisory active", "Caution status",
-                   "Warning threshold", "Alert issued", "Advisory condition detected", "Caution recommended"],
-        "dude": ["Heads up man", "Might wanna check", "Little concerning", "Watch this", "Keep an eye",
-                 "Heads up", "Check this out", "Bit worrying", "Monitor this", "Worth watching",
-                 "Pay attention", "Look at this", "Slightly concerning", "Watch out"],
-        "chick": ["Needs attention", "Little concern", "Worth checking", "Might need help", "Should look at",
-                  "Needs checking", "Some concern", "Worth attention", "Could need help", "Should check",
-                  "Needs review", "Bit concerning", "Worth looking at", "Might need attention"],
-        "nerd": ["Threshold breach detected", "Parameter deviation", "Anomaly identified", "Metric outlier", "Warning condition",
-                 "Threshold exceeded", "Parameter anomaly", "Statistical outlier", "Metric deviation", "Warning threshold",
-                 "Threshold violation", "Parameter warning", "Anomaly detected", "Metric warning"],
-        "rager": ["Potential problem", "Might be fucked", "Could be bad", "Watching this shit", "Possible clusterfuck",
-                  "Might break", "Could fail", "Watching closely", "Potential disaster", "Might fuck up",
-                  "Could be trouble", "Warning bullshit", "Possible problem", "Might be bad"],
-        "ops": ["Warning detected", "Caution advised", "Alert issued", "Warning condition", "Caution status",
-                "Alert detected", "Warning active", "Caution condition", "Alert status", "Warning issued",
-                "Caution detected", "Alert active", "Warning status", "Caution active"],
-        "tappit": ["Watch this bru", "Bit concerning hey", "Check it né", "Monitor bru", "Keep eye hey",
-                   "Watch closely bru", "Concerning né", "Check this hey", "Monitor closely", "Keep watching bru",
-                   "Heads up hey", "Bit worrying né", "Watch it bru", "Check closely hey"],
-        "comedian": ["Ironically concerning", "Surprisingly worrying", "Predictably alarming", "Absurdly cautious", "Deadpan warning",
-                     "Satirically alarming", "Comedically concerning", "Ironically alarming", "Absurdly worrying", "Predictably concerning",
-                     "Deadpan caution", "Satirically concerning", "Comedically alarming", "Ironically cautious"],
-        "action": ["Threat detected", "Caution advised", "Alert status", "Warning condition", "Threat level raised",
-                   "Caution status", "Alert condition", "Warning issued", "Threat active", "Caution condition",
-                   "Alert advised", "Warning status", "Threat condition", "Caution advised"],
-    },
-    "updated": {
-        "jarvis": ["System updated", "Configuration modified", "Settings refreshed", "Parameters adjusted", "System modified",
-                   "Configuration updated", "Settings adjusted", "Parameters refreshed", "System refreshed", "Configuration adjusted",
-                   "Settings modified", "Parameters updated", "System adjusted", "Configuration refreshed"],
-        "dude": ["Updated smooth", "Refreshed easy", "Modified nicely", "Adjusted well", "Updated flowing",
-                 "Refreshed smooth", "Modified easy", "Adjusted mellow", "Updated easy", "Refreshed nicely",
-                 "Modified smooth", "Adjusted easy", "Updated nicely", "Refreshed flowing"],
-        "chick": ["Updated beautifully", "Refreshed perfectly", "Modified elegantly", "Adjusted gorgeously", "Updated fab",
-                  "Refreshed beautifully", "Modified perfectly", "Adjusted elegantly", "Updated gorgeously", "Refreshed fab",
-                  "Modified beautifully", "Adjusted perfectly", "Updated elegantly", "Refreshed gorgeously"],
-        "nerd": ["Configuration state changed", "System parameters modified", "Settings updated successfully", "Configuration refreshed", "Parameters adjusted",
-                 "System state modified", "Configuration parameters updated", "Settings state changed", "Parameters modified", "System configuration updated",
-                 "Configuration successfully modified", "Settings parameters adjusted", "System successfully updated", "Configuration state modified"],
-        "rager": ["Updated finally", "Changed goddammit", "Modified at last", "Adjusted now", "Updated already",
-                  "Changed finally", "Modified now", "Adjusted finally", "Updated done", "Changed at last",
-                  "Modified finally", "Adjusted done", "Updated now", "Changed now"],
-        "ops": ["System updated", "Configuration changed", "Settings modified", "Parameters adjusted", "Update complete",
-                "Configuration updated", "Settings changed", "Parameters modified", "System modified", "Configuration modified",
-                "Settings updated", "Parameters changed", "Update applied", "Configuration applied"],
-        "tappit": ["Updated bru", "Refreshed hey", "Modified né", "Adjusted sharp", "Updated lekker",
-                   "Refreshed bru", "Modified hey", "Adjusted né", "Updated sharp", "Refreshed lekker",
-                   "Modified bru", "Adjusted hey", "Updated né", "Refreshed sharp"],
-        "comedian": ["Surprisingly updated", "Unexpectedly refreshed", "Ironically modified", "Predictably adjusted", "Absurdly updated",
-                     "Satirically refreshed", "Comedically modified", "Deadpan adjusted", "Ironically updated", "Absurdly refreshed",
-                     "Predictably modified", "Satirically adjusted", "Comedically updated", "Deadpan refreshed"],
-        "action": ["System secured", "Configuration updated", "Settings deployed", "Parameters adjusted", "Update executed",
-                   "Configuration deployed", "Settings secured", "Parameters executed", "System deployed", "Configuration executed",
-                   "Settings updated", "Parameters deployed", "Update secured", "Configuration secured"],
-    },
-    "restarted": {
-        "jarvis": ["System reinitialized", "Services cycled", "Operations reset", "Process restarted", "System cycled",
-                   "Services reset", "Operations restarted", "Process cycled", "System reset", "Services restarted",
-                   "Operations cycled", "Process reset", "System restarted", "Services cycled"],
-        "dude": ["Restarted smooth", "Cycled easy", "Reset flowing", "Rebooted mellow", "Restarted easy",
-                 "Cycled smooth", "Reset easy", "Rebooted smooth", "Restarted flowing", "Cycled mellow",
-                 "Reset smooth", "Rebooted easy", "Restarted mellow", "Cycled flowing"],
-        "chick": ["Restarted beautifully", "Cycled perfectly", "Reset elegantly", "Rebooted gorgeously", "Restarted fab",
-                  "Cycled beautifully", "Reset perfectly", "Rebooted elegantly", "Restarted gorgeously", "Cycled fab",
-                  "Reset beautifully", "Rebooted perfectly", "Restarted elegantly", "Cycled gorgeously"],
-        "nerd": ["Process respawned", "Services reinitialized", "System cold boot", "Runtime reset", "Process restarted",
-                 "Services cycled", "System reinitialized", "Runtime cycled", "Process cycled", "Services respawned",
-                 "System reset", "Runtime restarted", "Process reinitialized", "Services cold boot"],
-        "rager": ["Restarted again", "Cycled goddammit", "Reset fucking again", "Rebooted already", "Restarted now",
-                  "Cycled again", "Reset again", "Rebooted goddammit", "Restarted finally", "Cycled now",
-                  "Reset now", "Rebooted again", "Restarted goddammit", "Cycled finally"],
-        "ops": ["System restarted", "Services cycled", "Process reset", "Restart complete", "System cycled",
-                "Services reset", "Process restarted", "Restart executed", "System reset", "Services restarted",
-                "Process cycled", "Restart applied", "System reboot", "Services reboot"],
-        "tappit": ["Restarted bru", "Cycled hey", "Reset né", "Rebooted sharp", "Restarted lekker",
-                   "Cycled bru", "Reset hey", "Rebooted né", "Restarted sharp", "Cycled lekker",
-                   "Reset bru", "Rebooted hey", "Restarted né", "Cycled sharp"],
-        "comedian": ["Reluctantly restarted", "Grudgingly cycled", "Ironically reset", "Predictably rebooted", "Absurdly restarted",
-                     "Satirically cycled", "Comedically reset", "Deadpan rebooted", "Ironically cycled", "Absurdly reset",
-                     "Predictably restarted", "Satirically rebooted", "Comedically cycled", "Deadpan restarted"],
-        "action": ["System tactical reset", "Services redeployed", "Operation cycled", "Restart executed", "System redeployed",
-                   "Services cycled", "Operation reset", "Restart secured", "System cycled", "Services reset",
-                   "Operation restarted", "Restart deployed", "System reset", "Services executed"],
-    },
-    "connected": {
-        "jarvis": [
-            "New device connected to network, sir",
-            "Network connection established - device online",
-            "Device joined network successfully",
-            "New MAC address detected - connection active, sir",
-            "Network device connected and responding",
-            "Device online - network access granted",
-            "New connection established on network, sir",
-            "Device successfully joined network",
-            "Network device active - monitoring initiated",
-            "Connection established - device authenticated, sir",
-            "New device online - network expanded",
-            "Device connected - IP address assigned",
-            "Network connection active - device operational, sir",
-            "New device detected and connected",
-            "Device joined network - access configured, sir",
-            "Network connection successful - device ready",
-            "New MAC address connected to network",
-            "Device online - network topology updated, sir",
-            "Connection established - device catalogued",
-            "Network device connected successfully, sir",
-            "New device active on network",
-            "Device connection confirmed - monitoring active",
-            "Network expanded - new device online, sir",
-            "Connection established - device integrated",
-            "New network device detected and connected"
-        ],
-        "dude": [
-            "New device just connected man",
-            "Something joined the network bro",
-            "Got a new device online dude",
-            "New connection vibing on the network",
-            "Device just came online man",
-            "Something connected to network bro",
-            "New device on the network dude",
-            "Got a new MAC address connected man",
-            "Device joined network smooth bro",
-            "New device vibing online dude",
-            "Something new on network man",
-            "Device connected nice bro",
-            "New connection flowing dude",
-            "Got new device online man",
-            "Something joined smooth bro",
-            "New device cruising on network dude",
-            "Device connected easy man",
-            "New MAC vibing on network bro",
-            "Something came online dude",
-            "Device joined network man",
-            "New connection smooth bro",
-            "Got device online dude",
-            "Something new connected man",
-            "Device on network now bro",
-            "New device flowing online dude"
-        ],
-        "chick": [
-            "OMG new device connected babe!",
-            "New device joined network hun - exciting!",
-            "Device connected beautifully darling!",
-            "New connection on network sweetie!",
-            "OMG device online babe - yasss!",
-            "New device joined gorgeous!",
-            "Connection established perfectly hun!",
-            "New device on network darling!",
-            "OMG something connected babe!",
-            "Device online beautifully sweetie!",
-            "New network device hun - love it!",
-            "Connection successful gorgeous!",
-            "New device joined perfectly babe!",
-            "OMG device connected darling!",
-            "Network expanded beautifully hun!",
-            "New connection sweetie - fab!",
-            "Device online gorgeous!",
-            "New MAC address babe - exciting!",
-            "Connection established hun!",
-            "New device sweetie - perfect!",
-            "OMG network device darling!",
-            "Device joined beautifully babe!",
-            "New connection gorgeous!",
-            "Device online perfectly hun!",
-            "OMG new device sweetie!"
-        ],
-        "nerd": [
-            "New device: MAC address detected on subnet",
-            "Connection established: DHCP lease assigned",
-            "Device joined: ARP entry added to table",
-            "Network device: TCP handshake successful",
-            "New MAC: layer 2 connection verified",
-            "Device online: IP 192.168.1.x assigned",
-            "Connection active: device fingerprinted",
-            "New device: network layer reachable",
-            "MAC detected: switch port identified",
-            "Device connected: hostname resolution attempted",
-            "Network join: authentication successful",
-            "New connection: packet routing established",
-            "Device online: port scan initiated",
-            "MAC address: vendor OUI identified",
-            "Connection established: TTL 64 detected",
-            "New device: gateway reachable",
-            "Network device: mDNS broadcast detected",
-            "Connection active: SSDP discovery noted",
-            "Device joined: NetBIOS name queried",
-            "New MAC: VLAN assignment confirmed",
-            "Device online: firewall rules applied",
-            "Connection established: QoS configured",
-            "Network device: bandwidth allocation set",
-            "New device: monitoring agents deployed",
-            "MAC detected: device catalog updated"
-        ],
-        "rager": [
-            "New device connected goddammit",
-            "Something joined network - finally",
-            "Device online - about time",
-            "New connection on network shit",
-            "Device connected at last",
-            "New MAC on network goddammit",
-            "Something came online finally",
-            "Device joined network now",
-            "New device online - fuck",
-            "Connection established goddammit",
-            "Device on network at last",
-            "New MAC detected - finally",
-            "Something connected now",
-            "Device online goddammit",
-            "New connection finally",
-            "Device joined at last",
-            "New device connected now",
-            "Something on network goddammit",
-            "Device online finally - fuck",
-            "New MAC connected now",
-            "Connection established at last",
-            "Device joined goddammit",
-            "New device online now",
-            "Something connected finally",
-            "Device on network goddammit"
-        ],
-        "ops": [
-            "New device connected - status green",
-            "Network device online",
-            "Connection established - monitoring",
-            "Device joined network",
-            "New MAC address detected",
-            "Network connection active",
-            "Device online - catalogued",
-            "New device on network",
-            "Connection active - tracking",
-            "Device connected successfully",
-            "Network device detected",
-            "New connection established",
-            "Device online - monitoring",
-            "MAC address connected",
-            "Network device active",
-            "New device joined",
-            "Connection established",
-            "Device on network - green",
-            "New MAC online",
-            "Network device connected",
-            "Device joined - active",
-            "New connection online",
-            "Device connected - monitoring",
-            "Network device operational",
-            "New device active"
-        ],
-        "tappit": [
-            "New device connected bru - lekker",
-            "Something joined network hey china",
-            "Device online né boet - sharp",
-            "New MAC on network bru",
-            "Device connected lekker hey china",
-            "New device joined né boet",
-            "Connection sharp bru - device online",
-            "Something connected hey china",
-            "Device on network né bru - sorted",
-            "New MAC lekker boet",
-            "Network device online china - sharp",
-            "New device connected hey bru",
-            "Something joined né boet - lekker",
-            "Device online bru - all good china",
-            "New connection sharp hey né",
-            "MAC address connected bru",
-            "Device joined lekker boet",
-            "New device on network china - sharp",
-            "Connection established hey bru",
-            "Device online né boet - lekker",
-            "New MAC joined china - sorted",
-            "Network device bru - sharp hey",
-            "Something online né boet",
-            "Device connected lekker china",
-            "New device sharp bru - sorted"
-        ],
-        "comedian": [
-            "New device connected: another guest to the chaos",
-            "Network joined: the surveillance expands",
-            "Device online: privacy has left the chat",
-            "New connection: the network grows sentient",
-            "MAC detected: another soul enters the matrix",
-            "Device joined: welcome to the panopticon",
-            "Network device: the collection expands",
-            "New connection: IoT device #847 awakens",
-            "Device online: Skynet grows stronger",
-            "MAC address: another minion joins",
-            "Connection established: the hive mind expands",
-            "New device: because 60 devices wasn't enough",
-            "Network joined: the smart home gets smarter",
-            "Device online: another thing to monitor",
-            "New MAC: the device army grows",
-            "Connection active: surveillance intensifies",
-            "Device joined: network complexity +1",
-            "New device: the IoT infection spreads",
-            "MAC detected: another recruit to the botnet",
-            "Network device: the ecosystem expands ominously",
-            "Connection established: one more thing to update",
-            "New device: your network's new overlord",
-            "Device online: the singularity approaches",
-            "MAC address: welcome to the machine",
-            "Network joined: resistance is futile"
-        ],
-        "action": [
-            "New device connected - identify target",
-            "Network device online - assess threat",
-            "Connection established - evaluate asset",
-            "Device joined - tactical awareness",
-            "New MAC detected - classify contact",
-            "Network connection - monitor activity",
-            "Device online - assess intentions",
-            "New device - situational awareness",
-            "Connection active - identify entity",
-            "Device joined network - evaluate",
-            "New MAC - assess threat level",
-            "Network device - tactical intel",
-            "Connection established - monitor closely",
-            "Device online - identify purpose",
-            "New device detected - assess risk",
-            "Network joined - surveillance active",
-            "Connection active - classify target",
-            "Device connected - evaluate threat",
-            "New MAC - tactical monitoring",
-            "Network device - assess security",
-            "Connection established - track activity",
-            "Device joined - monitor movements",
-            "New device online - evaluate status",
-            "MAC detected - assess capabilities",
-            "Network connection - tactical watch"
-        ],
-    },
-    "disconnected": {
-        "jarvis": ["Connection terminated", "Link offline", "Network disconnected", "Service unavailable", "Connection lost",
-                   "Link terminated", "Network offline", "Service disconnected", "Connection offline", "Link lost",
-                   "Network terminated", "Service offline", "Connection unavailable", "Link unavailable"],
-        "dude": ["Disconnected man", "Link dropped", "Network down", "Offline now", "Disconnected now",
-                 "Link down man", "Network offline", "Offline man", "Disconnected dropped", "Link offline",
-                 "Network down man", "Offline down", "Disconnected offline", "Link lost"],
-        "chick": ["Disconnected sadly", "Link down", "Network offline", "Offline unfortunately", "Disconnected down",
-                  "Link offline sadly", "Network down", "Offline sadly", "Disconnected unfortunately", "Link unfortunately",
-                  "Network offline sadly", "Offline down", "Disconnected offline", "Link down"],
-        "nerd": ["Connection timeout", "Link failure", "Network unreachable", "Service terminated", "Connection refused",
-                 "Link timeout", "Network failure", "Service unreachable", "Connection terminated", "Link refused",
-                 "Network timeout", "Service failure", "Connection unreachable", "Link terminated"],
-        "rager": ["Disconnected goddammit", "Link dead", "Network fucked", "Offline shit", "Disconnected fuck",
-                  "Link down goddammit", "Network down fuck", "Offline goddammit", "Disconnected dead", "Link fucked",
-                  "Network dead", "Offline fuck", "Disconnected down", "Link goddammit"],
-        "ops": ["Connection lost", "Link down", "Network offline", "Service disconnected", "Connection offline",
-                "Link offline", "Network down", "Service offline", "Connection down", "Link lost",
-                "Network lost", "Service down", "Connection unavailable", "Link unavailable"],
-        "tappit": ["Disconnected bru", "Link down hey", "Network offline né", "Offline bru", "Disconnected hey",
-                   "Link offline bru", "Network down né", "Offline hey", "Disconnected né", "Link down bru",
-                   "Network offline hey", "Offline né", "Disconnected down", "Link offline hey"],
-        "comedian": ["Predictably disconnected", "Ironically offline", "Absurdly down", "Satirically lost", "Comedically disconnected",
-                     "Deadpan offline", "Ironically down", "Absurdly offline", "Predictably down", "Satirically disconnected",
-                     "Comedically offline", "Deadpan down", "Ironically lost", "Absurdly disconnected"],
-        "action": ["Connection lost", "Link compromised", "Network down", "Service offline", "Connection terminated",
-                   "Link down", "Network compromised", "Service lost", "Connection down", "Link terminated",
-                   "Network lost", "Service compromised", "Connection compromised", "Link lost"],
-    },
-    "stopped": {
-        "jarvis": ["Service terminated", "Operations halted", "Process stopped", "Activity ceased", "Service stopped",
-                   "Operations terminated", "Process halted", "Activity stopped", "Service halted", "Operations stopped",
-                   "Process ceased", "Activity terminated", "Service ceased", "Operations ceased"],
-        "dude": ["Stopped smooth", "Halted easy", "Shut down mellow", "Ceased flowing", "Stopped easy",
-                 "Halted smooth", "Shut down easy", "Ceased smooth", "Stopped flowing", "Halted mellow",
-                 "Shut down smooth", "Ceased easy", "Stopped mellow", "Halted flowing"],
-        "chick": ["Stopped gracefully", "Halted beautifully", "Shut down elegantly", "Ceased perfectly", "Stopped elegantly",
-                  "Halted gracefully", "Shut down beautifully", "Ceased elegantly", "Stopped perfectly", "Halted elegantly",
-                  "Shut down gracefully", "Ceased beautifully", "Stopped beautifully", "Halted perfectly"],
-        "nerd": ["Process terminated", "Service shutdown complete", "Operation ceased", "Task killed", "Process stopped",
-                 "Service terminated", "Operation halted", "Task terminated", "Process halted", "Service stopped",
-                 "Operation stopped", "Task stopped", "Process shutdown", "Service halted"],
-        "rager": ["Stopped finally", "Halted goddammit", "Shut down now", "Ceased already", "Stopped now",
-                  "Halted finally", "Shut down finally", "Ceased now", "Stopped goddammit", "Halted now",
-                  "Shut down goddammit", "Ceased finally", "Stopped already", "Halted already"],
-        "ops": ["Service stopped", "Operations halted", "Process terminated", "Activity ceased", "Service terminated",
-                "Operations stopped", "Process stopped", "Activity halted", "Service halted", "Operations terminated",
-                "Process halted", "Activity stopped", "Service ceased", "Operations ceased"],
-        "tappit": ["Stopped bru", "Halted hey", "Shut down né", "Ceased sharp", "Stopped lekker",
-                   "Halted bru", "Shut down hey", "Ceased né", "Stopped sharp", "Halted lekker",
-                   "Shut down bru", "Ceased hey", "Stopped né", "Halted sharp"],
-        "comedian": ["Reluctantly stopped", "Grudgingly halted", "Ironically ceased", "Predictably shutdown", "Absurdly stopped",
-                     "Satirically halted", "Comedically ceased", "Deadpan shutdown", "Ironically halted", "Absurdly ceased",
-                     "Predictably stopped", "Satirically shutdown", "Comedically halted", "Deadpan stopped"],
-        "action": ["Mission terminated", "Operations ceased", "Service shutdown", "Task completed", "Mission stopped",
-                   "Operations halted", "Service halted", "Task terminated", "Mission halted", "Operations stopped",
-                   "Service terminated", "Task stopped", "Mission ceased", "Operations terminated"],
-    },
-    "status": {
-        "jarvis": ["Status nominal", "Systems operational", "Operations normal", "All systems green", "Status optimal",
-                   "Systems stable", "Operations steady", "All nominal", "Status stable", "Systems normal",
-                   "Operations optimal", "All stable", "Status operational", "Systems steady"],
-        "dude": ["All good man", "Cruising smooth", "Vibing well", "Flowing easy", "All chill",
-                 "Cruising easy", "Vibing smooth", "Flowing well", "All smooth", "Cruising well",
-                 "Vibing easy", "Flowing smooth", "All easy", "Cruising vibes"],
-        "chick": ["Looking fabulous", "Running beautifully", "Performing gorgeously", "Operating perfectly", "Looking perfect",
-                  "Running fab", "Performing beautifully", "Operating gorgeously", "Looking gorgeous", "Running perfectly",
-                  "Performing fab", "Operating beautifully", "Looking beautifully", "Running gorgeously"],
-        "nerd": ["All parameters nominal", "Systems within spec", "Metrics optimal", "Performance nominal", "Parameters stable",
-                 "Systems optimal", "Metrics stable", "Performance optimal", "Parameters nominal", "Systems stable",
-                 "Metrics nominal", "Performance stable", "Parameters optimal", "Systems nominal"],
-        "rager": ["Shit's working", "Running fine", "Functioning normally", "Working properly", "Shit's functional",
-                  "Running ok", "Functioning fine", "Working ok", "Shit's running", "Running properly",
-                  "Functioning ok", "Working fine", "Shit's ok", "Running functional"],
-        "ops": ["Status green", "Systems operational", "All normal", "Operations nominal", "Status operational",
-                "Systems green", "All operational", "Operations green", "Status normal", "Systems nominal",
-                "All green", "Operations operational", "Status stable", "Systems stable"],
-        "tappit": ["All lekker bru", "Running sharp", "Good vibes né", "All sorted hey", "All good bru",
-                   "Running lekker", "Good sharp né", "All lekker hey", "Running sorted", "Good bru",
-                   "All sharp né", "Running good hey", "All sorted bru", "Good lekker"],
-        "comedian": ["Remarkably boring", "Uneventfully stable", "Thrillingly normal", "Suspensefully nominal", "Ironically stable",
-                     "Predictably boring", "Absurdly normal", "Satirically stable", "Deadpan nominal", "Comedically boring",
-                     "Ironically normal", "Absurdly stable", "Predictably nominal", "Satirically boring"],
-        "action": ["All sectors secure", "Mission nominal", "Operations green", "Status secured", "All operational",
-                   "Mission green", "Operations secure", "Status nominal", "All secure", "Mission operational",
-                   "Operations nominal", "Status green", "All nominal", "Mission secure"],
-    },
-    "scaling": {
-        "jarvis": ["Capacity adjustment initiated", "Resource scaling active", "Instance modification underway", "Scaling operation commenced"],
-        "dude": ["Scaling smooth", "Adjusting capacity easy", "Resizing flowing", "Scaling vibing well"],
-        "chick": ["Scaling beautifully", "Capacity adjusted perfectly", "Resizing gorgeous", "Scaling fab"],
-        "nerd": ["Horizontal scaling initiated", "Resource allocation adjusted", "Pod replicas modified", "Capacity optimization active"],
-        "rager": ["Scaling now", "Adjusting capacity", "Resizing", "Scaling active"],
-        "ops": ["Scaling in progress", "Capacity adjusting", "Resource scaling", "Instance modification"],
-        "tappit": ["Scaling bru", "Adjusting hey", "Resizing né", "Scaling sharp"],
-        "comedian": ["Scaling surprisingly", "Capacity ironically adjusted", "Resizing predictably", "Scaling absurdly"],
-        "action": ["Scaling operation", "Capacity adjustment", "Resource modification", "Scaling mission active"],
-    },
-    "upgrading": {
-        "jarvis": ["System upgrade in progress", "Package updates applying", "Version migration underway", "Software update active"],
-        "dude": ["Upgrading smooth", "Updates flowing in", "Patching easy", "Upgrading vibing"],
-        "chick": ["Upgrading beautifully", "Updates applying perfectly", "Patching gorgeous", "Upgrading fab"],
-        "nerd": ["Package manager updating", "Dependency resolution active", "Version bump in progress", "Binary patching underway"],
-        "rager": ["Upgrading now", "Updates applying", "Patching", "Upgrading finally"],
-        "ops": ["Upgrade in progress", "Updates applying", "Patching active", "System updating"],
-        "tappit": ["Upgrading bru", "Updates coming hey", "Patching né", "Upgrading sharp"],
-        "comedian": ["Upgrading reluctantly", "Updates surprisingly applying", "Patching ironically", "Upgrading predictably"],
-        "action": ["Upgrade operation active", "Updates deploying", "Patch mission underway", "System upgrade tactical"],
-    },
-    "backing_up": {
-        "jarvis": ["Backup operation in progress", "Data archival underway", "Snapshot creation active", "Backup process running"],
-        "dude": ["Backing up smooth", "Archiving flowing", "Snapshot vibing", "Backup cruising"],
-        "chick": ["Backing up beautifully", "Archiving perfectly", "Snapshot gorgeous", "Backup running fab"],
-        "nerd": ["Incremental backup active", "Data delta calculation", "Snapshot differential running", "Backup compression underway"],
-        "rager": ["Backing up now", "Archiving data", "Snapshot running", "Backup in progress"],
-        "ops": ["Backup running", "Archive in progress", "Snapshot active", "Backup operation underway"],
-        "tappit": ["Backing up bru", "Archiving hey", "Snapshot né", "Backup running sharp"],
-        "comedian": ["Backing up reluctantly", "Archiving surprisingly", "Snapshot ironically", "Backup predictably running"],
-        "action": ["Backup mission active", "Archive operation underway", "Snapshot tactical", "Backup secured"],
-    },
-    "scanning": {
-        "jarvis": ["Library scan in progress", "Media analysis underway", "Index operation active", "Scanning process running"],
-        "dude": ["Scanning smooth", "Indexing flowing", "Analyzing vibing", "Scan cruising"],
-        "chick": ["Scanning beautifully", "Indexing perfectly", "Analyzing gorgeous", "Scan running fab"],
-        "nerd": ["Metadata extraction active", "File hash calculation", "Index rebuild underway", "Library database updating"],
-        "rager": ["Scanning now", "Indexing running", "Analyzing", "Scan in progress"],
-        "ops": ["Scan running", "Index in progress", "Analysis active", "Scanning underway"],
-        "tappit": ["Scanning bru", "Indexing hey", "Analyzing né", "Scan running sharp"],
-        "comedian": ["Scanning reluctantly", "Indexing surprisingly", "Analyzing ironically", "Scan predictably running"],
-        "action": ["Scan mission active", "Index operation underway", "Analysis tactical", "Scanning secured"],
-    },
-    "deploying": {
-        "jarvis": ["Deployment operation active", "Service rollout underway", "Container provisioning", "Deploy process running"],
-        "dude": ["Deploying smooth", "Rolling out flowing", "Provisioning vibing", "Deploy cruising"],
-        "chick": ["Deploying beautifully", "Rolling out perfectly", "Provisioning gorgeous", "Deploy running fab"],
-        "nerd": ["Blue-green deployment active", "Container orchestration underway", "Service mesh updating", "Rolling update in progress"],
-        "rager": ["Deploying now", "Rolling out", "Provisioning", "Deploy running"],
-        "ops": ["Deploy in progress", "Rollout active", "Provisioning underway", "Deployment running"],
-        "tappit": ["Deploying bru", "Rolling out hey", "Provisioning né", "Deploy sharp"],
-        "comedian": ["Deploying reluctantly", "Rolling out surprisingly", "Provisioning ironically", "Deploy predictably"],
-        "action": ["Deploy mission active", "Rollout operation underway", "Provisioning tactical", "Deployment secured"],
-    },
-    "pulling": {
-        "jarvis": ["Image pull in progress", "Container download underway", "Registry fetch active", "Pull operation running"],
-        "dude": ["Pulling smooth", "Downloading flowing", "Fetching vibing", "Pull cruising"],
-        "chick": ["Pulling beautifully", "Downloading perfectly", "Fetching gorgeous", "Pull running fab"],
-        "nerd": ["Layer extraction active", "Docker registry download", "Image manifest fetching", "Container pull underway"],
-        "rager": ["Pulling now", "Downloading image", "Fetching", "Pull running"],
-        "ops": ["Pull in progress", "Download active", "Fetch underway", "Pulling image"],
-        "tappit": ["Pulling bru", "Downloading hey", "Fetching né", "Pull sharp"],
-        "comedian": ["Pulling reluctantly", "Downloading surprisingly", "Fetching ironically", "Pull predictably"],
-        "action": ["Pull mission active", "Download operation underway", "Fetch tactical", "Pull secured"],
-    },
-}
-        "jarvis": ["Migration process initiated", "Data transfer underway", "System relocation active", "Migration commenced"],
-        "dude": ["Migration flowing", "Moving data smooth", "Transferring easy", "Migrating vibes"],
-        "chick": ["Migrating beautifully", "Transfer running perfectly", "Moving elegantly", "Migration gorgeous"],
-        "nerd": ["Data migration executing", "Transfer protocol active", "System state replication", "Migration sequence running"],
-        "rager": ["Migrating this shit", "Moving data now", "Transferring goddammit", "Migration finally"],
-        "ops": ["Migration active", "Data transferring", "System relocating", "Migration in progress"],
-        "tappit": ["Migrating bru", "Moving data hey", "Transferring né", "Migration lekker"],
-        "comedian": ["Reluctantly migrating", "Ironically moving", "Predictably transferring", "Absurdly relocating"],
-        "action": ["Migration operation", "Data extraction active", "Transfer mission", "Migration tactical"],
-    },
-}
 
 def _generate_natural_header(persona: str, ctx: Dict, subject: str) -> str:
     """Generate natural, context-aware header"""
     try:
-        daypart = ctx.get("daypart", "afternoon")
+        banks = _phrase_banks()
+        greetings = banks.greetings.get((ctx.get("daypart", "afternoon"), persona))
+        greeting = _rng.choice(greetings) if greetings else "Update"
+
         service = ctx.get("primary_service")
-        action = ctx.get("action", "status")
-        urgency = ctx.get("urgency", 0)
-        
-        # Get greeting
-        greetings = _GREETINGS.get(daypart, {}).get(persona, ["Update"])
-        greeting = random.choice(greetings) if greetings else "Update"
-        
-        # Build status based on context
-        if urgency >= 6:
-            # Critical/failure - use service-specific or generic failure
-            statuses = {
-                "jarvis": [f"{service or 'system'} requires immediate attention", f"{service or 'service'} critical failure", f"{service or 'operations'} compromised"],
-                "dude": [f"{service or 'system'} needs help man", f"{service or 'service'} having major issues", f"{service or 'system'} seriously stuck"],
-                "chick": [f"{service or 'system'} needs urgent attention", f"{service or 'service'} critical issue", f"{service or 'system'} seriously struggling"],
-                "nerd": [f"{service or 'service'} catastrophic failure", f"{service or 'system'} critical exception", f"{service or 'service'} fatal error state"],
-                "rager": [f"{service or 'system'} is totally fucked", f"{service or 'service'} completely broken", f"{service or 'system'} fucking dead"],
-                "ops": [f"{service or 'service'} critical failure", f"{service or 'system'} down", f"{service or 'service'} offline"],
-                "tappit": [f"{service or 'system'} properly kak bru", f"{service or 'service'} completely broken hey", f"{service or 'system'} totally kaput né"],
-                "comedian": [f"{service or 'system'} catastrophically failed", f"{service or 'service'} dramatically dead", f"{service or 'system'} epic failure mode"],
-                "action": [f"{service or 'system'} critical breach", f"{service or 'service'} code red", f"{service or 'system'} emergency status"],
-            }
-        elif urgency >= 3:
-            # Warning
-            statuses = {
-                "jarvis": [f"{service or 'system'} advisory condition", f"{service or 'service'} caution recommended", f"{service or 'system'} monitoring required"],
-                "dude": [f"{service or 'system'} heads up", f"{service or 'service'} watch this", f"{service or 'system'} little concerning"],
-                "chick": [f"{service or 'system'} needs checking", f"{service or 'service'} some concern", f"{service or 'system'} worth attention"],
-                "nerd": [f"{service or 'service'} threshold breach", f"{service or 'system'} anomaly detected", f"{service or 'service'} parameter deviation"],
-                "rager": [f"{service or 'system'} potential problem", f"{service or 'service'} might be fucked", f"{service or 'system'} watch this shit"],
-                "ops": [f"{service or 'service'} warning", f"{service or 'system'} caution", f"{service or 'service'} alert"],
-                "tappit": [f"{service or 'system'} watch it bru", f"{service or 'service'} bit concerning hey", f"{service or 'system'} check this né"],
-                "comedian": [f"{service or 'system'} ironically concerning", f"{service or 'service'} surprisingly worrying", f"{service or 'system'} predictably alarming"],
-                "action": [f"{service or 'system'} threat detected", f"{service or 'service'} caution advised", f"{service or 'system'} alert status"],
-            }
-        elif action in ["failed", "disconnected", "stopped"]:
-            # Failure but lower urgency
-            statuses = {
-                "jarvis": [f"{service or 'system'} operation unsuccessful", f"{service or 'service'} failure detected", f"{service or 'system'} error condition"],
-                "dude": [f"{service or 'system'} needs help", f"{service or 'service'} acting up", f"{service or 'system'} got issues"],
-                "chick": [f"{service or 'system'} needs attention", f"{service or 'service'} issue detected", f"{service or 'system'} not looking good"],
-                "nerd": [f"{service or 'service'} error detected", f"{service or 'system'} failure mode active", f"{service or 'service'} anomaly confirmed"],
-                "rager": [f"{service or 'system'} is fucked", f"{service or 'service'} broke", f"{service or 'system'} shit the bed"],
-                "ops": [f"{service or 'service'} down", f"{service or 'system'} failed", f"{service or 'service'} offline"],
-                "tappit": [f"{service or 'system'} is kak", f"{service or 'service'} broken bru", f"{service or 'system'} not lekker"],
-                "comedian": [f"{service or 'system'} dramatically failed", f"{service or 'service'} quit the show", f"{service or 'system'} unexpected plot twist"],
-                "action": [f"{service or 'system'} compromised", f"{service or 'service'} mission critical", f"{service or 'system'} threat detected"],
-            }
-        else:
-            # Normal/positive status
-            statuses = {
-                "jarvis": [f"{service or 'systems'} running smoothly", f"{service or 'operations'} stable", f"{service or 'systems'} operating normally", f"{service or 'services'} nominal"],
-                "dude": [f"{service or 'system'} cruising", f"{service or 'setup'} flowing nice", f"{service or 'system'} vibing smooth", f"{service or 'everything'} chill"],
-                "chick": [f"{service or 'system'} looking fabulous", f"{service or 'setup'} running beautifully", f"{service or 'system'} performing gorgeously", f"{service or 'everything'} perfect"],
-                "nerd": [f"{service or 'system'} operating nominally", f"{service or 'metrics'} within bounds", f"{service or 'system'} performing optimally", f"{service or 'parameters'} stable"],
-                "rager": [f"{service or 'shit'} working", f"{service or 'system'} running", f"{service or 'shit'} functioning", f"{service or 'everything'} ok"],
-                "ops": [f"{service or 'system'} operational", f"{service or 'status'} green", f"{service or 'system'} stable", f"{service or 'services'} nominal"],
-                "tappit": [f"{service or 'system'} lekker bru", f"{service or 'setup'} running smooth", f"{service or 'system'} all good", f"{service or 'everything'} sorted"],
-                "comedian": [f"{service or 'system'} remarkably boring", f"{service or 'status'} uneventfully stable", f"{service or 'system'} thrillingly normal", f"{service or 'everything'} ironically fine"],
-                "action": [f"{service or 'system'} secure", f"{service or 'operation'} stable", f"{service or 'system'} operational", f"{service or 'all sectors'} green"],
-            }
-        
-        status = random.choice(statuses.get(persona, [f"{service or 'system'} operational"]))
-        
+        statuses = banks.headers.get((_header_tier(ctx), persona))
+        status = _fill(_rng.choice(statuses), service) if statuses else f"{service or 'system'} operational"
+
         return f"{greeting}, {status}"
     except:
         return f"{subject or 'Update'}"
@@ -4386,20 +560,13 @@ def _generate_natural_header(persona: str, ctx: Dict, subject: str) -> str:
 def _generate_intelligent_riff(persona: str, ctx: Dict, slot: int) -> str:
     """Generate intelligent riff with enhanced context awareness"""
     try:
-        service = ctx.get("primary_service")
+        banks = _phrase_banks()
         action = ctx.get("action")
-        
-        # Try service-specific first
-        key = (service, action)
-        if key in _SERVICE_RESPONSES and persona in _SERVICE_RESPONSES[key]:
-            return random.choice(_SERVICE_RESPONSES[key][persona])
-        
-        # Fall back to generic action responses
-        if action in _GENERIC_RESPONSES and persona in _GENERIC_RESPONSES[action]:
-            return random.choice(_GENERIC_RESPONSES[action][persona])
-        
-        # Final fallback to status
-        return random.choice(_GENERIC_RESPONSES.get("status", {}).get(persona, ["Systems operational"]))
+        # Service-specific first, then the generic action bank, then status
+        lines = (banks.services.get((ctx.get("primary_service"), action, persona))
+                 or banks.generic.get((action, persona))
+                 or banks.generic.get(("status", persona)))
+        return _rng.choice(lines) if lines else "Systems operational"
     except:
         return "Systems operational"
 
@@ -4522,3 +689,115 @@ def build_header_and_riffs(persona_name: str, subject: str = "", body: str = "",
         return header, lines
     except:
         return f"{subject or 'Update'}: ok", ["Status nominal", "Operations normal"]
+
+# ============================================================================
+# Benchmark: python3 personality.py --bench [N] [/data/jarvis.db]
+# ============================================================================
+_BENCH_CORPUS = [
+    ("Sonarr - Episode Downloaded", "The Expanse - S03E05 - Triple Point [WEBDL-1080p] has been downloaded and imported to /tv/The Expanse"),
+    ("Radarr", "Movie grabbed: Dune Part Two (2024) [Bluray-2160p] from indexer NZBgeek via SABnzbd"),
+    ("qBittorrent", "Torrent completed: ubuntu-24.04-desktop-amd64.iso, ratio 1.42, seeding to 12 peers"),
+    ("Uptime Kuma", "[Nextcloud] [🔴 Down] connect ECONNREFUSED 10.0.0.12:443 - service unreachable"),
+    ("Uptime Kuma", "[Nextcloud] [✅ Up] 200 - OK, response time 142 ms"),
+    ("Watchtower", "Found new linuxserver/plex:latest image (sha256:9f2c...). Stopping container plex, pulling and restarting"),
+    ("Proxmox VE", "Backup of VM 104 (homeassistant) finished successfully. Duration 00:04:12, size 8.21 GiB"),
+    ("Unraid Array", "Parity check finished (0 errors). Duration: 14 hours, 3 minutes. Average speed: 198.4 MB/sec"),
+    ("SMART warning", "Disk /dev/sdc (WDC WD80EFAX) reallocated sector count increased to 16. Drive health degraded"),
+    ("Certbot", "Certificate for jarvis.example.com renewed; expires in 89 days. nginx reloaded"),
+    ("Speedtest", "Download 912.4 Mbps, upload 38.1 Mbps, ping 9 ms, jitter 1.2 ms (ISP: Vumatel)"),
+    ("Sentinel", "Service jellyfin restarted after 3 failed health checks on host media-01"),
+    ("Gitea Actions", "Workflow 'deploy' for jarvis-prime failed on step build: error: exit code 137 (OOM killed)"),
+    ("Home Assistant", "Zigbee2MQTT: 4 devices unavailable since 02:14, coordinator offline"),
+    ("Weather", "Tomorrow: 28°C high, 14°C low, 60% chance of afternoon thunderstorms, wind NW 22 km/h"),
+    ("apt", "14 packages can be upgraded. 3 security updates available for openssl, sudo, libc6"),
+    ("Pi-hole", "Gravity updated: 1,284,221 domains blocked; DNS queries today 48,112 (12.4% blocked)"),
+    ("Backup", "restic snapshot 4f1a2c saved to b2:jarvis-backups, 1.2 GiB added, took 3m12s"),
+    ("Critical", "URGENT: PostgreSQL primary is down, replication lag 0, failover immediate action required"),
+    ("SABnzbd", "Repairing par2 set for Some.Show.S01E02, unpacking 42 segments, queued: 3 items"),
+]
+
+
+def _legacy_extract(text: str) -> Dict:
+    """The pre-index shape of _extract_smart_context: one substring scan per keyword"""
+    def any_in(keywords):
+        return any(k.rstrip("*") in text for k in keywords)
+    services = [s for s, kws in _CTX_SERVICES.items() if any_in(kws)]
+    return {
+        "services": services,
+        "action": next((a for a, kws in _CTX_ACTIONS.items() if any_in(kws)), "status"),
+        "urgency": next((u for u, kws in _CTX_URGENCY.items() if any_in(kws)), 0),
+        "flags": [f for f, kws in _CTX_FLAGS.items() if any_in(kws)],
+        "download": next((s for s, kws in _CTX_DOWNLOAD_STATES.items() if any_in(kws)), None),
+    }
+
+
+def _bench(n: int = 2000, db_path: Optional[str] = None):
+    """
+    Time the legacy per-keyword scan against the compiled index over a corpus
+    of notification bodies (the built-in samples, or title/body rows from a
+    Jarvis messages database), then module import time and header/riff
+    generation rate.
+    """
+    corpus = list(_BENCH_CORPUS)
+    if db_path:
+        import sqlite3
+        with sqlite3.connect(db_path) as conn:
+            corpus = [(t or "", b or "") for t, b in
+                      conn.execute("SELECT title, body FROM messages ORDER BY id DESC LIMIT 5000")] or corpus
+    texts = [f"{s} {b}".lower() for s, b in corpus]
+    print(f"[personality] bench: {len(texts)} messages x {n} rounds, "
+          f"{sum(len(v) for t in (_CTX_SERVICES, _CTX_ACTIONS, _CTX_URGENCY, _CTX_FLAGS, _CTX_DOWNLOAD_STATES) for v in t.values())} keywords")
+
+    def _time(fn):
+        t = time.perf_counter()
+        for _ in range(n):
+            for text in texts:
+                fn(text)
+        return (time.perf_counter() - t) / (n * len(texts)) * 1e6
+
+    legacy = _time(_legacy_extract)
+    single = _time(_CONTEXT_MATCHER.scan)
+    cached = _time(_scan_context)
+    print(f"  legacy substring scan  {legacy:8.1f} us/msg")
+    print(f"  compiled single pass   {single:8.1f} us/msg  ({legacy / single:.1f}x)")
+    print(f"  repeat message (cache) {cached:8.1f} us/msg")
+
+    # Phrase banks: import cost, lazy load, header/riff throughput
+    import subprocess
+    import sys
+    probe = "import time; t = time.perf_counter(); import personality; print(time.perf_counter() - t)"
+    runs = [float(subprocess.run([sys.executable, "-c", probe], cwd=str(Path(__file__).parent),
+                                 capture_output=True, text=True).stdout or "nan") for _ in range(5)]
+    t = time.perf_counter()
+    banks = _PhraseBanks.load()
+    load_ms = (time.perf_counter() - t) * 1000
+    print(f"  import personality      {min(runs) * 1000:8.1f} ms (best of 5)")
+    print(f"  phrase banks first use  {load_ms:8.1f} ms  {banks.stats()}")
+    seed_phrases(42)
+    count = n * len(corpus) // 10 or 1
+    t = time.perf_counter()
+    for i in range(count):
+        subject, body = corpus[i % len(corpus)]
+        lexi_quip(PERSONAS[i % len(PERSONAS)], subject=subject, body=body)
+    elapsed = time.perf_counter() - t
+    print(f"  headers                 {count / elapsed:8.0f} /s")
+    t = time.perf_counter()
+    for i in range(count):
+        subject, body = corpus[i % len(corpus)]
+        lexi_riffs(PERSONAS[i % len(PERSONAS)], 3, subject=subject, body=body)
+    print(f"  riff sets (3 lines)     {count / (time.perf_counter() - t):8.0f} /s")
+
+    # Where the word-boundary index disagrees with the substring scan
+    for (subject, body), text in list(zip(corpus, texts))[:20]:
+        ctx = _extract_smart_context(subject, body)
+        dropped = sorted(set(_legacy_extract(text)["services"]) - set(ctx["services"]))
+        if dropped:
+            print(f"  {subject[:28]:<28} substring-only: {', '.join(dropped)}")
+
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) >= 2 and sys.argv[1] == "--bench":
+        _bench(int(sys.argv[2]) if len(sys.argv) > 2 else 2000, sys.argv[3] if len(sys.argv) > 3 else None)
+    else:
+        print("usage: personality.py --bench [N] [messages.db]")
@@ -2,6 +2,11 @@
 # /app/personality_state.py — selector for personas (no moods)
 import json, datetime, os  # ADDITIVE: os for saving config
 
+try:
+    import options_store  # shared, change-aware /data/options.json snapshot
+except Exception:
+    options_store = None
+
 CONFIG_PATH = "/data/options.json"
 STATE_PATH = "/data/personality_state.json"
 
@@ -40,6 +45,14 @@ def _save_json(path, data):
 
 def _save_config(cfg):
     _save_json(CONFIG_PATH, cfg)
+    if options_store is not None:
+        options_store.invalidate()
+
+def _load_config(writable=False):
+    """Options for reading (shared snapshot) or, with writable=True, a private copy to edit and save"""
+    if options_store is not None:
+        return options_store.load() if writable else options_store.snapshot()
+    return _load(CONFIG_PATH)
 
 def _tod(now=None):
     now = now or datetime.datetime.now()
@@ -140,7 +153,7 @@ def _enabled_personas(cfg):
     return [DEFAULT_PERSONA]
 
 def get_active_persona():
-    cfg = _load(CONFIG_PATH)
+    cfg = _load_config()
     enabled = _enabled_personas(cfg)
 
     # Always keep the pool within the canonical set
@@ -173,7 +186,7 @@ def set_active_persona(name: str):
     _save_state(state)
 
     # Persist to options.json so get_active_persona() & the bot pick it up
-    cfg = _load(CONFIG_PATH)
+    cfg = _load_config(writable=True)
     cfg["active_persona"] = persona
 
     # Keep personas_enabled map coherent (only selected persona true)
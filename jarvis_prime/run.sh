@@ -90,6 +90,13 @@ export BEAUTIFY_ENABLED=$(jq -r '.beautify_enabled' "$CONFIG_PATH")
 export SILENT_REPOST=$(jq -r '.silent_repost // "true"' "$CONFIG_PATH")
 export INBOX_RETENTION_DAYS=$(jq -r '.retention_days // 30' "$CONFIG_PATH")
 export AUTO_PURGE_POLICY=$(jq -r '.auto_purge_policy // "off"' "$CONFIG_PATH")
+export JARVIS_INBOX_GROUP_COMMIT_MS=$(jq -r '.inbox_group_commit_ms // 0' "$CONFIG_PATH")
+export JARVIS_INBOX_GROUP_COMMIT_ROWS=$(jq -r '.inbox_group_commit_rows // 100' "$CONFIG_PATH")
+export ANALYTICS_RAW_RETENTION_DAYS=$(jq -r '.analytics_raw_retention_days // 0' "$CONFIG_PATH")
+export ANALYTICS_HTTP_TIMING=$(jq -r '.analytics_http_timing // false' "$CONFIG_PATH")
+export ANALYTICS_MAX_CONCURRENT_CHECKS=$(jq -r '.analytics_max_concurrent_checks // 20' "$CONFIG_PATH")
+export ANALYTICS_DOCKER_AUTOREGISTER=$(jq -r '.analytics_docker_autoregister // false' "$CONFIG_PATH")
+export ANALYTICS_DOCKER_EVENTS=$(jq -r '.analytics_docker_events // false' "$CONFIG_PATH")
 
 ############################################
 # Jarvis Prime — Default Playbook Loader
@@ -0,0 +1,9 @@
+# The add-on image copies every module flat into /app; mirror that layout here.
+import os
+import sys
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for _sub in ("core", "modules", "intakes", "personality", "llm"):
+    _path = os.path.join(_ROOT, _sub)
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
@@ -0,0 +1,50 @@
+import sqlite3
+import threading
+
+import pytest
+
+pytest.importorskip("aiohttp")
+import analytics
+
+
+@pytest.fixture
+def adb(tmp_path):
+    db = analytics.AnalyticsDB(db_path=str(tmp_path / "jarvis.db"))
+    yield db
+    db.close()
+
+
+def test_connection_is_reused_per_thread(adb):
+    assert adb._connect() is adb._connect()
+    other = []
+    t = threading.Thread(target=lambda: other.append(adb._connect()))
+    t.start()
+    t.join()
+    assert other[0] is not adb._connect()
+
+
+def test_close_rolls_back_open_transaction(adb):
+    conn = adb._connect()
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    conn.commit()
+    conn.row_factory = sqlite3.Row
+    conn.execute("INSERT INTO t VALUES (1)")
+    assert conn.in_transaction
+    conn.close()
+    assert not conn.in_transaction
+    assert conn.row_factory is None
+    # still usable after close(): it went back to the pool
+    assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+
+def test_left_open_transaction_does_not_hold_write_lock(adb, tmp_path):
+    conn = adb._connect()
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    conn.commit()
+    conn.execute("INSERT INTO t VALUES (1)")  # a call that raised before close()
+    adb._connect()  # next checkout rolls it back
+    other = sqlite3.connect(str(tmp_path / "jarvis.db"), timeout=0.1)
+    other.execute("INSERT INTO t VALUES (2)")
+    other.commit()
+    other.close()
+    assert [r[0] for r in conn.execute("SELECT x FROM t")] == [2]
@@ -0,0 +1,81 @@
+import pytest
+
+import beautify
+
+_SOURCES = ("smtp", "proxy", "gotify", "ntfy", "apprise", "webhook", "webhooks", "", "internal")
+
+# The oversized dump is cut by _truncate_input(), which the legacy chain never did
+_CORPUS = [c for c in beautify._BENCH_CORPUS if len(c[2]) <= 65536]
+
+_MIME_BODY = "Content-Type: text/plain; charset=utf-8\nContent-Transfer-Encoding: 7bit\n\nDisk /dev/sda at 91%"
+
+
+@pytest.mark.parametrize("source", _SOURCES)
+@pytest.mark.parametrize("title,body", [(t, b) for _, t, b in _CORPUS] + [("Forwarded", _MIME_BODY)])
+def test_pipeline_matches_legacy_chain(source, title, body):
+    b = beautify._run_pipeline(title, body, source)
+    assert (b.title, b.text) == beautify._legacy_front(title, body, source)
+
+
+@pytest.mark.parametrize("source", ("gotify", "ntfy", "internal"))
+def test_mime_headers_stripped_for_sources_without_preprocessor(source):
+    assert "Content-" not in beautify._run_pipeline("Forwarded", _MIME_BODY, source).text
+
+
+@pytest.fixture
+def options(monkeypatch):
+    opts = {}
+    monkeypatch.setattr(beautify, "_read_options", lambda: opts)
+    beautify.clear_decoration_cache()
+    yield opts
+    beautify.clear_decoration_cache()
+
+
+def _fp(body, **kw):
+    args = dict(mood="neutral", source_hint="gotify", mode="standard", persona="ops",
+                persona_quip=True, extras_in=None)
+    args.update(kw)
+    return beautify._decor_fingerprint("Title", body, **args)
+
+
+def test_fingerprint_keys_on_truncated_body(options):
+    options["beautify_input_max_chars"] = 100
+    head = "line\n" * 40
+    assert _fp(head + "a" * 500) == _fp(head + "b" * 500)
+    assert _fp("x" + head + "a" * 500) != _fp(head + "a" * 500)
+
+
+def test_fingerprint_ignores_trailing_whitespace_and_line_endings(options):
+    assert _fp("a  \r\nb\n\n\n\nc") == _fp("a\nb\n\nc")
+    assert _fp("a\nb") != _fp("a\nb", source_hint="smtp")
+    assert _fp("a\nb") != _fp("a\nb", extras_in={"riff_hint": False})
+
+
+def test_cache_hit_rerolls_overlay_and_keeps_extras(options, monkeypatch):
+    calls = []
+    quips = iter(f"💬 ops says: — quip {i}" for i in range(10))
+    monkeypatch.setattr(beautify, "_effective_persona", lambda p: p)
+    monkeypatch.setattr(beautify, "_persona_overlay_line", lambda p: next(quips))
+
+    def render(title, body, **kw):
+        calls.append(body)
+        return f"🔟 Jarvis Prime\n{beautify._persona_overlay_line('ops')}\n\n{body}", {"jarvis::beautified": True}
+
+    monkeypatch.setattr(beautify, "_beautify_uncached", render)
+    text1, extras1 = beautify.beautify_message("T", "same body", persona="ops")
+    text2, extras2 = beautify.beautify_message("T", "same body", persona="ops")
+
+    assert calls == ["same body"]
+    assert extras1 == extras2 == {"jarvis::beautified": True}
+    assert extras2 is not extras1
+    assert text1.split("\n")[1] == "💬 ops says: — quip 0"
+    assert text2.split("\n")[1] == "💬 ops says: — quip 1"
+    assert text1.split("\n")[2:] == text2.split("\n")[2:]
+
+
+def test_bypass_cache_renders_fresh(options, monkeypatch):
+    calls = []
+    monkeypatch.setattr(beautify, "_beautify_uncached", lambda t, b, **kw: (calls.append(b) or b, {}))
+    for _ in range(2):
+        beautify.beautify_message("T", "body", extras_in={"bypass_cache": True})
+    assert calls == ["body", "body"]
@@ -0,0 +1,164 @@
+import asyncio
+import zlib
+
+import pytest
+
+pytest.importorskip("aiohttp")
+import analytics
+from analytics import CheckScheduler, HealthCheck
+
+
+class FakeClock:
+    """Virtual time: whenever the loop would block, the clock jumps to the next timer."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+
+class _Selector:
+    def __init__(self, real, clock):
+        self._real, self._clock = real, clock
+
+    def select(self, timeout=None):
+        events = self._real.select(0)
+        if not events and timeout:
+            self._clock.now += timeout
+        return events
+
+    def __getattr__(self, name):
+        return getattr(self._real, name)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(analytics.time, "monotonic", lambda: clock.now)
+    loop = asyncio.SelectorEventLoop()
+    loop.time = lambda: clock.now
+    loop._selector = _Selector(loop._selector, clock)
+    clock.loop = loop
+    yield clock
+    loop.close()
+
+
+def _check(name, interval=10, enabled=True):
+    return HealthCheck(service_name=name, endpoint="http://x", check_type="http", interval=interval, enabled=enabled)
+
+
+def _run(clock, scheduler, until, setup=None, steps=()):
+    """Run the scheduler to virtual time `until`; steps are (at, fn) callbacks."""
+    async def main():
+        start = clock.now
+        scheduler.start()
+        for at, fn in steps:
+            await asyncio.sleep(start + at - clock.now)
+            fn()
+        await asyncio.sleep(start + until - clock.now)
+        await scheduler.stop()
+    clock.loop.run_until_complete(main())
+
+
+def test_phase_is_deterministic_and_within_spread():
+    svc = _check("plex", interval=300)
+    expected = (zlib.crc32(b"plex") % 10000) / 10000 * analytics.SCHEDULE_SPREAD
+    assert CheckScheduler.phase(svc) == expected
+    assert 0 <= CheckScheduler.phase(_check("nas", interval=5)) < 5
+    assert CheckScheduler.phase(_check("a")) != CheckScheduler.phase(_check("b"))
+
+
+def test_fixed_rate_from_phase(clock):
+    fired = []
+
+    async def run_check(svc):
+        fired.append(round(clock.now - 1000.0, 3))
+
+    sched = CheckScheduler(run_check)
+    svc = _check("plex", interval=10)
+    sched.schedule(svc)
+    _run(clock, sched, until=45)
+    phase = round(CheckScheduler.phase(svc), 3)
+    assert fired == [round(phase + 10 * i, 3) for i in range(len(fired))]
+    assert len(fired) == len([t for t in range(5) if phase + 10 * t <= 45])
+
+
+def test_interval_change_reschedules(clock):
+    fired = []
+
+    async def run_check(svc):
+        fired.append((round(clock.now - 1000.0, 3), svc.interval))
+
+    sched = CheckScheduler(run_check)
+    sched.schedule(_check("plex", interval=10))
+    _run(clock, sched, until=100, steps=[(25, lambda: sched.schedule(_check("plex", interval=30)))])
+    before = [t for t, i in fired if i == 10]
+    after = [t for t, i in fired if i == 30]
+    assert before and all(t <= 25 for t in before)
+    phase = CheckScheduler.phase(_check("plex", interval=30))
+    # the new config starts one phase after the change, then every 30 s; no stale 10 s slots
+    first = 25 + phase
+    assert after == [round(first + 30 * i, 3) for i in range(len(after))]
+    assert len(after) == len([i for i in range(4) if first + 30 * i <= 100])
+
+
+def test_removed_service_stops_firing(clock):
+    fired = []
+
+    async def run_check(svc):
+        fired.append((svc.service_name, clock.now - 1000.0))
+
+    sched = CheckScheduler(run_check)
+    sched.schedule(_check("plex", interval=5))
+    sched.schedule(_check("nas", interval=5))
+    _run(clock, sched, until=120, steps=[(61, lambda: sched.unschedule("plex"))])
+    assert all(t <= 61 for n, t in fired if n == "plex")
+    assert any(t > 61 for n, t in fired if n == "nas")
+    assert not sched.is_scheduled("plex") and sched.stats()["scheduled"] == 1
+
+
+def test_disabled_service_keeps_its_slot_but_never_runs(clock):
+    fired = []
+
+    async def run_check(svc):
+        fired.append(svc.service_name)
+
+    sched = CheckScheduler(run_check)
+    sched.schedule(_check("off", interval=5, enabled=False))
+    _run(clock, sched, until=120)
+    assert fired == []
+
+
+def test_concurrency_cap_holds(clock):
+    running, peak, done = [0], [0], []
+
+    async def run_check(svc):
+        running[0] += 1
+        peak[0] = max(peak[0], running[0])
+        await asyncio.sleep(20)  # slower than the interval
+        running[0] -= 1
+        done.append(svc.service_name)
+
+    sched = CheckScheduler(run_check, max_concurrency=3)
+    for i in range(10):
+        sched.schedule(_check(f"svc{i}", interval=10))
+    _run(clock, sched, until=200)
+    assert peak[0] == 3
+    assert len(done) > 10
+    stats = sched.stats()
+    assert stats["max_concurrency"] == 3 and stats["skipped_slots"] >= 0
+
+
+def test_a_check_never_overlaps_itself(clock):
+    active, overlaps = set(), []
+
+    async def run_check(svc):
+        if svc.service_name in active:
+            overlaps.append(svc.service_name)
+        active.add(svc.service_name)
+        await asyncio.sleep(25)  # spans two 10 s slots
+        active.discard(svc.service_name)
+
+    sched = CheckScheduler(run_check)
+    sched.schedule(_check("slow", interval=10))
+    _run(clock, sched, until=200)
+    assert overlaps == []
+    assert sched.stats()["checks_run"] >= 5
@@ -0,0 +1,223 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("aiohttp")
+import dispatcher as d
+import storage
+
+_real_backoff = d._backoff
+
+
+class FakeChannel(d.Channel):
+    name = "fake"
+
+    def __init__(self, fail_times=0, delay=0.0, block=None, **kw):
+        super().__init__(**kw)
+        self.fail_times = fail_times
+        self.delay = delay
+        self.block = block
+        self.attempts = 0
+        self.delivered = []
+
+    async def deliver(self, note):
+        self.attempts += 1
+        if self.block is not None:
+            while not self.block.is_set():
+                await asyncio.sleep(0.005)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.attempts <= self.fail_times:
+            raise ConnectionError(f"boom {self.attempts}")
+        self.delivered.append(note.title)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(d, "_backoff", lambda attempt, base=0.5, cap=10.0: 0.0)
+
+
+@pytest.fixture
+def run():
+    started = []
+
+    def _run(*channels):
+        disp = d.Dispatcher(list(channels))
+        disp.start()
+        started.append(disp)
+        return disp
+
+    yield _run
+    for disp in started:
+        disp.stop(timeout=5)
+
+
+def test_retries_until_success(run):
+    ch = FakeChannel(fail_times=2, retries=2)
+    disp = run(ch)
+    disp.submit(d.Notification(title="t", message="m"))
+    disp.wait_idle(5)
+    assert ch.delivered == ["t"]
+    assert (ch.stats.retries, ch.stats.failed, ch.stats.sent) == (2, 0, 1)
+
+
+def test_gives_up_after_retry_budget(run):
+    ch = FakeChannel(fail_times=10, retries=1)
+    disp = run(ch)
+    disp.submit(d.Notification(title="t", message="m"))
+    disp.wait_idle(5)
+    assert ch.attempts == 2
+    assert (ch.stats.failed, ch.stats.sent) == (1, 0)
+    assert ch.stats.last_error == "boom 2"
+
+
+def test_backoff_is_jittered_and_capped():
+    for attempt in range(8):
+        ceiling = min(10.0, 0.5 * 2 ** attempt)
+        waits = [_real_backoff(attempt) for _ in range(200)]
+        assert all(0.0 <= w <= ceiling for w in waits)
+        assert len(set(waits)) > 1
+
+
+def test_timeout_only_hits_the_slow_channel(run):
+    slow = FakeChannel(delay=1.0, retries=0, timeout=0.05)
+    fast = FakeChannel(retries=0)
+    fast.name = "fast"
+    disp = run(slow, fast)
+    t0 = time.perf_counter()
+    disp.submit(d.Notification(title="t", message="m"))
+    disp.wait_idle(5)
+    assert fast.delivered == ["t"] and slow.delivered == []
+    assert slow.stats.failed == 1 and "TimeoutError" in slow.stats.last_error
+    assert time.perf_counter() - t0 < 0.9
+
+
+def test_full_queue_drops_and_counts(run):
+    gate = threading.Event()
+    ch = FakeChannel(block=gate, retries=0, queue_size=2)
+    disp = run(ch)
+    disp.submit(d.Notification(title="t0", message="m"))
+    while ch.attempts == 0:
+        time.sleep(0.005)
+    for i in range(1, 5):
+        disp.submit(d.Notification(title=f"t{i}", message="m"))
+    time.sleep(0.05)
+    gate.set()
+    disp.wait_idle(5)
+    # one in flight, two queued, two dropped
+    assert ch.delivered == ["t0", "t1", "t2"]
+    assert ch.stats.dropped == 2
+
+
+def test_submit_raises_when_loop_failed_to_start(monkeypatch):
+    class Broken(FakeChannel):
+        async def open(self, dispatcher):
+            raise OSError("no socket")
+
+    disp = d.Dispatcher([Broken()])
+    with pytest.raises(RuntimeError):
+        disp.submit(d.Notification(title="t", message="m"))
+
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status = status
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise ConnectionError(f"HTTP {self.status}")
+
+    async def read(self):
+        return b"{}"
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, status):
+        self.status = status
+
+    def post(self, url, json=None, **kw):
+        return FakeResponse(self.status)
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def inbox_db(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "GROUP_COMMIT_MS", 0)
+    storage.init_db(str(tmp_path / "jarvis.db"))
+    yield storage
+    storage.flush_pending()
+    storage._CONN.close()
+    storage._CONN = None
+
+
+def _status_of_last_row(db, timeout=5.0):
+    end = time.time() + timeout
+    while time.time() < end:
+        rows = db.list_messages(limit=1)
+        if rows and rows[0]["extras"].get("status") != "pending":
+            return rows[0]["extras"]["status"]
+        time.sleep(0.01)
+    return db.list_messages(limit=1)[0]["extras"]["status"]
+
+
+@pytest.mark.parametrize("http_status,expected", [(200, 200), (500, 0)])
+def test_inbox_records_gotify_result(run, inbox_db, http_status, expected):
+    gotify = d.GotifyChannel("http://gotify.invalid", "tok", retries=0)
+    disp = run(d.InboxChannel(inbox_db), gotify)
+    disp.session = FakeSession(http_status)
+    disp.submit(d.Notification(title="t", message="m", inbox_title="t"))
+    disp.wait_idle(5)
+    assert _status_of_last_row(inbox_db) == expected
+
+
+def test_inbox_records_gotify_result_with_group_commit(run, inbox_db):
+    inbox_db.enable_group_commit(interval_ms=50, max_rows=10)
+    gotify = d.GotifyChannel("http://gotify.invalid", "tok", retries=0)
+    disp = run(d.InboxChannel(inbox_db), gotify)
+    disp.session = FakeSession(200)
+    disp.submit(d.Notification(title="t", message="m", inbox_title="t"))
+    disp.wait_idle(5)
+    assert _status_of_last_row(inbox_db) == 200
+
+
+def test_inbox_without_gotify_records_unconfigured(run, inbox_db):
+    disp = run(d.InboxChannel(inbox_db))
+    disp.submit(d.Notification(title="t", message="m", inbox_title="t"))
+    disp.wait_idle(5)
+    assert _status_of_last_row(inbox_db) == -1
+
+
+def test_send_message_falls_back_to_direct_sends(monkeypatch):
+    pytest.importorskip("requests")
+    import bot
+
+    class Down:
+        def submit(self, note):
+            raise RuntimeError("dispatcher loop is not running")
+
+    direct = []
+    monkeypatch.setattr(bot, "_dispatcher", Down())
+    monkeypatch.setattr(bot, "_send_direct", lambda *a: direct.append(a) or True)
+    assert bot.send_message("Disk", "sda at 91%", priority=6, decorate=False) is True
+    assert len(direct) == 1 and direct[0][1] == "Disk"
+
+
+def test_ntfy_flag_comes_from_options_snapshot(monkeypatch):
+    pytest.importorskip("requests")
+    import builtins
+    import ntfy_client
+
+    monkeypatch.delenv("PUSH_NTFY_ENABLED", raising=False)
+    monkeypatch.setattr(ntfy_client.options_store, "get", lambda key, default=None: False)
+    monkeypatch.setattr(builtins, "open", lambda *a, **kw: pytest.fail("options file opened per message"))
+    assert ntfy_client._read_option_flag() is False
@@ -0,0 +1,51 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("requests")
+import bot
+
+
+def _fill(monkeypatch, policy, titles, size=2):
+    monkeypatch.setattr(bot, "INTAKE_SHED_POLICY", policy)
+
+    async def run():
+        q = asyncio.Queue(maxsize=size)
+        monkeypatch.setattr(bot, "_intake_queue", q)
+        results = [await bot.enqueue_incoming(t, "body", source="test") for t in titles]
+        return results, [q.get_nowait()[1] for _ in range(q.qsize())]
+
+    return asyncio.run(run())
+
+
+def test_default_policy_never_drops():
+    assert bot.INTAKE_SHED_POLICY == "block"
+
+
+def test_drop_newest_rejects_new_item(monkeypatch):
+    results, queued = _fill(monkeypatch, "drop_newest", ["a", "b", "c"])
+    assert results == [True, True, False]
+    assert queued == ["a", "b"]
+
+
+def test_drop_oldest_evicts_head(monkeypatch):
+    results, queued = _fill(monkeypatch, "drop_oldest", ["a", "b", "c"])
+    assert results == [True, True, True]
+    assert queued == ["b", "c"]
+
+
+def test_block_waits_for_a_free_slot(monkeypatch):
+    monkeypatch.setattr(bot, "INTAKE_SHED_POLICY", "block")
+
+    async def run():
+        q = asyncio.Queue(maxsize=1)
+        monkeypatch.setattr(bot, "_intake_queue", q)
+        await bot.enqueue_incoming("a", "body", source="test")
+        pending = asyncio.ensure_future(bot.enqueue_incoming("b", "body", source="test"))
+        await asyncio.sleep(0.01)
+        assert not pending.done()
+        assert q.get_nowait()[1] == "a"
+        assert await asyncio.wait_for(pending, 1) is True
+        return q.get_nowait()[1]
+
+    assert asyncio.run(run()) == "b"
@@ -0,0 +1,159 @@
+import asyncio
+import socket
+
+import pytest
+
+pytest.importorskip("aiohttp")
+from aiohttp import web
+
+import analytics
+from analytics import IoTFingerprinter, NetworkDevice
+
+
+class FakeScanner:
+    def __init__(self, devices):
+        self.devices = devices
+
+    async def recent_devices(self, max_age=None):
+        return list(self.devices)
+
+    def _lookup_vendor(self, mac):
+        return None
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _serve(hits):
+    """An ESPHome-like device whose / redirects to the UI page"""
+    async def root(request):
+        hits.append(request.path)
+        raise web.HTTPFound("/ui")
+
+    async def ui(request):
+        hits.append(request.path)
+        return web.Response(text="<title>ESPHome Web Server</title>")
+
+    async def missing(request):
+        hits.append(request.path)
+        return web.Response(status=404)
+
+    app = web.Application()
+    app.router.add_get("/", root)
+    app.router.add_get("/ui", ui)
+    app.router.add_route("GET", "/{tail:.*}", missing)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    port = _free_port()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner, port
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(analytics.time, "time", lambda: now[0])
+    return now
+
+
+def _run_discovery(devices, clock, rounds):
+    """Run `rounds(fp, port, hits)` against a local device; returns its result"""
+    async def main():
+        hits = []
+        runner, port = await _serve(hits)
+        analytics.IOT_PROBE_PORTS = (port,)
+        fp = IoTFingerprinter(FakeScanner(devices))
+        fp._limiter = analytics._RateLimiter(0)
+        try:
+            return await rounds(fp, port, hits)
+        finally:
+            await fp.close()
+            await runner.cleanup()
+    return asyncio.run(main())
+
+
+@pytest.fixture(autouse=True)
+def _restore_ports(monkeypatch):
+    monkeypatch.setattr(analytics, "IOT_PROBE_PORTS", analytics.IOT_PROBE_PORTS)
+
+
+def test_follows_redirects_to_match(clock):
+    dev = NetworkDevice("aa:00", "127.0.0.1", hostname="kitchen")
+
+    async def rounds(fp, port, hits):
+        return port, hits, await fp.discover()
+
+    port, hits, found = _run_discovery([dev], clock, rounds)
+    assert [d["pattern"] for d in found] == ["esphome"]
+    assert found[0]["endpoint"] == f"http://127.0.0.1:{port}/"
+    assert found[0]["service_name"] == "ESPHome (kitchen)"
+    assert "/ui" in hits
+
+
+def test_fingerprint_reused_until_ttl(clock):
+    dev = NetworkDevice("aa:00", "127.0.0.1")
+
+    async def rounds(fp, port, hits):
+        first = await fp.discover()
+        probed = len(hits)
+        clock[0] += analytics.IOT_CACHE_TTL - 1
+        second = await fp.discover()
+        cached = (len(hits) == probed, fp.stats()["cached_devices"])
+        clock[0] += 2
+        third = await fp.discover()
+        return first, second, third, cached, len(hits) > probed, dict(fp.counters)
+
+    first, second, third, cached, reprobed, counters = _run_discovery([dev], clock, rounds)
+    assert first == second == third
+    assert cached == (True, 1)
+    assert reprobed
+    assert counters["cache_hits"] == 1 and counters["cache_misses"] == 2
+
+
+def test_cache_is_per_mac(clock):
+    a = NetworkDevice("aa:00", "127.0.0.1")
+    b = NetworkDevice("bb:00", "127.0.0.1")
+
+    async def rounds(fp, port, hits):
+        await fp.discover()
+        after_first = dict(fp.counters)
+        await fp.discover()
+        # same MAC on a new address is fingerprinted again
+        fp.scanner.devices = [NetworkDevice("aa:00", "127.0.0.2"), b]
+        await fp.discover()
+        after_move = dict(fp.counters)
+        fp.invalidate("bb:00")
+        await fp.discover()
+        return after_first, after_move, dict(fp.counters)
+
+    after_first, after_move, final = _run_discovery([a, b], clock, rounds)
+    assert after_first["cache_misses"] == 2 and after_first["cache_hits"] == 0
+    assert after_move["cache_hits"] == 3 and after_move["cache_misses"] == 3
+    assert final["cache_hits"] == 4 and final["cache_misses"] == 4
+
+
+def test_port_open_closes_the_probe_connection():
+    async def main():
+        closed = asyncio.Event()
+
+        async def handler(reader, writer):
+            await reader.read()  # EOF once the prober closed its side
+            closed.set()
+            writer.close()
+
+        server = await asyncio.start_server(handler, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        fp = IoTFingerprinter(FakeScanner([]))
+        try:
+            is_open = await fp._port_open("127.0.0.1", port)
+            await asyncio.wait_for(closed.wait(), 2)
+            is_closed = await fp._port_open("127.0.0.1", _free_port())
+        finally:
+            server.close()
+            await server.wait_closed()
+        return is_open, is_closed, fp.counters["port_probes"]
+
+    assert asyncio.run(main()) == (True, False, 2)
@@ -0,0 +1,166 @@
+import asyncio
+import sqlite3
+import time
+
+import pytest
+
+pytest.importorskip("aiohttp")
+import analytics
+from analytics import NetworkDevice
+
+
+@pytest.fixture
+def adb(tmp_path):
+    db = analytics.AnalyticsDB(db_path=str(tmp_path / "jarvis.db"))
+    yield db
+    db.close()
+
+
+def _known(adb, mac, ip, age, monitored=False, custom_name=None):
+    """Seed a known device last seen `age` seconds ago"""
+    seen = int(time.time()) - age
+    conn = sqlite3.connect(adb.db_path)
+    conn.execute("""
+        INSERT INTO network_devices
+        (mac_address, ip_address, hostname, custom_name, first_seen, last_seen, is_permanent, is_monitored)
+        VALUES (?, ?, NULL, ?, ?, ?, 0, ?)
+    """, (mac, ip, custom_name, seen - 86400, seen, int(monitored)))
+    conn.commit()
+    conn.close()
+
+
+def _rows(adb, sql, *args):
+    conn = sqlite3.connect(adb.db_path)
+    try:
+        return conn.execute(sql, args).fetchall()
+    finally:
+        conn.close()
+
+
+def _macs(devices):
+    return sorted(d.mac_address for d in devices)
+
+
+def _seed_mixed(adb):
+    _known(adb, "aa:00", "10.0.0.1", age=30, monitored=True)                 # steady, online
+    _known(adb, "aa:01", "10.0.0.2", age=400, monitored=True, custom_name="NAS")  # back online
+    _known(adb, "aa:02", "10.0.0.3", age=400, monitored=True)                # missing: goes offline
+    _known(adb, "aa:03", "10.0.0.4", age=400)                                # missing, unmonitored
+    _known(adb, "aa:04", "10.0.0.5", age=5000, monitored=True)               # long gone: already reported
+    _known(adb, "aa:05", "10.0.0.6", age=400)                                # back, unmonitored
+
+
+def _scan():
+    return [
+        NetworkDevice("aa:00", "10.0.0.1"),
+        NetworkDevice("aa:01", "10.0.0.22", hostname="nas"),
+        NetworkDevice("aa:05", "10.0.0.6"),
+        NetworkDevice("bb:00", "10.0.0.9", vendor="Acme"),
+        NetworkDevice("bb:00", "10.0.0.9", vendor="Acme"),  # duplicate ARP entry
+    ]
+
+
+def test_reconcile_change_sets(adb):
+    _seed_mixed(adb)
+    changes = adb.reconcile_devices(_scan())
+    assert _macs(changes["new"]) == ["bb:00"]
+    assert _macs(changes["online"]) == ["aa:01"]
+    assert _macs(changes["offline"]) == ["aa:02"]
+    # user-managed fields are carried over for the notification text
+    assert changes["online"][0].custom_name == "NAS"
+
+
+def test_reconcile_persists_devices_and_events(adb):
+    _seed_mixed(adb)
+    before = int(time.time())
+    adb.reconcile_devices(_scan())
+    devices = dict(_rows(adb, "SELECT mac_address, ip_address FROM network_devices"))
+    assert devices["aa:01"] == "10.0.0.22" and devices["bb:00"] == "10.0.0.9"
+    assert len(devices) == 7
+    # custom name / monitoring flags survive the upsert
+    assert _rows(adb, "SELECT custom_name, is_monitored FROM network_devices WHERE mac_address='aa:01'") == [("NAS", 1)]
+    seen = dict(_rows(adb, "SELECT mac_address, last_seen FROM network_devices"))
+    assert seen["aa:00"] >= before and seen["aa:02"] < before
+    events = sorted(_rows(adb, "SELECT event_type, mac_address FROM network_events"))
+    assert events == [("device_offline", "aa:02"), ("device_online", "aa:01"), ("new_device", "bb:00")]
+
+
+def test_reconcile_is_idempotent_for_an_unchanged_scan(adb):
+    _seed_mixed(adb)
+    adb.reconcile_devices(_scan())
+    changes = adb.reconcile_devices(_scan())
+    assert changes["new"] == [] and changes["online"] == []
+    assert _macs(changes["offline"]) == ["aa:02"]  # still inside the offline window
+    assert len(_rows(adb, "SELECT 1 FROM network_events WHERE event_type != 'device_offline'")) == 2
+
+
+def test_reconcile_rolls_back_on_failure(adb):
+    _seed_mixed(adb)
+    before = _rows(adb, "SELECT * FROM network_devices ORDER BY mac_address")
+    conn = sqlite3.connect(adb.db_path)
+    conn.execute("DROP TABLE network_events")  # the bulk event insert fails after the upsert
+    conn.commit()
+    conn.close()
+    with pytest.raises(sqlite3.OperationalError):
+        adb.reconcile_devices(_scan())
+    assert _rows(adb, "SELECT * FROM network_devices ORDER BY mac_address") == before
+    # the failed transaction did not leave the write lock held
+    conn = sqlite3.connect(adb.db_path, timeout=0.1)
+    conn.execute("UPDATE network_devices SET hostname = 'x'")
+    conn.commit()
+    conn.close()
+
+
+@pytest.fixture
+def notified(monkeypatch):
+    sent = []
+
+    async def fake_notify(service, severity, message):
+        sent.append((severity, message))
+
+    monkeypatch.setattr(analytics, "analytics_notify", fake_notify)
+    return sent
+
+
+def test_apply_scan_notifies_after_commit(adb, notified, monkeypatch):
+    _seed_mixed(adb)
+    scanner = analytics.NetworkScanner(adb)
+    committed = []
+
+    async def fake_notify(service, severity, message):
+        # a separate connection must already see the scan result
+        committed.append(bool(_rows(adb, "SELECT 1 FROM network_devices WHERE mac_address='bb:00'")))
+        notified.append((severity, message))
+
+    monkeypatch.setattr(analytics, "analytics_notify", fake_notify)
+    published = []
+    monkeypatch.setattr(analytics.live_feed, "publish", lambda kind, **data: published.append((kind, data)))
+
+    changes = asyncio.run(scanner.apply_scan(_scan()))
+    assert committed == [True, True, True]
+    assert [s for s, _ in notified] == ["info", "info", "warning"]
+    assert "NAS" in notified[1][1] and "bb:00" in notified[0][1]
+    assert published[0][0] == "devices"
+    assert [d["mac_address"] for d in published[0][1]["new"]] == ["bb:00"]
+    assert _macs(changes["offline"]) == ["aa:02"]
+
+
+def test_apply_scan_without_new_device_alerts(adb, notified):
+    _seed_mixed(adb)
+    scanner = analytics.NetworkScanner(adb)
+    scanner.alert_new_devices = False
+    asyncio.run(scanner.apply_scan(_scan()))
+    assert [s for s, _ in notified] == ["info", "warning"]
+
+
+def test_apply_scan_does_not_notify_when_reconcile_fails(adb, notified):
+    _seed_mixed(adb)
+    conn = sqlite3.connect(adb.db_path)
+    conn.execute("DROP TABLE network_events")
+    conn.commit()
+    conn.close()
+    scanner = analytics.NetworkScanner(adb)
+    with pytest.raises(sqlite3.OperationalError):
+        asyncio.run(scanner.apply_scan(_scan()))
+    assert notified == []
+    assert not _rows(adb, "SELECT 1 FROM network_devices WHERE mac_address='bb:00'")
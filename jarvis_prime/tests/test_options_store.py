@@ -0,0 +1,115 @@
+import json
+import os
+
+import pytest
+
+from options_store import OptionsStore
+
+
+@pytest.fixture
+def opts_file(tmp_path):
+    path = tmp_path / "options.json"
+    stamp = [1_000_000_000]
+
+    def write(text):
+        path.write_text(text if isinstance(text, str) else json.dumps(text))
+        stamp[0] += 1  # a new mtime for every write, even within one clock tick
+        os.utime(path, ns=(stamp[0] * 10**9, stamp[0] * 10**9))
+
+    write({"llm_enabled": True, "intake_workers": 1})
+    return path, write
+
+
+def test_refresh_loads_and_skips_unchanged(opts_file):
+    path, _ = opts_file
+    store = OptionsStore([str(path)], check_seconds=0)
+    assert store.refresh() is True
+    assert dict(store.snapshot()) == {"llm_enabled": True, "intake_workers": 1}
+    assert store.refresh() is False
+    assert store.reloads == 1
+
+
+@pytest.mark.parametrize("broken", ['{"llm_enabled": false, "intake_wor', "", "[1, 2]", "{{{"])
+def test_broken_or_half_written_file_keeps_last_snapshot(opts_file, broken):
+    path, write = opts_file
+    store = OptionsStore([str(path)], check_seconds=0)
+    store.refresh()
+    write(broken)
+    assert store.refresh() is False
+    assert store.parse_errors == 1
+    assert store.get("llm_enabled") is True  # re-checks and fails again, still the last good copy
+    # the writer finishes: the next check picks it up
+    write({"llm_enabled": False, "intake_workers": 1})
+    assert store.refresh() is True
+    assert store.get("llm_enabled") is False
+
+
+def test_missing_file_gives_empty_snapshot(tmp_path):
+    store = OptionsStore([str(tmp_path / "nope.json")], check_seconds=0)
+    store.refresh()
+    assert dict(store.snapshot()) == {}
+    assert store.path is None
+
+
+def test_snapshot_is_read_only_and_load_is_a_copy(opts_file):
+    path, _ = opts_file
+    store = OptionsStore([str(path)], check_seconds=0)
+    with pytest.raises(TypeError):
+        store.snapshot()["llm_enabled"] = False
+    copy = store.load()
+    copy["llm_enabled"] = False
+    assert store.get("llm_enabled") is True
+
+
+def test_subscribers_get_only_their_keys(opts_file):
+    path, write = opts_file
+    store = OptionsStore([str(path)], check_seconds=3600)  # keep the watcher idle
+    store.refresh()
+    seen, every = [], []
+    store.subscribe(lambda changed, snap: seen.append((changed, snap["llm_enabled"])), keys=("llm_enabled",))
+    unsubscribe = store.subscribe(lambda changed, snap: every.append(changed))
+
+    write({"llm_enabled": True, "intake_workers": 4})
+    store.refresh()
+    assert seen == [] and every == [frozenset({"intake_workers"})]
+
+    unsubscribe()
+    write({"llm_enabled": False, "intake_workers": 4})
+    store.refresh()
+    assert seen == [(frozenset({"llm_enabled"}), False)]
+    assert len(every) == 1
+    assert store.version == 3
+
+
+def test_failing_listener_does_not_block_others(opts_file):
+    path, write = opts_file
+    store = OptionsStore([str(path)], check_seconds=3600)
+    store.refresh()
+    got = []
+
+    def bad(changed, snap):
+        raise RuntimeError("boom")
+
+    store.subscribe(bad)
+    store.subscribe(lambda changed, snap: got.append(changed))
+    write({"llm_enabled": False, "intake_workers": 1})
+    assert store.refresh() is True
+    assert got == [frozenset({"llm_enabled"})]
+
+
+def test_merge_layers_files_in_order(tmp_path):
+    base, override = tmp_path / "options.json", tmp_path / "config.json"
+    base.write_text(json.dumps({"rag_enabled": True, "ha_url": "http://a"}))
+    override.write_text(json.dumps({"ha_url": "http://b", "ha_token": "t"}))
+    merged = OptionsStore([str(base), str(override)], check_seconds=0, merge=True)
+    assert dict(merged.snapshot()) == {"rag_enabled": True, "ha_url": "http://b", "ha_token": "t"}
+    first = OptionsStore([str(base), str(override)], check_seconds=0)
+    assert dict(first.snapshot()) == {"rag_enabled": True, "ha_url": "http://a"}
+
+    # an edit to either file is picked up; a broken one keeps the last good merge
+    override.write_text(json.dumps({"ha_url": "http://c"}) + " " * 20)
+    assert merged.snapshot()["ha_url"] == "http://c" and "ha_token" not in merged.snapshot()
+    override.write_text('{"ha_url": ')
+    assert merged.snapshot()["ha_url"] == "http://c"
+    override.unlink()
+    assert merged.snapshot()["ha_url"] == "http://a"
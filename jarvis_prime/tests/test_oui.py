@@ -0,0 +1,49 @@
+import oui
+
+
+def _build(tmp_path, files):
+    seed = tmp_path / "seed.tsv"
+    seed.write_text("# test seed\nAABBCC\tSeedCo\n001B63\tApple\n")
+    data = tmp_path / "oui"
+    data.mkdir()
+    for name, text in files.items():
+        (data / name).write_text(text)
+    return oui.OuiIndex.build(seed=seed, data_dir=data)
+
+
+def test_longest_prefix_wins(tmp_path):
+    idx = _build(tmp_path, {
+        "oui.csv": "Registry,Assignment,Organization Name,Organization Address\n"
+                   "MA-L,70B3D5,IEEE Registration Authority,addr\n"
+                   "MA-L,FCECDA,\"Ubiquiti Inc\",addr\n",
+        "mam.csv": "Registry,Assignment,Organization Name,Organization Address\n"
+                   "MA-M,70B3D51,Acme Sensors GmbH,addr\n",
+        "oui36.csv": "Registry,Assignment,Organization Name,Organization Address\n"
+                     "MA-S,70B3D5123,Tiny Widgets Ltd,addr\n",
+    })
+    assert idx.lookup("70:B3:D5:12:34:56") == ("Tiny Widgets", 36)
+    assert idx.lookup("70:B3:D5:1F:00:00") == ("Acme Sensors", 28)
+    # the MA-L block sub-assigned by the RA has no vendor of its own
+    assert idx.lookup("70:B3:D5:F0:00:00") is None
+    assert idx.lookup("fc-ec-da-01-02-03") == ("Ubiquiti", 24)
+
+
+def test_data_files_override_seed_and_accept_manuf(tmp_path):
+    idx = _build(tmp_path, {"manuf": "AA:BB:CC\tOther\tOther Corporation\n00:1B:63:40:00:00/28\tFruitSub\n"})
+    assert idx.lookup("aabbcc000001") == ("Other", 24)
+    assert idx.lookup("00:1B:63:41:00:00") == ("FruitSub", 28)
+    assert idx.lookup("00:1B:63:80:00:00") == ("Apple", 24)
+
+
+def test_invalid_and_unknown_addresses(tmp_path):
+    idx = _build(tmp_path, {})
+    assert idx.lookup("not a mac") is None
+    assert idx.lookup("00:1B:63:00:00") is None
+    assert idx.lookup("12:34:56:78:9A:BC") is None
+
+
+def test_canonical_vendor_and_randomized():
+    assert oui.canonical_vendor("Apple, Inc.") == "Apple"
+    assert oui.canonical_vendor("Shenzhen Foo Technology Co., Ltd.") == "Shenzhen Foo"
+    assert oui.is_randomized("DA:A1:19:00:00:01")
+    assert not oui.is_randomized("00:1B:63:00:00:01")
@@ -0,0 +1,55 @@
+import pytest
+
+import personality as p
+
+# (subject, body) -> services, action, urgency, download_state
+CONTEXT_CASES = [
+    # whole-word matching: substrings inside longer words no longer count
+    (("Weekly email report", "Sent 14 emails to the team"),
+     (["email"], "status", 0, None)),                     # "ai" in "email" is not the jarvis service
+    (("Security", "Possible sabotage attempt logged by fail2ban"),
+     (["security"], "status", 0, None)),                  # "sab" in "sabotage" is not SABnzbd
+    (("Radarr", "Movie download started"),
+     (["radarr", "media"], "started", 0, None)),          # "down" in "download" is not an outage
+    (("Watchtower", "Stopping container plex, pulling and restarting"),
+     (["plex", "docker"], "restarted", 0, None)),         # "restarting" is not "started"
+    # real notification bodies
+    (("Sonarr - Episode Downloaded", "The Expanse S03E05 has been downloaded and imported"),
+     (["sonarr", "media"], "completed", 0, None)),
+    (("Uptime Kuma", "[Nextcloud] [Down] connect ECONNREFUSED - service unreachable"),
+     (["uptime-kuma", "nextcloud"], "failed", 6, None)),
+    (("Uptime Kuma", "[Nextcloud] [Up] 200 - OK"),
+     (["uptime-kuma", "nextcloud"], "completed", 0, None)),
+    (("SABnzbd", "Repairing par2 set, unpacking 42 segments, queued: 3 items"),
+     (["sabnzbd"], "status", 0, "extracting")),
+    (("qBittorrent", "Torrent completed, ratio 1.42, seeding to 12 peers"),
+     (["qbittorrent", "media"], "completed", 1, "seeding")),
+    (("Critical", "URGENT: PostgreSQL primary is down, failover immediate action required"),
+     (["postgresql", "database"], "failed", 8, None)),
+    (("SMART warning", "Disk /dev/sdc reallocated sector count increased. Drive health degraded"),
+     (["storage", "monitoring"], "warning", 3, None)),
+    (("Home Assistant", "4 devices unavailable, coordinator offline"),
+     (["homeassistant"], "disconnected", 6, None)),
+    (("Proxmox", "Backups of 3 VMs finished"),            # plural "backups" still finds backup
+     (["proxmox", "backup"], "completed", 0, None)),
+    (("Plex", "plex transcoder crashed"),
+     (["plex"], "failed", 6, None)),
+]
+
+
+@pytest.mark.parametrize("message,expected", CONTEXT_CASES, ids=[c[0][0] + ": " + c[0][1][:30] for c in CONTEXT_CASES])
+def test_context_extraction(message, expected):
+    ctx = p._extract_smart_context(*message)
+    assert (ctx["services"], ctx["action"], ctx["urgency"], ctx["download_state"]) == expected
+    assert ctx["primary_service"] == expected[0][0]
+
+
+def test_context_flags():
+    ctx = p._extract_smart_context("qBittorrent", "Torrent completed, ratio 1.42")
+    assert ctx["is_torrent"] and not ctx["is_usenet"] and ctx["has_numbers"]
+    ctx = p._extract_smart_context("SABnzbd", "unpacking segments")
+    assert ctx["is_usenet"] and not ctx["is_torrent"] and not ctx["has_numbers"]
+    ctx = p._extract_smart_context("Critical", "act immediately, disk at 98%")
+    assert ctx["time_sensitive"] and ctx["has_percentage"]
+    ctx = p._extract_smart_context("Nothing", "all quiet")
+    assert ctx["services"] == [] and ctx["primary_service"] is None and ctx["action"] == "status"
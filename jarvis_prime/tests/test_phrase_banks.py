@@ -0,0 +1,59 @@
+import pytest
+
+import personality as p
+
+
+@pytest.fixture
+def fixed_daypart(monkeypatch):
+    monkeypatch.setattr(p, "_daypart", lambda now_ts=None: "evening")
+
+
+@pytest.mark.parametrize("persona", ["ops", "jarvis", "dude", "rager"])
+def test_same_seed_same_header_and_riffs(fixed_daypart, persona):
+    def render():
+        p.seed_phrases(1234)
+        header = p.persona_header(persona, subject="Plex", body="plex transcoder crashed")
+        riffs = p.lexi_riffs(persona, n=3, subject="Plex", body="plex transcoder crashed")
+        return header, riffs
+
+    first = render()
+    assert render() == first
+    p.seed_phrases(99)
+    others = {p.persona_header(persona, subject="Plex", body="plex transcoder crashed") for _ in range(20)}
+    assert len(others) > 1  # selection really is random once reseeded
+
+
+def test_slots_take_the_service_or_the_default_word():
+    parts = tuple(p._SLOT_RE.split("{system} operational, {status} green"))
+    assert p._fill(parts, "plex") == "plex operational, plex green"
+    assert p._fill(parts, None) == "system operational, status green"
+    assert p._fill(tuple(p._SLOT_RE.split("{system} stable")), None) == "system stable"
+
+
+def test_every_header_template_fills_cleanly(fixed_daypart):
+    banks = p._phrase_banks()
+    for (tier, persona), templates in banks.headers.items():
+        for parts in templates:
+            for service in ("plex", None):
+                text = p._fill(parts, service)
+                assert "{" not in text and "}" not in text, (tier, persona, text)
+                if service and len(parts) > 1:
+                    assert service in text
+
+
+def test_banks_cover_every_persona():
+    banks = p._phrase_banks()
+    for persona in p.PERSONAS:
+        for daypart in ("early_morning", "morning", "afternoon", "evening", "late_night"):
+            assert banks.greetings.get((daypart, persona)), (daypart, persona)
+        for tier in p._HEADER_TIERS:
+            assert banks.headers.get((tier, persona)), (tier, persona)
+        assert banks.generic.get(("status", persona)), persona
+
+
+def test_missing_phrase_banks_fall_back(tmp_path, monkeypatch, fixed_daypart):
+    banks = p._PhraseBanks.load(tmp_path / "missing.json")
+    assert banks.stats() == {"greetings": 0, "headers": 0, "service_riffs": 0, "generic_riffs": 0}
+    monkeypatch.setattr(p, "_banks", banks)
+    assert p.persona_header("ops", subject="Plex", body="plex transcoder crashed").startswith("Update, plex operational")
+    assert p.lexi_riffs("ops", n=2, subject="Plex", body="x") == ["Systems operational", "Systems operational"]
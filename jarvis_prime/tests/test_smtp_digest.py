@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+import dispatcher as d
+
+
+class RecordingSmtp(d.SmtpChannel):
+    def __init__(self, fail_times=0, **kw):
+        kw.setdefault("retries", 1)
+        super().__init__("smtp.invalid", 587, to=["ops@example.com"], sender="jarvis@example.com", **kw)
+        self.fail_times = fail_times
+        self.sent = []
+
+    def send_raw(self, subject, msg):
+        if self.fail_times > 0:
+            self.fail_times -= 1
+            raise ConnectionError("relay down")
+        self.sent.append((subject, msg))
+
+    def _drop(self):
+        pass
+
+
+def _note(title, priority):
+    return d.Notification(title=title, message=f"body of {title}", priority=priority)
+
+
+def _run(ch, scenario):
+    async def main():
+        await ch.open(None)
+        try:
+            await scenario()
+        finally:
+            await ch.close()
+    asyncio.run(main())
+
+
+def _plain_text(msg):
+    return [p.get_payload(decode=True).decode() for p in msg.get_payload()][0]
+
+
+def test_bands_are_digested_separately_on_window_flush():
+    ch = RecordingSmtp(digest_window=0.3, digest_subject_prefix="Jarvis")
+
+    async def scenario():
+        for title, prio in (("a", 2), ("b", 5), ("c", 3), ("d", 6)):
+            await ch.handle(_note(title, prio))
+        assert ch.sent == []
+        await asyncio.sleep(0.8)
+        assert ch.extra_stats()["batched_pending"] == 0
+
+    _run(ch, scenario)
+    subjects = sorted(s for s, _ in ch.sent)
+    assert subjects == ["Jarvis: Digest — 2 notifications (low)", "Jarvis: Digest — 2 notifications (normal)"]
+    low = next(m for s, m in ch.sent if s.endswith("(low)"))
+    text = _plain_text(low)
+    assert "a (priority 2)" in text and "c (priority 3)" in text and "b (priority" not in text
+    assert ch.digests == 2
+
+
+def test_max_batch_flushes_before_the_window():
+    ch = RecordingSmtp(digest_window=60, digest_max_batch=3)
+
+    async def scenario():
+        for i in range(4):
+            await ch.handle(_note(f"n{i}", 5))
+        assert [s for s, _ in ch.sent] == ["Digest — 3 notifications (normal)"]
+        assert ch.extra_stats()["batched_pending"] == 1
+
+    _run(ch, scenario)
+    # close() flushes the remainder; a single leftover is mailed on its own
+    assert [s for s, _ in ch.sent] == ["Digest — 3 notifications (normal)", "n3"]
+
+
+def test_high_priority_bypasses_the_digest():
+    ch = RecordingSmtp(digest_window=60, digest_bypass_priority=8)
+
+    async def scenario():
+        await ch.handle(_note("low", 2))
+        await ch.handle(_note("urgent", 8))
+        assert [s for s, _ in ch.sent] == ["urgent"]
+
+    _run(ch, scenario)
+    assert [s for s, _ in ch.sent] == ["urgent", "low"]
+
+
+def test_close_waits_for_a_flush_in_retry_backoff(monkeypatch):
+    monkeypatch.setattr(d, "_backoff", lambda attempt, base=0.5, cap=10.0: 0.4)
+    ch = RecordingSmtp(fail_times=1, digest_window=0.3)
+
+    async def scenario():
+        await ch.handle(_note("a", 5))
+        await ch.handle(_note("b", 5))
+        await asyncio.sleep(0.6)  # the flusher popped the batch and is sleeping before its retry
+        assert ch.sent == [] and ch.extra_stats()["batched_pending"] == 0
+
+    _run(ch, scenario)
+    assert [s for s, _ in ch.sent] == ["Digest — 2 notifications (normal)"]
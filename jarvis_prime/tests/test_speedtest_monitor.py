@@ -0,0 +1,188 @@
+import asyncio
+import json
+import sqlite3
+import sys
+
+import pytest
+
+pytest.importorskip("aiohttp")
+import analytics
+from analytics import SpeedTestResult
+
+SERVER = {"id": 1234, "host": "speedtest.example.net", "port": 8080,
+          "name": "Example ISP", "location": "Amsterdam", "country": "Netherlands", "ip": "192.0.2.10"}
+
+
+def _transcript(download=250.0, upload=40.0, latency=12.345, jitter=0.8):
+    """A `speedtest --format=jsonl --progress=yes` run, trimmed to the fields the CLI emits"""
+    lines = [
+        {"type": "testStart", "timestamp": "2026-10-16T12:00:00Z", "isp": "Example ISP", "server": SERVER},
+        "Reading server list...",  # non-JSON chatter is skipped
+    ]
+    for p in (0.0, 0.25, 0.5, 0.75, 1.0):
+        lines.append({"type": "ping", "ping": {"jitter": jitter, "latency": latency + (1 - p), "progress": p}})
+    for kind, mbps in (("download", download), ("upload", upload)):
+        for step in range(11):
+            p = step / 10
+            lines.append({"type": kind, kind: {"bandwidth": int(mbps * 125000 * (0.5 + p / 2)),
+                                               "bytes": step * 1000, "elapsed": step * 100, "progress": p}})
+            # sub-percent steps in between must not produce extra updates
+            if step < 10:
+                lines.append({"type": kind, kind: {"bandwidth": int(mbps * 125000), "progress": p + 0.004}})
+    lines.append({
+        "type": "result", "timestamp": "2026-10-16T12:00:20Z",
+        "ping": {"jitter": jitter, "latency": latency, "low": 11.0, "high": 14.0},
+        "download": {"bandwidth": int(download * 125000), "bytes": 300000000, "elapsed": 10000},
+        "upload": {"bandwidth": int(upload * 125000), "bytes": 50000000, "elapsed": 10000},
+        "packetLoss": 0.5, "isp": "Example ISP", "server": SERVER,
+        "result": {"id": "abc", "url": "https://www.speedtest.net/result/c/abc", "persisted": True},
+    })
+    return "\n".join(l if isinstance(l, str) else json.dumps(l) for l in lines) + "\n"
+
+
+@pytest.fixture
+def adb(tmp_path):
+    db = analytics.AnalyticsDB(db_path=str(tmp_path / "jarvis.db"))
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def notified(monkeypatch):
+    sent = []
+
+    async def fake_notify(service, severity, message):
+        sent.append((severity, message))
+
+    monkeypatch.setattr(analytics, "analytics_notify", fake_notify)
+    return sent
+
+
+@pytest.fixture
+def fake_cli(tmp_path, monkeypatch):
+    """Point SPEEDTEST_CMD at a script replaying a transcript; returns a setter"""
+    def use(transcript, exit_code=0, stderr=""):
+        (tmp_path / "run.jsonl").write_text(transcript)
+        script = tmp_path / "speedtest.py"
+        script.write_text(
+            "import sys\n"
+            f"sys.stdout.write(open({str(tmp_path / 'run.jsonl')!r}).read())\n"
+            f"sys.stderr.write({stderr!r})\n"
+            f"sys.exit({exit_code})\n"
+        )
+        monkeypatch.setattr(analytics, "SPEEDTEST_CMD", (sys.executable, str(script)))
+    return use
+
+
+def _run(monitor):
+    async def main():
+        q = monitor.subscribe()
+        result = await monitor.run_speedtest()
+        updates = []
+        while not q.empty():
+            updates.append(q.get_nowait()["job"])
+        return result, updates
+    return asyncio.run(main())
+
+
+def test_run_job_follows_transcript(adb, notified, fake_cli):
+    fake_cli(_transcript())
+    monitor = analytics.SpeedTestMonitor(adb)
+    result, updates = _run(monitor)
+
+    assert result.download == 250.0 and result.upload == 40.0
+    assert result.ping == 12.35 and result.jitter == 0.8 and result.packet_loss == 0.5
+    assert result.server == "Example ISP (Amsterdam)"
+
+    job = updates[-1]
+    assert job["state"] == "done" and job["error"] is None
+    assert job["result"]["download"] == 250.0 and job["progress"] == 1.0
+    assert job["live"] == {"server": "Example ISP (Amsterdam)", "ping": 12.35,
+                           "download": 250.0, "upload": 40.0}
+
+    running = [u for u in updates if u["state"] == "running" and u["phase"]]
+    phases = [u["phase"] for u in running]
+    assert phases == sorted(phases, key=["ping", "download", "upload"].index)
+    progress = [u["progress"] for u in running]
+    assert progress == sorted(progress)
+    # one update per phase start and whole-percent step, not per CLI line
+    assert len(running) == 5 + 11 + 11
+    assert progress[5] == 0.1 and progress[16] == 0.55
+
+    assert adb.get_latest_speed_test()["download"] == 250.0
+    assert notified and notified[0][0] == "info"
+
+
+def test_run_job_reports_cli_failure(adb, notified, fake_cli):
+    transcript = json.dumps({"type": "log", "level": "error", "message": "Cannot open socket"}) + "\n"
+    fake_cli(transcript, exit_code=2, stderr="boom")
+    monitor = analytics.SpeedTestMonitor(adb)
+    for _ in range(3):
+        result, updates = _run(monitor)
+        assert result is None
+        assert updates[-1]["state"] == "failed"
+        assert updates[-1]["error"] == "Cannot open socket"
+    assert monitor.consecutive_failures == 3
+    assert [s for s, _ in notified] == ["critical"]
+    assert adb.get_latest_speed_test() is None
+
+
+def test_run_job_without_result_line_fails(adb, notified, fake_cli):
+    fake_cli(_transcript().rsplit("\n", 2)[0] + "\n", stderr="interrupted")
+    monitor = analytics.SpeedTestMonitor(adb)
+    result, updates = _run(monitor)
+    assert result is None
+    assert updates[-1]["state"] == "failed" and updates[-1]["error"] == "interrupted"
+
+
+def test_run_job_without_cli(adb, notified, monkeypatch):
+    monkeypatch.setattr(analytics, "SPEEDTEST_CMD", ("definitely-not-installed-speedtest",))
+    result, updates = _run(analytics.SpeedTestMonitor(adb))
+    assert result is None
+    assert updates[-1]["error"] == "speedtest CLI not installed"
+
+
+def _recompute(adb, last_n):
+    conn = sqlite3.connect(adb.db_path)
+    try:
+        total, last, d, u, p = conn.execute(
+            "SELECT COUNT(*), MAX(timestamp), AVG(download), AVG(upload), AVG(ping) FROM network_speed").fetchone()
+        recent = conn.execute(
+            "SELECT AVG(download), AVG(upload), AVG(ping) FROM "
+            "(SELECT * FROM network_speed ORDER BY timestamp DESC LIMIT ?)", (last_n,)).fetchone()
+    finally:
+        conn.close()
+    stats = {"total_tests": total, "last_test": last, "avg_download": round(d, 2),
+             "avg_upload": round(u, 2), "avg_ping": round(p, 2)}
+    averages = dict(zip(("avg_download", "avg_upload", "avg_ping"), (round(v, 2) for v in recent)))
+    return stats, averages
+
+
+def test_aggregates_match_full_recompute(adb, notified, fake_cli, monkeypatch):
+    monitor = analytics.SpeedTestMonitor(adb)
+    fake_cli(_transcript(download=300.0, upload=50.0, latency=10.0))
+    _run(monitor)
+    assert adb.get_speed_test_stats() == _recompute(adb, 5)[0]
+
+    # older results arriving late, plus more than SPEED_RECENT_KEEP in total
+    base = 1_700_000_000
+    for i in range(analytics.SPEED_RECENT_KEEP + 7):
+        ts = base + (i * 7919) % 100_000  # shuffled timestamps
+        adb.record_speed_test(SpeedTestResult(ts, 100.0 + i, 20.0 + i % 5, 9.0 + i % 3, "s"))
+    fake_cli(_transcript(download=90.0, upload=9.0, latency=30.0))
+    real_time = analytics.time.time
+    monkeypatch.setattr(analytics.time, "time", lambda: real_time() + 60)  # a later run, not a tie
+    _run(monitor)
+
+    for last_n in (1, 5, analytics.SPEED_RECENT_KEEP):
+        stats, averages = _recompute(adb, last_n)
+        assert adb.get_speed_test_stats() == stats
+        assert adb.get_speed_test_averages(last_n) == averages
+
+    # a cold load from disk agrees with the incrementally maintained copy
+    cold = analytics.AnalyticsDB(db_path=adb.db_path)
+    try:
+        assert cold.get_speed_test_stats() == adb.get_speed_test_stats()
+        assert cold.get_speed_test_averages(5) == adb.get_speed_test_averages(5)
+    finally:
+        cold.close()
@@ -0,0 +1,164 @@
+import sqlite3
+import threading
+
+import pytest
+
+import storage
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "DB_PATH", str(tmp_path / "jarvis.db"))
+    monkeypatch.setattr(storage, "GROUP_COMMIT_MS", 0)
+    storage.init_db(str(tmp_path / "jarvis.db"))
+    yield storage
+    storage.flush_pending()
+    storage._CONN.close()
+    storage._CONN = None
+
+
+def test_group_commit_writes_every_submit(db):
+    db.enable_group_commit(interval_ms=20, max_rows=10)
+    futs = [db.submit_message(f"t{i}", "body", "test") for i in range(25)]
+    ids = [f.result(timeout=5) for f in futs]
+    assert len(set(ids)) == 25
+    assert {m["title"] for m in db.list_messages(limit=50)} == {f"t{i}" for i in range(25)}
+
+
+def test_submit_after_final_drain_is_written(db):
+    db.enable_group_commit(interval_ms=20, max_rows=10)
+    db.submit_message("before", "body", "test").result(timeout=5)
+    # shutdown has started and the flusher already exited, but flush_pending() hasn't returned yet
+    with db._wb_cond:
+        db._wb_stop = True
+        db._wb_cond.notify_all()
+    db._wb_thread.join(5)
+    fut = db.submit_message("late", "body", "test")
+    assert fut.done() and fut.result() > 0
+    assert not db._wb_buf
+    assert {m["title"] for m in db.list_messages(limit=10)} == {"before", "late"}
+
+
+def test_submit_racing_shutdown_is_never_lost(db):
+    db.enable_group_commit(interval_ms=5, max_rows=5)
+    futs = []
+
+    def writer():
+        for i in range(200):
+            futs.append(db.submit_message(f"r{i}", "body", "test"))
+
+    t = threading.Thread(target=writer)
+    t.start()
+    db.flush_pending()
+    t.join()
+    ids = [f.result(timeout=5) for f in futs]
+    assert len(set(ids)) == 200
+    assert len(db.list_messages(limit=500)) == 200
+
+
+def test_flush_pending_drains_rows_left_by_a_stuck_flusher(db, monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(db, "_wb_loop", lambda: release.wait(5))  # flusher never drains
+    db.enable_group_commit(interval_ms=20, max_rows=10)
+    fut = db.submit_message("queued", "body", "test")
+    db.flush_pending(timeout=0.05)
+    release.set()
+    assert fut.result(timeout=5) > 0
+    assert [m["title"] for m in db.list_messages(limit=10)] == ["queued"]
+
+
+def test_keyset_pages_walk_without_gaps(db):
+    ids = [db.save_message(f"m{i}", f"body {i}", "test") for i in range(12)]
+    page1 = db.list_messages(limit=5)
+    page2 = db.list_messages(limit=5, before_id=page1[-1]["id"])
+    page3 = db.list_messages(limit=5, before_id=page2[-1]["id"])
+    assert [m["id"] for m in page1 + page2 + page3] == ids[::-1]
+    newer = db.list_messages(limit=3, after_id=ids[4])
+    assert [m["id"] for m in newer] == ids[7:4:-1]
+
+
+def test_search_pages_by_id(db):
+    ids = [db.save_message(f"disk {i}", "sda warning" if i % 2 else "all good", "test") for i in range(10)]
+    hits = db.list_messages(q="warn", limit=10)
+    assert [m["id"] for m in hits] == [ids[i] for i in (9, 7, 5, 3, 1)]
+    older = db.list_messages(q="warn", limit=10, before_id=ids[5])
+    assert [m["id"] for m in older] == [ids[3], ids[1]]
+    newer = db.list_messages(q="warn", limit=2, after_id=ids[2])
+    assert [m["id"] for m in newer] == [ids[5], ids[3]]
+
+
+def test_search_after_id_matches_plain_listing(db):
+    ids = [db.save_message(f"m{i}", "warning", "test") for i in range(10)]
+    plain = db.list_messages(limit=3, after_id=ids[2])
+    searched = db.list_messages(q="warning", limit=3, after_id=ids[2])
+    assert [m["id"] for m in searched] == [m["id"] for m in plain] == ids[5:2:-1]
+
+
+
+
+def _ids(rows):
+    return [m["id"] for m in rows]
+
+
+def test_fts_index_follows_insert_update_delete(db):
+    if not db._FTS_ENABLED:
+        pytest.skip("SQLite built without FTS5")
+    a = db.save_message("Disk alert", "sda is failing", "smart")
+    b = db.save_message("Backup", "finished fine", "duplicati")
+    assert _ids(db.list_messages(q="failing")) == [a]
+    with db._db_lock:
+        db._conn().execute("UPDATE messages SET body='sdb is failing' WHERE id=?", (b,))
+    assert _ids(db.list_messages(q="sdb")) == [b]
+    assert _ids(db.list_messages(q="finished")) == []
+    db.delete_message(a)
+    assert _ids(db.list_messages(q="failing")) == [b]
+
+
+def test_existing_rows_are_backfilled_into_new_index(tmp_path, monkeypatch):
+    path = str(tmp_path / "legacy.db")
+    legacy = sqlite3.connect(path)
+    legacy.execute("CREATE TABLE messages (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, "
+                   "body TEXT NOT NULL, source TEXT NOT NULL, ts INTEGER NOT NULL)")
+    legacy.execute("INSERT INTO messages(title, body, source, ts) VALUES ('Old', 'watchtower updated nginx', 'gotify', 1)")
+    legacy.commit()
+    legacy.close()
+    monkeypatch.setattr(storage, "GROUP_COMMIT_MS", 0)
+    storage.init_db(path)
+    try:
+        if not storage._FTS_ENABLED:
+            pytest.skip("SQLite built without FTS5")
+        hits = storage.list_messages(q="nginx")
+        assert [m["title"] for m in hits] == ["Old"]
+        assert "<mark>nginx</mark>" in hits[0]["snippet"]
+    finally:
+        storage._CONN.close()
+        storage._CONN = None
+
+
+def test_rank_puts_title_hits_first(db):
+    if not db._FTS_ENABLED:
+        pytest.skip("SQLite built without FTS5")
+    body_hit = db.save_message("Nightly report", "plex restarted twice", "cron")
+    title_hit = db.save_message("Plex down", "container exited", "uptime")
+    db.save_message("Other", "nothing here", "cron")
+    assert _ids(db.list_messages(q="plex")) == [title_hit, body_hit]
+    db.save_message("Newest", "plex mentioned in passing", "cron")
+    assert _ids(db.list_messages(q="plex", rank=True))[0] == title_hit
+
+
+def test_highlights_are_html_escaped(db):
+    if not db._FTS_ENABLED:
+        pytest.skip("SQLite built without FTS5")
+    db.save_message("<b>alert</b>", 'payload <img src=x onerror="alert(1)"> alert', "webhook")
+    hit = db.list_messages(q="alert")[0]
+    assert hit["snippet"] == "payload &lt;img src=x onerror=&quot;<mark>alert</mark>(1)&quot;&gt; <mark>alert</mark>"
+    assert hit["title_hl"] == "&lt;b&gt;<mark>alert</mark>&lt;/b&gt;"
+    assert hit["body"].startswith("payload <img")  # stored content itself is untouched
+
+
+def test_partial_terms_fall_back_to_substring_search(db):
+    warn = db.save_message("Disk", "warning: 91% used", "qnap")
+    sonarr = db.save_message("Episode grabbed", "The Expanse", "sonarr")
+    assert _ids(db.list_messages(q="arn")) == [warn]
+    assert _ids(db.list_messages(q="arr")) == [sonarr]
+    assert _ids(db.list_messages(q="nothing-like-this")) == []
@@ -0,0 +1,81 @@
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import worker_manager
+
+# Stand-in for llm_worker.py: streams tokens until it reads a cancel request
+FAKE_WORKER = r'''
+import json, sys, threading, time
+cancel = threading.Event()
+requests = []
+lock = threading.Condition()
+def reader():
+    for line in sys.stdin:
+        req = json.loads(line)
+        if req["method"] == "cancel":
+            cancel.set()
+            continue
+        with lock:
+            requests.append(req)
+            lock.notify()
+threading.Thread(target=reader, daemon=True).start()
+def out(obj):
+    sys.stdout.write(json.dumps(obj) + "\n")
+    sys.stdout.flush()
+while True:
+    with lock:
+        while not requests:
+            lock.wait()
+        req = requests.pop(0)
+    if req["method"] == "ping":
+        out({"success": True})
+    elif req["method"] == "generate_stream":
+        cancel.clear()
+        n = req["params"].get("tokens", 1000)
+        for i in range(n):
+            if cancel.is_set():
+                break
+            out({"token": f"t{i} "})
+            time.sleep(0.005)
+        out({"success": not cancel.is_set(), "cancelled": cancel.is_set()})
+'''
+
+
+@pytest.fixture
+def mgr():
+    m = worker_manager.get_worker()
+    saved = (m.process, m.pid)
+    m.process = subprocess.Popen([sys.executable, "-c", FAKE_WORKER], stdin=subprocess.PIPE,
+                                 stdout=subprocess.PIPE, bufsize=1, universal_newlines=True)
+    m.pid = m.process.pid
+    yield m
+    m.stop()
+    m.process, m.pid = saved
+
+
+def test_stream_yields_every_token(mgr):
+    assert list(mgr.stream("generate_stream", {"tokens": 5})) == [f"t{i} " for i in range(5)]
+    assert mgr.call("ping", {}, timeout=5) == {"success": True}
+
+
+def test_cancel_event_stops_stream_and_keeps_pipe_in_sync(mgr):
+    cancel = threading.Event()
+    got = []
+    for tok in mgr.stream("generate_stream", {}, cancel=cancel):
+        got.append(tok)
+        if len(got) == 3:
+            cancel.set()
+    assert 3 <= len(got) < 1000
+    # the cancelled reply was drained: the next call reads its own response
+    assert mgr.call("ping", {}, timeout=5) == {"success": True}
+    assert mgr.is_alive()
+
+
+def test_closing_iterator_early_cancels(mgr):
+    it = mgr.stream("generate_stream", {})
+    assert next(it) == "t0 "
+    it.close()
+    assert mgr.call("ping", {}, timeout=5) == {"success": True}
@@ -45,15 +45,157 @@ document.addEventListener('DOMContentLoaded', () => {
     });
   });
 
-  // Auto-refresh every 30 seconds when analytics tab is active
+  // Server push keeps the tab current; polling is only the fallback while the feed is down
+  analyticsLiveConnect();
   setInterval(() => {
     const analyticsTab = document.getElementById('analytics');
-    if (analyticsTab && analyticsTab.classList.contains('active')) {
+    if (!analyticsLive.connected && analyticsTab && analyticsTab.classList.contains('active')) {
       analyticsRefresh();
     }
   }, 30000);
 });
 
+// ---- Live feed (SSE) ------------------------------------------------------
+// The server sends a snapshot on connect, then deltas: status, metrics,
+// incident, service, devices, speedtest. Other modules (Atlas) can listen via
+// analyticsOnLive(fn).
+const analyticsLive = {
+  source: null,
+  connected: false,
+  services: new Map(),
+  listeners: [],
+  timers: {}
+};
+
+function analyticsOnLive(fn) {
+  analyticsLive.listeners.push(fn);
+}
+
+function analyticsPanelActive(name) {
+  const analyticsTab = document.getElementById('analytics');
+  const panel = document.getElementById(`analytics-${name}`);
+  return !!(analyticsTab && analyticsTab.classList.contains('active') && panel && panel.classList.contains('active'));
+}
+
+// Coalesce bursts of events into one refresh per key
+function analyticsLiveDebounce(key, fn, ms = 1500) {
+  clearTimeout(analyticsLive.timers[key]);
+  analyticsLive.timers[key] = setTimeout(fn, ms);
+}
+
+function analyticsLiveConnect() {
+  if (typeof EventSource === 'undefined' || analyticsLive.source) return;
+  const es = new EventSource(ANALYTICS_API('live'));
+  analyticsLive.source = es;
+  
+  es.onopen = () => { analyticsLive.connected = true; };
+  es.onerror = () => {
+    // EventSource reconnects on its own (resuming via Last-Event-ID); poll meanwhile
+    analyticsLive.connected = false;
+  };
+  es.onmessage = (event) => {
+    let msg;
+    try {
+      msg = JSON.parse(event.data);
+    } catch (error) {
+      return;
+    }
+    analyticsLive.connected = true;
+    analyticsHandleLive(msg);
+    analyticsLive.listeners.forEach(fn => {
+      try { fn(msg); } catch (error) { console.error('[analytics] live listener failed:', error); }
+    });
+  };
+}
+
+function analyticsHandleLive(msg) {
+  switch (msg.type) {
+    case 'snapshot':
+      analyticsLive.services = new Map((msg.services || []).map(s => [s.service_name, s]));
+      analyticsRenderHealthScore(msg.health);
+      if (analyticsPanelActive('dashboard')) analyticsLoadDashboard(msg.services);
+      if (analyticsPanelActive('services')) analyticsLoadServices(msg.services);
+      break;
+    
+    case 'status':
+      analyticsApplyState(msg.service, msg.state);
+      if (analyticsPanelActive('services')) {
+        analyticsLiveDebounce('services', () => analyticsLoadServices([...analyticsLive.services.values()]));
+      }
+      break;
+    
+    case 'metrics':
+      Object.entries(msg.services || {}).forEach(([name, state]) => analyticsApplyState(name, state));
+      break;
+    
+    case 'incident':
+      if (analyticsPanelActive('incidents')) analyticsLiveDebounce('incidents', analyticsLoadIncidents);
+      break;
+    
+    case 'service':
+      // Config changed: one refetch, shared by the dashboard and the services table
+      analyticsLiveDebounce('service-list', async () => {
+        try {
+          const services = await (await fetch(ANALYTICS_API('services'))).json();
+          analyticsLive.services = new Map(services.map(s => [s.service_name, s]));
+          analyticsRenderLiveHealth();
+          if (analyticsPanelActive('dashboard')) analyticsLoadDashboard(services);
+          if (analyticsPanelActive('services')) analyticsLoadServices(services);
+        } catch (error) {
+          console.error('[analytics] service refresh failed:', error);
+        }
+      });
+      break;
+    
+    case 'devices':
+      if (analyticsPanelActive('network')) analyticsLiveDebounce('network', analyticsLoadNetworkDashboard);
+      break;
+    
+    case 'speedtest':
+      if (analyticsPanelActive('internet') && !analyticsSpeedStream) {
+        analyticsLiveDebounce('internet', analyticsLoadInternetDashboard, 500);
+      }
+      break;
+    
+    case 'resync':
+      // Events were dropped: start a fresh stream (no Last-Event-ID) to get a new snapshot
+      analyticsLive.connected = false;
+      if (analyticsLive.source) analyticsLive.source.close();
+      analyticsLive.source = null;
+      analyticsLiveConnect();
+      break;
+  }
+}
+
+// Merge one service's live state into the local model and redraw only its card
+function analyticsApplyState(name, state) {
+  const service = analyticsLive.services.get(name);
+  if (!service || !state) return;
+  service.current_status = state.status;
+  service.last_check = state.timestamp;
+  service.is_suppressed = !!(state.suppressed_until && state.suppressed_until * 1000 > Date.now());
+  service.flap_count = state.flaps;
+  
+  analyticsRenderLiveHealth();
+  const grid = document.getElementById('analytics-services-grid');
+  const card = grid && grid.querySelector(`[data-service="${CSS.escape(name)}"]`);
+  if (card) card.replaceWith(analyticsCreateServiceCard(service, analyticsServiceUptime(service)));
+}
+
+// Health figures recomputed from the local model (24h uptime is kept from the last snapshot)
+function analyticsRenderLiveHealth() {
+  const services = [...analyticsLive.services.values()];
+  const total = services.length;
+  const up = services.filter(s => s.current_status === 'up').length;
+  analyticsRenderHealthScore({
+    health_score: total ? Math.round((up / total) * 1000) / 10 : 100,
+    up_services: up,
+    down_services: total - up,
+    total_services: total
+  });
+}
+
+
 // Switch between analytics sub-tabs
 function switchAnalyticsTab(tabName) {
   // Update tab buttons
@@ -94,35 +236,39 @@ async function analyticsLoadHealthScore() {
   try {
     const response = await fetch(ANALYTICS_API('health-score'));
     const data = await response.json();
-
-    document.getElementById('health-score').textContent = data.health_score + '%';
-    document.getElementById('services-up').textContent = data.up_services || 0;
-    document.getElementById('services-down').textContent = data.down_services || 0;
-    document.getElementById('services-total').textContent = data.total_services || 0;
-
-    // Color code health score
-    const scoreEl = document.getElementById('health-score');
-    if (data.health_score >= 99) {
-      scoreEl.style.color = '#22c55e';
-    } else if (data.health_score >= 95) {
-      scoreEl.style.color = '#60a5fa';
-    } else if (data.health_score >= 90) {
-      scoreEl.style.color = '#f59e0b';
-    } else {
-      scoreEl.style.color = '#ef4444';
-    }
+    analyticsRenderHealthScore(data);
   } catch (error) {
     console.error('Error loading health score:', error);
   }
 }
 
-// Load dashboard service cards
-async function analyticsLoadDashboard() {
+function analyticsRenderHealthScore(data) {
+  if (!data || !document.getElementById('health-score')) return;
+  
+  document.getElementById('health-score').textContent = data.health_score + '%';
+  document.getElementById('services-up').textContent = data.up_services || 0;
+  document.getElementById('services-down').textContent = data.down_services || 0;
+  document.getElementById('services-total').textContent = data.total_services || 0;
+
+  // Color code health score
+  const scoreEl = document.getElementById('health-score');
+  if (data.health_score >= 99) {
+    scoreEl.style.color = '#22c55e';
+  } else if (data.health_score >= 95) {
+    scoreEl.style.color = '#60a5fa';
+  } else if (data.health_score >= 90) {
+    scoreEl.style.color = '#f59e0b';
+  } else {
+    scoreEl.style.color = '#ef4444';
+  }
+}
+
+// Load dashboard service cards (from the live model when it is passed in)
+async function analyticsLoadDashboard(preloaded) {
   const grid = document.getElementById('analytics-services-grid');
   
   try {
-    const response = await fetch(ANALYTICS_API('services'));
-    const services = await response.json();
+    const services = Array.isArray(preloaded) ? preloaded : await (await fetch(ANALYTICS_API('services'))).json();
 
     if (services.length === 0) {
       grid.innerHTML = `
@@ -137,7 +283,7 @@ async function analyticsLoadDashboard() {
     grid.innerHTML = '';
     
     for (const service of services) {
-      const uptime = await analyticsGetUptime(service.service_name);
+      const uptime = analyticsServiceUptime(service) || await analyticsGetUptime(service.service_name);
       const card = analyticsCreateServiceCard(service, uptime);
       grid.appendChild(card);
     }
@@ -147,6 +293,15 @@ async function analyticsLoadDashboard() {
   }
 }
 
+// 24h uptime figures already carried by the services listing (same rollups as /uptime)
+function analyticsServiceUptime(service) {
+  if (service.total_checks_24h === undefined) return null;
+  return {
+    uptime_percentage: service.uptime_24h,
+    total_checks: service.total_checks_24h
+  };
+}
+
 // Get uptime stats for a service
 async function analyticsGetUptime(serviceName) {
   try {
@@ -161,6 +316,7 @@ async function analyticsGetUptime(serviceName) {
 function analyticsCreateServiceCard(service, uptime) {
   const card = document.createElement('div');
   card.className = 'playbook-card';
+  card.dataset.service = service.service_name;
 
   const status = service.current_status || 'unknown';
   const statusColors = {
@@ -231,13 +387,12 @@ function analyticsCreateServiceCard(service, uptime) {
   return card;
 }
 
-// Load services list
-async function analyticsLoadServices() {
+// Load services list (from the live model when it is passed in)
+async function analyticsLoadServices(preloaded) {
   const tbody = document.getElementById('analytics-services-list');
   
   try {
-    const response = await fetch(ANALYTICS_API('services'));
-    const services = await response.json();
+    const services = Array.isArray(preloaded) ? preloaded : await (await fetch(ANALYTICS_API('services'))).json();
 
     if (services.length === 0) {
       tbody.innerHTML = `
@@ -1222,7 +1377,9 @@ async function analyticsLoadInternetDashboard() {
     if (status.testing) {
       document.getElementById('speed-test-btn').disabled = true;
       document.getElementById('speed-test-btn').textContent = '⏳ Testing...';
-    } else {
+      // Pick up progress of a run started elsewhere (schedule, another tab)
+      if (status.job && !analyticsSpeedStream) analyticsFollowSpeedJob(status.job.id);
+    } else if (!analyticsSpeedStream) {
       document.getElementById('speed-test-btn').disabled = false;
       document.getElementById('speed-test-btn').textContent = '🚀 Run Test Now';
     }
@@ -1279,33 +1436,81 @@ function analyticsDisplayLatestSpeedTest(test) {
   `;
 }
 
-// Run speed test
-async function analyticsRunSpeedTest() {
+// Run speed test (background job; progress arrives over SSE)
+let analyticsSpeedStream = null;
+
+function analyticsSpeedButton(label, disabled) {
   const btn = document.getElementById('speed-test-btn');
-  btn.disabled = true;
-  btn.textContent = '⏳ Testing...';
+  if (!btn) return;
+  btn.disabled = disabled;
+  btn.textContent = label;
+}
+
+function analyticsFollowSpeedJob(jobId) {
+  if (analyticsSpeedStream) analyticsSpeedStream.close();
+  const es = new EventSource(ANALYTICS_API(`speedtest/stream?job=${encodeURIComponent(jobId)}`));
+  analyticsSpeedStream = es;
+  
+  es.onmessage = (event) => {
+    let job;
+    try {
+      job = JSON.parse(event.data).job;
+    } catch (error) {
+      return;
+    }
+    if (!job) return;
+    
+    if (job.state === 'queued' || job.state === 'running') {
+      const pct = Math.round((job.progress || 0) * 100);
+      const live = job.live || {};
+      const figure = job.phase === 'ping' && live.ping != null ? ` ${live.ping}ms`
+        : job.phase && live[job.phase] != null ? ` ${live[job.phase]} Mbps` : '';
+      analyticsSpeedButton(`⏳ ${job.phase || 'Starting'} ${pct}%${figure}`, true);
+      return;
+    }
+    
+    es.close();
+    analyticsSpeedStream = null;
+    analyticsSpeedButton('🚀 Run Test Now', false);
+    if (job.state === 'done') {
+      showToast('Speed test completed', 'success');
+    } else if (job.state === 'cancelled') {
+      showToast('Speed test cancelled', 'info');
+    } else {
+      showToast(job.error || 'Speed test failed', 'error');
+    }
+    analyticsLoadInternetDashboard();
+  };
   
-  showToast('Speed test started (may take 30-60 seconds)...', 'info');
+  es.onerror = () => {
+    // Stream dropped (e.g. add-on restart): fall back to the regular dashboard refresh
+    es.close();
+    analyticsSpeedStream = null;
+    analyticsSpeedButton('🚀 Run Test Now', false);
+    analyticsLoadInternetDashboard();
+  };
+}
+
+async function analyticsRunSpeedTest() {
+  analyticsSpeedButton('⏳ Testing...', true);
   
   try {
-    const response = await fetch(ANALYTICS_API('speedtest/run'), {
+    const response = await fetch(ANALYTICS_API('speedtest/jobs'), {
       method: 'POST'
     });
+    const data = await response.json();
     
-    if (response.ok) {
-      const data = await response.json();
-      showToast('Speed test completed', 'success');
-      analyticsLoadInternetDashboard();
+    if (response.ok && data.job) {
+      showToast(data.already_running ? 'Speed test already running' : 'Speed test started (may take 30-60 seconds)...', 'info');
+      analyticsFollowSpeedJob(data.job.id);
     } else {
-      const error = await response.json();
-      showToast(error.error || 'Speed test failed', 'error');
+      showToast(data.error || 'Speed test failed', 'error');
+      analyticsSpeedButton('🚀 Run Test Now', false);
     }
   } catch (error) {
     console.error('Speed test error:', error);
     showToast('Speed test failed', 'error');
-  } finally {
-    btn.disabled = false;
-    btn.textContent = '🚀 Run Test Now';
+    analyticsSpeedButton('🚀 Run Test Now', false);
   }
 }
 
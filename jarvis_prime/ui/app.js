@@ -502,6 +502,89 @@
     }
   }
 
+  let activeChatStream = null; // AbortController of the reply being streamed
+
+  function showChatOutput(text) {
+    const out = $('#chat-output');
+    if (!out) return;
+    out.hidden = !text;
+    out.textContent = text || '';
+    out.scrollTop = out.scrollHeight;
+  }
+
+  function onChatReply(result) {
+    console.log('LLM response:', result);
+    updateChatStatus('Complete');
+    
+    // Create inbox message with the response
+    jfetch(API('api/messages'), {
+      method: 'POST',
+      body: JSON.stringify({
+        title: 'AI Response',
+        body: result || '(empty response)',
+        source: 'llm-chat',
+        priority: 5
+      })
+    }).catch(e => console.error('Failed to save response:', e));
+    
+    toast('AI responded successfully', 'success');
+    
+    setTimeout(() => {
+      updateChatStatus('Ready');
+    }, 2000);
+  }
+
+  function onChatError(error) {
+    console.error('LLM error:', error);
+    updateChatStatus('Error');
+    toast('Chat failed: ' + error.message, 'error');
+    
+    setTimeout(() => {
+      updateChatStatus('Ready');
+    }, 3000);
+  }
+
+  /**
+   * POST a chat to the SSE endpoint and read the reply as it is generated.
+   * Aborting the signal closes the connection, which stops generation server-side.
+   * @returns {Promise<string>} the cleaned full reply
+   */
+  async function streamLLMChat(payload, onToken, signal) {
+    const r = await fetch(API('api/llm/chat/stream'), {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(payload),
+      signal
+    });
+    if (!r.ok || !r.body) {
+      const text = await r.text().catch(() => '');
+      const err = new Error(`${r.status} ${r.statusText}: ${text}`);
+      err.status = r.status;
+      throw err;
+    }
+    
+    const reader = r.body.getReader();
+    const decoder = new TextDecoder();
+    let buf = '';
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buf += decoder.decode(value, { stream: true });
+      let cut;
+      while ((cut = buf.indexOf('\n\n')) >= 0) {
+        const frame = buf.slice(0, cut);
+        buf = buf.slice(cut + 2);
+        const data = frame.split('\n').filter(l => l.startsWith('data:')).map(l => l.slice(5).trim()).join('\n');
+        if (!data) continue; // comment / keepalive
+        const ev = JSON.parse(data);
+        if (ev.event === 'token') onToken(ev.text);
+        else if (ev.event === 'done') return ev.text;
+        else if (ev.event === 'error') throw new Error(ev.error || 'Generation failed');
+      }
+    }
+    throw new Error('Stream ended before the reply finished');
+  }
+
   async function sendChatMessage() {
     const input = $('#chat-input');
     if (!input) return;
@@ -510,71 +593,49 @@
     if (!text) return;
 
     const sendBtn = $('#chat-send');
+    const payload = {
+      messages: [
+        { role: 'user', content: text }
+      ],
+      max_tokens: 384,
+      timeout: 20
+    };
+    
+    // A new question supersedes the one still generating
+    if (activeChatStream) activeChatStream.abort();
+    const controller = new AbortController();
+    activeChatStream = controller;
     
     try {
       if (sendBtn) sendBtn.classList.add('loading');
-      updateChatStatus('Processing...');
-      
-      const userMessage = text;
+      updateChatStatus('Waiting for AI...');
       input.value = '';
+      showChatOutput('');
       
-      console.log('Sending chat message to LLM:', userMessage);
+      console.log('Sending chat message to LLM:', text);
       
-      // Submit to LLM chat endpoint
-      await submitLLMTask(
-        'api/llm/chat',
-        {
-          messages: [
-            { role: 'user', content: userMessage }
-          ],
-          max_tokens: 384,
-          timeout: 20
-        },
-        (result) => {
-          // Success callback
-          console.log('LLM response:', result);
-          updateChatStatus('Complete');
-          
-          // Create inbox message with the response
-          jfetch(API('api/messages'), {
-            method: 'POST',
-            body: JSON.stringify({
-              title: 'AI Response',
-              body: result || '(empty response)',
-              source: 'llm-chat',
-              priority: 5
-            })
-          }).catch(e => console.error('Failed to save response:', e));
-          
-          toast('AI responded successfully', 'success');
-          
-          setTimeout(() => {
-            updateChatStatus('Ready');
-          }, 2000);
-        },
-        (error) => {
-          // Error callback
-          console.error('LLM error:', error);
-          updateChatStatus('Error');
-          toast('Chat failed: ' + error.message, 'error');
-          
-          setTimeout(() => {
-            updateChatStatus('Ready');
-          }, 3000);
-        }
-      );
+      let partial = '';
+      const result = await streamLLMChat(payload, (piece) => {
+        if (!partial) updateChatStatus('Generating...');
+        partial += piece;
+        showChatOutput(partial);
+      }, controller.signal);
       
-      updateChatStatus('Waiting for AI...');
+      showChatOutput(result);
+      onChatReply(result);
       
     } catch (e) {
-      console.error('Chat error:', e);
-      updateChatStatus('Error');
-      toast('Chat failed: ' + e.message, 'error');
-      
-      setTimeout(() => {
-        updateChatStatus('Ready');
-      }, 3000);
+      if (e.name === 'AbortError') return;
+      if (e.status === 404 || e.status === 405) {
+        // Older backend without the stream endpoint: submit and poll
+        try {
+          await submitLLMTask('api/llm/chat', payload, onChatReply, onChatError);
+        } catch (_) { /* reported via onChatError */ }
+        return;
+      }
+      onChatError(e);
     } finally {
+      if (activeChatStream === controller) activeChatStream = null;
       if (sendBtn) sendBtn.classList.remove('loading');
     }
   }
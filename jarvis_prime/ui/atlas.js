@@ -9,12 +9,32 @@ const ATLAS_API = (path = '') => {
   return '/api/atlas/' + path.replace(/^\/+/, '');
 };
 
+// Topology changes arrive over the analytics live feed; the 45s timer only
+// redraws when something changed while the tab was hidden, or when the feed is down.
+const ATLAS_LIVE_EVENTS = new Set(['snapshot', 'status', 'service', 'devices']);
+const ATLAS_REDRAW_DELAY = 6000;  // just past the server's 5s snapshot cache
+let atlasDirty = false;
+let atlasRedrawTimer = null;
+
 document.addEventListener('DOMContentLoaded', () => {
   const atlasTab = document.getElementById('atlas');
   if (!atlasTab) return;
 
+  const live = typeof analyticsOnLive === 'function';
+  if (live) {
+    analyticsOnLive((msg) => {
+      if (!ATLAS_LIVE_EVENTS.has(msg.type)) return;
+      atlasDirty = true;
+      if (!atlasTab.classList.contains('active')) return;
+      clearTimeout(atlasRedrawTimer);
+      atlasRedrawTimer = setTimeout(atlasRender, ATLAS_REDRAW_DELAY);
+    });
+  }
+
   setInterval(() => {
-    if (atlasTab.classList.contains('active')) atlasRender();
+    if (!atlasTab.classList.contains('active')) return;
+    const feedUp = live && typeof analyticsLive !== 'undefined' && analyticsLive.connected;
+    if (atlasDirty || !feedUp) atlasRender();
   }, 45000);
 
   atlasRender();
@@ -28,6 +48,7 @@ async function atlasRender() {
     const res = await fetch(ATLAS_API('topology'));
     if (!res.ok) throw new Error('Failed to fetch topology');
     const data = await res.json();
+    atlasDirty = false;
     drawAtlasGraph(container, data);
   } catch (err) {
     console.error('[atlas] render failed:', err);